@@ -0,0 +1,6 @@
+"""
+Benchmarks de rendimiento de la simulación y de los generadores.
+
+Cada módulo es una suite que se ejecuta con ``python -m benchmarks.<suite>`` y
+puede compararse contra una referencia guardada en JSON.
+"""
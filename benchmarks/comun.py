@@ -0,0 +1,320 @@
+"""
+Utilidades comunes de las suites de benchmarks.
+
+Cada benchmark se mide en dos pasadas: una cronometrada, de la que salen las
+operaciones por segundo y los percentiles de latencia, y otra bajo tracemalloc
+para el pico de memoria (tracemalloc vuelve más lento el código, por lo que no se
+mezcla con los tiempos). Los resultados pueden guardarse como referencia en JSON
+y compararse con ella en ejecuciones posteriores.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+DIRECTORIO_REFERENCIAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "referencias")
+
+
+@dataclass
+class ResultadoBenchmark:
+    """
+    Medición de un benchmark.
+
+    Attributes:
+        nombre (str): Identificador del benchmark
+        operaciones (int): Operaciones cronometradas en total
+        segundos (float): Tiempo total de las operaciones cronometradas
+        ops_por_segundo (float): Operaciones por segundo
+        latencia_p50_us, latencia_p95_us, latencia_p99_us (float): Percentiles de la
+            latencia por operación, en microsegundos
+        memoria_pico_kb (float): Pico de memoria asignada durante una muestra (KiB;
+            None si no se midió)
+    """
+
+    nombre: str
+    operaciones: int
+    segundos: float
+    ops_por_segundo: float
+    latencia_p50_us: float
+    latencia_p95_us: float
+    latencia_p99_us: float
+    memoria_pico_kb: Optional[float]
+
+    def a_dict(self) -> dict:
+        return asdict(self)
+
+
+def resumir(
+    nombre: str,
+    duraciones: Sequence[float],
+    operaciones_por_muestra: int,
+    memoria_pico: Optional[int],
+) -> ResultadoBenchmark:
+    """
+    Construye un resultado a partir de la duración de cada muestra.
+
+    Args:
+        nombre (str): Identificador del benchmark
+        duraciones (Sequence[float]): Segundos de cada muestra
+        operaciones_por_muestra (int): Operaciones ejecutadas en cada muestra
+        memoria_pico (int): Pico de memoria en bytes (None si no se midió)
+
+    Returns:
+        ResultadoBenchmark: Medición resumida
+    """
+    duraciones = np.asarray(duraciones, dtype=np.float64)
+    latencias = duraciones / operaciones_por_muestra * 1e6
+    p50, p95, p99 = np.percentile(latencias, [50, 95, 99])
+    operaciones = operaciones_por_muestra * len(duraciones)
+    segundos = float(duraciones.sum())
+    return ResultadoBenchmark(
+        nombre=nombre,
+        operaciones=operaciones,
+        segundos=round(segundos, 6),
+        ops_por_segundo=round(operaciones / segundos, 2) if segundos > 0 else float("inf"),
+        latencia_p50_us=round(float(p50), 3),
+        latencia_p95_us=round(float(p95), 3),
+        latencia_p99_us=round(float(p99), 3),
+        memoria_pico_kb=round(memoria_pico / 1024, 1) if memoria_pico is not None else None,
+    )
+
+
+def memoria_pico(preparar: Callable[[], Any], ejecutar: Callable[[Any], Any]) -> int:
+    """
+    Mide el pico de memoria asignada por ejecutar(estado), sin contar lo que
+    asigna preparar().
+
+    Returns:
+        int: Pico en bytes
+    """
+    estado = preparar()
+    tracemalloc.start()
+    try:
+        ejecutar(estado)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def medir(
+    nombre: str,
+    preparar: Callable[[], Any],
+    ejecutar: Callable[[Any], Any],
+    operaciones_por_muestra: int,
+    muestras: int,
+    calentamiento: int = 1,
+    medir_memoria: bool = True,
+) -> ResultadoBenchmark:
+    """
+    Mide un benchmark repitiendo ejecutar(estado) sobre un único estado preparado.
+
+    Args:
+        nombre (str): Identificador del benchmark
+        preparar (Callable[[], Any]): Crea el estado (no se cronometra)
+        ejecutar (Callable[[Any], Any]): Ejecuta una muestra de operaciones_por_muestra
+            operaciones sobre el estado
+        operaciones_por_muestra (int): Operaciones de cada muestra
+        muestras (int): Muestras cronometradas
+        calentamiento (int): Muestras previas que no se cronometran
+        medir_memoria (bool): Si es False, se omite la pasada con tracemalloc (útil
+            para cargas grandes, en las que tracemalloc es muy lento)
+
+    Returns:
+        ResultadoBenchmark: Medición resumida
+    """
+    estado = preparar()
+    for _ in range(calentamiento):
+        ejecutar(estado)
+    reloj = time.perf_counter
+    duraciones = []
+    for _ in range(muestras):
+        inicio = reloj()
+        ejecutar(estado)
+        duraciones.append(reloj() - inicio)
+    pico = memoria_pico(preparar, ejecutar) if medir_memoria else None
+    return resumir(nombre, duraciones, operaciones_por_muestra, pico)
+
+
+def ruta_referencia(suite: str) -> str:
+    """Ruta por defecto del archivo de referencia de una suite."""
+    return os.path.join(DIRECTORIO_REFERENCIAS, f"{suite}.json")
+
+
+def guardar_referencia(ruta: str, resultados: List[ResultadoBenchmark]) -> None:
+    """Guarda los resultados como referencia, junto con datos del entorno."""
+    os.makedirs(os.path.dirname(os.path.abspath(ruta)), exist_ok=True)
+    with open(ruta, "w") as f:
+        json.dump(
+            {
+                "python": platform.python_version(),
+                "plataforma": platform.platform(),
+                "creada": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "resultados": {r.nombre: r.a_dict() for r in resultados},
+            },
+            f,
+            indent=2,
+        )
+
+
+def cargar_referencia(ruta: str) -> Optional[Dict[str, dict]]:
+    """
+    Carga una referencia guardada.
+
+    Returns:
+        Dict[str, dict]: Resultados por nombre de benchmark, o None si no existe
+    """
+    try:
+        with open(ruta, "r") as f:
+            return json.load(f)["resultados"]
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        return None
+
+
+def comparar(
+    resultados: List[ResultadoBenchmark], referencia: Dict[str, dict], tolerancia: float
+) -> List[str]:
+    """
+    Compara los resultados con la referencia.
+
+    Se considera regresión que las operaciones por segundo bajen, o que el pico de
+    memoria suba, más que la fracción tolerancia respecto de la referencia.
+
+    Args:
+        resultados (List[ResultadoBenchmark]): Mediciones actuales
+        referencia (Dict[str, dict]): Resultados de referencia por nombre
+        tolerancia (float): Variación relativa admitida (0.15 = 15 %)
+
+    Returns:
+        List[str]: Descripción de cada regresión encontrada
+    """
+    regresiones = []
+    for resultado in resultados:
+        base = referencia.get(resultado.nombre)
+        if base is None:
+            continue
+        if resultado.ops_por_segundo < base["ops_por_segundo"] * (1 - tolerancia):
+            regresiones.append(
+                f"{resultado.nombre}: {resultado.ops_por_segundo:,.0f} ops/s "
+                f"(referencia {base['ops_por_segundo']:,.0f})"
+            )
+        # Picos muy pequeños varían por detalles del intérprete: se ignoran
+        if (
+            resultado.memoria_pico_kb is not None
+            and base["memoria_pico_kb"] is not None
+            and base["memoria_pico_kb"] >= 64
+            and resultado.memoria_pico_kb > base["memoria_pico_kb"] * (1 + tolerancia)
+        ):
+            regresiones.append(
+                f"{resultado.nombre}: {resultado.memoria_pico_kb:,.1f} KiB de pico "
+                f"(referencia {base['memoria_pico_kb']:,.1f})"
+            )
+    return regresiones
+
+
+def formatear_tabla(
+    resultados: List[ResultadoBenchmark], referencia: Optional[Dict[str, dict]] = None
+) -> str:
+    """
+    Da formato de tabla a los resultados; con referencia, agrega la variación de
+    las operaciones por segundo.
+    """
+    encabezado = ["benchmark", "ops/s", "p50 µs", "p95 µs", "p99 µs", "pico KiB"]
+    if referencia is not None:
+        encabezado.append("vs ref")
+    filas = []
+    for r in resultados:
+        fila = [
+            r.nombre,
+            f"{r.ops_por_segundo:,.0f}",
+            f"{r.latencia_p50_us:,.2f}",
+            f"{r.latencia_p95_us:,.2f}",
+            f"{r.latencia_p99_us:,.2f}",
+            f"{r.memoria_pico_kb:,.1f}" if r.memoria_pico_kb is not None else "-",
+        ]
+        if referencia is not None:
+            base = referencia.get(r.nombre)
+            fila.append(
+                f"{r.ops_por_segundo / base['ops_por_segundo'] - 1:+.1%}" if base else "-"
+            )
+        filas.append(fila)
+    anchos = [max(len(str(c)) for c in columna) for columna in zip(encabezado, *filas)]
+    lineas = [
+        "  ".join(
+            celda.ljust(ancho) if i == 0 else celda.rjust(ancho)
+            for i, (celda, ancho) in enumerate(zip(fila, anchos))
+        )
+        for fila in [encabezado] + filas
+    ]
+    lineas.insert(1, "  ".join("-" * ancho for ancho in anchos))
+    return "\n".join(lineas)
+
+
+def ejecutar_suite(
+    suite: str,
+    benchmarks: Dict[str, Callable[[float], List[ResultadoBenchmark]]],
+    argv: Optional[List[str]] = None,
+) -> int:
+    """
+    Punto de entrada de línea de comandos de una suite.
+
+    Args:
+        suite (str): Nombre de la suite (también nombra su archivo de referencia)
+        benchmarks (Dict[str, Callable]): Funciones que reciben la escala y retornan
+            sus mediciones, por nombre
+        argv (List[str]): Argumentos (por defecto, los del proceso)
+
+    Returns:
+        int: 0 si no hay regresiones, 1 si las hay
+    """
+    parser = argparse.ArgumentParser(
+        prog=f"python -m benchmarks.{suite}", description=f"Benchmarks de {suite}"
+    )
+    parser.add_argument(
+        "--solo", nargs="+", choices=sorted(benchmarks), help="Benchmarks a ejecutar"
+    )
+    parser.add_argument(
+        "--escala",
+        type=float,
+        default=1.0,
+        help="Multiplica el tamaño de las cargas (p. ej. 0.1 para una corrida rápida)",
+    )
+    parser.add_argument("--referencia", default=ruta_referencia(suite), help="Archivo JSON")
+    parser.add_argument(
+        "--guardar-referencia", action="store_true", help="Guarda los resultados como referencia"
+    )
+    parser.add_argument(
+        "--tolerancia", type=float, default=0.15, help="Regresión admitida (0.15 = 15 %%)"
+    )
+    parser.add_argument("--json", help="Escribe también los resultados en este archivo")
+    args = parser.parse_args(argv)
+    if args.escala <= 0:
+        parser.error("--escala debe ser positiva")
+
+    resultados: List[ResultadoBenchmark] = []
+    for nombre in args.solo or list(benchmarks):
+        print(f"Ejecutando {nombre}...", file=sys.stderr)
+        resultados.extend(benchmarks[nombre](args.escala))
+
+    referencia = None if args.guardar_referencia else cargar_referencia(args.referencia)
+    print(formatear_tabla(resultados, referencia))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump([r.a_dict() for r in resultados], f, indent=2)
+    if args.guardar_referencia:
+        guardar_referencia(args.referencia, resultados)
+        print(f"Referencia guardada en {args.referencia}")
+        return 0
+    if referencia is None:
+        return 0
+    regresiones = comparar(resultados, referencia, args.tolerancia)
+    for regresion in regresiones:
+        print(f"REGRESIÓN {regresion}")
+    return 1 if regresiones else 0
@@ -0,0 +1,151 @@
+"""
+Benchmarks del generador congruencial, de RandomWrapper y de las pruebas de
+aleatoriedad de modelos/pruebas.
+
+Los generadores se miden en números por segundo para cada método de la interfaz
+(incluidas las variantes que entregan muchos valores por llamada). Cada prueba de
+aleatoriedad se mide en números validados por segundo con 10^4, 10^6 y 10^7
+números, para ver dónde se va el tiempo de la validación y cómo escala cada prueba.
+
+Uso:
+    python -m benchmarks.generadores --solo generadores
+    python -m benchmarks.generadores --solo pruebas --escala 0.1   # 10^3, 10^5 y 10^6
+"""
+
+import sys
+from typing import List
+
+import numpy as np
+
+from modelos.linear_congruence import LinearCongruenceRandom
+from modelos.pruebas.average_test import AverageTest
+from modelos.pruebas.chi2_test import ChiTest
+from modelos.pruebas.chi_square_test import ChiSquareTest
+from modelos.pruebas.ks_test import KsTest
+from modelos.pruebas.poker_test import PokerTest
+from modelos.pruebas.variance_test import VarianceTest
+from modelos.random_wrapper import RandomWrapper
+from modelos.substreams import derive_seed, derive_seeds
+
+from .comun import ResultadoBenchmark, ejecutar_suite, medir
+
+SEMILLA = 12345
+NUMEROS_POR_MUESTRA = 100_000
+TAMANOS_PRUEBAS = (10**4, 10**6, 10**7)
+# Por encima de este tamaño se omite la pasada de memoria: con tracemalloc las
+# pruebas de 10^7 números tardan minutos
+MAX_NUMEROS_MEMORIA = 10**6
+
+ZONAS = ["CENTRO", "INTERMEDIA", "EXTERIOR", "ERROR"]
+PESOS_ZONAS = [0.3, 0.38, 0.27, 0.05]
+
+# Pruebas de modelos/pruebas: nombre y función que ejecuta la prueba completa
+PRUEBAS = {
+    "promedio": lambda numeros: AverageTest(numeros).evaluate_test(),
+    "varianza": lambda numeros: VarianceTest(numeros).evaluate_test(),
+    "chi_cuadrado": lambda numeros: ChiSquareTest(numeros).evaluate_test(),
+    "chi2": lambda numeros: ChiTest(numeros).checkTest(),
+    "ks": lambda numeros: KsTest(numeros).checkTest(),
+    "poker": lambda numeros: PokerTest(numeros).check_poker(),
+}
+
+
+def _medir_llamadas(nombre, crear, llamar, valores_por_llamada, escala):
+    """
+    Mide una función del generador llamada repetidamente.
+
+    Args:
+        crear (Callable[[], Any]): Crea el generador
+        llamar (Callable[[Any], Any]): Obtiene valores del generador una vez
+        valores_por_llamada (int): Números que entrega cada llamada
+    """
+    llamadas = max(1, int(NUMEROS_POR_MUESTRA * escala) // valores_por_llamada)
+
+    def ejecutar(generador):
+        for _ in range(llamadas):
+            llamar(generador)
+
+    return medir(nombre, crear, ejecutar, llamadas * valores_por_llamada, 20)
+
+
+def benchmark_generadores(escala: float) -> List[ResultadoBenchmark]:
+    """Números por segundo de cada método del generador y de RandomWrapper."""
+    llamadas = [
+        ("lcg.random", lambda: LinearCongruenceRandom(SEMILLA), lambda g: g.random(), 1),
+        ("wrapper.random", lambda: RandomWrapper(SEMILLA), lambda g: g.random(), 1),
+        (
+            "wrapper.random[antitetico]",
+            lambda: RandomWrapper(SEMILLA, antithetic=True),
+            lambda g: g.random(),
+            1,
+        ),
+        ("wrapper.uniform", lambda: RandomWrapper(SEMILLA), lambda g: g.uniform(0.0, 10.0), 1),
+        ("wrapper.randint", lambda: RandomWrapper(SEMILLA), lambda g: g.randint(1, 100), 1),
+        ("wrapper.choice", lambda: RandomWrapper(SEMILLA), lambda g: g.choice(ZONAS), 1),
+        # Así elige la zona Blanco en cada tiro
+        (
+            "wrapper.choices[k=1]",
+            lambda: RandomWrapper(SEMILLA),
+            lambda g: g.choices(ZONAS, weights=PESOS_ZONAS, k=1),
+            1,
+        ),
+        (
+            "wrapper.choices[k=1000]",
+            lambda: RandomWrapper(SEMILLA),
+            lambda g: g.choices(ZONAS, weights=PESOS_ZONAS, k=1000),
+            1000,
+        ),
+        (
+            "wrapper.sample[k=100]",
+            lambda: RandomWrapper(SEMILLA),
+            lambda g: g.sample(range(1000), 100),
+            100,
+        ),
+        ("derive_seed", lambda: SEMILLA, lambda semilla: derive_seed(semilla, 7, 3), 1),
+        (
+            "derive_seeds[10^4]",
+            lambda: SEMILLA,
+            lambda semilla: derive_seeds(semilla, np.arange(10**4)),
+            10**4,
+        ),
+    ]
+    return [
+        _medir_llamadas(nombre, crear, llamar, valores, escala)
+        for nombre, crear, llamar, valores in llamadas
+    ]
+
+
+def benchmark_pruebas(escala: float) -> List[ResultadoBenchmark]:
+    """Números validados por segundo de cada prueba, para cada tamaño de muestra."""
+    resultados = []
+    for tamano in TAMANOS_PRUEBAS:
+        n = max(1000, int(tamano * escala))
+        generador = LinearCongruenceRandom(SEMILLA)
+        numeros = [generador.random() for _ in range(n)]
+        # Varias muestras con pocos números y una sola con muchos
+        muestras = min(20, max(1, 3 * 10**6 // n))
+        for nombre, prueba in PRUEBAS.items():
+            resultados.append(
+                medir(
+                    f"{nombre}[n={n}]",
+                    lambda: numeros,
+                    # Cada muestra valida una copia (KsTest ordena la lista en su
+                    # lugar); copiarla cuesta poco frente a cualquier prueba
+                    lambda numeros, prueba=prueba: prueba(list(numeros)),
+                    n,
+                    muestras,
+                    calentamiento=1 if n <= 10**5 else 0,
+                    medir_memoria=n <= MAX_NUMEROS_MEMORIA,
+                )
+            )
+    return resultados
+
+
+BENCHMARKS = {
+    "generadores": benchmark_generadores,
+    "pruebas": benchmark_pruebas,
+}
+
+
+if __name__ == "__main__":
+    sys.exit(ejecutar_suite("generadores", BENCHMARKS))
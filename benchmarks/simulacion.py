@@ -0,0 +1,145 @@
+"""
+Benchmarks de las capas de la simulación: tiro, ronda, juego y simulación completa.
+
+Todas las cargas usan semillas fijas, por lo que dos ejecuciones sobre el mismo
+código simulan exactamente los mismos tiros.
+
+Uso:
+    python -m benchmarks.simulacion                       # compara con la referencia
+    python -m benchmarks.simulacion --guardar-referencia  # guarda una nueva referencia
+    python -m benchmarks.simulacion --escala 0.05 --solo tiro juego
+"""
+
+import sys
+import time
+from dataclasses import replace
+from typing import List
+
+from modelos.random_wrapper import RandomWrapper
+from simulacion.blanco_objetivo import Blanco, NivelRegistro
+from simulacion.contexto import ContextoSimulacion
+from simulacion.equipo import Equipo
+from simulacion.juego import Juego
+from simulacion.ronda import Enfrentamiento, Ronda
+from simulacion.simulador import ConfiguracionSimulacion, Simulador
+
+from .comun import ResultadoBenchmark, ejecutar_suite, medir, memoria_pico, resumir
+
+SEMILLA = 12345
+TIROS_POR_MUESTRA = 10_000
+RONDAS_POR_JUEGO = 10
+JUEGOS_SIMULACION = 20_000
+# tracemalloc hace unas 8 veces más lenta la simulación: el pico de memoria de la
+# simulación completa se mide sobre sus primeros juegos
+JUEGOS_MEMORIA = 500
+
+
+def _muestras(base: int, escala: float) -> int:
+    return max(5, int(base * escala))
+
+
+def _equipos(rng, jugadores_por_equipo: int = 5):
+    return (
+        Equipo("Equipo 1", jugadores_por_equipo, rng),
+        Equipo("Equipo 2", jugadores_por_equipo, rng),
+    )
+
+
+def benchmark_tiro(escala: float) -> List[ResultadoBenchmark]:
+    """Blanco.realizar_tiro sin registro y con el registro completo."""
+    resultados = []
+    for nivel in (NivelRegistro.NINGUNO, NivelRegistro.COMPLETO):
+
+        def preparar(nivel=nivel):
+            rng = RandomWrapper(SEMILLA)
+            return Blanco(rng, nivel_registro=nivel), _equipos(rng)[0].jugadores[0]
+
+        def ejecutar(estado):
+            blanco, jugador = estado
+            jugador.resistencia_actual = TIROS_POR_MUESTRA * blanco.costo_tiro
+            if blanco.registro is not None:
+                blanco.registro.reiniciar()
+            realizar_tiro = blanco.realizar_tiro
+            for _ in range(TIROS_POR_MUESTRA):
+                realizar_tiro(jugador)
+
+        resultados.append(
+            medir(f"tiro[{nivel}]", preparar, ejecutar, TIROS_POR_MUESTRA, _muestras(30, escala))
+        )
+    return resultados
+
+
+def benchmark_ronda(escala: float) -> List[ResultadoBenchmark]:
+    """Ronda.jugar con dos equipos de cinco jugadores; cada muestra es un juego de rondas."""
+
+    def preparar():
+        rng = RandomWrapper(SEMILLA)
+        equipo1, equipo2 = _equipos(rng)
+        enfrentamiento = Enfrentamiento(equipo1, equipo2)
+        blanco = Blanco(rng, nivel_registro=NivelRegistro.NINGUNO)
+        ronda = Ronda(1, equipo1, equipo2, blanco, rng, enfrentamiento=enfrentamiento)
+        return enfrentamiento, ronda
+
+    def ejecutar(estado):
+        enfrentamiento, ronda = estado
+        for jugador in enfrentamiento.jugadores:
+            jugador.resetear_jugador()
+            jugador.guardar_puntaje_total()
+        for numero in range(1, RONDAS_POR_JUEGO + 1):
+            ronda.reiniciar(numero)
+            ronda.jugar()
+
+    return [medir("ronda", preparar, ejecutar, RONDAS_POR_JUEGO, _muestras(300, escala))]
+
+
+def benchmark_juego(escala: float) -> List[ResultadoBenchmark]:
+    """Juego.jugar_juego_completo reutilizando el juego, como hace el Simulador."""
+
+    def preparar():
+        contexto = ContextoSimulacion(semilla=SEMILLA, nivel_registro=NivelRegistro.NINGUNO)
+        equipo1, equipo2 = _equipos(contexto.rng)
+        juego = Juego(equipo1, equipo2, num_rondas=RONDAS_POR_JUEGO, contexto=contexto)
+        return [juego, 0]
+
+    def ejecutar(estado):
+        juego, numero = estado
+        if numero:
+            juego.reiniciar(numero + 1)
+        juego.jugar_juego_completo()
+        estado[1] = numero + 1
+
+    return [medir("juego", preparar, ejecutar, 1, _muestras(500, escala))]
+
+
+def benchmark_simulacion(escala: float) -> List[ResultadoBenchmark]:
+    """
+    Simulación completa (por defecto, los 20.000 juegos de la configuración
+    estándar); la latencia por juego sale del tiempo entre llamadas de progreso y
+    el pico de memoria, de una corrida de a lo sumo JUEGOS_MEMORIA juegos.
+    """
+    config = ConfiguracionSimulacion(
+        num_juegos=max(1, int(JUEGOS_SIMULACION * escala)), semilla=SEMILLA
+    ).validar()
+    reloj = time.perf_counter
+    marcas = [reloj()]
+
+    def al_progresar(_completados, _total):
+        marcas.append(reloj())
+
+    Simulador(config).ejecutar(al_progresar)
+    duraciones = [fin - inicio for inicio, fin in zip(marcas, marcas[1:])]
+    config_memoria = replace(config, num_juegos=min(config.num_juegos, JUEGOS_MEMORIA))
+    pico = memoria_pico(lambda: Simulador(config_memoria), lambda simulador: simulador.ejecutar())
+    return [resumir(f"simulacion[{config.num_juegos}]", duraciones, 1, pico)]
+
+
+BENCHMARKS = {
+    "tiro": benchmark_tiro,
+    "ronda": benchmark_ronda,
+    "juego": benchmark_juego,
+    "simulacion": benchmark_simulacion,
+}
+
+
+if __name__ == "__main__":
+    sys.exit(ejecutar_suite("simulacion", BENCHMARKS))
@@ -7,12 +7,21 @@ from flask import (
     send_file,
     jsonify,
     request,
+    Response,
+    g,
 )
-from utils.graficas import generar_grafica_puntos_jugadores_response
-from simulacion.juego import Juego
-from simulacion.equipo import Equipo
-from numpy import int64  # Solo importamos el tipo específico que necesitamos
+from simulacion.cache import CacheResultados
+from simulacion.consultas import Consulta
+from simulacion.perfilado import perfilar_juegos
+from simulacion.simulador import ConfiguracionSimulacion, Simulador
+from simulacion.torneo import ConfiguracionTorneo, Torneo
+from simulacion.trabajos import GestorTrabajos
+from utils.metricas import TIPO_CONTENIDO, RegistroMetricas, memoria_residente
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import hmac
 import json
+import os
 import threading
 import time
 
@@ -20,66 +29,112 @@ app = Flask(__name__)
 app.secret_key = "tu_clave_secreta"
 
 # Variables globales
-equipo_1 = Equipo("Los tiguere", 5)
-equipo_2 = Equipo("Los jaguares", 5)
-todos_resultados = []  # Variable global para almacenar todos los resultados
+todos_resultados = []  # Resultados de la última simulación completada
+equipos_actuales = []  # Plantillas de los equipos de la última simulación completada
+resultados_lock = threading.Lock()
 
 JSON_FILE = "simulacion_data.json"
 
-# Variables para el progreso de la simulación
-simulacion_en_progreso = False
-progreso_actual = 0
-total_juegos_simulacion = 20000
-juegos_completados = 0
 
-
-def convert_numpy(obj):
+def publicar_resultados(resultados, equipos):
     """
-    Convierte objetos de NumPy a tipos nativos de Python para permitir la serialización JSON.
+    Publica los resultados de una simulación terminada como los resultados actuales.
 
-    Esta función es crucial porque los objetos NumPy (como np.int64) no son directamente
-    serializables a JSON. La función recorre recursivamente diccionarios y listas para
-    convertir todos los tipos NumPy encontrados.
+    Actualiza las variables globales consultadas por las vistas y sobrescribe
+    resultados_acumulados.json, que es el archivo que leen la tabla de juegos y
+    las gráficas.
 
     Args:
-        obj: El objeto a convertir (puede ser dict, list, np.int64 u otro tipo)
+        resultados (List[dict]): Resultados por juego de la simulación
+        equipos (List[dict]): Plantillas de los equipos participantes
+    """
+    global todos_resultados, equipos_actuales
+    # Si la carga inicial sigue en curso, se espera para que no pise estos resultados
+    obtener_resultados()
+    with resultados_lock:
+        todos_resultados = resultados
+        equipos_actuales = equipos
+        with open("resultados_acumulados.json", "w") as f:
+            json.dump(resultados, f)
 
-    Returns:
-        El objeto convertido a tipos nativos de Python
-    """
-    if isinstance(obj, dict):
-        return {k: convert_numpy(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_numpy(x) for x in obj]
-    elif isinstance(obj, int64):
-        return int(obj)
-    else:
-        return obj
+
+def _al_completar_trabajo(trabajo):
+    publicar_resultados(trabajo.resultados, trabajo.equipos)
+    print(
+        f"Trabajo {trabajo.trabajo_id} {trabajo.estado}: "
+        f"{len(trabajo.resultados)} juegos en "
+        f"{trabajo.finalizado - trabajo.iniciado:.2f} segundos"
+    )
+
+
+# Caché de simulaciones con semilla, indexada por configuración, equipos y blanco
+cache_resultados = CacheResultados("cache_resultados", max_bytes=512 * 1024 * 1024)
+
+# Cola de simulaciones: cada trabajo tiene su propio contexto y equipos
+gestor_trabajos = GestorTrabajos(
+    max_trabajadores=2, al_completar=_al_completar_trabajo, cache=cache_resultados
+)
+
+# Torneos: se ejecutan de a uno, y cada uno reparte sus partidos entre procesos
+torneos = OrderedDict()  # torneo_id -> Torneo, en orden de envío
+MAX_TORNEOS = 20
+ejecutor_torneos = ThreadPoolExecutor(max_workers=1, thread_name_prefix="torneo")
+
+
+# Carga diferida de resultados_acumulados.json: empieza con la primera petición
+resultados_cargados = threading.Event()
+_carga_resultados_iniciada = False
+_carga_resultados_lock = threading.Lock()
 
 
 def cargar_resultados():
     """
-    Carga los resultados previos de simulaciones desde un archivo JSON al iniciar la aplicación.
+    Carga los resultados previos de simulaciones desde un archivo JSON.
 
     Esta función permite la persistencia de datos entre ejecuciones de la aplicación,
     facilitando el análisis de simulaciones anteriores. Si el archivo no existe o está
     corrupto, inicializa una lista vacía para almacenar nuevos resultados.
 
     Utiliza la variable global todos_resultados como almacenamiento principal de los datos
-    de simulación en memoria durante la ejecución de la aplicación.
+    de simulación en memoria durante la ejecución de la aplicación. No se llama al
+    importar el módulo: la ejecuta iniciar_carga_resultados en un hilo, para que el
+    proceso arranque rápido aunque el archivo sea grande.
     """
     global todos_resultados
+    cargados = []
     try:
         with open("resultados_acumulados.json", "r") as f:
-            todos_resultados = json.load(f)
-        print(f"Cargados {len(todos_resultados)} juegos de resultados")
+            cargados = json.load(f)
+        print(f"Cargados {len(cargados)} juegos de resultados")
     except (FileNotFoundError, json.JSONDecodeError):
-        todos_resultados = []
         print("No se encontraron resultados previos o el archivo está corrupto")
+    finally:
+        # Ante un error inesperado quedan vacíos, en lugar de bloquear a quien espera
+        with resultados_lock:
+            todos_resultados = cargados
+        resultados_cargados.set()
+
 
+def iniciar_carga_resultados():
+    """Comienza a leer resultados_acumulados.json en un hilo, si aún no se hizo."""
+    global _carga_resultados_iniciada
+    with _carga_resultados_lock:
+        if _carga_resultados_iniciada:
+            return
+        _carga_resultados_iniciada = True
+    threading.Thread(target=cargar_resultados, name="carga-resultados", daemon=True).start()
 
-# Cargar resultados al iniciar
-cargar_resultados()
+
+def obtener_resultados():
+    """
+    Retorna los resultados actuales, esperando a que termine la carga inicial.
+
+    Returns:
+        List[dict]: Resultados por juego con el esquema de resultados_acumulados.json
+    """
+    iniciar_carga_resultados()
+    resultados_cargados.wait()
+    return todos_resultados
 
 
 # Función para buscar un juego por ID
@@ -97,8 +152,7 @@ def buscar_juego_por_id(juego_id):
     Returns:
         dict: Los datos del juego si se encuentra, None en caso contrario
     """
-    global todos_resultados
-    for juego in todos_resultados:
+    for juego in obtener_resultados():
         if str(juego["id_juego"]) == str(juego_id):
             return juego
     return None
@@ -109,225 +163,649 @@ def index():
     return render_template("index.html")
 
 
-@app.route("/iniciar_simulacion", methods=["POST"])
-def iniciar_simulacion():
-    global simulacion_en_progreso, progreso_actual, juegos_completados, total_juegos_simulacion
+def leer_configuracion(datos):
+    """
+    Construye la configuración de una simulación a partir de los datos de una petición.
+
+    Args:
+        datos (dict): Parámetros recibidos (JSON o formulario). Claves admitidas:
+            num_juegos, num_rondas, semilla, nivel_registro y, para el modo
+            secuencial, semi_ancho_objetivo, confianza y juegos_minimos; las
+            ausentes toman su valor por defecto
 
-    if simulacion_en_progreso:
-        return jsonify({"error": "Ya hay una simulación en progreso"}), 400
+    Returns:
+        ConfiguracionSimulacion: Configuración validada
 
-    # Resetear variables de progreso
-    progreso_actual = 0
-    juegos_completados = 0
+    Raises:
+        ValueError: Si algún parámetro no tiene el tipo esperado o está fuera de rango
+    """
+    campos = {
+        "num_juegos": int,
+        "num_rondas": int,
+        "semilla": int,
+        "semi_ancho_objetivo": float,
+        "confianza": float,
+        "juegos_minimos": int,
+        "nivel_registro": str,
+    }
+    config = ConfiguracionSimulacion()
+    for campo, tipo in campos.items():
+        valor = datos.get(campo)
+        if valor is None or valor == "":
+            continue
+        try:
+            setattr(config, campo, tipo(valor))
+        except (TypeError, ValueError):
+            raise ValueError(f"{campo} debe ser un número")
+    return config.validar()
 
-    # Iniciar la simulación en un hilo separado
-    thread = threading.Thread(target=ejecutar_simulacion)
-    thread.daemon = True
-    thread.start()
 
-    return jsonify({"status": "Simulación iniciada correctamente"})
+@app.route("/iniciar_simulacion", methods=["POST"])
+def iniciar_simulacion():
+    """
+    Encola una nueva simulación y retorna el identificador del trabajo creado.
+
+    Varias simulaciones pueden ejecutarse a la vez; cada una usa sus propios
+    equipos, generador y contadores. El progreso se consulta en
+    /progreso_simulacion o en /trabajos/<trabajo_id>.
+
+    Args (JSON o formulario, todos opcionales):
+        num_juegos: Cantidad de juegos a simular (por defecto 20000)
+        num_rondas: Rondas por juego (por defecto 10)
+        semilla: Semilla del generador para obtener resultados reproducibles
+        semi_ancho_objetivo: Activa el modo secuencial; la simulación se detiene
+            cuando todos los intervalos de confianza tienen este semi-ancho
+        confianza: Nivel de confianza del modo secuencial (por defecto 0.95)
+        juegos_minimos: Juegos mínimos antes de evaluar la convergencia
+        nivel_registro: "ninguno", "puntajes" o "completo"; con "completo" el
+            trabajo ofrece mapas de calor en /trabajos/<trabajo_id>/tiros/...
+
+    Returns:
+        Respuesta JSON con el identificador del trabajo, o un error 400 si los
+        parámetros no son válidos
+    """
+    datos = request.get_json(silent=True) or request.form
+    try:
+        config = leer_configuracion(datos)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    trabajo = gestor_trabajos.enviar(config)
+    return jsonify(
+        {
+            "status": "Simulación iniciada correctamente",
+            "trabajo_id": trabajo.trabajo_id,
+        }
+    )
 
 
 @app.route('/progreso_simulacion', methods=['GET'])
 def progreso_simulacion():
-    global progreso_actual, juegos_completados, total_juegos_simulacion
-    
+    """
+    Retorna el progreso de un trabajo de simulación.
+
+    Args (via request.args):
+        trabajo_id: Identificador del trabajo (opcional, por defecto el más reciente)
+    """
+    trabajo_id = request.args.get("trabajo_id")
+    trabajo = (
+        gestor_trabajos.obtener(trabajo_id) if trabajo_id else gestor_trabajos.ultimo()
+    )
+    if trabajo is None:
+        return jsonify({"progreso": 0, "juegos_completados": 0, "total_juegos": 0})
+
     return jsonify({
-        "progreso": progreso_actual,
-        "juegos_completados": juegos_completados,
-        "total_juegos": total_juegos_simulacion
+        "trabajo_id": trabajo.trabajo_id,
+        "estado": trabajo.estado,
+        "progreso": trabajo.progreso,
+        "juegos_completados": trabajo.juegos_completados,
+        "total_juegos": trabajo.total_juegos
     })
 
-def ejecutar_simulacion():
+
+@app.route("/trabajos", methods=["GET"])
+def listar_trabajos():
+    """Endpoint API que lista el estado de todos los trabajos de simulación."""
+    return jsonify([trabajo.resumen() for trabajo in gestor_trabajos.listar()])
+
+
+@app.route("/trabajos/<trabajo_id>", methods=["GET"])
+def estado_trabajo(trabajo_id):
+    """
+    Endpoint API que retorna el estado de un trabajo de simulación.
+
+    Returns:
+        Respuesta JSON con el resumen del trabajo o un error 404
+    """
+    trabajo = gestor_trabajos.obtener(trabajo_id)
+    if trabajo is None:
+        return jsonify({"error": "Trabajo no encontrado"}), 404
+    return jsonify(trabajo.resumen())
+
+
+@app.route("/trabajos/<trabajo_id>/cancelar", methods=["POST"])
+def cancelar_trabajo(trabajo_id):
+    """
+    Cancela un trabajo de simulación.
+
+    Si el trabajo está en ejecución, se detiene al terminar el juego en curso y
+    sus resultados parciales quedan disponibles en /trabajos/<trabajo_id>/resultados.
+
+    Returns:
+        Respuesta JSON con el resumen del trabajo, 404 si no existe o 409 si ya
+        había terminado
+    """
+    trabajo = gestor_trabajos.obtener(trabajo_id)
+    if trabajo is None:
+        return jsonify({"error": "Trabajo no encontrado"}), 404
+    if not gestor_trabajos.cancelar(trabajo_id):
+        return jsonify({"error": "El trabajo ya había terminado"}), 409
+    return jsonify(trabajo.resumen())
+
+
+@app.route("/cancelar_simulacion", methods=["POST"])
+def cancelar_simulacion():
+    """
+    Cancela el trabajo más reciente (o el indicado con trabajo_id).
+
+    Args (via request.args):
+        trabajo_id: Identificador del trabajo (opcional)
     """
-    Función que ejecuta la simulación en segundo plano, actualizando el progreso.
+    trabajo_id = request.args.get("trabajo_id")
+    trabajo = (
+        gestor_trabajos.obtener(trabajo_id) if trabajo_id else gestor_trabajos.ultimo()
+    )
+    if trabajo is None:
+        return jsonify({"error": "Trabajo no encontrado"}), 404
+    return cancelar_trabajo(trabajo.trabajo_id)
+
+
+@app.route("/trabajos/<trabajo_id>/resultados", methods=["GET"])
+def resultados_trabajo(trabajo_id):
     """
-    global simulacion_en_progreso, progreso_actual, juegos_completados
-    global equipo_1, equipo_2, todos_resultados, total_juegos_simulacion
-    
+    Retorna los resultados por juego de un trabajo terminado.
+
+    Returns:
+        Respuesta JSON con la lista de resultados o un error 404 si el trabajo
+        no existe o aún no tiene resultados
+    """
+    resultados_guardados = gestor_trabajos.resultados(trabajo_id)
+    if resultados_guardados is None:
+        return jsonify({"error": "Resultados no disponibles"}), 404
+    return jsonify(resultados_guardados)
+
+
+@app.route("/trabajos/<trabajo_id>/tiros/mapa_calor", methods=["GET"])
+def mapa_calor_trabajo(trabajo_id):
+    """
+    Retorna el histograma bidimensional de los impactos de un trabajo terminado.
+
+    Args (via request.args):
+        celdas: Celdas por lado del mapa (por defecto 60; debe dividir a 300)
+        genero: 'M' o 'F' para filtrar por género (opcional)
+
+    Returns:
+        Respuesta JSON con los bordes y conteos del mapa, 404 si el trabajo no
+        registró tiros o no ha terminado, o 400 si los parámetros no son válidos
+    """
+    estadisticas = gestor_trabajos.estadisticas_tiros(trabajo_id)
+    if estadisticas is None:
+        return jsonify({"error": "Estadísticas de tiros no disponibles"}), 404
     try:
-        simulacion_en_progreso = True
-        tiempo_inicio = time.time()
-        print("Iniciando simulación en segundo plano...")
-        
-        # Reiniciar la lista de resultados
-        todos_resultados = []
-        
-        for i in range(total_juegos_simulacion):
-            if i % 1000 == 0:
-                print(f"Progreso: {i}/{total_juegos_simulacion} juegos ({i/total_juegos_simulacion*100:.1f}%)")
-            
-            juego = Juego(equipo_1, equipo_2, num_rondas=10, juego_actual=i + 1)
-            juego.jugar_juego_completo()
-            
-            resultado_juego = {
-                "id_juego": juego.id_juego,
-                "jugador_con_mas_suerte": (
-                    {
-                        "nombre": juego.jugador_con_mas_suerte.nombre,
-                        "user_id": juego.jugador_con_mas_suerte.user_id,
-                        "suerte": juego.jugador_con_mas_suerte.suerte,
-                    }
-                    if isinstance(juego.jugador_con_mas_suerte, object)
-                    and hasattr(juego.jugador_con_mas_suerte, "nombre")
-                    else "No determinado"
-                ),
-                "jugador_con_mas_experiencia": (
-                    {
-                        "nombre": juego.jugador_con_mas_experiencia.nombre,
-                        "user_id": juego.jugador_con_mas_experiencia.user_id,
-                        "experiencia": juego.experiencia_maxima,
-                    }
-                    if isinstance(juego.jugador_con_mas_experiencia, object)
-                    and hasattr(juego.jugador_con_mas_experiencia, "nombre")
-                    else "No determinado"
-                ),
-                "genero_con_mas_victorias": juego.genero_con_mas_victorias,
-                "generos_victorias_totales": {
-                    "M": juego.victorias_por_genero["M"],
-                    "F": juego.victorias_por_genero["F"],
-                },
-                "generos_victorias_globales": {
-                    "M": Juego.generos_victorias_totales["M"],
-                    "F": Juego.generos_victorias_totales["F"],
-                },
-                "equipo_ganador": (
-                    {
-                        "nombre": juego.equipo_ganador_juego.nombre,
-                        "puntaje": juego.puntaje_ganador,
-                    }
-                    if juego.equipo_ganador_juego is not None
-                    else {"nombre": "Empate", "puntaje": 0}
-                ),
-                "numero_juego": juego.juego_actual,
-                "equipo_1": {
-                    "nombre": juego.equipo1.nombre,
-                    "rondas_ganadas": juego.equipo1.rondas_ganadas,
-                    "puntaje_total": juego.puntaje_equipo1_final,
-                },
-                "equipo_2": {
-                    "nombre": juego.equipo2.nombre,
-                    "rondas_ganadas": juego.equipo2.rondas_ganadas,
-                    "puntaje_total": juego.puntaje_equipo2_final,
-                },
-            }
-            
-            todos_resultados.append(convert_numpy(resultado_juego))
-            
-            # Actualizar el progreso
-            juegos_completados = i + 1
-            progreso_actual = int((i + 1) / total_juegos_simulacion * 100)
-        
-        # Escribir resultados al archivo
-        with open("resultados_acumulados.json", "w") as f:
-            json.dump(todos_resultados, f)
-        
-        tiempo_total = time.time() - tiempo_inicio
-        print(f"Simulación completada en {tiempo_total:.2f} segundos")
-        
-    except Exception as e:
-        print(f"Error en la simulación: {str(e)}")
-    finally:
-        simulacion_en_progreso = False
+        celdas = int(request.args.get("celdas", 60))
+        return jsonify(estadisticas.mapa_calor(celdas, request.args.get("genero") or None))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
-@app.route("/jugar", methods=["POST"])
-def jugar():
+
+@app.route("/trabajos/<trabajo_id>/tiros/zonas", methods=["GET"])
+def zonas_trabajo(trabajo_id):
     """
-    Redirige a la página de resultados para un juego específico identificado por su ID.
+    Retorna las frecuencias de zonas por género y por jugador de un trabajo terminado.
+
+    Returns:
+        Respuesta JSON con las tablas de frecuencias o un error 404 si el trabajo
+        no registró tiros o no ha terminado
+    """
+    estadisticas = gestor_trabajos.estadisticas_tiros(trabajo_id)
+    if estadisticas is None:
+        return jsonify({"error": "Estadísticas de tiros no disponibles"}), 404
+    return jsonify(estadisticas.frecuencias_zonas())
 
-    Esta función es un punto de entrada para la consulta de simulaciones específicas,
-    simplificando la navegación y búsqueda de resultados históricos. Recibe el ID
-    como parámetro GET y redirige a la función resultados con ese parámetro.
+
+@app.route("/trabajos/<trabajo_id>/ratings", methods=["GET"])
+def ratings_trabajo(trabajo_id):
+    """
+    Retorna el Elo de los equipos y el rendimiento de los jugadores de un trabajo.
+
+    Puede consultarse mientras el trabajo se ejecuta: los ratings se actualizan
+    al terminar cada juego.
 
     Args (via request.args):
-        id: El identificador único del juego a buscar
+        limite: Máximo de equipos y de jugadores a incluir (opcional)
 
     Returns:
-        Redirección a la página de resultados con el ID del juego especificado
+        Respuesta JSON con los ratings o un error 404 si el trabajo no existe o
+        aún no ha iniciado
     """
+    trabajo = gestor_trabajos.obtener(trabajo_id)
+    if trabajo is None or trabajo.ratings is None:
+        return jsonify({"error": "Ratings no disponibles"}), 404
+    limite = request.args.get("limite", type=int)
+    return jsonify(trabajo.ratings.a_dict(max(limite, 0) if limite is not None else None))
+
+
+@app.route("/trabajos/<trabajo_id>/consulta", methods=["POST"])
+def consultar_trabajo(trabajo_id):
+    """
+    Filtra, agrupa y agrega los resultados de un trabajo terminado sobre su archivo
+    columnar, sin cargarlos en memoria como lista de diccionarios.
+
+    Args (via JSON):
+        filtros: Lista de [columna, operador, valor] (opcional)
+        agrupar: Lista de columnas o {"columna", "ancho"} (opcional)
+        agregados: Objeto nombre -> [función, argumentos...] (por defecto, el conteo)
+
+    Returns:
+        Respuesta JSON con los grupos y sus agregados (ver Consulta.ejecutar), 404 si
+        el trabajo no existe o no ha terminado, o 400 si la consulta no es válida
+    """
+    archivo = gestor_trabajos.archivo_columnar(trabajo_id)
+    if archivo is None:
+        return jsonify({"error": "Resultados no disponibles"}), 404
+    try:
+        consulta = Consulta.desde_dict(request.get_json(silent=True) or {})
+        return jsonify(consulta.ejecutar(archivo))
+    except KeyError as e:
+        return jsonify({"error": e.args[0]}), 400
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+
+def leer_configuracion_torneo(datos):
+    """
+    Construye la configuración de un torneo a partir de los datos de una petición.
+
+    Args:
+        datos (dict): Parámetros recibidos (JSON o formulario). Claves admitidas:
+            num_equipos, jugadores_por_equipo, formato, juegos_por_partido,
+            num_rondas y semilla; las ausentes toman su valor por defecto
+
+    Returns:
+        ConfiguracionTorneo: Configuración validada
+
+    Raises:
+        ValueError: Si algún parámetro no tiene el tipo esperado o está fuera de rango
+    """
+    campos = {
+        "num_equipos": int,
+        "jugadores_por_equipo": int,
+        "formato": str,
+        "juegos_por_partido": int,
+        "num_rondas": int,
+        "semilla": int,
+    }
+    config = ConfiguracionTorneo()
+    for campo, tipo in campos.items():
+        valor = datos.get(campo)
+        if valor is None or valor == "":
+            continue
+        try:
+            setattr(config, campo, tipo(valor))
+        except (TypeError, ValueError):
+            raise ValueError(f"{campo} debe ser un número")
+    return config.validar()
+
+
+@app.route("/torneos", methods=["POST"])
+def iniciar_torneo():
+    """
+    Encola un torneo entre muchos equipos y retorna su identificador.
+
+    La clasificación se consulta en /torneos/<torneo_id> mientras el torneo avanza.
+
+    Returns:
+        Respuesta JSON con el identificador del torneo, o un error 400 si los
+        parámetros no son válidos
+    """
+    datos = request.get_json(silent=True) or request.form
+    try:
+        torneo = Torneo(leer_configuracion_torneo(datos))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    torneos[torneo.torneo_id] = torneo
+    # Se descartan los torneos terminados más antiguos
+    terminados = [t for t in torneos.values() if t.finalizado is not None]
+    for antiguo in terminados[: max(0, len(torneos) - MAX_TORNEOS)]:
+        torneos.pop(antiguo.torneo_id, None)
+    ejecutor_torneos.submit(torneo.ejecutar)
+    return jsonify({"status": "Torneo iniciado correctamente", "torneo_id": torneo.torneo_id})
+
+
+@app.route("/torneos/<torneo_id>", methods=["GET"])
+def estado_torneo(torneo_id):
+    """
+    Retorna el progreso y la clasificación actual de un torneo.
+
+    Args (via request.args):
+        limite: Máximo de equipos de la clasificación a incluir (opcional)
+        plantillas: Si es "1", incluye las plantillas de los equipos
+
+    Returns:
+        Respuesta JSON con el resumen del torneo o un error 404
+    """
+    torneo = torneos.get(torneo_id)
+    if torneo is None:
+        return jsonify({"error": "Torneo no encontrado"}), 404
+    resumen = torneo.resumen(incluir_plantillas=request.args.get("plantillas") == "1")
+    limite = request.args.get("limite", type=int)
+    if limite is not None:
+        resumen["clasificacion"] = resumen["clasificacion"][: max(limite, 0)]
+    return jsonify(resumen)
+
+
+@app.route("/torneos/<torneo_id>/ratings", methods=["GET"])
+def ratings_torneo(torneo_id):
+    """
+    Retorna el Elo de los equipos y el rendimiento de los jugadores de un torneo,
+    actualizados con cada juego terminado.
+
+    Args (via request.args):
+        limite: Máximo de equipos y de jugadores a incluir (opcional)
+
+    Returns:
+        Respuesta JSON con los ratings o un error 404
+    """
+    torneo = torneos.get(torneo_id)
+    if torneo is None:
+        return jsonify({"error": "Torneo no encontrado"}), 404
+    limite = request.args.get("limite", type=int)
+    return jsonify(torneo.ratings.a_dict(max(limite, 0) if limite is not None else None))
+
+
+@app.route("/torneos/<torneo_id>/cancelar", methods=["POST"])
+def cancelar_torneo(torneo_id):
+    """
+    Cancela un torneo; los partidos en curso terminan y la tabla queda parcial.
+
+    Returns:
+        Respuesta JSON con el resumen del torneo o un error 404
+    """
+    torneo = torneos.get(torneo_id)
+    if torneo is None:
+        return jsonify({"error": "Torneo no encontrado"}), 404
+    torneo.cancelacion.set()
+    return jsonify(torneo.resumen())
+
+
+@app.route("/cache_resultados", methods=["GET"])
+def estado_cache_resultados():
+    """Endpoint API con el número de entradas, tamaño y aciertos de la caché."""
+    return jsonify(cache_resultados.estadisticas())
+
+
+@app.route("/cache_resultados/limpiar", methods=["POST"])
+def limpiar_cache_resultados():
+    """Elimina todas las entradas de la caché de resultados."""
+    cache_resultados.limpiar()
+    return jsonify(cache_resultados.estadisticas())
+
+
+# Juegos que admite una petición de perfilado (se ejecutan durante la petición)
+MAX_JUEGOS_PERFILADO = 300
+
+# Variable de entorno con el token que habilita /admin/perfilar
+VARIABLE_TOKEN_ADMIN = "ARQUERIA_TOKEN_ADMIN"
+
+
+def token_admin_valido():
+    """
+    Verifica el encabezado X-Token-Admin de la petición contra ARQUERIA_TOKEN_ADMIN.
+
+    Returns:
+        None si el token es válido, o la respuesta de error: 404 si no hay token
+        configurado (los endpoints de administración quedan deshabilitados) o 403
+        si el token no coincide
+    """
+    token = os.environ.get(VARIABLE_TOKEN_ADMIN)
+    if not token:
+        return jsonify({"error": "No encontrado"}), 404
+    recibido = request.headers.get("X-Token-Admin", "")
+    if not hmac.compare_digest(recibido.encode("utf-8"), token.encode("utf-8")):
+        return jsonify({"error": "Token de administración inválido"}), 403
+    return None
+
+
+@app.route("/admin/perfilar", methods=["POST"])
+def perfilar():
+    """
+    Simula unos pocos juegos bajo cProfile y muestreo de pilas, y retorna dónde
+    se va el tiempo.
+
+    Requiere el encabezado X-Token-Admin con el valor de ARQUERIA_TOKEN_ADMIN. Los
+    juegos se simulan durante la petición, de a un perfilado a la vez.
+
+    Args (JSON o formulario, todos opcionales):
+        num_juegos: Juegos a simular (por defecto 100, como máximo MAX_JUEGOS_PERFILADO)
+        num_rondas, semilla, nivel_registro: Como en /iniciar_simulacion
+        top: Cantidad de funciones a retornar (por defecto 25)
+        orden: "cumulative" (por defecto), "tottime" o "calls"
+        formato: "colapsado" para descargar solo las pilas en formato de flamegraph
+
+    Returns:
+        Respuesta JSON con las funciones más costosas y las pilas colapsadas, texto
+        plano con las pilas si formato es "colapsado", un error 400 si los
+        parámetros no son válidos, 403 o 404 según token_admin_valido, o 409 si ya
+        hay un perfilado en curso
+    """
+    error = token_admin_valido()
+    if error is not None:
+        return error
+    datos = dict(request.get_json(silent=True) or request.form.to_dict())
+    datos.setdefault("num_juegos", 100)
+    try:
+        config = leer_configuracion(datos)
+        if config.num_juegos > MAX_JUEGOS_PERFILADO:
+            raise ValueError(f"num_juegos debe ser a lo sumo {MAX_JUEGOS_PERFILADO}")
+        perfil = perfilar_juegos(
+            config,
+            num_juegos=config.num_juegos,
+            top=int(datos.get("top", 25)),
+            orden=datos.get("orden", "cumulative"),
+            esperar=False,
+        )
+    except (TypeError, ValueError) as e:
+        return jsonify({"error": str(e)}), 400
+    except RuntimeError as e:
+        return jsonify({"error": str(e)}), 409
+    if datos.get("formato") == "colapsado":
+        return Response(
+            perfil["pilas_colapsadas"],
+            mimetype="text/plain",
+            headers={"Content-Disposition": "attachment; filename=pilas_colapsadas.txt"},
+        )
+    return jsonify(perfil)
+
+
+# Métricas para /metrics (formato de texto de Prometheus)
+metricas = RegistroMetricas()
+metrica_latencia = metricas.histograma(
+    "arqueria_http_peticion_segundos",
+    "Duración de las peticiones HTTP por ruta, método y código de estado",
+    ("ruta", "metodo", "codigo"),
+)
+metrica_juegos = metricas.contador(
+    "arqueria_juegos_simulados_total", "Juegos simulados por los trabajos de simulación"
+)
+metrica_rondas = metricas.contador(
+    "arqueria_rondas_simuladas_total", "Rondas simuladas por los trabajos de simulación"
+)
+metrica_tiros = metricas.contador(
+    "arqueria_tiros_simulados_total",
+    "Tiros de turno y tiros extra simulados por los trabajos de simulación",
+)
+metrica_fases = metricas.contador(
+    "arqueria_simulacion_fase_segundos_total",
+    "Tiempo acumulado en cada fase de la simulación de un juego",
+    ("fase",),
+)
+metrica_memoria = metricas.medidor(
+    "arqueria_memoria_residente_bytes", "Memoria residente (RSS) del proceso"
+)
+metrica_resultados = metricas.medidor(
+    "arqueria_resultados_juegos", "Juegos de la última simulación publicada"
+)
+metrica_resultados_bytes = metricas.medidor(
+    "arqueria_resultados_archivo_bytes", "Tamaño de resultados_acumulados.json"
+)
+metrica_cache_bytes = metricas.medidor(
+    "arqueria_cache_resultados_bytes", "Bytes ocupados por la caché de resultados"
+)
+metrica_cache_entradas = metricas.medidor(
+    "arqueria_cache_resultados_entradas", "Entradas de la caché de resultados"
+)
+metrica_trabajos = metricas.medidor(
+    "arqueria_trabajos", "Trabajos de simulación conocidos por estado", ("estado",)
+)
+metrica_progreso = metricas.medidor(
+    "arqueria_trabajo_juegos_completados",
+    "Juegos completados por cada trabajo pendiente o en ejecución",
+    ("trabajo_id",),
+)
+metrica_torneos = metricas.medidor(
+    "arqueria_torneos", "Torneos conocidos por estado", ("estado",)
+)
+
+
+@metricas.recolector
+def _recolectar_metricas():
+    contadores = gestor_trabajos.contadores()
+    metrica_juegos.fijar(contadores.juegos)
+    metrica_rondas.fijar(contadores.rondas)
+    metrica_tiros.fijar(contadores.tiros)
+    for fase, segundos in contadores.segundos.items():
+        metrica_fases.fijar(segundos, fase=fase)
+
+    rss = memoria_residente()
+    if rss is not None:
+        metrica_memoria.fijar(rss)
+    metrica_resultados.fijar(len(todos_resultados))
+    try:
+        metrica_resultados_bytes.fijar(os.path.getsize("resultados_acumulados.json"))
+    except OSError:
+        metrica_resultados_bytes.fijar(0)
+    cache = cache_resultados.estadisticas()
+    metrica_cache_bytes.fijar(cache["bytes"])
+    metrica_cache_entradas.fijar(cache["entradas"])
+
+    for estado, cantidad in gestor_trabajos.conteo_por_estado().items():
+        metrica_trabajos.fijar(cantidad, estado=estado)
+    # Solo los trabajos activos, para que las series no crezcan sin límite
+    metrica_progreso.limpiar()
+    for trabajo in gestor_trabajos.listar():
+        if not trabajo.terminado:
+            metrica_progreso.fijar(trabajo.juegos_completados, trabajo_id=trabajo.trabajo_id)
+    metrica_torneos.limpiar()
+    for estado, cantidad in Counter(t.estado for t in list(torneos.values())).items():
+        metrica_torneos.fijar(cantidad, estado=estado)
+
+
+@app.before_request
+def _iniciar_medicion():
+    g.inicio_peticion = time.perf_counter()
+    iniciar_carga_resultados()
+
+
+@app.after_request
+def _registrar_latencia(respuesta):
+    inicio = g.pop("inicio_peticion", None)
+    if inicio is not None:
+        # La regla ("/trabajos/<trabajo_id>") y no la URL, para acotar las series
+        regla = request.url_rule.rule if request.url_rule is not None else "sin_ruta"
+        metrica_latencia.observar(
+            time.perf_counter() - inicio,
+            ruta=regla,
+            metodo=request.method,
+            codigo=respuesta.status_code,
+        )
+    return respuesta
+
+
+@app.route("/listo", methods=["GET"])
+def listo():
+    """
+    Endpoint de disponibilidad (readiness) para balanceadores y orquestadores.
+
+    El proceso arranca sin leer resultados_acumulados.json; la primera petición,
+    incluida esta, inicia la carga en segundo plano.
+
+    Returns:
+        Respuesta JSON con 200 cuando los resultados están cargados, o 503 mientras
+        la carga sigue en curso
+    """
+    if not resultados_cargados.is_set():
+        return jsonify({"listo": False}), 503
+    return jsonify({"listo": True, "juegos": len(todos_resultados)})
+
+
+@app.route("/metrics", methods=["GET"])
+def exponer_metricas():
+    """
+    Métricas de la aplicación en el formato de texto de Prometheus: juegos, rondas
+    y tiros simulados, tiempo por fase de la simulación, latencia por ruta, memoria,
+    tamaño de los resultados y de la caché, y estado de trabajos y torneos.
+
+    Los totales son contadores; las tasas por segundo se calculan en Prometheus,
+    por ejemplo rate(arqueria_juegos_simulados_total[1m]).
+    """
+    return Response(metricas.exponer(), content_type=TIPO_CONTENIDO)
+
+
+# Juegos que admite /jugar (se simulan durante la petición, sin progreso ni cancelación)
+MAX_JUEGOS_SINCRONOS = ConfiguracionSimulacion.num_juegos
+
+
+@app.route("/jugar", methods=["POST"])
+def jugar():
+    """
+    Ejecuta una simulación completa de forma síncrona y redirige a los resultados.
+
+    A diferencia de /iniciar_simulacion, la respuesta se envía cuando la
+    simulación termina. Los resultados se publican como resultados actuales.
+    Como la simulación ocupa el hilo de la petición, admite a lo sumo
+    MAX_JUEGOS_SINCRONOS juegos; las corridas más largas van por /iniciar_simulacion.
+
+    Returns:
+        Redirección a la página de resultados, o un error 400 si los parámetros no
+        son válidos o piden más de MAX_JUEGOS_SINCRONOS juegos
+    """
+    try:
+        config = leer_configuracion(request.form)
+        if config.num_juegos > MAX_JUEGOS_SINCRONOS:
+            raise ValueError(
+                f"num_juegos debe ser a lo sumo {MAX_JUEGOS_SINCRONOS} en /jugar; "
+                "use /iniciar_simulacion para corridas más largas"
+            )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
     tiempo_inicio = time.time()
     print("Iniciando simulación...")
 
-    total_juegos = 20000
-    global equipo_1, equipo_2, todos_resultados
-
-    # Reiniciar la lista de resultados
-    todos_resultados = []
-    ultimo_juego = None
-
-    for i in range(total_juegos):
-        if i % 1000 == 0:
-            print(f"Progreso: {i}/{total_juegos} juegos ({i/total_juegos*100:.1f}%)")
-
-        juego = Juego(equipo_1, equipo_2, num_rondas=10, juego_actual=i + 1)
-        juego.jugar_juego_completo()
-
-        resultado_juego = {
-            "id_juego": juego.id_juego,
-            "jugador_con_mas_suerte": (
-                {
-                    "nombre": juego.jugador_con_mas_suerte.nombre,
-                    "user_id": juego.jugador_con_mas_suerte.user_id,
-                    "suerte": juego.jugador_con_mas_suerte.suerte,
-                }
-                if isinstance(juego.jugador_con_mas_suerte, object)
-                and hasattr(juego.jugador_con_mas_suerte, "nombre")
-                else "No determinado"
-            ),
-            "jugador_con_mas_experiencia": (
-                {
-                    "nombre": juego.jugador_con_mas_experiencia.nombre,
-                    "user_id": juego.jugador_con_mas_experiencia.user_id,
-                    "experiencia": juego.experiencia_maxima,
-                }
-                if isinstance(juego.jugador_con_mas_experiencia, object)
-                and hasattr(juego.jugador_con_mas_experiencia, "nombre")
-                else "No determinado"
-            ),
-            "genero_con_mas_victorias": juego.genero_con_mas_victorias,
-            "generos_victorias_totales": {
-                "M": juego.victorias_por_genero["M"],
-                "F": juego.victorias_por_genero["F"],
-            },
-            "generos_victorias_globales": {
-                "M": Juego.generos_victorias_totales["M"],
-                "F": Juego.generos_victorias_totales["F"],
-            },
-            "equipo_ganador": (
-                {
-                    "nombre": juego.equipo_ganador_juego.nombre,
-                    "puntaje": juego.puntaje_ganador,
-                }
-                if juego.equipo_ganador_juego is not None
-                else {"nombre": "Empate", "puntaje": 0}
-            ),
-            "numero_juego": juego.juego_actual,
-            "equipo_1": {
-                "nombre": juego.equipo1.nombre,
-                "rondas_ganadas": juego.equipo1.rondas_ganadas,
-                "puntaje_total": juego.puntaje_equipo1_final,
-            },
-            "equipo_2": {
-                "nombre": juego.equipo2.nombre,
-                "rondas_ganadas": juego.equipo2.rondas_ganadas,
-                "puntaje_total": juego.puntaje_equipo2_final,
-            },
-        }
+    simulador = Simulador(config)
 
-        todos_resultados.append(convert_numpy(resultado_juego))
+    def al_progresar(completados, total):
+        if completados % 1000 == 0:
+            print(f"Progreso: {completados}/{total} juegos ({completados/total*100:.1f}%)")
 
-        # Almacenar información del último juego
-        if i == total_juegos - 1:
-            ultimo_juego = resultado_juego
-
-    # Escribir resultados al archivo
-    with open("resultados_acumulados.json", "w") as f:
-        json.dump(todos_resultados, f)
+    resultados_simulacion = simulador.ejecutar(al_progresar)
+    publicar_resultados(resultados_simulacion, simulador.equipos())
 
     tiempo_total = time.time() - tiempo_inicio
     print(f"Simulación completada en {tiempo_total:.2f} segundos")
 
-    session["game_id"] = juego.id_juego
+    if resultados_simulacion:
+        session["game_id"] = resultados_simulacion[-1]["id_juego"]
 
     # Importante: devolver una respuesta válida
     return redirect(url_for("resultados"))
@@ -357,15 +835,13 @@ def resultados():
         Renderización de la plantilla resultados.html con los datos procesados
     """
     game_id = session.get("game_id", None)
-    global equipo_1, equipo_2, todos_resultados
 
     # Verificar si se solicita un juego específico
     juego_id_solicitado = request.args.get("juego_id", None)
 
     try:
-        # Si no hay resultados en memoria, cargarlos del archivo
-        if not todos_resultados:
-            cargar_resultados()
+        # Espera a la carga inicial del archivo si aún no terminó
+        todos_resultados = obtener_resultados()
 
         # Determinar qué juego mostrar
         if juego_id_solicitado:
@@ -390,10 +866,12 @@ def resultados():
                     "puntaje_total": ultimo_juego["equipo_1"]["puntaje_total"],
                     "jugadores": [
                         {
-                            "nombre": jugador.nombre,
-                            "genero": jugador.genero,
+                            "nombre": jugador["nombre"],
+                            "genero": jugador["genero"],
                         }
-                        for jugador in equipo_1.jugadores
+                        for jugador in (
+                            equipos_actuales[0]["jugadores"] if equipos_actuales else []
+                        )
                     ],
                 },
                 "equipo2": {
@@ -402,10 +880,12 @@ def resultados():
                     "puntaje_total": ultimo_juego["equipo_2"]["puntaje_total"],
                     "jugadores": [
                         {
-                            "nombre": jugador.nombre,
-                            "genero": jugador.genero,
+                            "nombre": jugador["nombre"],
+                            "genero": jugador["genero"],
                         }
-                        for jugador in equipo_2.jugadores
+                        for jugador in (
+                            equipos_actuales[1]["jugadores"] if equipos_actuales else []
+                        )
                     ],
                 },
                 "historial_puntajes": [],  # No tenemos historial de rondas detallado
@@ -417,10 +897,9 @@ def resultados():
                 "total_juegos": len(todos_resultados),
                 "numero_juego": ultimo_juego["numero_juego"],
                 "generos_victorias_totales": ultimo_juego["generos_victorias_totales"],
-                "generos_victorias_globales": {
-                    "M": Juego.generos_victorias_totales["M"],
-                    "F": Juego.generos_victorias_totales["F"],
-                },
+                "generos_victorias_globales": todos_resultados[-1][
+                    "generos_victorias_globales"
+                ],
             }
 
             resultado_final = f"Simulación completada con éxito: {len(todos_resultados)} juegos simulados"
@@ -514,6 +993,9 @@ def graficas():
     Returns:
         Renderización de la plantilla graficas.html con la imagen de la gráfica
     """
+    # matplotlib tarda en importarse: solo se carga cuando alguien pide una gráfica
+    from utils.graficas import generar_grafica_puntos_jugadores_response
+
     grafica_img = generar_grafica_puntos_jugadores_response()
     return render_template("graficas.html", grafica_img=grafica_img)
 
@@ -525,8 +1007,7 @@ def todos_juegos():
     Devuelve una lista de diccionarios con información sobre cada juego,
     incluyendo jugadores, puntajes y estadísticas.
     """
-    global todos_resultados
-    return jsonify(todos_resultados)
+    return jsonify(obtener_resultados())
 
 
 @app.route("/todos_juegos/<int:id>", methods=["GET"])
@@ -546,8 +1027,7 @@ def juego_por_id(id):
     Returns:
         Respuesta JSON con los datos del juego o un mensaje de error con código 404
     """
-    global todos_resultados
-    juego = next((j for j in todos_resultados if j["numero_juego"] == id), None)
+    juego = next((j for j in obtener_resultados() if j["numero_juego"] == id), None)
     if juego:
         return jsonify(juego)
     else:
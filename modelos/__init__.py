@@ -11,11 +11,26 @@ Este paquete contiene:
   - VarianceTest: Prueba de Varianza
 """
 
+import importlib
+
 from .prng import PRNG
-from .pruebas.average_test import AverageTest
-from .pruebas.ks_test import KsTest
-from .pruebas.poker_test import PokerTest
-from .pruebas.chi_square_test import ChiSquareTest
-from .pruebas.variance_test import VarianceTest
 
-__all__ = ['PRNG', 'AverageTest', 'KsTest', 'PokerTest', 'ChiSquareTest', 'VarianceTest']
\ No newline at end of file
+# Las pruebas importan scipy y matplotlib, que tardan cerca de un segundo en cargar:
+# se importan al primer acceso, para que el generador pueda usarse sin ellas
+_LAZY_TESTS = {
+    'AverageTest': '.pruebas.average_test',
+    'KsTest': '.pruebas.ks_test',
+    'PokerTest': '.pruebas.poker_test',
+    'ChiSquareTest': '.pruebas.chi_square_test',
+    'VarianceTest': '.pruebas.variance_test',
+}
+
+__all__ = ['PRNG', 'AverageTest', 'KsTest', 'PokerTest', 'ChiSquareTest', 'VarianceTest']
+
+
+def __getattr__(name):
+    if name in _LAZY_TESTS:
+        value = getattr(importlib.import_module(_LAZY_TESTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
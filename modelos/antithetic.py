@@ -0,0 +1,34 @@
+"""
+Generador antitético para reducción de varianza.
+
+Envuelve otro generador y, por cada número u que este produce, retorna 1 - u.
+Dos simulaciones con la misma semilla, una con el generador base y otra con su
+versión antitética, quedan correlacionadas negativamente; promediar cada par de
+resultados reduce la varianza del estimador.
+
+Relaciones:
+- Hereda de PRNG, por lo que randint, uniform, choice, shuffle, etc. se construyen
+  sobre los números antitéticos
+- Lo usa RandomWrapper cuando se crea con antithetic=True
+"""
+
+from .prng import PRNG
+
+
+class AntitheticRandom(PRNG):
+    """Generador que refleja cada número del generador base (u -> 1 - u)."""
+
+    def __init__(self, base: PRNG):
+        """
+        Args:
+            base: Generador cuyos números se reflejan
+        """
+        self.base = base
+
+    def seed(self, value: int) -> None:
+        """Establece la semilla del generador base."""
+        self.base.seed(value)
+
+    def random(self) -> float:
+        """Retorna 1 - u, donde u es el siguiente número del generador base."""
+        return 1.0 - self.base.random()
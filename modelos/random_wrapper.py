@@ -5,6 +5,7 @@ from typing import Sequence, TypeVar, List, Any
 import math
 from .prng import PRNG
 from .linear_congruence import LinearCongruenceRandom
+from .antithetic import AntitheticRandom
 
 T = TypeVar('T')
 
@@ -13,8 +14,25 @@ class RandomWrapper:
     Wrapper que proporciona una interfaz compatible con random usando
     nuestro generador de números pseudoaleatorios validado.
     """
-    def __init__(self, seed: int = None):
-        self._rng = LinearCongruenceRandom(seed_value=seed)
+    def __init__(self, seed: int = None, antithetic: bool = False):
+        """
+        Args:
+            seed: Semilla del generador (None usa una semilla basada en el tiempo)
+            antithetic: Si es True, cada número u se reemplaza por 1 - u
+        """
+        self._base = LinearCongruenceRandom(seed_value=seed)
+        self._rng = self._base
+        self.antithetic = antithetic
+
+    @property
+    def antithetic(self) -> bool:
+        """Indica si el generador entrega la variable antitética 1 - u."""
+        return self._rng is not self._base
+
+    @antithetic.setter
+    def antithetic(self, value: bool) -> None:
+        """Activa o desactiva el modo antitético sin alterar el estado del generador."""
+        self._rng = AntitheticRandom(self._base) if value else self._base
     
     def seed(self, seed: int) -> None:
         """Establece la semilla del generador."""
@@ -80,4 +98,9 @@ randint = _instance.randint
 choice = _instance.choice
 choices = _instance.choices
 shuffle = _instance.shuffle
-sample = _instance.sample
\ No newline at end of file
+sample = _instance.sample
+
+
+def get_instance() -> RandomWrapper:
+    """Retorna la instancia global compartida por las funciones del módulo."""
+    return _instance
@@ -0,0 +1,65 @@
+"""
+Derivación de semillas para subflujos independientes del generador.
+
+Permite obtener, a partir de una semilla base y una o más claves enteras (por
+ejemplo, el número de juego), una semilla distinta y reproducible para cada
+subflujo. Dos simulaciones que usan la misma semilla base consumen así los mismos
+números en cada juego aunque sus parámetros las hagan avanzar a ritmos distintos,
+lo que permite aplicar números aleatorios comunes entre escenarios.
+
+Relaciones:
+- Las semillas producidas son válidas para LinearCongruenceRandom (1 <= s < m)
+- derive_seeds calcula muchas semillas a la vez con NumPy (aritmética módulo 2^64)
+"""
+
+import numpy as np
+
+from .linear_congruence import LinearCongruenceRandom
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+
+
+def _splitmix64(x: int) -> int:
+    """Función de mezcla de SplitMix64: distribuye bien semillas consecutivas."""
+    x = (x + _GOLDEN_GAMMA) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+def derive_seed(seed: int, *keys: int) -> int:
+    """
+    Deriva la semilla de un subflujo.
+
+    Args:
+        seed: Semilla base
+        *keys: Claves enteras que identifican el subflujo (p. ej. número de juego)
+
+    Returns:
+        int: Semilla en el rango [1, m - 1] del generador congruencial
+    """
+    x = _splitmix64(seed & _MASK64)
+    for key in keys:
+        x = _splitmix64(x ^ (key & _MASK64))
+    return x % (LinearCongruenceRandom.DEFAULT_M - 1) + 1
+
+
+def derive_seeds(seed: int, keys: np.ndarray) -> np.ndarray:
+    """
+    Versión vectorizada de derive_seed para una sola clave por subflujo.
+
+    Args:
+        seed: Semilla base
+        keys: Arreglo de claves enteras no negativas
+
+    Returns:
+        np.ndarray: Semillas (int64) iguales a derive_seed(seed, k) para cada clave k
+    """
+    base = np.uint64(_splitmix64(seed & _MASK64))
+    x = np.asarray(keys, dtype=np.uint64) ^ base
+    x = x + np.uint64(_GOLDEN_GAMMA)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    x = x ^ (x >> np.uint64(31))
+    return (x % np.uint64(LinearCongruenceRandom.DEFAULT_M - 1) + np.uint64(1)).astype(np.int64)
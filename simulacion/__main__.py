@@ -0,0 +1,257 @@
+"""
+Ejecución de simulaciones por lotes desde la línea de comandos, sin la aplicación web.
+
+Solo importa el núcleo de la simulación (ni Flask ni matplotlib) y no lee ni escribe
+resultados_acumulados.json, así que arranca rápido en tareas programadas y pipelines.
+
+Con --procesos mayor que 1, los juegos se reparten en ese número de réplicas
+independientes que se ejecutan en paralelo. Cada réplica es una simulación completa
+con su propia semilla, derivada de --semilla y del número de réplica, y con sus propios
+equipos: los jugadores acumulan estado de un juego al siguiente, así que una sola
+simulación no puede partirse entre procesos sin cambiar sus resultados. Los
+resultados son reproducibles para la misma semilla y el mismo número de procesos.
+
+Uso:
+    python -m simulacion --juegos 20000 --semilla 42
+    python -m simulacion --juegos 100000 --semilla 42 --procesos 4 --formato csv -o juegos.csv
+    python -m simulacion --juegos 1000000 --semilla 42 --formato columnar -o corrida/
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from typing import List, Optional, Tuple
+
+from modelos.substreams import derive_seed
+
+from .archivo_columnar import guardar_resultados
+from .barrido import metricas_agregadas
+from .simulador import ConfiguracionSimulacion, ContadoresSimulacion, Simulador
+
+FORMATOS = ("resumen", "json", "jsonl", "csv", "columnar")
+
+COLUMNAS_CSV = (
+    "replica",
+    "numero_juego",
+    "id_juego",
+    "equipo_1",
+    "puntaje_equipo_1",
+    "rondas_equipo_1",
+    "equipo_2",
+    "puntaje_equipo_2",
+    "rondas_equipo_2",
+    "ganador",
+    "genero_con_mas_victorias",
+)
+
+
+def _ejecutar_replica(
+    config: ConfiguracionSimulacion,
+) -> Tuple[List[dict], List[dict], ContadoresSimulacion]:
+    """Simula una réplica y retorna sus resultados, sus equipos y sus contadores."""
+    simulador = Simulador(config)
+    simulador.ejecutar()
+    return simulador.resultados, simulador.equipos(), simulador.contadores
+
+
+def configuraciones_replicas(
+    config: ConfiguracionSimulacion, procesos: int
+) -> List[ConfiguracionSimulacion]:
+    """
+    Reparte los juegos de una configuración entre réplicas independientes.
+
+    Args:
+        config (ConfiguracionSimulacion): Configuración de toda la corrida
+        procesos (int): Número de réplicas
+
+    Returns:
+        List[ConfiguracionSimulacion]: Una configuración por réplica; con una sola
+            réplica, la configuración original
+    """
+    if procesos == 1:
+        return [config]
+    if config.semilla is None:
+        config = replace(config, semilla=int(time.time() * 1000) % (2**31 - 1) + 1)
+    base, resto = divmod(config.num_juegos, procesos)
+    return [
+        replace(
+            config,
+            num_juegos=base + (1 if replica < resto else 0),
+            semilla=derive_seed(config.semilla, replica),
+        ).validar()
+        for replica in range(procesos)
+        if base + (1 if replica < resto else 0) > 0
+    ]
+
+
+def simular(config: ConfiguracionSimulacion, procesos: int = 1) -> dict:
+    """
+    Ejecuta una simulación por lotes, opcionalmente repartida entre procesos.
+
+    Args:
+        config (ConfiguracionSimulacion): Configuración validada
+        procesos (int): Réplicas en que se reparten los juegos; se ejecutan en a lo
+            sumo un proceso por CPU
+
+    Returns:
+        dict: "configuracion", "procesos", "replicas" (semilla, juegos y equipos de
+            cada una), "resultados" (lista de (réplica, resultado)), "duracion",
+            "juegos_por_segundo", "contadores" y "metricas" (ver metricas_agregadas)
+    """
+    configs = configuraciones_replicas(config, procesos)
+    inicio = time.perf_counter()
+    if len(configs) == 1:
+        salidas = [_ejecutar_replica(configs[0])]
+    else:
+        max_procesos = min(len(configs), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_procesos) as executor:
+            salidas = list(executor.map(_ejecutar_replica, configs))
+    duracion = time.perf_counter() - inicio
+
+    contadores = ContadoresSimulacion()
+    resultados = []
+    replicas = []
+    for replica, (config_replica, (resultados_replica, equipos, totales_replica)) in enumerate(
+        zip(configs, salidas)
+    ):
+        resultados.extend((replica, resultado) for resultado in resultados_replica)
+        replicas.append(
+            {
+                "semilla": config_replica.semilla,
+                "juegos": len(resultados_replica),
+                "equipos": equipos,
+            }
+        )
+        contadores.sumar(totales_replica)
+
+    return {
+        "configuracion": config.a_dict(),
+        "procesos": len(configs),
+        "replicas": replicas,
+        "resultados": resultados,
+        "duracion": duracion,
+        "juegos_por_segundo": len(resultados) / duracion if duracion > 0 else 0.0,
+        "contadores": contadores.a_dict(),
+        "metricas": metricas_agregadas([resultado for _, resultado in resultados]),
+    }
+
+
+def fila_csv(replica: int, resultado: dict) -> list:
+    """Retorna la fila de COLUMNAS_CSV de un resultado."""
+    return [
+        replica,
+        resultado["numero_juego"],
+        resultado["id_juego"],
+        resultado["equipo_1"]["nombre"],
+        resultado["equipo_1"]["puntaje_total"],
+        resultado["equipo_1"]["rondas_ganadas"],
+        resultado["equipo_2"]["nombre"],
+        resultado["equipo_2"]["puntaje_total"],
+        resultado["equipo_2"]["rondas_ganadas"],
+        resultado["equipo_ganador"]["nombre"],
+        resultado["genero_con_mas_victorias"],
+    ]
+
+
+def escribir(corrida: dict, formato: str, salida) -> None:
+    """
+    Escribe una corrida de simular() en el formato indicado.
+
+    Args:
+        corrida (dict): Retorno de simular()
+        formato (str): "resumen" (texto), "json" (resumen y juegos), "jsonl" (un
+            juego por línea) o "csv" (un juego por fila, ver COLUMNAS_CSV)
+        salida (TextIO): Archivo de destino
+    """
+    if formato == "jsonl":
+        for replica, resultado in corrida["resultados"]:
+            salida.write(json.dumps(dict(resultado, replica=replica)) + "\n")
+    elif formato == "csv":
+        escritor = csv.writer(salida, lineterminator="\n")
+        escritor.writerow(COLUMNAS_CSV)
+        escritor.writerows(fila_csv(replica, r) for replica, r in corrida["resultados"])
+    elif formato == "json":
+        json.dump(
+            dict(
+                corrida,
+                resultados=[dict(r, replica=replica) for replica, r in corrida["resultados"]],
+            ),
+            salida,
+        )
+        salida.write("\n")
+    else:
+        contadores = corrida["contadores"]
+        salida.write(
+            f"{len(corrida['resultados'])} juegos en {corrida['duracion']:.2f} s "
+            f"({corrida['juegos_por_segundo']:.0f} juegos/s, {corrida['procesos']} procesos)\n"
+            f"{contadores['rondas']} rondas, {contadores['tiros']} tiros\n"
+        )
+        for metrica, valor in corrida["metricas"].items():
+            salida.write(f"{metrica:>24}  {valor:.4f}\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Ejecuta una simulación por lotes desde la línea de comandos."""
+    parser = argparse.ArgumentParser(
+        prog="python -m simulacion", description="Simulación de arquería por lotes"
+    )
+    parser.add_argument("--juegos", type=int, default=20000, help="Juegos a simular")
+    parser.add_argument("--rondas", type=int, default=10, help="Rondas por juego")
+    parser.add_argument("--semilla", type=int, default=None)
+    parser.add_argument("--jugadores", type=int, default=5, help="Jugadores por equipo")
+    parser.add_argument("--equipo1", default=ConfiguracionSimulacion.nombre_equipo1)
+    parser.add_argument("--equipo2", default=ConfiguracionSimulacion.nombre_equipo2)
+    parser.add_argument(
+        "--procesos", type=int, default=1, help="Procesos; cada uno simula una réplica"
+    )
+    parser.add_argument("--formato", choices=FORMATOS, default="resumen")
+    parser.add_argument(
+        "-o",
+        "--salida",
+        help="Archivo de salida (por defecto, la consola); con columnar, el directorio",
+    )
+    args = parser.parse_args(argv)
+    if args.formato == "columnar" and not args.salida:
+        parser.error("el formato columnar requiere --salida")
+
+    try:
+        if args.procesos < 1:
+            raise ValueError("procesos debe ser al menos 1")
+        config = ConfiguracionSimulacion(
+            num_juegos=args.juegos,
+            num_rondas=args.rondas,
+            semilla=args.semilla,
+            nombre_equipo1=args.equipo1,
+            nombre_equipo2=args.equipo2,
+            jugadores_por_equipo=args.jugadores,
+        ).validar()
+    except ValueError as e:
+        parser.error(str(e))
+
+    corrida = simular(config, args.procesos)
+    if args.formato == "columnar":
+        guardar_resultados(
+            args.salida,
+            [dict(resultado, replica=replica) for replica, resultado in corrida["resultados"]],
+            {
+                "configuracion": corrida["configuracion"],
+                "replicas": [
+                    {"semilla": r["semilla"], "juegos": r["juegos"]} for r in corrida["replicas"]
+                ],
+            },
+        )
+    elif args.salida:
+        with open(args.salida, "w", newline="") as salida:
+            escribir(corrida, args.formato, salida)
+    else:
+        escribir(corrida, args.formato, sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,375 @@
+"""
+Cálculo analítico de distribuciones de puntaje.
+
+Cada tiro de Blanco es una variable categórica sobre {10, 9, 8, 0} cuyas
+probabilidades dependen del género, de la suerte de la ronda y de la experiencia
+del jugador, y el número de tiros de una ronda queda determinado por la
+resistencia y el costo del tiro. Este módulo obtiene, sin Monte Carlo, las
+distribuciones de puntaje resultantes mediante convoluciones (calculadas con FFT)
+y, a partir de ellas, las probabilidades de victoria.
+
+Modelo:
+- La suerte de cada jugador en la ronda es round(U(1, 3), 2): 201 valores posibles,
+  sobre los que se promedia de forma exacta. Los tiros de un jugador son
+  independientes dada su suerte.
+- El tiro extra lo realiza el primer jugador del equipo con la suerte máxima, con
+  su misma suerte; la distribución del equipo en la ronda incluye de forma exacta
+  la correlación entre ese tiro y los tiros propios de cada jugador.
+- Para el juego completo, el cansancio de cada jugador se sigue con una
+  programación dinámica sobre su cansancio acumulado. Se aproxima la experiencia
+  como constante durante el juego (se ignora el +3 del ganador de cada ronda y el
+  beneficio de resistencia) y el tiro extra de cada ronda como independiente de
+  los tiros propios del jugador que lo realiza.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .blanco_objetivo import Blanco
+from .jugador import Jugador
+
+# Valores posibles de la suerte (round(uniform(1.0, 3.0), 2)) y su probabilidad:
+# los extremos solo reciben la mitad del intervalo de redondeo
+SUERTES = np.round(np.linspace(1.0, 3.0, 201), 2)
+PESOS_SUERTE = np.full(len(SUERTES), 0.01 / 2.0)
+PESOS_SUERTE[[0, -1]] /= 2.0
+# P(suerte < v) y P(suerte <= v) para cada valor v de SUERTES
+_SUERTE_MENOR = np.concatenate(([0.0], np.cumsum(PESOS_SUERTE)[:-1]))
+_SUERTE_MENOR_IGUAL = np.cumsum(PESOS_SUERTE)
+
+_PUNTAJE_MAXIMO_TIRO = max(Blanco.ZONAS.values())
+
+
+@dataclass(frozen=True)
+class EstadoJugador:
+    """
+    Estado de un jugador que determina su distribución de puntaje.
+
+    Attributes:
+        genero (str): Género del jugador ('M' o 'F')
+        resistencia_inicial (int): Resistencia base del jugador
+        experiencia (int): Experiencia durante la ronda o el juego
+        resistencia_actual (Optional[int]): Resistencia al comenzar la primera ronda
+            (None usa resistencia_inicial)
+    """
+    genero: str
+    resistencia_inicial: int
+    experiencia: int = 10
+    resistencia_actual: Optional[int] = None
+
+    @classmethod
+    def desde_jugador(cls, jugador) -> "EstadoJugador":
+        """Construye el estado a partir de un Jugador de la simulación."""
+        return cls(
+            jugador.genero,
+            jugador.resistencia_inicial,
+            jugador.experiencia,
+            jugador.resistencia_actual,
+        )
+
+    @property
+    def resistencia_ronda(self) -> int:
+        """Resistencia con la que comienza la primera ronda."""
+        return (
+            self.resistencia_actual
+            if self.resistencia_actual is not None
+            else self.resistencia_inicial
+        )
+
+
+def estados_equipo(equipo) -> List[EstadoJugador]:
+    """Retorna el estado actual de los jugadores de un Equipo, en su orden de tiro."""
+    return [EstadoJugador.desde_jugador(jugador) for jugador in equipo.jugadores]
+
+
+def convolucionar(*distribuciones: np.ndarray) -> np.ndarray:
+    """
+    Convoluciona distribuciones de puntaje (índice = puntaje) mediante FFT.
+
+    Acepta arreglos de una dimensión o con una primera dimensión común (por
+    ejemplo, una distribución por valor de suerte), que se convolucionan fila a fila.
+
+    Returns:
+        np.ndarray: Distribución de la suma de las variables
+    """
+    largo = sum(d.shape[-1] for d in distribuciones) - len(distribuciones) + 1
+    tamano = 1 << (largo - 1).bit_length()
+    producto = np.fft.rfft(distribuciones[0], tamano)
+    for distribucion in distribuciones[1:]:
+        producto = producto * np.fft.rfft(distribucion, tamano)
+    resultado = np.fft.irfft(producto, tamano)[..., :largo]
+    # La FFT deja residuos numéricos del orden de 1e-17 que pueden ser negativos
+    return np.clip(resultado, 0.0, None)
+
+
+def comparar(distribucion1: np.ndarray, distribucion2: np.ndarray) -> Dict[str, float]:
+    """
+    Compara dos puntajes independientes.
+
+    Args:
+        distribucion1, distribucion2 (np.ndarray): Distribuciones de puntaje
+
+    Returns:
+        dict: Probabilidades de que gane cada uno ("equipo1", "equipo2") o de "empate"
+    """
+    largo = max(len(distribucion1), len(distribucion2))
+    p1 = np.pad(distribucion1, (0, largo - len(distribucion1)))
+    p2 = np.pad(distribucion2, (0, largo - len(distribucion2)))
+    acumulada2 = np.cumsum(p2)
+    acumulada1 = np.cumsum(p1)
+    # P(X1 > X2) = sum_x P(X1 = x) P(X2 < x)
+    gana1 = float(np.dot(p1[1:], acumulada2[:-1]))
+    gana2 = float(np.dot(p2[1:], acumulada1[:-1]))
+    empate = float(np.dot(p1, p2))
+    return {"equipo1": gana1, "equipo2": gana2, "empate": empate}
+
+
+def media(distribucion: np.ndarray) -> float:
+    """Retorna el puntaje esperado de una distribución."""
+    return float(np.dot(np.arange(len(distribucion)), distribucion))
+
+
+class MotorAnalitico:
+    """
+    Calcula distribuciones de puntaje exactas con los parámetros de una simulación.
+    """
+
+    def __init__(self, probabilidades=None, costo_tiro=None, rango_cansancio=None):
+        """
+        Args:
+            probabilidades (dict): Probabilidades base por género y zona
+                (None usa Blanco.PROBABILIDADES)
+            costo_tiro (int): Resistencia consumida por tiro
+                (None usa Blanco.TIRO_RESISTENCIA_COST)
+            rango_cansancio (tuple): Cansancio mínimo y máximo por ronda
+                (None usa Jugador.RANGO_CANSANCIO)
+        """
+        self.probabilidades = (
+            probabilidades if probabilidades is not None else Blanco.PROBABILIDADES
+        )
+        self.costo_tiro = costo_tiro if costo_tiro is not None else Blanco.TIRO_RESISTENCIA_COST
+        self.rango_cansancio = (
+            tuple(rango_cansancio) if rango_cansancio is not None else Jugador.RANGO_CANSANCIO
+        )
+        self._tiros_por_suerte: Dict[tuple, np.ndarray] = {}
+
+    @classmethod
+    def desde_config(cls, config) -> "MotorAnalitico":
+        """Crea el motor con los parámetros de una ConfiguracionSimulacion."""
+        return cls(config.probabilidades, config.costo_tiro, config.rango_cansancio)
+
+    def tiros(self, resistencia: int) -> int:
+        """Número de tiros que realiza un jugador que comienza la ronda con esa resistencia."""
+        return max(0, resistencia // self.costo_tiro)
+
+    def distribucion_tiro(self, genero: str, experiencia: int) -> np.ndarray:
+        """
+        Distribución del puntaje de un tiro para cada valor posible de la suerte.
+
+        Replica Blanco._ajustar_probabilidades: la suerte aumenta la probabilidad de
+        CENTRAL y la experiencia reduce la de ERROR.
+
+        Returns:
+            np.ndarray: Arreglo (len(SUERTES), 11); la fila k es la distribución con
+                        suerte SUERTES[k]
+        """
+        clave = (genero, experiencia)
+        if clave not in self._tiros_por_suerte:
+            base = self.probabilidades[genero]
+            pesos = np.empty((len(SUERTES), len(Blanco.ZONAS)))
+            for j, zona in enumerate(Blanco.ZONAS):
+                pesos[:, j] = base[zona]
+            zonas = list(Blanco.ZONAS)
+            pesos[:, zonas.index("CENTRAL")] *= 1 + 0.1 * (SUERTES / 3.0)
+            pesos[:, zonas.index("ERROR")] *= 1 - 0.2 * min(1.0, experiencia / 50.0)
+            pesos /= pesos.sum(axis=1, keepdims=True)
+
+            distribucion = np.zeros((len(SUERTES), _PUNTAJE_MAXIMO_TIRO + 1))
+            for j, puntaje in enumerate(Blanco.ZONAS.values()):
+                distribucion[:, puntaje] += pesos[:, j]
+            self._tiros_por_suerte[clave] = distribucion
+        return self._tiros_por_suerte[clave]
+
+    def _ronda_por_suerte(self, genero: str, experiencia: int, tiros: int) -> np.ndarray:
+        """Distribución del puntaje propio en la ronda para cada valor de la suerte."""
+        tiro = self.distribucion_tiro(genero, experiencia)
+        if tiros == 0:
+            return np.ones((len(SUERTES), 1))
+        largo = _PUNTAJE_MAXIMO_TIRO * tiros + 1
+        tamano = 1 << (largo - 1).bit_length()
+        resultado = np.fft.irfft(np.fft.rfft(tiro, tamano) ** tiros, tamano)[:, :largo]
+        return np.clip(resultado, 0.0, None)
+
+    def distribucion_jugador_ronda(
+        self, estado: EstadoJugador, tiros: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Distribución del puntaje propio de un jugador en una ronda (sin el tiro extra).
+
+        Args:
+            estado (EstadoJugador): Estado del jugador
+            tiros (int): Número de tiros (por defecto, los que permite resistencia_ronda)
+
+        Returns:
+            np.ndarray: Distribución del puntaje (índice = puntaje)
+        """
+        if tiros is None:
+            tiros = self.tiros(estado.resistencia_ronda)
+        return PESOS_SUERTE @ self._ronda_por_suerte(estado.genero, estado.experiencia, tiros)
+
+    def distribucion_tiro_extra(self, estados: Sequence[EstadoJugador]) -> np.ndarray:
+        """
+        Distribución marginal del tiro extra de un equipo en una ronda.
+
+        Returns:
+            np.ndarray: Distribución del puntaje del tiro extra
+        """
+        resultado = np.zeros(_PUNTAJE_MAXIMO_TIRO + 1)
+        n = len(estados)
+        for j, estado in enumerate(estados):
+            # j tiene la suerte máxima v si los anteriores tienen suerte < v y los
+            # posteriores suerte <= v (max() se queda con el primero en caso de empate)
+            peso = PESOS_SUERTE * _SUERTE_MENOR ** j * _SUERTE_MENOR_IGUAL ** (n - 1 - j)
+            resultado += peso @ self.distribucion_tiro(estado.genero, estado.experiencia)
+        return resultado
+
+    def distribucion_equipo_ronda(
+        self, estados: Sequence[EstadoJugador], tiros: Optional[Sequence[int]] = None
+    ) -> np.ndarray:
+        """
+        Distribución exacta del puntaje de un equipo en una ronda, incluido el tiro extra.
+
+        Args:
+            estados (Sequence[EstadoJugador]): Jugadores en el orden del equipo
+            tiros (Sequence[int]): Tiros de cada jugador (por defecto, según su resistencia)
+
+        Returns:
+            np.ndarray: Distribución del puntaje del equipo
+        """
+        if tiros is None:
+            tiros = [self.tiros(estado.resistencia_ronda) for estado in estados]
+        por_suerte = [
+            self._ronda_por_suerte(estado.genero, estado.experiencia, n)
+            for estado, n in zip(estados, tiros)
+        ]
+        # Distribuciones conjuntas P(suerte < v, puntaje) y P(suerte <= v, puntaje)
+        menores, menores_iguales = [], []
+        for distribucion in por_suerte:
+            ponderada = PESOS_SUERTE[:, None] * distribucion
+            acumulada = np.cumsum(ponderada, axis=0)
+            menores_iguales.append(acumulada)
+            menores.append(acumulada - ponderada)
+
+        largo = sum(d.shape[1] - 1 for d in por_suerte) + _PUNTAJE_MAXIMO_TIRO + 1
+        tamano = 1 << (largo - 1).bit_length()
+        transformadas_menor = [np.fft.rfft(d, tamano) for d in menores]
+        transformadas_menor_igual = [np.fft.rfft(d, tamano) for d in menores_iguales]
+        total = np.zeros(tamano // 2 + 1, dtype=complex)
+        for j, estado in enumerate(estados):
+            # El jugador j tiene la suerte máxima: sus tiros y el extra usan la misma suerte
+            producto = (
+                PESOS_SUERTE[:, None]
+                * np.fft.rfft(por_suerte[j], tamano)
+                * np.fft.rfft(self.distribucion_tiro(estado.genero, estado.experiencia), tamano)
+            )
+            for i in range(len(estados)):
+                if i < j:
+                    producto = producto * transformadas_menor[i]
+                elif i > j:
+                    producto = producto * transformadas_menor_igual[i]
+            total += producto.sum(axis=0)
+        return np.clip(np.fft.irfft(total, tamano)[:largo], 0.0, None)
+
+    def probabilidades_ronda(
+        self, estados1: Sequence[EstadoJugador], estados2: Sequence[EstadoJugador]
+    ) -> Dict[str, float]:
+        """
+        Probabilidades de que cada equipo gane una ronda (o de empate).
+
+        Returns:
+            dict: Claves "equipo1", "equipo2" y "empate"
+        """
+        return comparar(
+            self.distribucion_equipo_ronda(estados1), self.distribucion_equipo_ronda(estados2)
+        )
+
+    def distribucion_jugador_juego(self, estado: EstadoJugador, num_rondas: int = 10) -> np.ndarray:
+        """
+        Distribución del puntaje propio de un jugador en un juego completo.
+
+        Sigue con programación dinámica el cansancio acumulado del jugador, que
+        determina sus tiros en cada ronda.
+
+        Returns:
+            np.ndarray: Distribución del puntaje del jugador en el juego
+        """
+        minimo, maximo = self.rango_cansancio
+        prob_cansancio = 1.0 / (maximo - minimo + 1)
+        rondas_por_tiros: Dict[int, np.ndarray] = {}
+
+        def ronda(tiros: int) -> np.ndarray:
+            if tiros not in rondas_por_tiros:
+                rondas_por_tiros[tiros] = self.distribucion_jugador_ronda(estado, tiros)
+            return rondas_por_tiros[tiros]
+
+        # cansancio acumulado -> distribución conjunta P(cansancio, puntaje)
+        estados = {0: np.ones(1)}
+        for numero in range(num_rondas):
+            siguientes: Dict[int, np.ndarray] = {}
+            for cansancio, distribucion in estados.items():
+                resistencia = (
+                    estado.resistencia_ronda
+                    if numero == 0
+                    else estado.resistencia_inicial - cansancio
+                )
+                despues = np.convolve(distribucion, ronda(self.tiros(resistencia)))
+                for incremento in range(minimo, maximo + 1):
+                    clave = cansancio + incremento
+                    previo = siguientes.get(clave)
+                    aporte = prob_cansancio * despues
+                    if previo is None:
+                        siguientes[clave] = aporte
+                    else:
+                        largo = max(len(previo), len(aporte))
+                        siguientes[clave] = np.pad(previo, (0, largo - len(previo))) + np.pad(
+                            aporte, (0, largo - len(aporte))
+                        )
+            estados = siguientes
+
+        largo = max(len(d) for d in estados.values())
+        return sum(np.pad(d, (0, largo - len(d))) for d in estados.values())
+
+    def distribucion_equipo_juego(
+        self, estados: Sequence[EstadoJugador], num_rondas: int = 10
+    ) -> np.ndarray:
+        """
+        Distribución del puntaje de un equipo en un juego completo.
+
+        Returns:
+            np.ndarray: Distribución del puntaje del equipo en el juego
+        """
+        extra = self.distribucion_tiro_extra(estados)
+        partes: List[np.ndarray] = [
+            self.distribucion_jugador_juego(estado, num_rondas) for estado in estados
+        ]
+        partes.extend([extra] * num_rondas)
+        return convolucionar(*partes)
+
+    def probabilidades_juego(
+        self,
+        estados1: Sequence[EstadoJugador],
+        estados2: Sequence[EstadoJugador],
+        num_rondas: int = 10,
+    ) -> Dict[str, float]:
+        """
+        Probabilidades de que cada equipo gane un juego completo (o de empate).
+
+        Returns:
+            dict: Claves "equipo1", "equipo2" y "empate"
+        """
+        return comparar(
+            self.distribucion_equipo_juego(estados1, num_rondas),
+            self.distribucion_equipo_juego(estados2, num_rondas),
+        )
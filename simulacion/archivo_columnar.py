@@ -0,0 +1,310 @@
+"""
+Archivo columnar de resultados de juegos.
+
+Guarda una lista de resultados (el esquema de resultados_acumulados.json) como un
+directorio con un archivo .npy por campo y un manifiesto JSON pequeño. Los campos
+anidados se aplanan con puntos ("equipo_1.puntaje_total"), los enteros se guardan
+con el tipo más chico que los contiene y los textos se codifican con diccionario:
+la columna guarda un código por juego y un segundo archivo los textos distintos.
+
+Las columnas se abren con np.load(mmap_mode="r"), así que abrir un archivo solo lee
+el manifiesto y cada columna se lee del disco recién cuando se usa.
+
+Estructura:
+    <ruta>/manifiesto.json
+    <ruta>/<campo>.npy               (valores, o códigos para los textos; -1 es nulo)
+    <ruta>/<campo>.diccionario.npy   (textos distintos en UTF-8, solo para los textos)
+    <ruta>/<campo>.nulos.npy         (solo si a un campo no textual le falta valor)
+"""
+
+import json
+import os
+import shutil
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+FORMATO = "arqueria-columnar"
+VERSION = 1
+MANIFIESTO = "manifiesto.json"
+
+
+class TipoColumna:
+    """Tipos de columna del archivo."""
+
+    ENTERO = "entero"
+    REAL = "real"
+    BOOLEANO = "booleano"
+    TEXTO = "texto"
+
+
+def _aplanar(fila: dict, prefijo: str, destino: dict) -> None:
+    for clave, valor in fila.items():
+        if isinstance(valor, dict):
+            _aplanar(valor, f"{prefijo}{clave}.", destino)
+        else:
+            destino[f"{prefijo}{clave}"] = valor
+
+
+def _entero_minimo(minimo: int, maximo: int) -> np.dtype:
+    """Retorna el tipo entero con signo más chico que contiene [minimo, maximo]."""
+    for tipo in (np.int8, np.int16, np.int32, np.int64):
+        limites = np.iinfo(tipo)
+        if limites.min <= minimo and maximo <= limites.max:
+            return np.dtype(tipo)
+    raise ValueError(f"Enteros fuera del rango de int64: [{minimo}, {maximo}]")
+
+
+def _codificar(nombre: str, valores: list) -> dict:
+    """
+    Convierte los valores de un campo (None donde falta) en su arreglo, su máscara
+    de nulos y, para los textos, su diccionario.
+    """
+    presentes = [v for v in valores if v is not None]
+    tipos = {type(v) for v in presentes}
+    nulos = np.fromiter((v is None for v in valores), dtype=bool, count=len(valores))
+    columna = {"nulos": nulos if nulos.any() else None, "diccionario": None}
+
+    if not tipos or tipos == {str}:
+        diccionario: Dict[str, int] = {}
+        codigos = [
+            -1 if v is None else diccionario.setdefault(v, len(diccionario)) for v in valores
+        ]
+        columna["tipo"] = TipoColumna.TEXTO
+        columna["datos"] = np.array(codigos, dtype=_entero_minimo(-1, max(len(diccionario), 1)))
+        columna["diccionario"] = np.array(
+            [texto.encode("utf-8") for texto in diccionario], dtype=np.bytes_
+        )
+        # En los textos el código -1 ya marca el nulo
+        columna["nulos"] = None
+    elif tipos == {bool}:
+        columna["tipo"] = TipoColumna.BOOLEANO
+        columna["datos"] = np.array([bool(v) for v in valores], dtype=bool)
+    elif tipos == {int}:
+        columna["tipo"] = TipoColumna.ENTERO
+        columna["datos"] = np.array(
+            [0 if v is None else v for v in valores],
+            dtype=_entero_minimo(min(presentes), max(presentes)),
+        )
+    elif tipos <= {int, float}:
+        columna["tipo"] = TipoColumna.REAL
+        columna["datos"] = np.array(
+            [np.nan if v is None else v for v in valores], dtype=np.float64
+        )
+    else:
+        nombres_tipos = sorted(t.__name__ for t in tipos)
+        raise ValueError(f"El campo {nombre!r} mezcla tipos no admitidos: {nombres_tipos}")
+    return columna
+
+
+def guardar_resultados(
+    ruta: str, resultados: Sequence[dict], metadatos: Optional[dict] = None
+) -> dict:
+    """
+    Escribe resultados de juegos como archivo columnar.
+
+    El directorio se escribe completo en una ruta temporal y luego reemplaza al
+    anterior, de modo que nunca queda un archivo a medio escribir en ruta.
+
+    Args:
+        ruta (str): Directorio del archivo
+        resultados (Sequence[dict]): Resultados por juego; los campos pueden ser
+            enteros, reales, booleanos, textos o diccionarios con esos valores
+        metadatos (dict): Datos serializables adicionales para el manifiesto
+
+    Returns:
+        dict: El manifiesto escrito
+
+    Raises:
+        ValueError: Si un campo mezcla tipos no admitidos (p. ej. listas)
+    """
+    filas = len(resultados)
+    valores: Dict[str, list] = {}
+    plano: dict = {}
+    for i, resultado in enumerate(resultados):
+        plano.clear()
+        _aplanar(resultado, "", plano)
+        for campo, valor in plano.items():
+            columna = valores.get(campo)
+            if columna is None:
+                columna = valores[campo] = [None] * filas
+            columna[i] = valor
+
+    temporal = f"{ruta}.tmp"
+    shutil.rmtree(temporal, ignore_errors=True)
+    os.makedirs(temporal)
+    columnas = {}
+    for campo, lista in valores.items():
+        columna = _codificar(campo, lista)
+        np.save(os.path.join(temporal, f"{campo}.npy"), columna["datos"])
+        if columna["nulos"] is not None:
+            np.save(os.path.join(temporal, f"{campo}.nulos.npy"), columna["nulos"])
+        if columna["diccionario"] is not None:
+            np.save(os.path.join(temporal, f"{campo}.diccionario.npy"), columna["diccionario"])
+        columnas[campo] = {
+            "tipo": columna["tipo"],
+            "dtype": columna["datos"].dtype.str,
+            "nulos": columna["nulos"] is not None,
+        }
+
+    manifiesto = {
+        "formato": FORMATO,
+        "version": VERSION,
+        "filas": filas,
+        "columnas": columnas,
+        "metadatos": metadatos or {},
+    }
+    with open(os.path.join(temporal, MANIFIESTO), "w") as f:
+        json.dump(manifiesto, f)
+    shutil.rmtree(ruta, ignore_errors=True)
+    os.replace(temporal, ruta)
+    return manifiesto
+
+
+class ArchivoColumnar:
+    """
+    Lectura de un archivo columnar escrito con guardar_resultados.
+
+    Cada columna se abre mapeada en memoria la primera vez que se pide y queda en
+    una caché de la instancia.
+    """
+
+    def __init__(self, ruta: str):
+        """
+        Args:
+            ruta (str): Directorio del archivo
+
+        Atributos:
+            filas (int): Cantidad de juegos
+            metadatos (dict): Metadatos guardados con el archivo
+
+        Raises:
+            FileNotFoundError: Si el directorio o su manifiesto no existen
+            ValueError: Si el manifiesto no es de este formato
+        """
+        self.ruta = ruta
+        with open(os.path.join(ruta, MANIFIESTO), "r") as f:
+            manifiesto = json.load(f)
+        if manifiesto.get("formato") != FORMATO or manifiesto.get("version") != VERSION:
+            raise ValueError(f"{ruta} no es un archivo columnar de versión {VERSION}")
+        self.filas: int = manifiesto["filas"]
+        self.metadatos: dict = manifiesto["metadatos"]
+        self._columnas: Dict[str, dict] = manifiesto["columnas"]
+        self._arreglos: Dict[str, np.ndarray] = {}
+        self._diccionarios: Dict[str, List[str]] = {}
+
+    @property
+    def columnas(self) -> List[str]:
+        """Nombres de las columnas, en el orden en que aparecen en los resultados."""
+        return list(self._columnas)
+
+    def _descripcion(self, nombre: str) -> dict:
+        try:
+            return self._columnas[nombre]
+        except KeyError:
+            raise KeyError(f"Columna desconocida: {nombre!r}") from None
+
+    def _cargar(self, archivo: str) -> np.ndarray:
+        arreglo = self._arreglos.get(archivo)
+        if arreglo is None:
+            ruta = os.path.join(self.ruta, archivo)
+            # Un arreglo vacío no se puede mapear en memoria
+            arreglo = np.load(ruta, mmap_mode="r" if self.filas else None)
+            self._arreglos[archivo] = arreglo
+        return arreglo
+
+    def tipo(self, nombre: str) -> str:
+        """Retorna el TipoColumna de una columna."""
+        return self._descripcion(nombre)["tipo"]
+
+    def valores(self, nombre: str) -> np.ndarray:
+        """
+        Retorna la columna tal como está guardada (los códigos, para los textos).
+
+        Returns:
+            np.ndarray: Arreglo de solo lectura con una entrada por juego
+        """
+        self._descripcion(nombre)
+        return self._cargar(f"{nombre}.npy")
+
+    def nulos(self, nombre: str) -> np.ndarray:
+        """Retorna una máscara con True en los juegos a los que les falta el campo."""
+        descripcion = self._descripcion(nombre)
+        if descripcion["tipo"] == TipoColumna.TEXTO:
+            return self.valores(nombre) < 0
+        if descripcion["nulos"]:
+            return self._cargar(f"{nombre}.nulos.npy")
+        return np.zeros(self.filas, dtype=bool)
+
+    def diccionario(self, nombre: str) -> List[str]:
+        """Retorna los textos distintos de una columna de texto, en orden de código."""
+        if self.tipo(nombre) != TipoColumna.TEXTO:
+            raise ValueError(f"La columna {nombre!r} no es de texto")
+        diccionario = self._diccionarios.get(nombre)
+        if diccionario is None:
+            ruta = os.path.join(self.ruta, f"{nombre}.diccionario.npy")
+            diccionario = [texto.decode("utf-8") for texto in np.load(ruta).tolist()]
+            self._diccionarios[nombre] = diccionario
+        return diccionario
+
+    def codigo(self, nombre: str, texto: str) -> Optional[int]:
+        """Retorna el código de un texto en una columna, o None si no aparece."""
+        try:
+            return self.diccionario(nombre).index(texto)
+        except ValueError:
+            return None
+
+    def _decodificar(self, nombre: str, codigos: np.ndarray) -> np.ndarray:
+        diccionario = np.array(self.diccionario(nombre) + [None], dtype=object)
+        # El código -1 toma el último elemento: None
+        return diccionario[codigos]
+
+    def textos(self, nombre: str) -> np.ndarray:
+        """Retorna una columna de texto decodificada (None donde falta)."""
+        return self._decodificar(nombre, self.valores(nombre))
+
+    def resultados(
+        self, columnas: Optional[Sequence[str]] = None, inicio: int = 0, fin: Optional[int] = None
+    ) -> List[dict]:
+        """
+        Reconstruye los resultados por juego, con sus campos anidados.
+
+        Los campos que faltan en un juego (o que valían None) se omiten.
+
+        Args:
+            columnas (Sequence[str]): Columnas a incluir (por defecto, todas)
+            inicio (int): Primer juego (índice desde 0)
+            fin (int): Juego final, excluido (por defecto, el último)
+
+        Returns:
+            List[dict]: Un diccionario por juego
+        """
+        columnas = self.columnas if columnas is None else list(columnas)
+        seleccion = slice(inicio, fin)
+        listas = []
+        for nombre in columnas:
+            if self.tipo(nombre) == TipoColumna.TEXTO:
+                # Se decodifican solo los códigos del rango pedido
+                codigos = self.valores(nombre)[seleccion]
+                listas.append(self._decodificar(nombre, codigos).tolist())
+                continue
+            valores = self.valores(nombre)[seleccion].tolist()
+            nulos = self.nulos(nombre)[seleccion]
+            if nulos.any():
+                for i in np.flatnonzero(nulos).tolist():
+                    valores[i] = None
+            listas.append(valores)
+
+        rutas = [nombre.split(".") for nombre in columnas]
+        resultados = []
+        for fila in zip(*listas):
+            resultado: dict = {}
+            for ruta, valor in zip(rutas, fila):
+                if valor is None:
+                    continue
+                destino = resultado
+                for clave in ruta[:-1]:
+                    destino = destino.setdefault(clave, {})
+                destino[ruta[-1]] = valor
+            resultados.append(resultado)
+        return resultados
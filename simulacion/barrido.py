@@ -0,0 +1,264 @@
+"""
+Barrido de parámetros de la simulación.
+
+Ejecuta una simulación por cada celda de una rejilla de parámetros (por ejemplo
+probabilidades del blanco, costo del tiro, número de rondas o rango de
+cansancio) y guarda las métricas agregadas de cada celda en un cubo de
+resultados. Las celdas se reparten entre procesos y todas usan la misma semilla
+con subflujos por juego, de modo que las diferencias entre celdas se deben a los
+parámetros y no al ruido de muestreo (números aleatorios comunes).
+"""
+
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import fields, replace
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from .simulador import ConfiguracionSimulacion, Simulador
+
+# Métricas agregadas que se calculan para cada celda del barrido
+METRICAS_BARRIDO = (
+    "prob_victoria_equipo1",
+    "prob_victoria_equipo2",
+    "prob_empate",
+    "puntaje_medio_equipo1",
+    "puntaje_medio_equipo2",
+    "diferencia_media",
+    "desviacion_diferencia",
+    "prop_genero_M",
+    "prop_genero_F",
+)
+
+
+def metricas_agregadas(resultados: List[dict]) -> Dict[str, float]:
+    """
+    Calcula las métricas agregadas de una lista de resultados de juegos.
+
+    Args:
+        resultados (List[dict]): Resultados con el esquema de resultados_acumulados.json
+
+    Returns:
+        Dict[str, float]: Valor de cada métrica de METRICAS_BARRIDO
+    """
+    if not resultados:
+        return {metrica: float("nan") for metrica in METRICAS_BARRIDO}
+    puntaje1 = np.fromiter(
+        (r["equipo_1"]["puntaje_total"] for r in resultados), dtype=np.float64
+    )
+    puntaje2 = np.fromiter(
+        (r["equipo_2"]["puntaje_total"] for r in resultados), dtype=np.float64
+    )
+    generos = np.array([r["genero_con_mas_victorias"] for r in resultados])
+    diferencia = puntaje1 - puntaje2
+    return {
+        "prob_victoria_equipo1": float(np.mean(diferencia > 0)),
+        "prob_victoria_equipo2": float(np.mean(diferencia < 0)),
+        "prob_empate": float(np.mean(diferencia == 0)),
+        "puntaje_medio_equipo1": float(puntaje1.mean()),
+        "puntaje_medio_equipo2": float(puntaje2.mean()),
+        "diferencia_media": float(diferencia.mean()),
+        "desviacion_diferencia": float(diferencia.std(ddof=1)) if len(diferencia) > 1 else 0.0,
+        "prop_genero_M": float(np.mean(generos == "M")),
+        "prop_genero_F": float(np.mean(generos == "F")),
+    }
+
+
+def _ejecutar_celda(config: ConfiguracionSimulacion) -> List[float]:
+    """Simula una celda del barrido y retorna sus métricas en el orden de METRICAS_BARRIDO."""
+    metricas = metricas_agregadas(Simulador(config).ejecutar())
+    return [metricas[metrica] for metrica in METRICAS_BARRIDO]
+
+
+class CuboResultados:
+    """
+    Métricas agregadas de un barrido, organizadas como un arreglo de
+    dimensión (n_valores_eje_1, ..., n_valores_eje_k, n_metricas).
+    """
+
+    def __init__(
+        self,
+        ejes: Dict[str, List[Any]],
+        valores: np.ndarray,
+        metricas=METRICAS_BARRIDO,
+        configuracion_base: Optional[dict] = None,
+    ):
+        """
+        Args:
+            ejes (Dict[str, List[Any]]): Parámetro barrido -> valores, en el orden de los ejes
+            valores (np.ndarray): Arreglo de métricas por celda
+            metricas (tuple): Nombres de las métricas (último eje del arreglo)
+            configuracion_base (dict): Configuración común a todas las celdas
+        """
+        self.ejes = dict(ejes)
+        self.valores = valores
+        self.metricas = tuple(metricas)
+        self.configuracion_base = configuracion_base or {}
+
+    def metrica(self, nombre: str) -> np.ndarray:
+        """Retorna el sub-arreglo de una métrica (una dimensión por parámetro barrido)."""
+        return self.valores[..., self.metricas.index(nombre)]
+
+    def a_dict(self) -> dict:
+        """
+        Retorna el cubo en formato serializable.
+
+        Returns:
+            dict: Ejes, métricas, configuración base y una fila por celda con sus
+                  parámetros y métricas
+        """
+        celdas = []
+        for indices in itertools.product(*(range(len(v)) for v in self.ejes.values())):
+            parametros = {
+                nombre: valores[i]
+                for (nombre, valores), i in zip(self.ejes.items(), indices)
+            }
+            celdas.append(
+                {
+                    "parametros": parametros,
+                    "metricas": dict(zip(self.metricas, self.valores[indices].tolist())),
+                }
+            )
+        return {
+            "ejes": self.ejes,
+            "metricas": list(self.metricas),
+            "configuracion_base": self.configuracion_base,
+            "celdas": celdas,
+        }
+
+    def guardar(self, ruta_base: str) -> None:
+        """
+        Guarda el cubo en ruta_base.npz (arreglo de valores) y ruta_base.json (ejes,
+        métricas y configuración base).
+        """
+        directorio = os.path.dirname(ruta_base)
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+        np.savez_compressed(f"{ruta_base}.npz", valores=self.valores)
+        with open(f"{ruta_base}.json", "w") as f:
+            json.dump(
+                {
+                    "ejes": self.ejes,
+                    "metricas": list(self.metricas),
+                    "configuracion_base": self.configuracion_base,
+                },
+                f,
+            )
+
+    @classmethod
+    def cargar(cls, ruta_base: str) -> "CuboResultados":
+        """Carga un cubo guardado con guardar()."""
+        with open(f"{ruta_base}.json", "r") as f:
+            manifiesto = json.load(f)
+        with np.load(f"{ruta_base}.npz") as datos:
+            valores = datos["valores"]
+        return cls(
+            manifiesto["ejes"],
+            valores,
+            manifiesto["metricas"],
+            manifiesto["configuracion_base"],
+        )
+
+
+class BarridoParametros:
+    """
+    Ejecuta una simulación por cada combinación de una rejilla de parámetros.
+    Los nombres de la rejilla son campos de ConfiguracionSimulacion, por ejemplo:
+
+        BarridoParametros({
+            "costo_tiro": [4, 5, 6],
+            "num_rondas": [5, 10, 15],
+            "rango_cansancio": [[1, 2], [1, 3]],
+        }, ConfiguracionSimulacion(num_juegos=2000, semilla=7))
+    """
+
+    def __init__(
+        self,
+        rejilla: Dict[str, List[Any]],
+        config_base: Optional[ConfiguracionSimulacion] = None,
+        max_procesos: Optional[int] = None,
+    ):
+        """
+        Args:
+            rejilla (Dict[str, List[Any]]): Parámetro -> lista de valores a probar
+            config_base (ConfiguracionSimulacion): Valores de los parámetros no barridos;
+                debe tener semilla para poder usar números aleatorios comunes
+            max_procesos (int): Procesos de trabajo (por defecto, uno por CPU;
+                1 ejecuta las celdas en el proceso actual)
+
+        Raises:
+            ValueError: Si la rejilla está vacía, nombra un parámetro inexistente,
+                        o la configuración base no tiene semilla
+        """
+        if not rejilla or any(len(valores) == 0 for valores in rejilla.values()):
+            raise ValueError("La rejilla debe tener al menos un valor por parámetro")
+        campos = {campo.name for campo in fields(ConfiguracionSimulacion)}
+        desconocidos = set(rejilla) - campos
+        if desconocidos:
+            raise ValueError(f"Parámetros desconocidos: {sorted(desconocidos)}")
+        self.config_base = (
+            config_base
+            if config_base is not None
+            else ConfiguracionSimulacion(num_juegos=1000, semilla=12345)
+        )
+        if self.config_base.semilla is None:
+            raise ValueError("El barrido requiere una semilla para usar números aleatorios comunes")
+        self.rejilla = {nombre: list(valores) for nombre, valores in rejilla.items()}
+        self.max_procesos = max_procesos or os.cpu_count() or 1
+
+    def celdas(self):
+        """
+        Genera las celdas de la rejilla.
+
+        Returns:
+            List[tuple]: (índices, configuración validada) por cada combinación
+        """
+        nombres = list(self.rejilla)
+        celdas = []
+        for indices in itertools.product(*(range(len(v)) for v in self.rejilla.values())):
+            cambios = {
+                nombre: self.rejilla[nombre][i] for nombre, i in zip(nombres, indices)
+            }
+            config = replace(self.config_base, subflujos=True, **cambios).validar()
+            celdas.append((indices, config))
+        return celdas
+
+    def ejecutar(
+        self, al_progresar: Optional[Callable[[int, int], None]] = None
+    ) -> CuboResultados:
+        """
+        Ejecuta todas las celdas y construye el cubo de resultados.
+
+        Args:
+            al_progresar (Callable[[int, int], None]): Función opcional que recibe
+                (celdas_completadas, total_celdas)
+
+        Returns:
+            CuboResultados: Métricas agregadas por celda
+        """
+        celdas = self.celdas()
+        forma = tuple(len(v) for v in self.rejilla.values()) + (len(METRICAS_BARRIDO),)
+        valores = np.full(forma, np.nan)
+
+        if self.max_procesos == 1:
+            for completadas, (indices, config) in enumerate(celdas, start=1):
+                valores[indices] = _ejecutar_celda(config)
+                if al_progresar is not None:
+                    al_progresar(completadas, len(celdas))
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_procesos) as executor:
+                futuros = {
+                    executor.submit(_ejecutar_celda, config): indices
+                    for indices, config in celdas
+                }
+                for completadas, futuro in enumerate(as_completed(futuros), start=1):
+                    valores[futuros[futuro]] = futuro.result()
+                    if al_progresar is not None:
+                        al_progresar(completadas, len(celdas))
+
+        return CuboResultados(
+            self.rejilla, valores, METRICAS_BARRIDO, self.config_base.a_dict()
+        )
@@ -1,7 +1,12 @@
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from typing import List, Dict
 import math  # Necesario para cálculos trigonométricos
-from modelos.random_wrapper import uniform, choices
+import numpy as np
+from modelos.linear_congruence import LinearCongruenceRandom
+from modelos.random_wrapper import get_instance
+from modelos.substreams import derive_seeds
+from .eventos import Evento
+from .registro_tiros import RegistroTiros
 
 @dataclass
 class Lanzamiento:
@@ -13,6 +18,7 @@ class Lanzamiento:
         zona (int): Identificador numérico de la zona impactada
         puntaje (int): Puntuación obtenida por el tiro
     """
+    __slots__ = ("coordenadas", "zona", "puntaje")
     coordenadas: List[float]
     zona: int
     puntaje: int
@@ -29,12 +35,28 @@ class JugadorTiros:
         genero (str): Género del jugador ('M' o 'F')
         lanzamientos (List[Lanzamiento]): Lista de todos los tiros realizados
     """
+    __slots__ = ("jugador_id", "nombre", "genero", "lanzamientos")
     jugador_id: str
     nombre: str
     genero: str
     lanzamientos: List[Lanzamiento]
 
 
+class NivelRegistro:
+    """
+    Niveles de registro de tiros de un blanco.
+
+    NINGUNO: no se guarda ningún tiro (solo se calculan los puntajes)
+    PUNTAJES: se guardan jugador, zona y puntaje de cada tiro
+    COMPLETO: además, las coordenadas de cada tiro pueden consultarse; se calculan
+        solo cuando se piden, a partir de un subflujo propio de cada tiro
+    """
+    NINGUNO = "ninguno"
+    PUNTAJES = "puntajes"
+    COMPLETO = "completo"
+    TODOS = (NINGUNO, PUNTAJES, COMPLETO)
+
+
 class Blanco:
     """
     Representa el blanco de tiro con arco y maneja la lógica de puntuación.
@@ -49,6 +71,8 @@ class Blanco:
 
     # Mapeo zona -> puntaje (nombre a valor numérico)
     ZONAS = {"CENTRAL": 10, "INTERMEDIA": 9, "EXTERIOR": 8, "ERROR": 0}
+    # Código compacto de cada zona (su posición en ZONAS) usado en el registro de tiros
+    CODIGOS_ZONA = {zona: codigo for codigo, zona in enumerate(ZONAS)}
 
     # Parámetros de radios
     RADIO_CENTRAL = 1.0
@@ -56,6 +80,14 @@ class Blanco:
     RADIO_EXTERIOR = 5.0
     RADIO_ERROR_MULTIPLIER = 1.5  # Multiplicador para tiros fuera del blanco
 
+    # Radio mínimo y máximo de cada zona, en el orden de ZONAS
+    RANGOS_RADIO = (
+        (0.0, RADIO_CENTRAL),
+        (RADIO_CENTRAL, RADIO_INTERMEDIA),
+        (RADIO_INTERMEDIA, RADIO_EXTERIOR),
+        (RADIO_EXTERIOR, RADIO_EXTERIOR * RADIO_ERROR_MULTIPLIER),
+    )
+
     # Coste de resistencia
     TIRO_RESISTENCIA_COST = 5
 
@@ -65,8 +97,54 @@ class Blanco:
         "F": {"CENTRAL": 0.30, "INTERMEDIA": 0.38, "EXTERIOR": 0.27, "ERROR": 0.05},
     }
 
-    def __init__(self):
-        self.players: Dict[str, JugadorTiros] = {}  # JugadorID -> Datos
+    def __init__(
+        self,
+        rng=None,
+        probabilidades=None,
+        costo_tiro=None,
+        nivel_registro=NivelRegistro.COMPLETO,
+        eventos=None,
+    ):
+        """
+        Inicializa el blanco con un historial de tiros vacío.
+
+        Args:
+            rng (RandomWrapper): Generador a utilizar (por defecto, la instancia global)
+            probabilidades (dict): Probabilidades base por género y zona
+                (por defecto, PROBABILIDADES)
+            costo_tiro (int): Resistencia consumida por tiro
+                (por defecto, TIRO_RESISTENCIA_COST)
+            nivel_registro (str): Nivel de NivelRegistro con el que se guardan los tiros
+            eventos (BusEventos): Bus al que se emite Evento.TIRO (None: no se emite)
+
+        Atributos:
+            semilla_coordenadas (int): Semilla de la que se derivan las coordenadas
+                de cada tiro
+            registro (RegistroTiros): Historial de tiros (None con NivelRegistro.NINGUNO)
+
+        Raises:
+            ValueError: Si el nivel de registro no existe
+        """
+        self.rng = rng if rng is not None else get_instance()
+        self.probabilidades = (
+            probabilidades if probabilidades is not None else self.PROBABILIDADES
+        )
+        self.costo_tiro = (
+            costo_tiro if costo_tiro is not None else self.TIRO_RESISTENCIA_COST
+        )
+        if nivel_registro not in NivelRegistro.TODOS:
+            raise ValueError(f"Nivel de registro desconocido: {nivel_registro!r}")
+        self.nivel_registro = nivel_registro
+        self.eventos = eventos
+        # Se extrae siempre, para que el flujo principal no dependa del nivel de registro
+        self.semilla_coordenadas = self.rng.randint(1, LinearCongruenceRandom.DEFAULT_M - 1)
+        if nivel_registro == NivelRegistro.NINGUNO:
+            self.registro = None
+        else:
+            self.registro = RegistroTiros(
+                list(self.ZONAS.values()),
+                self.coordenadas_tiros if nivel_registro == NivelRegistro.COMPLETO else None,
+            )
 
     def realizar_tiro(self, jugador) -> int:
         """
@@ -84,25 +162,30 @@ class Blanco:
             - Registra el tiro en el historial del jugador
         """
         # Verificar resistencia
-        # if jugador.resistencia_actual < self.TIRO_RESISTENCIA_COST:
+        # if jugador.resistencia_actual < self.costo_tiro:
         #    return self.ZONAS["ERROR"]
 
         # Actualizar estado del jugador
-        jugador.resistencia_actual -= self.TIRO_RESISTENCIA_COST
+        jugador.resistencia_actual -= self.costo_tiro
         jugador.tiros_realizados += 1
 
         # Calcular probabilidades ajustadas
         probs = self._ajustar_probabilidades(jugador)
-        zona, coordenadas = self._generar_tiro(probs)
+        zona = self._seleccionar_zona(probs)
         puntaje = self.ZONAS[zona]
 
         # Registrar el tiro
-        if jugador.user_id not in self.players:
-            self._registrar_nuevo_jugador(jugador)
-
-        self.players[jugador.user_id].lanzamientos.append(
-            Lanzamiento(coordenadas=coordenadas, zona=self.ZONAS[zona], puntaje=puntaje)
-        )
+        if self.registro is not None:
+            self.registro.registrar(jugador, self.CODIGOS_ZONA[zona], puntaje)
+        if self.eventos is not None:
+            self.eventos.emitir(
+                Evento.TIRO,
+                blanco=self,
+                jugador=jugador,
+                zona=zona,
+                puntaje=puntaje,
+                desempate=False,
+            )
 
         return puntaje
 
@@ -124,35 +207,43 @@ class Blanco:
         jugador.reiniciar_suerte()
 
         probs = self._ajustar_probabilidades(jugador)
-        zona, coordenadas = self._generar_tiro(probs)
+        zona = self._seleccionar_zona(probs)
         puntaje = self.ZONAS[zona]
 
-        if jugador.user_id not in self.players:
-            self._registrar_nuevo_jugador(jugador)
-
-        self.players[jugador.user_id].lanzamientos.append(
-            Lanzamiento(coordenadas=coordenadas, zona=self.ZONAS[zona], puntaje=puntaje)
-        )
+        if self.registro is not None:
+            self.registro.registrar(jugador, self.CODIGOS_ZONA[zona], puntaje)
+        if self.eventos is not None:
+            self.eventos.emitir(
+                Evento.TIRO,
+                blanco=self,
+                jugador=jugador,
+                zona=zona,
+                puntaje=puntaje,
+                desempate=True,
+            )
 
         return puntaje
 
-    def _registrar_nuevo_jugador(self, jugador):
+    @property
+    def players(self) -> Dict[str, JugadorTiros]:
         """
-        Crea un nuevo registro para un jugador en el sistema.
-
-        Args:
-            jugador (Jugador): El jugador a registrar
+        Historial de tiros agrupado por jugador (JugadorID -> Datos).
 
-        Efectos:
-            - Crea una nueva entrada en self.players para el jugador
-            - Inicializa su lista de lanzamientos
-        """
-        self.players[jugador.user_id] = JugadorTiros(
-            jugador_id=jugador.user_id,
-            nombre=jugador.nombre,
-            genero=jugador.genero,
-            lanzamientos=[],
-        )
+        Se construye bajo demanda a partir del registro compacto, por lo que solo
+        debe usarse para inspeccionar tiros puntuales; para procesar muchos tiros
+        conviene leer self.registro.tiros directamente.
+        """
+        if self.registro is None:
+            return {}
+        return {
+            datos["jugador_id"]: JugadorTiros(
+                jugador_id=datos["jugador_id"],
+                nombre=datos["nombre"],
+                genero=datos["genero"],
+                lanzamientos=[Lanzamiento(**tiro) for tiro in datos["lanzamientos"]],
+            )
+            for datos in self.registro.serializar()
+        }
 
     def _ajustar_probabilidades(self, jugador) -> Dict[str, float]:
         """
@@ -170,7 +261,7 @@ class Blanco:
             3. Reduce prob. de ERROR según la experiencia
             4. Normaliza las probabilidades
         """
-        probs = self.PROBABILIDADES[jugador.genero].copy()
+        probs = self.probabilidades[jugador.genero].copy()
 
         # Aumentar probabilidad de CENTRAL por suerte
         factor_suerte = jugador.suerte / 3.0  # Normalizar suerte (rango 0-9)
@@ -184,49 +275,56 @@ class Blanco:
         total = sum(probs.values())
         return {zona: prob / total for zona, prob in probs.items()}
 
-    def _generar_tiro(self, probs: Dict[str, float]) -> tuple:
+    def _seleccionar_zona(self, probs: Dict[str, float]) -> str:
         """
-        Genera las coordenadas y zona de impacto de un tiro.
+        Selecciona la zona de impacto de un tiro según las probabilidades.
 
         Args:
             probs (Dict[str, float]): Probabilidades ajustadas para cada zona
 
         Returns:
-            tuple: (zona, [x, y]) donde zona es el identificador de la zona impactada
-                  y [x, y] son las coordenadas del impacto
-
-        Proceso:
-            1. Selecciona la zona de impacto según las probabilidades
-            2. Calcula el radio según la zona
-            3. Genera coordenadas polares aleatorias
-            4. Convierte a coordenadas cartesianas
+            str: Identificador de la zona impactada
         """
-        # Seleccionar zona
-        zona = choices(
+        return self.rng.choices(
             population=list(probs.keys()), 
             weights=list(probs.values()), 
             k=1
         )[0]
 
-        # Calcular radio según zona
-        if zona == "ERROR":
-            radio = uniform(
-                self.RADIO_EXTERIOR, 
-                self.RADIO_EXTERIOR * self.RADIO_ERROR_MULTIPLIER
-            )
-        elif zona == "EXTERIOR":
-            radio = uniform(self.RADIO_INTERMEDIA, self.RADIO_EXTERIOR)
-        elif zona == "INTERMEDIA":
-            radio = uniform(self.RADIO_CENTRAL, self.RADIO_INTERMEDIA)
-        else:  # CENTRAL
-            radio = uniform(0, self.RADIO_CENTRAL)
+    def coordenadas_tiros(self, numeros_tiro: np.ndarray, codigos_zona: np.ndarray) -> tuple:
+        """
+        Genera las coordenadas de impacto de un conjunto de tiros.
 
-        # Generar coordenadas polares
-        angulo = uniform(0, 2 * math.pi)
-        x = round(radio * math.cos(angulo), 2)
-        y = round(radio * math.sin(angulo), 2)
+        Cada tiro tiene su propio subflujo, derivado de semilla_coordenadas y de su
+        número de tiro en el blanco, por lo que sus coordenadas son siempre las
+        mismas sin importar cuándo se calculen ni el nivel de registro.
 
-        return zona, [x, y]
+        Args:
+            numeros_tiro (np.ndarray): Número de cada tiro en el blanco (desde 0)
+            codigos_zona (np.ndarray): Código de la zona impactada (posición en ZONAS)
+
+        Returns:
+            tuple: Arreglos (x, y) con las coordenadas redondeadas a 2 decimales
+
+        Proceso:
+            1. Deriva la semilla del subflujo de cada tiro
+            2. Obtiene dos números del generador congruencial con esa semilla
+            3. Calcula el radio dentro de la zona y el ángulo
+            4. Convierte a coordenadas cartesianas
+        """
+        m = LinearCongruenceRandom.DEFAULT_M
+        a = LinearCongruenceRandom.DEFAULT_A
+        estado = derive_seeds(self.semilla_coordenadas, numeros_tiro)
+        # a * estado < 2^47, por lo que el producto no desborda int64
+        estado = a * estado % m
+        u_radio = estado / (m - 1)
+        estado = a * estado % m
+        u_angulo = estado / (m - 1)
+
+        rangos = np.asarray(self.RANGOS_RADIO)[np.asarray(codigos_zona, dtype=np.int64)]
+        radio = rangos[:, 0] + (rangos[:, 1] - rangos[:, 0]) * u_radio
+        angulo = 2 * math.pi * u_angulo
+        return np.round(radio * np.cos(angulo), 2), np.round(radio * np.sin(angulo), 2)
 
     def obtener_tiros_serializables(self) -> List[dict]:
         """
@@ -236,7 +334,22 @@ class Blanco:
             List[dict]: Lista de diccionarios con los datos de tiros
                        de cada jugador en formato JSON
         """
-        return [asdict(player) for player in self.players.values()]
+        if self.registro is None:
+            return []
+        return self.registro.serializar()
+
+    def reiniciar(self):
+        """
+        Prepara el blanco para un nuevo juego, como si se creara uno nuevo.
+
+        Efectos:
+            - Extrae una nueva semilla de coordenadas del generador (igual que el
+              constructor, para que el flujo principal no cambie al reutilizarlo)
+            - Vacía el registro de tiros y reinicia su numeración
+        """
+        self.semilla_coordenadas = self.rng.randint(1, LinearCongruenceRandom.DEFAULT_M - 1)
+        if self.registro is not None:
+            self.registro.reiniciar()
 
     def reset(self):
         """
@@ -245,4 +358,5 @@ class Blanco:
         Efectos:
             - Elimina todos los registros de tiros anteriores
         """
-        self.players.clear()
+        if self.registro is not None:
+            self.registro.limpiar()
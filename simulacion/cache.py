@@ -0,0 +1,196 @@
+"""
+Caché de resultados de simulaciones.
+
+Una simulación con semilla es determinista: la misma configuración, los mismos
+equipos y las mismas constantes del blanco producen los mismos juegos. Este
+módulo calcula una clave a partir de todo ese contenido y guarda los resultados
+en disco bajo esa clave, de modo que una configuración repetida se resuelve sin
+volver a simular. El tamaño total del directorio está acotado y, al superarse,
+se eliminan primero las entradas usadas hace más tiempo (LRU).
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Optional
+
+from .blanco_objetivo import Blanco
+
+# Se incrementa cuando cambia la lógica de la simulación, para invalidar entradas viejas
+VERSION_CACHE = 4
+
+
+def _constantes_blanco() -> dict:
+    """Retorna las constantes de Blanco que afectan el resultado de los tiros."""
+    return {
+        "zonas": Blanco.ZONAS,
+        "radios": [
+            Blanco.RADIO_CENTRAL,
+            Blanco.RADIO_INTERMEDIA,
+            Blanco.RADIO_EXTERIOR,
+            Blanco.RADIO_ERROR_MULTIPLIER,
+        ],
+        "tiro_resistencia_cost": Blanco.TIRO_RESISTENCIA_COST,
+        "probabilidades": Blanco.PROBABILIDADES,
+    }
+
+
+def _plantilla(equipo) -> dict:
+    """
+    Retorna los datos de un equipo que determinan su desempeño.
+
+    Los nombres e identificadores de los jugadores no influyen en los tiros, por lo
+    que no forman parte de la clave; al recuperar una entrada se usa la plantilla
+    guardada junto con los resultados.
+    """
+    return {
+        "nombre": equipo.nombre,
+        "jugadores": [
+            [jugador.genero, jugador.resistencia_inicial] for jugador in equipo.jugadores
+        ],
+    }
+
+
+def clave_simulacion(simulador) -> Optional[str]:
+    """
+    Calcula la clave de caché de una simulación.
+
+    Args:
+        simulador (Simulador): Simulador ya construido (con sus equipos generados)
+
+    Returns:
+        str: Hash SHA-256 del contenido de la simulación, o None si la simulación
+             no tiene semilla y por lo tanto no es reproducible
+    """
+    if simulador.config.semilla is None:
+        return None
+    contenido = {
+        "version": VERSION_CACHE,
+        "configuracion": simulador.config.a_dict(),
+        "equipos": [_plantilla(simulador.equipo1), _plantilla(simulador.equipo2)],
+        "blanco": _constantes_blanco(),
+    }
+    serializado = json.dumps(contenido, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(serializado.encode("utf-8")).hexdigest()
+
+
+class CacheResultados:
+    """
+    Caché en disco de resultados de simulaciones, con tamaño acotado.
+    Cada entrada es un archivo JSON cuyo nombre es la clave de la simulación; la
+    fecha de modificación del archivo registra su último uso.
+    """
+
+    def __init__(self, directorio: str = "cache_resultados", max_bytes: int = 512 * 1024 * 1024):
+        """
+        Inicializa la caché.
+
+        Args:
+            directorio (str): Carpeta donde se guardan las entradas
+            max_bytes (int): Tamaño máximo total de las entradas en disco
+        """
+        self.directorio = directorio
+        self.max_bytes = max_bytes
+        self.aciertos = 0
+        self.fallos = 0
+        self._lock = threading.Lock()
+
+    def _ruta(self, clave: str) -> str:
+        return os.path.join(self.directorio, f"{clave}.json")
+
+    def obtener(self, clave: str) -> Optional[dict]:
+        """
+        Busca una entrada y, si existe, la marca como usada recientemente.
+
+        Args:
+            clave (str): Clave calculada con clave_simulacion
+
+        Returns:
+            dict: Datos guardados ({"equipos", "resultados"}) o None si no hay entrada
+        """
+        ruta = self._ruta(clave)
+        with self._lock:
+            try:
+                with open(ruta, "r") as f:
+                    datos = json.load(f)
+                os.utime(ruta)
+            except (FileNotFoundError, json.JSONDecodeError):
+                self.fallos += 1
+                return None
+            self.aciertos += 1
+            return datos
+
+    def guardar(self, clave: str, datos: dict) -> None:
+        """
+        Guarda una entrada y elimina las menos usadas si se supera el tamaño máximo.
+
+        Args:
+            clave (str): Clave calculada con clave_simulacion
+            datos (dict): Datos serializables a guardar
+        """
+        with self._lock:
+            os.makedirs(self.directorio, exist_ok=True)
+            ruta = self._ruta(clave)
+            temporal = f"{ruta}.{threading.get_ident()}.tmp"
+            with open(temporal, "w") as f:
+                json.dump(datos, f)
+            os.replace(temporal, ruta)
+            self._desalojar()
+
+    def _entradas(self):
+        """Retorna (ruta, tamaño, último uso) de cada entrada en disco."""
+        try:
+            nombres = os.listdir(self.directorio)
+        except FileNotFoundError:
+            return []
+        entradas = []
+        for nombre in nombres:
+            if not nombre.endswith(".json"):
+                continue
+            ruta = os.path.join(self.directorio, nombre)
+            try:
+                info = os.stat(ruta)
+            except FileNotFoundError:
+                continue
+            entradas.append((ruta, info.st_size, info.st_mtime))
+        return entradas
+
+    def _desalojar(self) -> None:
+        """Elimina las entradas usadas hace más tiempo hasta respetar max_bytes."""
+        entradas = sorted(self._entradas(), key=lambda e: e[2])
+        total = sum(tamano for _, tamano, _ in entradas)
+        for ruta, tamano, _ in entradas:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(ruta)
+            except FileNotFoundError:
+                pass
+            total -= tamano
+
+    def limpiar(self) -> None:
+        """Elimina todas las entradas de la caché."""
+        with self._lock:
+            for ruta, _, _ in self._entradas():
+                try:
+                    os.remove(ruta)
+                except FileNotFoundError:
+                    pass
+
+    def estadisticas(self) -> dict:
+        """
+        Retorna el estado de la caché.
+
+        Returns:
+            dict: Número de entradas, bytes usados, límite, aciertos y fallos
+        """
+        with self._lock:
+            entradas = self._entradas()
+        return {
+            "entradas": len(entradas),
+            "bytes": sum(tamano for _, tamano, _ in entradas),
+            "max_bytes": self.max_bytes,
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+        }
@@ -0,0 +1,580 @@
+"""
+Consultas vectorizadas sobre un archivo columnar de resultados.
+
+Una Consulta filtra los juegos, los agrupa por columnas y calcula agregados por
+grupo sin recorrer los resultados en Python: los filtros son máscaras de NumPy, cada
+grupo es un código entero por juego y los agregados se obtienen con np.bincount y
+ufunc.at sobre esos códigos. Las columnas de texto se comparan y agrupan por su
+código de diccionario, sin decodificarlas.
+
+Ejemplo (tasa de victorias de "Los jaguares" cada 1000 juegos):
+    Consulta.desde_dict({
+        "agrupar": [{"columna": "numero_juego", "ancho": 1000}],
+        "agregados": {
+            "juegos": ["conteo"],
+            "tasa_jaguares": ["proporcion", "equipo_ganador.nombre", "==", "Los jaguares"],
+        },
+    }).ejecutar(archivo)
+
+Filtros: [columna, operador, valor] con los operadores de OPERADORES. Las columnas de
+texto solo admiten "==", "!=" y "en". Los juegos a los que les falta la columna no
+cumplen ningún filtro sobre ella.
+
+Agrupación: nombres de columna o {"columna": ..., "ancho": n} para agrupar una
+columna numérica en intervalos [k*n, (k+1)*n); la clave es el inicio del intervalo.
+Los juegos sin valor forman su propio grupo, con clave None.
+
+Agregados (nombre -> [función, argumentos...]):
+    ["conteo"]                            Juegos del grupo
+    ["fraccion"]                          Juegos del grupo / juegos seleccionados
+    ["proporcion", columna, op, valor]    Fracción de juegos del grupo que cumplen
+                                          la condición
+    ["suma" | "media" | "minimo" | "maximo" | "desviacion", columna]
+    ["percentil", columna, p]             p en [0, 100] o lista de ellos; interpolación
+                                          lineal, como np.percentile
+    ["histograma", columna, ancho]        Conteos en intervalos de ese ancho, iguales
+                                          para todos los grupos
+Los agregados numéricos ignoran los juegos sin valor y valen None en un grupo vacío.
+"""
+
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .archivo_columnar import ArchivoColumnar, TipoColumna
+
+OPERADORES = ("==", "!=", "<", "<=", ">", ">=", "en", "entre")
+OPERADORES_TEXTO = ("==", "!=", "en")
+
+AGREGADOS_NUMERICOS = ("suma", "media", "minimo", "maximo", "desviacion")
+AGREGADOS = ("conteo", "fraccion", "proporcion", "percentil", "histograma") + AGREGADOS_NUMERICOS
+
+# Argumentos de cada agregado (los numéricos reciben solo la columna)
+ARGUMENTOS_AGREGADOS = {
+    "conteo": 0,
+    "fraccion": 0,
+    "proporcion": 3,
+    "percentil": 2,
+    "histograma": 2,
+}
+
+# Celdas máximas de las tablas grupo x valor (histogramas y percentiles de enteros)
+MAX_CELDAS = 1 << 22
+
+# Grupos hasta los que los percentiles se calculan grupo por grupo con np.percentile
+MAX_GRUPOS_PARTICION = 16
+
+_COMPARACIONES = {
+    "==": np.equal,
+    "!=": np.not_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+}
+
+
+def _condicion(archivo: ArchivoColumnar, columna: str, operador: str, valor: Any) -> np.ndarray:
+    """
+    Evalúa columna <operador> valor sobre todos los juegos.
+
+    Returns:
+        np.ndarray: Máscara con True en los juegos que cumplen la condición
+
+    Raises:
+        KeyError: Si la columna no existe
+        ValueError: Si el operador o el valor no son válidos para la columna
+    """
+    if operador not in OPERADORES:
+        raise ValueError(f"Operador desconocido {operador!r}; use uno de {list(OPERADORES)}")
+    if operador == "en" and not isinstance(valor, (list, tuple)):
+        raise ValueError(f"El operador 'en' requiere una lista de valores ({columna})")
+    if operador == "entre" and (not isinstance(valor, (list, tuple)) or len(valor) != 2):
+        raise ValueError(f"El operador 'entre' requiere [mínimo, máximo] ({columna})")
+
+    datos = archivo.valores(columna)
+    if archivo.tipo(columna) == TipoColumna.TEXTO:
+        if operador not in OPERADORES_TEXTO:
+            raise ValueError(
+                f"La columna {columna!r} es de texto y solo admite {list(OPERADORES_TEXTO)}"
+            )
+        textos = valor if operador == "en" else [valor]
+        if not all(isinstance(texto, str) for texto in textos):
+            raise ValueError(f"La columna {columna!r} es de texto y requiere valores de texto")
+        codigos = [archivo.codigo(columna, texto) for texto in textos]
+        codigos = [codigo for codigo in codigos if codigo is not None]
+        if operador == "en":
+            return np.isin(datos, codigos)
+        if not codigos:
+            # Un texto que no aparece en la columna
+            return np.zeros(archivo.filas, dtype=bool) if operador == "==" else datos >= 0
+        if operador == "==":
+            return datos == codigos[0]
+        return (datos != codigos[0]) & (datos >= 0)
+
+    valores = valor if operador in ("en", "entre") else [valor]
+    if not all(isinstance(v, (int, float)) for v in valores):
+        raise ValueError(f"La columna {columna!r} es numérica y requiere valores numéricos")
+    if operador == "en":
+        mascara = np.isin(datos, valores)
+    elif operador == "entre":
+        mascara = (datos >= valor[0]) & (datos <= valor[1])
+    else:
+        mascara = _COMPARACIONES[operador](datos, valor)
+    nulos = archivo.nulos(columna)
+    return mascara & ~nulos if nulos.any() else mascara
+
+
+def _columna_numerica(archivo: ArchivoColumnar, columna: str) -> np.ndarray:
+    if archivo.tipo(columna) == TipoColumna.TEXTO:
+        raise ValueError(f"La columna {columna!r} es de texto y no admite agregados numéricos")
+    return archivo.valores(columna)
+
+
+def _a_python(valor: Any) -> Any:
+    """Convierte escalares de NumPy a tipos de Python (NaN -> None) para JSON."""
+    if isinstance(valor, np.generic):
+        valor = valor.item()
+    if isinstance(valor, float) and math.isnan(valor):
+        return None
+    return valor
+
+
+@dataclass
+class Consulta:
+    """
+    Filtros, agrupación y agregados de una consulta sobre un archivo columnar.
+
+    Atributos:
+        filtros (List[list]): Condiciones [columna, operador, valor] que deben
+            cumplirse todas
+        agrupar (List[Union[str, dict]]): Columnas de agrupación; vacío para un
+            único grupo con todos los juegos seleccionados
+        agregados (Dict[str, list]): Nombre del resultado -> [función, argumentos...]
+    """
+
+    filtros: List[list] = field(default_factory=list)
+    agrupar: List[Union[str, dict]] = field(default_factory=list)
+    agregados: Dict[str, list] = field(default_factory=lambda: {"juegos": ["conteo"]})
+
+    @classmethod
+    def desde_dict(cls, datos: dict) -> "Consulta":
+        """
+        Construye una consulta desde un diccionario (p. ej. el cuerpo de una petición).
+
+        Args:
+            datos (dict): Claves opcionales "filtros", "agrupar" y "agregados"
+
+        Returns:
+            Consulta: Consulta con la forma ya validada
+
+        Raises:
+            ValueError: Si los datos no tienen la forma esperada
+        """
+        if not isinstance(datos, dict):
+            raise ValueError("La consulta debe ser un objeto JSON")
+        desconocidas = set(datos) - {"filtros", "agrupar", "agregados"}
+        if desconocidas:
+            raise ValueError(f"Claves desconocidas en la consulta: {sorted(desconocidas)}")
+        consulta = cls()
+        if "filtros" in datos:
+            consulta.filtros = datos["filtros"]
+        if "agrupar" in datos:
+            consulta.agrupar = datos["agrupar"]
+        if "agregados" in datos:
+            consulta.agregados = datos["agregados"]
+        return consulta.validar()
+
+    def validar(self) -> "Consulta":
+        """
+        Verifica la forma de la consulta (las columnas se verifican al ejecutarla).
+
+        Returns:
+            Consulta: La misma consulta
+
+        Raises:
+            ValueError: Si un filtro, una agrupación o un agregado está mal formado
+        """
+        if not isinstance(self.filtros, list) or not all(
+            isinstance(f, (list, tuple)) and len(f) == 3 and isinstance(f[0], str)
+            for f in self.filtros
+        ):
+            raise ValueError("filtros debe ser una lista de [columna, operador, valor]")
+        if not isinstance(self.agrupar, list):
+            raise ValueError("agrupar debe ser una lista de columnas")
+        for grupo in self.agrupar:
+            if isinstance(grupo, dict):
+                ancho = grupo.get("ancho")
+                if (
+                    set(grupo) != {"columna", "ancho"}
+                    or not isinstance(grupo["columna"], str)
+                    or isinstance(ancho, bool)
+                    or not isinstance(ancho, (int, float))
+                    or ancho <= 0
+                ):
+                    raise ValueError(
+                        'Una agrupación por intervalos es {"columna": ..., "ancho": n > 0}'
+                    )
+            elif not isinstance(grupo, str):
+                raise ValueError("Cada agrupación debe ser una columna o {columna, ancho}")
+        if not isinstance(self.agregados, dict) or not self.agregados:
+            raise ValueError("agregados debe ser un objeto no vacío")
+        for nombre, agregado in self.agregados.items():
+            self._validar_agregado(nombre, agregado)
+        return self
+
+    @staticmethod
+    def _validar_agregado(nombre: str, agregado: Any) -> None:
+        if not isinstance(agregado, (list, tuple)) or not agregado:
+            raise ValueError(f"El agregado {nombre!r} debe ser [función, argumentos...]")
+        funcion, argumentos = agregado[0], list(agregado[1:])
+        if funcion not in AGREGADOS:
+            raise ValueError(
+                f"Agregado desconocido {funcion!r} en {nombre!r}; use uno de {list(AGREGADOS)}"
+            )
+        esperados = ARGUMENTOS_AGREGADOS.get(funcion, 1)
+        if len(argumentos) != esperados or (esperados and not isinstance(argumentos[0], str)):
+            raise ValueError(f"{funcion!r} en {nombre!r} requiere {esperados} argumentos")
+        if funcion == "percentil":
+            percentiles = argumentos[1] if isinstance(argumentos[1], list) else [argumentos[1]]
+            if not percentiles or not all(
+                isinstance(p, (int, float)) and not isinstance(p, bool) and 0 <= p <= 100
+                for p in percentiles
+            ):
+                raise ValueError(f"Los percentiles de {nombre!r} deben estar en [0, 100]")
+        if funcion == "histograma":
+            ancho = argumentos[1]
+            if isinstance(ancho, bool) or not isinstance(ancho, (int, float)) or ancho <= 0:
+                raise ValueError(f"El ancho del histograma {nombre!r} debe ser positivo")
+
+    def a_dict(self) -> dict:
+        """Retorna la consulta como diccionario serializable."""
+        return {
+            "filtros": [list(f) for f in self.filtros],
+            "agrupar": list(self.agrupar),
+            "agregados": {nombre: list(a) for nombre, a in self.agregados.items()},
+        }
+
+    def ejecutar(self, archivo: ArchivoColumnar) -> dict:
+        """
+        Ejecuta la consulta sobre un archivo columnar.
+
+        Args:
+            archivo (ArchivoColumnar): Resultados por columnas
+
+        Returns:
+            dict: "filas" (juegos del archivo), "seleccionadas" (juegos que cumplen
+                los filtros), "grupos" (lista de {"clave": {columna: valor},
+                "agregados": {nombre: valor}}, ordenada por clave) y "duracion_ms"
+
+        Raises:
+            KeyError: Si la consulta usa una columna que el archivo no tiene
+            ValueError: Si un operador, valor o agregado no es válido para su columna
+        """
+        self.validar()
+        inicio = time.perf_counter()
+
+        mascara = np.ones(archivo.filas, dtype=bool)
+        for columna, operador, valor in self.filtros:
+            mascara &= _condicion(archivo, columna, operador, valor)
+        seleccion = np.flatnonzero(mascara)
+        todas = len(seleccion) == archivo.filas
+
+        def tomar(arreglo: np.ndarray) -> np.ndarray:
+            return np.asarray(arreglo) if todas else arreglo[seleccion]
+
+        grupos, claves = self._agrupar(archivo, tomar, len(seleccion))
+        total_grupos = len(claves)
+        conteo = np.bincount(grupos, minlength=total_grupos)
+
+        resultados: Dict[str, list] = {}
+        for nombre, agregado in self.agregados.items():
+            funcion, argumentos = agregado[0], list(agregado[1:])
+            if funcion == "conteo":
+                valores: list = conteo.tolist()
+            elif funcion == "fraccion":
+                valores = (conteo / len(seleccion) if len(seleccion) else conteo * np.nan).tolist()
+            elif funcion == "proporcion":
+                cumple = tomar(_condicion(archivo, *argumentos))
+                cumplen = np.bincount(grupos, weights=cumple, minlength=total_grupos)
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    valores = (cumplen / conteo).tolist()
+            else:
+                columna = argumentos[0]
+                datos = tomar(_columna_numerica(archivo, columna))
+                grupos_validos = grupos
+                nulos = tomar(archivo.nulos(columna))
+                if nulos.any():
+                    datos, grupos_validos = datos[~nulos], grupos[~nulos]
+                valores = _agregar(
+                    funcion,
+                    archivo.tipo(columna),
+                    datos,
+                    grupos_validos,
+                    total_grupos,
+                    argumentos[1:],
+                )
+            resultados[nombre] = [_a_python(v) for v in valores]
+
+        filas = [
+            {
+                "clave": clave,
+                "agregados": {nombre: valores[i] for nombre, valores in resultados.items()},
+            }
+            for i, clave in enumerate(claves)
+        ]
+        columnas = [g["columna"] if isinstance(g, dict) else g for g in self.agrupar]
+        filas.sort(
+            key=lambda fila: [(fila["clave"][c] is not None, fila["clave"][c]) for c in columnas]
+        )
+        return {
+            "filas": archivo.filas,
+            "seleccionadas": int(len(seleccion)),
+            "grupos": filas,
+            "duracion_ms": (time.perf_counter() - inicio) * 1000,
+        }
+
+    def _agrupar(
+        self, archivo: ArchivoColumnar, tomar, seleccionadas: int
+    ) -> Tuple[np.ndarray, List[dict]]:
+        """
+        Asigna a cada juego seleccionado el índice de su grupo.
+
+        Returns:
+            Tuple[np.ndarray, List[dict]]: Índice de grupo por juego y la clave de
+                cada grupo ({columna: valor})
+        """
+        if not self.agrupar:
+            return np.zeros(seleccionadas, dtype=np.intp), [{}]
+
+        columnas = []
+        combinado = np.zeros(seleccionadas, dtype=np.int64)
+        tamanos = []
+        for grupo in self.agrupar:
+            if isinstance(grupo, dict):
+                columna, ancho = grupo["columna"], grupo["ancho"]
+            else:
+                columna, ancho = grupo, None
+            codigos, etiquetas = _codigos_grupo(archivo, columna, ancho, tomar)
+            columnas.append((columna, etiquetas))
+            tamanos.append(len(etiquetas))
+            if math.prod(tamanos) >= 2**62:
+                raise ValueError("Demasiadas combinaciones de grupos")
+            combinado = combinado * len(etiquetas) + codigos
+
+        # Se conservan solo las combinaciones que aparecen
+        if combinado.size and math.prod(tamanos) <= max(4 * seleccionadas, MAX_CELDAS):
+            presentes = np.flatnonzero(np.bincount(combinado, minlength=math.prod(tamanos)))
+            indice = np.empty(math.prod(tamanos), dtype=np.intp)
+            indice[presentes] = np.arange(len(presentes))
+            grupos = indice[combinado]
+        else:
+            presentes, grupos = np.unique(combinado, return_inverse=True)
+
+        posiciones = np.unravel_index(presentes, tamanos)
+        claves = [{} for _ in range(len(presentes))]
+        for (columna, etiquetas), posicion in zip(columnas, posiciones):
+            for clave, i in zip(claves, posicion.tolist()):
+                clave[columna] = etiquetas[i]
+        return grupos.reshape(-1), claves
+
+
+def _codigos_grupo(
+    archivo: ArchivoColumnar, columna: str, ancho: Optional[float], tomar
+) -> Tuple[np.ndarray, list]:
+    """
+    Convierte una columna de agrupación en códigos 0..k-1 y sus k etiquetas.
+
+    Los juegos sin valor reciben el código 0 y la etiqueta None.
+    """
+    tipo = archivo.tipo(columna)
+    if tipo == TipoColumna.TEXTO:
+        if ancho is not None:
+            raise ValueError(f"La columna {columna!r} es de texto y no admite intervalos")
+        # El código -1 (nulo) pasa a 0 y el resto se corre en uno
+        codigos = tomar(archivo.valores(columna)).astype(np.int64) + 1
+        return codigos, [None] + archivo.diccionario(columna)
+
+    datos = tomar(archivo.valores(columna))
+    nulos = tomar(archivo.nulos(columna))
+    if ancho is not None:
+        if tipo == TipoColumna.BOOLEANO:
+            raise ValueError(f"La columna {columna!r} es booleana y no admite intervalos")
+        datos = np.floor_divide(np.where(nulos, 0, datos), ancho).astype(np.int64)
+    elif tipo == TipoColumna.REAL:
+        datos = np.where(nulos, 0.0, datos)
+    else:
+        datos = datos.astype(np.int64)
+
+    validos = datos[~nulos] if nulos.any() else datos
+    if not validos.size:
+        valores_distintos = np.zeros(0, dtype=datos.dtype)
+        codigos = np.zeros(len(datos), dtype=np.int64)
+    elif (
+        datos.dtype.kind == "i"
+        and int(validos.max()) - int(validos.min()) < 4 * len(datos) + 1024
+    ):
+        # Rango chico: el código es el desplazamiento desde el mínimo, sin ordenar
+        minimo = int(validos.min())
+        presentes = np.bincount(validos - minimo).nonzero()[0]
+        indice = np.zeros(int(validos.max()) - minimo + 1, dtype=np.int64)
+        indice[presentes] = np.arange(len(presentes))
+        valores_distintos = presentes + minimo
+        codigos = indice[np.clip(datos - minimo, 0, len(indice) - 1)]
+    else:
+        valores_distintos, codigos = np.unique(datos, return_inverse=True)
+        codigos = codigos.reshape(-1)
+
+    if ancho is not None:
+        etiquetas = [_a_python(v * ancho) for v in valores_distintos]
+    elif tipo == TipoColumna.BOOLEANO:
+        etiquetas = [bool(v) for v in valores_distintos.tolist()]
+    else:
+        etiquetas = valores_distintos.tolist()
+    if not nulos.any():
+        return codigos + 1, [None] + etiquetas
+    return np.where(nulos, 0, codigos + 1), [None] + etiquetas
+
+
+def _agregar(
+    funcion: str,
+    tipo: str,
+    datos: np.ndarray,
+    grupos: np.ndarray,
+    total_grupos: int,
+    argumentos: list,
+) -> list:
+    """
+    Calcula un agregado numérico por grupo.
+
+    Args:
+        funcion (str): Uno de AGREGADOS_NUMERICOS, "percentil" o "histograma"
+        tipo (str): TipoColumna de los datos
+        datos (np.ndarray): Valores sin nulos
+        grupos (np.ndarray): Índice de grupo de cada valor
+        total_grupos (int): Cantidad de grupos
+        argumentos (list): Argumentos del agregado después de la columna
+
+    Returns:
+        list: Un valor por grupo (NaN en los grupos vacíos)
+    """
+    enteros = tipo in (TipoColumna.ENTERO, TipoColumna.BOOLEANO)
+    if datos.dtype == bool:
+        datos = datos.astype(np.int8)
+    if funcion == "histograma":
+        return _histograma(datos, grupos, total_grupos, argumentos[0])
+    if funcion == "percentil":
+        return _percentiles(datos, grupos, total_grupos, argumentos[0], enteros)
+
+    datos = datos.astype(np.float64)
+    conteo = np.bincount(grupos, minlength=total_grupos)
+    suma = np.bincount(grupos, weights=datos, minlength=total_grupos)
+    if funcion == "suma":
+        return suma.astype(np.int64).tolist() if enteros else suma.tolist()
+    with np.errstate(invalid="ignore", divide="ignore"):
+        media = suma / conteo
+        if funcion == "media":
+            return media.tolist()
+        if funcion == "desviacion":
+            # Desviación muestral, en dos pasadas para no perder precisión
+            desvios = np.bincount(
+                grupos, weights=(datos - media[grupos]) ** 2, minlength=total_grupos
+            )
+            return np.sqrt(desvios / (conteo - 1)).tolist()
+
+    extremo = np.full(total_grupos, np.inf if funcion == "minimo" else -np.inf)
+    (np.minimum if funcion == "minimo" else np.maximum).at(extremo, grupos, datos)
+    extremo[conteo == 0] = np.nan
+    if enteros:
+        return [None if math.isnan(v) else int(v) for v in extremo.tolist()]
+    return extremo.tolist()
+
+
+def _percentiles(
+    datos: np.ndarray,
+    grupos: np.ndarray,
+    total_grupos: int,
+    percentiles: Union[float, List[float]],
+    enteros: bool,
+) -> list:
+    """
+    Percentiles por grupo con interpolación lineal entre estadísticos de orden.
+
+    Con enteros de rango chico los estadísticos de orden salen de una tabla de
+    conteos grupo x valor; con pocos grupos, de np.percentile sobre cada grupo (que
+    usa selección parcial, sin ordenar); en otro caso se ordenan los valores por grupo.
+    """
+    lista = percentiles if isinstance(percentiles, list) else [percentiles]
+    conteo = np.bincount(grupos, minlength=total_grupos)
+    no_vacios = conteo > 0
+    tabla = np.full((total_grupos, len(lista)), np.nan)
+
+    if enteros and datos.size:
+        minimo = int(datos.min())
+        rango = int(datos.max()) - minimo + 1
+    if enteros and datos.size and rango * total_grupos <= MAX_CELDAS:
+        acumulado = np.cumsum(
+            np.bincount(
+                grupos * rango + (datos.astype(np.int64) - minimo),
+                minlength=total_grupos * rango,
+            ).reshape(total_grupos, rango),
+            axis=1,
+        )
+
+        def estadistico(k: np.ndarray) -> np.ndarray:
+            # Valor de orden k (desde 0) de cada grupo
+            return (acumulado <= k[:, None]).sum(axis=1) + minimo
+    elif total_grupos <= MAX_GRUPOS_PARTICION:
+        for grupo in np.flatnonzero(no_vacios).tolist():
+            valores = datos if total_grupos == 1 else datos[grupos == grupo]
+            tabla[grupo] = np.percentile(valores, lista)
+        estadistico = None
+    else:
+        ordenados = datos[np.lexsort((datos, grupos))].astype(np.float64)
+        comienzos = np.concatenate(([0], np.cumsum(conteo)[:-1]))
+
+        def estadistico(k: np.ndarray) -> np.ndarray:
+            return ordenados[np.where(no_vacios, comienzos + k, 0)]
+
+    if estadistico is not None and datos.size:
+        for columna, p in enumerate(lista):
+            posicion = np.maximum(conteo - 1, 0) * (p / 100)
+            bajo = np.floor(posicion).astype(np.int64)
+            inferior = estadistico(bajo).astype(np.float64)
+            superior = estadistico(np.ceil(posicion).astype(np.int64)).astype(np.float64)
+            tabla[:, columna] = np.where(
+                no_vacios, inferior + (superior - inferior) * (posicion - bajo), np.nan
+            )
+
+    if isinstance(percentiles, list):
+        return [[None if math.isnan(v) else v for v in fila] for fila in tabla.tolist()]
+    return tabla[:, 0].tolist()
+
+
+def _histograma(
+    datos: np.ndarray, grupos: np.ndarray, total_grupos: int, ancho: float
+) -> list:
+    """
+    Conteos por grupo en intervalos [inicio + k*ancho, inicio + (k+1)*ancho).
+
+    Returns:
+        list: Por grupo, {"inicio", "ancho", "conteos"}; todos los grupos comparten
+            inicio y cantidad de intervalos
+    """
+    if not datos.size:
+        return [{"inicio": None, "ancho": ancho, "conteos": []} for _ in range(total_grupos)]
+    intervalos = np.floor_divide(datos, ancho).astype(np.int64)
+    primero = int(intervalos.min())
+    cantidad = int(intervalos.max()) - primero + 1
+    if cantidad * total_grupos > MAX_CELDAS:
+        raise ValueError(
+            f"El histograma tendría demasiados intervalos ({cantidad}); use un ancho mayor"
+        )
+    conteos = np.bincount(
+        grupos * cantidad + (intervalos - primero), minlength=total_grupos * cantidad
+    ).reshape(total_grupos, cantidad)
+    inicio = _a_python(primero * ancho)
+    return [{"inicio": inicio, "ancho": ancho, "conteos": fila} for fila in conteos.tolist()]
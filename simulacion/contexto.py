@@ -0,0 +1,57 @@
+from modelos.random_wrapper import RandomWrapper, get_instance
+from .blanco_objetivo import NivelRegistro
+
+
+class ContextoSimulacion:
+    """
+    Estado aislado de una simulación.
+    Agrupa el generador de números aleatorios y los contadores acumulados entre
+    juegos, de modo que varias simulaciones puedan ejecutarse al mismo tiempo
+    sin compartir estado.
+    """
+
+    def __init__(
+        self,
+        semilla=None,
+        rng=None,
+        probabilidades=None,
+        costo_tiro=None,
+        rango_cansancio=None,
+        nivel_registro=NivelRegistro.COMPLETO,
+        eventos=None,
+    ):
+        """
+        Inicializa un contexto de simulación.
+
+        Args:
+            semilla (int): Semilla del generador propio del contexto (opcional)
+            rng (RandomWrapper): Generador ya construido; si se indica, se ignora la semilla
+            probabilidades (dict): Probabilidades base por género y zona del blanco
+                (None usa Blanco.PROBABILIDADES)
+            costo_tiro (int): Resistencia consumida por tiro
+                (None usa Blanco.TIRO_RESISTENCIA_COST)
+            rango_cansancio (tuple): Cansancio mínimo y máximo por ronda
+                (None usa Jugador.RANGO_CANSANCIO)
+            nivel_registro (str): Nivel de NivelRegistro de los blancos de cada juego
+            eventos (BusEventos): Bus al que se emiten los eventos de rondas y tiros
+                (None: sin instrumentación)
+
+        Atributos:
+            rng (RandomWrapper): Generador usado por equipos, jugadores, blancos y rondas
+            generos_victorias_totales (dict): Victorias acumuladas por género en la simulación
+            semilla_subflujo (int): Semilla del juego en curso cuando se usan subflujos;
+                si no es None, cada ronda reinicia rng con una semilla derivada de ella
+        """
+        self.semilla = semilla
+        self.rng = rng if rng is not None else RandomWrapper(semilla)
+        self.probabilidades = probabilidades
+        self.costo_tiro = costo_tiro
+        self.rango_cansancio = rango_cansancio
+        self.nivel_registro = nivel_registro
+        self.eventos = eventos
+        self.generos_victorias_totales = {"M": 0, "F": 0}
+        self.semilla_subflujo = None
+
+
+# Contexto usado por los juegos creados sin un contexto explícito
+CONTEXTO_GLOBAL = ContextoSimulacion(rng=get_instance())
@@ -0,0 +1,169 @@
+"""
+Parada temprana por convergencia para simulaciones Monte Carlo.
+
+En lugar de simular siempre la cantidad máxima de juegos, el monitor mantiene
+en línea un intervalo de confianza para cada métrica objetivo (probabilidad de
+victoria de cada equipo y proporción de juegos ganados por cada género) y
+permite detener la simulación cuando todos los intervalos tienen un semi-ancho
+menor o igual al solicitado.
+"""
+
+from math import sqrt
+from statistics import NormalDist
+from typing import Dict, Iterable, Optional
+
+
+class EstimadorProporcion:
+    """
+    Estimador en línea de una proporción con intervalo de Wilson.
+    Solo guarda dos contadores, por lo que cada actualización es O(1).
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.exitos = 0
+
+    def registrar(self, exito: bool) -> None:
+        """Agrega una observación de Bernoulli."""
+        self.n += 1
+        if exito:
+            self.exitos += 1
+
+    @property
+    def estimacion(self) -> float:
+        """Proporción observada (0.0 si aún no hay observaciones)."""
+        return self.exitos / self.n if self.n else 0.0
+
+    def intervalo(self, z: float) -> tuple:
+        """
+        Calcula el intervalo de confianza de Wilson.
+
+        A diferencia del intervalo normal, no colapsa a ancho cero cuando la
+        proporción observada es 0 o 1, lo que evita detenciones prematuras.
+
+        Args:
+            z (float): Cuantil de la normal estándar para el nivel de confianza
+
+        Returns:
+            tuple: (inferior, superior, semi_ancho)
+        """
+        if self.n == 0:
+            return 0.0, 1.0, 0.5
+        p = self.estimacion
+        z2 = z * z
+        denominador = 1 + z2 / self.n
+        centro = (p + z2 / (2 * self.n)) / denominador
+        semi_ancho = z * sqrt(p * (1 - p) / self.n + z2 / (4 * self.n * self.n)) / denominador
+        return max(0.0, centro - semi_ancho), min(1.0, centro + semi_ancho), semi_ancho
+
+
+class MonitorConvergencia:
+    """
+    Sigue las métricas de una simulación juego a juego y decide cuándo detenerla.
+
+    Métricas disponibles:
+        victoria_equipo1: Probabilidad de que el equipo 1 gane el juego
+        victoria_equipo2: Probabilidad de que el equipo 2 gane el juego
+        victoria_genero_M: Proporción de juegos en que el género M gana más rondas
+        victoria_genero_F: Proporción de juegos en que el género F gana más rondas
+    """
+
+    METRICAS = (
+        "victoria_equipo1",
+        "victoria_equipo2",
+        "victoria_genero_M",
+        "victoria_genero_F",
+    )
+
+    def __init__(
+        self,
+        semi_ancho_objetivo: float,
+        confianza: float = 0.95,
+        juegos_minimos: int = 100,
+        metricas: Optional[Iterable[str]] = None,
+    ):
+        """
+        Inicializa el monitor.
+
+        Args:
+            semi_ancho_objetivo (float): Semi-ancho máximo aceptado para cada intervalo
+            confianza (float): Nivel de confianza de los intervalos (entre 0 y 1)
+            juegos_minimos (int): Juegos mínimos antes de evaluar la convergencia
+            metricas (Iterable[str]): Métricas objetivo (por defecto, todas)
+
+        Raises:
+            ValueError: Si algún parámetro está fuera de rango o una métrica no existe
+        """
+        if not 0 < semi_ancho_objetivo <= 0.5:
+            raise ValueError("El semi-ancho objetivo debe estar en (0, 0.5]")
+        if not 0 < confianza < 1:
+            raise ValueError("La confianza debe estar en (0, 1)")
+        if juegos_minimos < 1:
+            raise ValueError("Se requiere al menos un juego antes de evaluar la convergencia")
+        self.metricas = tuple(metricas) if metricas is not None else self.METRICAS
+        desconocidas = set(self.metricas) - set(self.METRICAS)
+        if desconocidas:
+            raise ValueError(f"Métricas desconocidas: {sorted(desconocidas)}")
+
+        self.semi_ancho_objetivo = semi_ancho_objetivo
+        self.confianza = confianza
+        self.juegos_minimos = juegos_minimos
+        self.z = NormalDist().inv_cdf((1 + confianza) / 2)
+        self.estimadores: Dict[str, EstimadorProporcion] = {
+            metrica: EstimadorProporcion() for metrica in self.METRICAS
+        }
+
+    @property
+    def juegos(self) -> int:
+        """Cantidad de juegos registrados."""
+        return self.estimadores["victoria_equipo1"].n
+
+    def registrar(self, resultado: dict) -> None:
+        """
+        Actualiza las métricas con el resultado serializado de un juego.
+
+        Args:
+            resultado (dict): Resultado con el esquema de resultados_acumulados.json
+        """
+        puntaje1 = resultado["equipo_1"]["puntaje_total"]
+        puntaje2 = resultado["equipo_2"]["puntaje_total"]
+        genero = resultado["genero_con_mas_victorias"]
+        self.estimadores["victoria_equipo1"].registrar(puntaje1 > puntaje2)
+        self.estimadores["victoria_equipo2"].registrar(puntaje2 > puntaje1)
+        self.estimadores["victoria_genero_M"].registrar(genero == "M")
+        self.estimadores["victoria_genero_F"].registrar(genero == "F")
+
+    def convergio(self) -> bool:
+        """Indica si todas las métricas objetivo alcanzaron el semi-ancho solicitado."""
+        if self.juegos < self.juegos_minimos:
+            return False
+        return all(
+            self.estimadores[metrica].intervalo(self.z)[2] <= self.semi_ancho_objetivo
+            for metrica in self.metricas
+        )
+
+    def resumen(self) -> dict:
+        """
+        Retorna los intervalos actuales en formato serializable.
+
+        Returns:
+            dict: Juegos usados, indicador de convergencia y, por métrica, la
+                  estimación, los límites y el semi-ancho del intervalo
+        """
+        intervalos = {}
+        for metrica, estimador in self.estimadores.items():
+            inferior, superior, semi_ancho = estimador.intervalo(self.z)
+            intervalos[metrica] = {
+                "estimacion": estimador.estimacion,
+                "inferior": inferior,
+                "superior": superior,
+                "semi_ancho": semi_ancho,
+                "objetivo": metrica in self.metricas,
+            }
+        return {
+            "juegos_usados": self.juegos,
+            "convergio": self.convergio(),
+            "semi_ancho_objetivo": self.semi_ancho_objetivo,
+            "confianza": self.confianza,
+            "intervalos": intervalos,
+        }
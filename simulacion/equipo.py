@@ -1,7 +1,7 @@
 from .jugador import Jugador
-import names  # Necesario para generar nombres aleatorios
+from .nombres import nombre_completo
 from uuid import uuid4  # Más específico que importar todo uuid
-from modelos.random_wrapper import choice, shuffle
+from modelos.random_wrapper import get_instance
 
 class Equipo:
     """
@@ -9,13 +9,26 @@ class Equipo:
     Gestiona un grupo de jugadores y mantiene las estadísticas del equipo.
     """
 
-    def __init__(self, nombre, num_jugadores=5):
+    __slots__ = (
+        "rng",
+        "equipo_id",
+        "nombre",
+        "jugadores",
+        "rondas_ganadas",
+        "puntaje_total",
+        "puntaje_juego",
+        "juegos_ganados",
+        "jugadores_por_id",
+    )
+
+    def __init__(self, nombre, num_jugadores=5, rng=None):
         """
         Inicializa un nuevo equipo con sus jugadores.
 
         Args:
             nombre (str): Nombre identificador del equipo
             num_jugadores (int): Número de jugadores en el equipo (mínimo 2)
+            rng (RandomWrapper): Generador a utilizar (por defecto, la instancia global)
 
         Atributos:
             equipo_id (str): Identificador único del equipo
@@ -25,6 +38,7 @@ class Equipo:
             puntaje_juego (int): Puntos acumulados en el juego actual
             juegos_ganados (int): Número total de juegos ganados
         """
+        self.rng = rng if rng is not None else get_instance()
         self.equipo_id = str(uuid4())
         self.nombre = nombre
         self.jugadores = self._generar_jugadores(num_jugadores)
@@ -59,20 +73,20 @@ class Equipo:
 
         jugadores = []
         # Asegurar al menos un jugador de cada género
-        nombre_m = names.get_full_name(gender="male")
-        jugadores.append(Jugador(nombre_m, "M"))
+        nombre_m = nombre_completo("M", self.rng)
+        jugadores.append(Jugador(nombre_m, "M", self.rng))
 
-        nombre_f = names.get_full_name(gender="female")
-        jugadores.append(Jugador(nombre_f, "F"))
+        nombre_f = nombre_completo("F", self.rng)
+        jugadores.append(Jugador(nombre_f, "F", self.rng))
 
         # Para el resto de jugadores, asignar género aleatoriamente
         for _ in range(num_jugadores - 2):
-            genero = choice(["M", "F"])
-            nombre = names.get_full_name(gender="male" if genero == "M" else "female")
-            jugadores.append(Jugador(nombre, genero))
+            genero = self.rng.choice(["M", "F"])
+            nombre = nombre_completo(genero, self.rng)
+            jugadores.append(Jugador(nombre, genero, self.rng))
 
         # Mezclar la lista para que el orden sea aleatorio
-        shuffle(jugadores)
+        self.rng.shuffle(jugadores)
         return jugadores
 
     def realizar_ronda(self):
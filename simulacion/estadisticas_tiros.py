@@ -0,0 +1,225 @@
+"""
+Estadísticas agregadas de los tiros de una simulación.
+
+Al terminar cada juego, los tiros registrados por su blanco se agregan en un mapa
+de calor de alta resolución por género y en tablas de frecuencia de zonas por
+género y por jugador. Todo el agrupamiento es vectorizado: los índices de celda de
+los tiros se acumulan en bloques y se cuentan con np.bincount, por lo que el costo
+por tiro es mínimo aun con decenas de millones de tiros. Las consultas (mapa con
+otra resolución, tablas de zonas) se calculan a partir de los acumulados y se
+memorizan hasta que llegan nuevos tiros.
+"""
+
+import json
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .blanco_objetivo import Blanco
+
+GENEROS = ("M", "F")
+
+
+class EstadisticasTiros:
+    """
+    Acumula mapas de calor y frecuencias de zonas de los tiros de una simulación.
+
+    El mapa base cubre el cuadrado [-EXTENSION, EXTENSION] con celdas de lado
+    RESOLUCION; los mapas de menor resolución se obtienen sumando bloques de celdas.
+    """
+
+    RESOLUCION = 0.05
+    EXTENSION = Blanco.RADIO_EXTERIOR * Blanco.RADIO_ERROR_MULTIPLIER
+    CELDAS_BASE = int(round(2 * EXTENSION / RESOLUCION))
+    # Cantidad de índices pendientes a partir de la cual se vuelcan en el mapa
+    MAX_PENDIENTES = 1 << 20
+
+    def __init__(self):
+        """
+        Atributos:
+            total_tiros (int): Tiros agregados
+            jugadores (List[dict]): Datos de cada jugador (jugador_id, nombre, genero)
+        """
+        zonas = len(Blanco.ZONAS)
+        self.total_tiros = 0
+        self.jugadores: List[dict] = []
+        self._indices: Dict[str, int] = {}
+        self._mapa = np.zeros(len(GENEROS) * self.CELDAS_BASE ** 2, dtype=np.int64)
+        self._zonas_genero = np.zeros(len(GENEROS) * zonas, dtype=np.int64)
+        self._zonas_jugador = np.zeros((0, zonas), dtype=np.int64)
+        self._pendientes: List[np.ndarray] = []
+        self._cantidad_pendiente = 0
+        self._memo: Dict[tuple, dict] = {}
+        self._lock = threading.Lock()
+
+    def _indice_jugador(self, jugador) -> int:
+        indice = self._indices.get(jugador.jugador_id)
+        if indice is None:
+            indice = len(self.jugadores)
+            self._indices[jugador.jugador_id] = indice
+            self.jugadores.append(
+                {
+                    "jugador_id": jugador.jugador_id,
+                    "nombre": jugador.nombre,
+                    "genero": jugador.genero,
+                }
+            )
+        return indice
+
+    def acumular(self, registro) -> None:
+        """
+        Agrega los tiros de un registro (normalmente, el blanco de un juego terminado).
+
+        Args:
+            registro (RegistroTiros): Registro de tiros; sin coordenadas solo se
+                actualizan las tablas de zonas
+        """
+        if registro is None or len(registro) == 0:
+            return
+        tiros = registro.tiros
+        zonas = len(Blanco.ZONAS)
+        codigos = tiros["zona"].astype(np.int64)
+        generos_locales = np.array(
+            [GENEROS.index(j.genero) for j in registro.jugadores], dtype=np.int64
+        )
+        generos = generos_locales[tiros["jugador"]]
+
+        with self._lock:
+            globales = np.array([self._indice_jugador(j) for j in registro.jugadores])
+            if len(self.jugadores) > len(self._zonas_jugador):
+                faltantes = len(self.jugadores) - len(self._zonas_jugador)
+                self._zonas_jugador = np.vstack(
+                    [self._zonas_jugador, np.zeros((faltantes, zonas), dtype=np.int64)]
+                )
+            self._zonas_genero += np.bincount(
+                generos * zonas + codigos, minlength=len(self._zonas_genero)
+            )
+            self._zonas_jugador += np.bincount(
+                globales[tiros["jugador"]] * zonas + codigos,
+                minlength=self._zonas_jugador.size,
+            ).reshape(self._zonas_jugador.shape)
+
+            if registro.tiene_coordenadas:
+                celdas = self.CELDAS_BASE
+                columnas = ((tiros["x"] + self.EXTENSION) / self.RESOLUCION).astype(np.int64)
+                filas = ((tiros["y"] + self.EXTENSION) / self.RESOLUCION).astype(np.int64)
+                np.clip(columnas, 0, celdas - 1, out=columnas)
+                np.clip(filas, 0, celdas - 1, out=filas)
+                self._pendientes.append((generos * celdas + filas) * celdas + columnas)
+                self._cantidad_pendiente += len(tiros)
+                if self._cantidad_pendiente >= self.MAX_PENDIENTES:
+                    self._volcar_pendientes()
+
+            self.total_tiros += len(tiros)
+            self._memo.clear()
+
+    def _volcar_pendientes(self) -> None:
+        """Cuenta los índices de celda pendientes y los suma al mapa base."""
+        if self._pendientes:
+            self._mapa += np.bincount(np.concatenate(self._pendientes), minlength=len(self._mapa))
+            self._pendientes = []
+            self._cantidad_pendiente = 0
+
+    def mapa_calor(self, celdas: int = 60, genero: Optional[str] = None) -> dict:
+        """
+        Histograma bidimensional de las coordenadas de impacto.
+
+        Args:
+            celdas (int): Celdas por lado; debe dividir a CELDAS_BASE
+            genero (str): 'M' o 'F' para filtrar por género (None: todos los tiros)
+
+        Returns:
+            dict: celdas, extensión, bordes de las celdas, total y conteos
+                  (conteos[fila][columna], fila según y y columna según x)
+
+        Raises:
+            ValueError: Si celdas no divide a CELDAS_BASE o el género no existe
+        """
+        if celdas < 1 or self.CELDAS_BASE % celdas != 0:
+            raise ValueError(f"celdas debe ser un divisor de {self.CELDAS_BASE}")
+        if genero is not None and genero not in GENEROS:
+            raise ValueError(f"genero debe ser uno de {list(GENEROS)}")
+        clave = ("mapa_calor", celdas, genero)
+        with self._lock:
+            if clave not in self._memo:
+                self._volcar_pendientes()
+                base = self.CELDAS_BASE
+                mapa = self._mapa.reshape(len(GENEROS), base, base)
+                mapa = mapa.sum(axis=0) if genero is None else mapa[GENEROS.index(genero)]
+                factor = base // celdas
+                conteos = mapa.reshape(celdas, factor, celdas, factor).sum(axis=(1, 3))
+                self._memo[clave] = {
+                    "celdas": celdas,
+                    "extension": self.EXTENSION,
+                    "genero": genero,
+                    "bordes": np.linspace(-self.EXTENSION, self.EXTENSION, celdas + 1).tolist(),
+                    "total": int(conteos.sum()),
+                    "conteos": conteos.tolist(),
+                }
+            return self._memo[clave]
+
+    def frecuencias_zonas(self) -> dict:
+        """
+        Tablas de frecuencia de zonas por género y por jugador.
+
+        Returns:
+            dict: "por_genero" (género -> conteos y proporciones por zona) y
+                  "por_jugador" (datos del jugador con sus conteos y proporciones)
+        """
+        clave = ("zonas",)
+        with self._lock:
+            if clave not in self._memo:
+                zonas = list(Blanco.ZONAS)
+                por_genero = self._zonas_genero.reshape(len(GENEROS), len(zonas))
+                self._memo[clave] = {
+                    "total_tiros": self.total_tiros,
+                    "por_genero": {
+                        genero: _tabla(zonas, por_genero[i]) for i, genero in enumerate(GENEROS)
+                    },
+                    "por_jugador": [
+                        dict(jugador, **_tabla(zonas, self._zonas_jugador[i]))
+                        for i, jugador in enumerate(self.jugadores)
+                    ],
+                }
+            return self._memo[clave]
+
+    def guardar(self, ruta: str) -> None:
+        """Guarda los acumulados en un archivo .npz."""
+        with self._lock:
+            self._volcar_pendientes()
+            np.savez_compressed(
+                ruta,
+                mapa=self._mapa,
+                zonas_genero=self._zonas_genero,
+                zonas_jugador=self._zonas_jugador,
+                total_tiros=self.total_tiros,
+                jugadores=json.dumps(self.jugadores),
+            )
+
+    @classmethod
+    def cargar(cls, ruta: str) -> "EstadisticasTiros":
+        """Carga los acumulados guardados con guardar()."""
+        estadisticas = cls()
+        with np.load(ruta) as datos:
+            estadisticas._mapa = datos["mapa"]
+            estadisticas._zonas_genero = datos["zonas_genero"]
+            estadisticas._zonas_jugador = datos["zonas_jugador"]
+            estadisticas.total_tiros = int(datos["total_tiros"])
+            estadisticas.jugadores = json.loads(str(datos["jugadores"]))
+        estadisticas._indices = {
+            jugador["jugador_id"]: i for i, jugador in enumerate(estadisticas.jugadores)
+        }
+        return estadisticas
+
+
+def _tabla(zonas: List[str], conteos: np.ndarray) -> dict:
+    """Conteos y proporciones por zona de una fila de frecuencias."""
+    total = int(conteos.sum())
+    return {
+        "total": total,
+        "conteos": {zona: int(n) for zona, n in zip(zonas, conteos)},
+        "proporciones": {
+            zona: (int(n) / total if total else 0.0) for zona, n in zip(zonas, conteos)
+        },
+    }
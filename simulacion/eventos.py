@@ -0,0 +1,93 @@
+"""
+Eventos de la simulación para instrumentación.
+
+Métricas, trazas o análisis propios pueden suscribirse a los eventos de las
+rondas y de los tiros sin modificar Ronda ni Blanco. Cada suscriptor es una
+función que recibe los datos del evento como argumentos con nombre.
+
+El bus se asigna a ContextoSimulacion.eventos. Al comenzar cada juego, Juego se
+lo pasa al blanco y a la ronda solo si tiene suscriptores; si no, ambos conservan
+eventos = None y el ciclo de tiros no hace más que esa comparación. Por eso las
+suscripciones hechas a mitad de un juego se toman en cuenta desde el siguiente.
+"""
+
+import threading
+from typing import Callable, Dict, Tuple
+
+
+class Evento:
+    """
+    Eventos disponibles y los datos que recibe cada suscriptor.
+
+    - INICIO_RONDA: ronda (Ronda)
+    - TIRO: blanco (Blanco), jugador (Jugador), zona (str), puntaje (int),
+      desempate (bool); se emite por cada tiro, incluidos los extra y los de desempate
+    - TIRO_EXTRA: ronda (Ronda), jugador (Jugador), puntaje (int)
+    - DESEMPATE: ronda (Ronda), empatados (List[Jugador]), ganador (Jugador)
+    - FIN_RONDA: ronda (Ronda), resultado (ResultadoRonda)
+    """
+
+    INICIO_RONDA = "inicio_ronda"
+    TIRO = "tiro"
+    TIRO_EXTRA = "tiro_extra"
+    DESEMPATE = "desempate"
+    FIN_RONDA = "fin_ronda"
+    TODOS = (INICIO_RONDA, TIRO, TIRO_EXTRA, DESEMPATE, FIN_RONDA)
+
+
+class BusEventos:
+    """
+    Registro de suscriptores por evento.
+
+    Las listas de suscriptores se reemplazan (no se modifican) al suscribir o
+    desuscribir, así que es seguro hacerlo desde otro hilo mientras se emite.
+    """
+
+    def __init__(self):
+        self._suscriptores: Dict[str, Tuple[Callable, ...]] = {}
+        self._lock = threading.Lock()
+
+    def suscribir(self, evento: str, funcion: Callable) -> Callable:
+        """
+        Registra una función para un evento.
+
+        Args:
+            evento (str): Uno de los valores de Evento
+            funcion (Callable): Función que recibe los datos del evento como
+                argumentos con nombre
+
+        Returns:
+            Callable: La misma función
+
+        Raises:
+            ValueError: Si el evento no existe
+        """
+        if evento not in Evento.TODOS:
+            raise ValueError(f"Evento desconocido: {evento!r}")
+        with self._lock:
+            self._suscriptores[evento] = self._suscriptores.get(evento, ()) + (funcion,)
+        return funcion
+
+    def desuscribir(self, evento: str, funcion: Callable) -> None:
+        """Quita una función de un evento (no hace nada si no estaba suscrita)."""
+        with self._lock:
+            restantes = tuple(f for f in self._suscriptores.get(evento, ()) if f is not funcion)
+            if restantes:
+                self._suscriptores[evento] = restantes
+            else:
+                self._suscriptores.pop(evento, None)
+
+    def hay_suscriptores(self, evento: str = None) -> bool:
+        """Indica si el evento (o, sin argumento, cualquier evento) tiene suscriptores."""
+        if evento is None:
+            return bool(self._suscriptores)
+        return evento in self._suscriptores
+
+    def emitir(self, evento: str, **datos) -> None:
+        """
+        Llama a los suscriptores del evento con sus datos.
+
+        Las excepciones de un suscriptor se propagan y detienen el juego en curso.
+        """
+        for funcion in self._suscriptores.get(evento, ()):
+            funcion(**datos)
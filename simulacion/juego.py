@@ -1,17 +1,22 @@
 import uuid
+from modelos.substreams import derive_seed
 from .blanco_objetivo import Blanco
-from .ronda import Ronda
+from .contexto import CONTEXTO_GLOBAL
+from .ronda import Enfrentamiento, ResultadoRonda, Ronda
 
 
 class Juego:
     """
     Clase principal que coordina un juego completo de arquería.
     Gestiona la interacción entre equipos, rondas y mantiene estadísticas globales.
-    """
 
-    generos_victorias_totales = {"M": 0, "F": 0}  # Contador de victorias por género
+    Un juego terminado puede reutilizarse para el siguiente con reiniciar(): el
+    blanco, la ronda y los resultados de cada ronda se crean una sola vez.
+    """
 
-    def __init__(self, equipo1, equipo2, num_rondas=10, juego_actual=0):
+    def __init__(
+        self, equipo1, equipo2, num_rondas=10, juego_actual=0, contexto=None, nivel_registro=None
+    ):
         """
         Inicializa un nuevo juego de arquería.
 
@@ -20,10 +25,16 @@ class Juego:
             equipo2 (Equipo): Segundo equipo participante
             num_rondas (int): Número de rondas a jugar (default: 10)
             juego_actual (int): Número identificador del juego actual
+            contexto (ContextoSimulacion): Estado aislado de la simulación a la que
+                pertenece el juego (por defecto, el contexto global)
+            nivel_registro (str): Nivel de NivelRegistro con el que el blanco guarda
+                los tiros (por defecto, el del contexto)
 
         Atributos:
             id_juego (str): Identificador único del juego
-            historial_rondas (List[dict]): Registro de resultados de cada ronda
+            enfrentamiento (Enfrentamiento): Índices de jugadores, equipos y géneros
+            historial_rondas (List[ResultadoRonda]): Registro de resultados de cada
+                ronda jugada (se reutiliza en el siguiente juego tras reiniciar())
             puntaje_ganador (int): Puntaje más alto obtenido en el juego
             experiencia_maxima (int): Máxima experiencia alcanzada por un jugador
             jugador_con_mas_suerte (Jugador): Jugador que tuvo más suerte en el juego
@@ -31,13 +42,37 @@ class Juego:
             equipo_ganador_juego (Equipo): Equipo que ganó el juego
             genero_con_mas_victorias (str): Género que acumuló más victorias
         """
-        self.id_juego = str(uuid.uuid4())
+        self.contexto = contexto if contexto is not None else CONTEXTO_GLOBAL
         self.equipo1 = equipo1
         self.equipo2 = equipo2
-        self.blanco = Blanco()
+        self.blanco = Blanco(
+            self.contexto.rng,
+            self.contexto.probabilidades,
+            self.contexto.costo_tiro,
+            nivel_registro if nivel_registro is not None else self.contexto.nivel_registro,
+        )
         self.num_rondas = num_rondas
+        self.enfrentamiento = Enfrentamiento(equipo1, equipo2)
+        # Resultados preasignados de cada ronda y ronda reutilizable que los llena
+        self._resultados_rondas = [
+            ResultadoRonda.nuevo(numero, equipo1.nombre, equipo2.nombre)
+            for numero in range(1, num_rondas + 1)
+        ]
+        self._ronda = Ronda(
+            0,
+            equipo1,
+            equipo2,
+            self.blanco,
+            rango_cansancio=self.contexto.rango_cansancio,
+            enfrentamiento=self.enfrentamiento,
+        )
+        self.victorias_por_genero = {"M": 0, "F": 0}
+        self._reiniciar_estado(juego_actual)
+
+    def _reiniciar_estado(self, juego_actual):
+        """Deja en cero el estado propio de un juego."""
+        self.id_juego = str(uuid.uuid4())
         self.ronda_actual = 0
-        self.historial_rondas = []
         self.juego_actual = juego_actual
         self.equipo1.puntaje_juego = 0
         self.equipo2.puntaje_juego = 0
@@ -48,7 +83,34 @@ class Juego:
         self.jugador_con_mas_experiencia = None
         self.equipo_ganador_juego = None
         self.genero_con_mas_victorias = None
-        self.victorias_por_genero = {"M": 0, "F": 0}
+        self.victorias_por_genero["M"] = 0
+        self.victorias_por_genero["F"] = 0
+        # Sin suscriptores, blanco y ronda no reciben el bus y no emiten nada
+        eventos = self.contexto.eventos
+        if eventos is not None and not eventos.hay_suscriptores():
+            eventos = None
+        self.blanco.eventos = eventos
+        self._ronda.eventos = eventos
+
+    def reiniciar(self, juego_actual=0):
+        """
+        Prepara el juego para jugar otro entre los mismos equipos.
+
+        Args:
+            juego_actual (int): Número identificador del nuevo juego
+
+        Efectos:
+            - Reinicia el blanco (con una nueva semilla de coordenadas y su registro vacío)
+            - Asigna un nuevo id_juego y deja en cero el estado del juego
+            - Los resultados de las rondas del juego anterior se sobrescriben
+        """
+        self.blanco.reiniciar()
+        self._reiniciar_estado(juego_actual)
+
+    @property
+    def historial_rondas(self):
+        """Resultados de las rondas jugadas hasta el momento."""
+        return self._resultados_rondas[: self.ronda_actual]
 
     def jugar_ronda(self):
         """
@@ -56,13 +118,18 @@ class Juego:
         
         Efectos:
             - Incrementa el contador de ronda actual
-            - Crea y ejecuta una nueva instancia de Ronda
+            - Reinicia y ejecuta la ronda del juego
             - Almacena el resultado en el historial
         """
         self.ronda_actual += 1
-        ronda = Ronda(self.ronda_actual, self.equipo1, self.equipo2, self.blanco)
-        resultado = ronda.jugar()
-        self.historial_rondas.append(resultado)
+        if self.contexto.semilla_subflujo is not None:
+            self.contexto.rng.seed(derive_seed(self.contexto.semilla_subflujo, self.ronda_actual))
+        if self.ronda_actual > len(self._resultados_rondas):
+            self._resultados_rondas.append(
+                ResultadoRonda.nuevo(self.ronda_actual, self.equipo1.nombre, self.equipo2.nombre)
+            )
+        self._ronda.reiniciar(self.ronda_actual, self._resultados_rondas[self.ronda_actual - 1])
+        self._ronda.jugar()
 
     def jugar_juego_completo(self):
         """
@@ -79,7 +146,7 @@ class Juego:
             - Determina y registra ganadores
             - Actualiza contadores globales
         """
-        for jugador in self.equipo1.jugadores + self.equipo2.jugadores:
+        for jugador in self.enfrentamiento.jugadores:
             jugador.resetear_jugador()
             jugador.guardar_puntaje_total()
 
@@ -135,10 +202,10 @@ class Juego:
         """
         # Calcular puntajes totales del juego
         self.equipo1.puntaje_juego = sum(
-            ronda["equipo 1"]["puntaje"] for ronda in self.historial_rondas
+            ronda.equipo1.puntaje for ronda in self.historial_rondas
         )
         self.equipo2.puntaje_juego = sum(
-            ronda["equipo 2"]["puntaje"] for ronda in self.historial_rondas
+            ronda.equipo2.puntaje for ronda in self.historial_rondas
         )
 
         # Asignar puntajes a los equipos
@@ -173,7 +240,7 @@ class Juego:
         self.equipo1.puntaje_juego = 0
         self.equipo2.puntaje_juego = 0
 
-        for jugador in self.equipo1.jugadores + self.equipo2.jugadores:
+        for jugador in self.enfrentamiento.jugadores:
             jugador.finalizar_juego()
 
     def resultado_puntos_por_jugador(self):
@@ -185,7 +252,7 @@ class Juego:
             - Mantiene registro de puntos por jugador
         """
         puntos_por_jugador = {}
-        for jugador in self.equipo1.jugadores + self.equipo2.jugadores:
+        for jugador in self.enfrentamiento.jugadores:
             jugador.puntaje_juego_actual = (
                 jugador.puntaje_total - jugador.puntaje_juego_anterior
             )
@@ -209,23 +276,12 @@ class Juego:
         # es el jugador con más suerte del juego
         jugadores_suerte = {}
         for ronda in self.historial_rondas:
-            jugador_id = ronda["jugador_con_mas_suerte"]["user_id"]
-
-            if jugador_id not in jugadores_suerte:
-                jugadores_suerte[jugador_id] = 1
-            else:
-                jugadores_suerte[jugador_id] += 1
+            jugador = ronda.jugador_con_mas_suerte
+            if jugador is not None:
+                jugadores_suerte[jugador] = jugadores_suerte.get(jugador, 0) + 1
         # se busca el jugador con más suerte
         if jugadores_suerte:
-            jugador_id_mas_suerte = max(jugadores_suerte, key=jugadores_suerte.get)
-
-            # se busca el jugador con más suerte
-            for jugador in self.equipo1.jugadores + self.equipo2.jugadores:
-                if jugador.user_id == jugador_id_mas_suerte:
-                    self.jugador_con_mas_suerte = jugador
-                    break
-            else:
-                self.jugador_con_mas_suerte = "No determinado"
+            self.jugador_con_mas_suerte = max(jugadores_suerte, key=jugadores_suerte.get)
         else:
             self.jugador_con_mas_suerte = "No determinado"
 
@@ -243,7 +299,7 @@ class Juego:
             - Actualiza experiencia_maxima
         """
         """Determina el jugador con mayor experiencia acumulada."""
-        todos_jugadores = self.equipo1.jugadores + self.equipo2.jugadores
+        todos_jugadores = self.enfrentamiento.jugadores
 
         if todos_jugadores:
             # Encuentra el jugador con mayor experiencia
@@ -269,34 +325,24 @@ class Juego:
         Efectos:
             - Actualiza victorias_por_genero
             - Actualiza genero_con_mas_victorias
-            - Actualiza el contador global generos_victorias_totales
+            - Actualiza el contador generos_victorias_totales del contexto
         """
-        # Analizamos cada ronda para contar victorias por género
+        # Contamos las rondas ganadas por cada equipo
+        rondas_ganadas = [0, 0]
         for ronda in self.historial_rondas:
-            if ronda["ganador_individual"] != "EMPATE" and ronda["ganador_individual"]:
-                # Identificar el equipo ganador
-                equipo_ganador = (
-                    self.equipo1
-                    if ronda["ganador_individual"] == self.equipo1.nombre
-                    else self.equipo2
+            if ronda.ganador_individual != "EMPATE" and ronda.ganador_individual:
+                rondas_ganadas[0 if ronda.ganador_individual == self.equipo1.nombre else 1] += 1
+
+        # Cada victoria se asigna al género del jugador con mayor puntaje del equipo
+        # ganador; el puntaje comparado es puntaje_ronda_actual, que tras el juego es
+        # el de la última ronda, así que ese jugador es el mismo en todas las rondas
+        enfrentamiento = self.enfrentamiento
+        for rango, victorias in zip(enfrentamiento.rangos, rondas_ganadas):
+            if victorias:
+                mejor = max(
+                    rango, key=lambda i: enfrentamiento.jugadores[i].puntaje_ronda_actual
                 )
-
-                # Encontrar al jugador con mayor puntaje de ese equipo en esa ronda
-                mejor_jugador = None
-                mejor_puntaje = -1
-
-                for jugador in equipo_ganador.jugadores:
-                    for j in self.equipo1.jugadores + self.equipo2.jugadores:
-                        if (
-                            j.nombre == jugador.nombre
-                            and j.puntaje_ronda_actual > mejor_puntaje
-                        ):
-                            mejor_puntaje = j.puntaje_ronda_actual
-                            mejor_jugador = j
-
-                # Sumar victoria al género correspondiente
-                if mejor_jugador:
-                    self.victorias_por_genero[mejor_jugador.genero] += 1
+                self.victorias_por_genero[enfrentamiento.generos[mejor]] += victorias
 
         # Determinar el género con más victorias en este juego
         if self.victorias_por_genero["M"] > self.victorias_por_genero["F"]:
@@ -306,6 +352,6 @@ class Juego:
         else:
             self.genero_con_mas_victorias = "Empate"
 
-        # Actualizar el contador global si no fue empate
+        # Actualizar el contador de la simulación si no fue empate
         if self.genero_con_mas_victorias != "Empate":
-            Juego.generos_victorias_totales[self.genero_con_mas_victorias] += 1
+            self.contexto.generos_victorias_totales[self.genero_con_mas_victorias] += 1
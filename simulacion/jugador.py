@@ -1,5 +1,5 @@
 from uuid import uuid4  # Más específico que importar todo uuid
-from modelos.random_wrapper import randint, uniform
+from modelos.random_wrapper import get_instance
 
 
 class Jugador:
@@ -8,13 +8,39 @@ class Jugador:
     Maneja la lógica de tiros, resistencia, experiencia y suerte del jugador.
     """
 
-    def __init__(self, nombre, genero):
+    __slots__ = (
+        "rng",
+        "user_id",
+        "nombre",
+        "genero",
+        "resistencia_inicial",
+        "experiencia_inicial",
+        "rondas_con_beneficio",
+        "resistencia",
+        "experiencia",
+        "suerte",
+        "puntaje_total",
+        "puntaje_juego_anterior",
+        "puntaje_juego_actual",
+        "puntaje_ronda_actual",
+        "cansancio_acumulado",
+        "tiros_realizados",
+        "resistencia_actual",
+        "consecutivo_extra_ganados",
+        "beneficio_resistencia",
+    )
+
+    # Cansancio (pérdida de resistencia) que se acumula al final de cada ronda
+    RANGO_CANSANCIO = (1, 2)
+
+    def __init__(self, nombre, genero, rng=None):
         """
         Inicializa un nuevo jugador con sus atributos base.
 
         Args:
             nombre (str): Nombre del jugador
             genero (str): Género del jugador ('M' o 'F')
+            rng (RandomWrapper): Generador a utilizar (por defecto, la instancia global)
 
         Atributos:
             user_id (str): Identificador único del jugador
@@ -24,6 +50,7 @@ class Jugador:
             cansancio_acumulado (int): Pérdida de resistencia acumulada
             beneficio_resistencia (bool): Indica si el jugador tiene beneficio de resistencia
         """
+        self.rng = rng if rng is not None else get_instance()
         self.user_id = str(uuid4())
         self.nombre = nombre
         self.genero = genero  # 'M' o 'F'
@@ -32,7 +59,7 @@ class Jugador:
         self.puntaje_total = 0
         self.puntaje_juego_anterior = 0
         self.puntaje_juego_actual = 0
-        self.puntje_ronda_actual = 0
+        self.puntaje_ronda_actual = 0
         self.cansancio_acumulado = 0
         self.tiros_realizados = 0
 
@@ -54,7 +81,7 @@ class Jugador:
         """
         # Generamos y guardamos los valores iniciales
         # resistencia: 35 ± 10
-        self.resistencia_inicial = randint(25, 45)  # 35 ± 10
+        self.resistencia_inicial = self.rng.randint(25, 45)  # 35 ± 10
         self.experiencia_inicial = 10
         self.rondas_con_beneficio = 0
 
@@ -109,16 +136,19 @@ class Jugador:
         self.beneficio_resistencia = False
         self.experiencia = 10
 
-    def puede_tirar(self):
+    def puede_tirar(self, costo_tiro=5):
         """
         Verifica si el jugador tiene suficiente resistencia para realizar un tiro.
-        
+
+        Args:
+            costo_tiro (int): Resistencia que consume un tiro
+                (por defecto 5, el valor de Blanco.TIRO_RESISTENCIA_COST)
+
         Returns:
-            bool: True si el jugador tiene al menos 5 puntos de resistencia, False en caso contrario
+            bool: True si el jugador tiene al menos costo_tiro puntos de resistencia,
+                  False en caso contrario
         """
-        return (
-            self.resistencia_actual >= 5
-        )  # Mismo valor que Blanco.TIRO_RESISTENCIA_COST
+        return self.resistencia_actual >= costo_tiro
 
     def actualizar_resistencia(self):
         """
@@ -146,11 +176,11 @@ class Jugador:
         Actualiza el estado del jugador al final de una ronda.
         
         Efectos:
-            - Incrementa el cansancio acumulado en 1-2 unidades
+            - Incrementa el cansancio acumulado según RANGO_CANSANCIO (1-2 unidades)
             - Actualiza la resistencia según el cansancio
             - Incrementa la experiencia en 1 punto
         """
-        perdida_adicional = randint(1, 2)  # Usar nuestro generador en lugar de random
+        perdida_adicional = self.rng.randint(*self.RANGO_CANSANCIO)  # Usar nuestro generador en lugar de random
         self.cansancio_acumulado += perdida_adicional
         self.resistencia = self.resistencia_inicial - self.cansancio_acumulado
 
@@ -184,7 +214,7 @@ class Jugador:
         Efectos:
             - Asigna un valor aleatorio de suerte entre 1.0 y 3.0
         """
-        self.suerte = round(uniform(1.0, 3.0), 2)
+        self.suerte = round(self.rng.uniform(1.0, 3.0), 2)
 
     def guardar_puntaje_total(self):
         """
@@ -0,0 +1,119 @@
+"""
+Generación de nombres de jugadores con el generador de la simulación.
+
+Los nombres y apellidos son los más frecuentes de las listas del censo de EE. UU.
+que usaba el paquete names. Se guardan como tuplas en memoria y se eligen con
+el RandomWrapper del contexto, de modo que las plantillas de los equipos se
+repiten con la misma semilla y no se lee ningún archivo por jugador.
+"""
+
+from modelos.random_wrapper import get_instance
+
+NOMBRES_MASCULINOS = (
+    "James", "John", "Robert", "Michael", "William", "David", "Richard", "Charles",
+    "Joseph", "Thomas", "Christopher", "Daniel", "Paul", "Mark", "Donald", "George",
+    "Kenneth", "Steven", "Edward", "Brian", "Ronald", "Anthony", "Kevin", "Jason",
+    "Matthew", "Gary", "Timothy", "Jose", "Larry", "Jeffrey", "Frank", "Scott", "Eric",
+    "Stephen", "Andrew", "Raymond", "Gregory", "Joshua", "Jerry", "Dennis", "Walter",
+    "Patrick", "Peter", "Harold", "Douglas", "Henry", "Carl", "Arthur", "Ryan", "Roger",
+    "Joe", "Juan", "Jack", "Albert", "Jonathan", "Justin", "Terry", "Gerald", "Keith",
+    "Samuel", "Willie", "Ralph", "Lawrence", "Nicholas", "Roy", "Benjamin", "Bruce",
+    "Brandon", "Adam", "Harry", "Fred", "Wayne", "Billy", "Steve", "Louis", "Jeremy",
+    "Aaron", "Randy", "Howard", "Eugene", "Carlos", "Russell", "Bobby", "Victor",
+    "Martin", "Ernest", "Phillip", "Todd", "Jesse", "Craig", "Alan", "Shawn",
+    "Clarence", "Sean", "Philip", "Chris", "Johnny", "Earl", "Jimmy", "Antonio",
+    "Danny", "Bryan", "Tony", "Luis", "Mike", "Stanley", "Leonard", "Nathan", "Dale",
+    "Manuel", "Rodney", "Curtis", "Norman", "Allen", "Marvin", "Vincent", "Glenn",
+    "Jeffery", "Travis", "Jeff", "Chad", "Jacob", "Lee", "Melvin", "Alfred", "Kyle",
+    "Francis", "Bradley", "Jesus", "Herbert", "Frederick", "Ray", "Joel", "Edwin",
+    "Don", "Eddie", "Ricky", "Troy", "Randall", "Barry", "Alexander", "Bernard",
+    "Mario", "Leroy", "Francisco", "Marcus", "Micheal", "Theodore", "Clifford",
+    "Miguel",
+)
+
+NOMBRES_FEMENINOS = (
+    "Mary", "Patricia", "Linda", "Barbara", "Elizabeth", "Jennifer", "Maria", "Susan",
+    "Margaret", "Dorothy", "Lisa", "Nancy", "Karen", "Betty", "Helen", "Sandra",
+    "Donna", "Carol", "Ruth", "Sharon", "Michelle", "Laura", "Sarah", "Kimberly",
+    "Deborah", "Jessica", "Shirley", "Cynthia", "Angela", "Melissa", "Brenda", "Amy",
+    "Anna", "Rebecca", "Virginia", "Kathleen", "Pamela", "Martha", "Debra", "Amanda",
+    "Stephanie", "Carolyn", "Christine", "Marie", "Janet", "Catherine", "Frances",
+    "Ann", "Joyce", "Diane", "Alice", "Julie", "Heather", "Teresa", "Doris", "Gloria",
+    "Evelyn", "Jean", "Cheryl", "Mildred", "Katherine", "Joan", "Ashley", "Judith",
+    "Rose", "Janice", "Kelly", "Nicole", "Judy", "Christina", "Kathy", "Theresa",
+    "Beverly", "Denise", "Tammy", "Irene", "Jane", "Lori", "Rachel", "Marilyn",
+    "Andrea", "Kathryn", "Louise", "Sara", "Anne", "Jacqueline", "Wanda", "Bonnie",
+    "Julia", "Ruby", "Lois", "Tina", "Phyllis", "Norma", "Paula", "Diana", "Annie",
+    "Lillian", "Emily", "Robin", "Peggy", "Crystal", "Gladys", "Rita", "Dawn", "Connie",
+    "Florence", "Tracy", "Edna", "Tiffany", "Carmen", "Rosa", "Cindy", "Grace", "Wendy",
+    "Victoria", "Edith", "Kim", "Sherry", "Sylvia", "Josephine", "Thelma", "Shannon",
+    "Sheila", "Ethel", "Ellen", "Elaine", "Marjorie", "Carrie", "Charlotte", "Monica",
+    "Esther", "Pauline", "Emma", "Juanita", "Anita", "Rhonda", "Hazel", "Amber", "Eva",
+    "Debbie", "April", "Leslie", "Clara", "Lucille", "Jamie", "Joanne", "Eleanor",
+    "Valerie", "Danielle",
+)
+
+APELLIDOS = (
+    "Smith", "Johnson", "Williams", "Jones", "Brown", "Davis", "Miller", "Wilson",
+    "Moore", "Taylor", "Anderson", "Thomas", "Jackson", "White", "Harris", "Martin",
+    "Thompson", "Garcia", "Martinez", "Robinson", "Clark", "Rodriguez", "Lewis", "Lee",
+    "Walker", "Hall", "Allen", "Young", "Hernandez", "King", "Wright", "Lopez", "Hill",
+    "Scott", "Green", "Adams", "Baker", "Gonzalez", "Nelson", "Carter", "Mitchell",
+    "Perez", "Roberts", "Turner", "Phillips", "Campbell", "Parker", "Evans", "Edwards",
+    "Collins", "Stewart", "Sanchez", "Morris", "Rogers", "Reed", "Cook", "Morgan",
+    "Bell", "Murphy", "Bailey", "Rivera", "Cooper", "Richardson", "Cox", "Howard",
+    "Ward", "Torres", "Peterson", "Gray", "Ramirez", "James", "Watson", "Brooks",
+    "Kelly", "Sanders", "Price", "Bennett", "Wood", "Barnes", "Ross", "Henderson",
+    "Coleman", "Jenkins", "Perry", "Powell", "Long", "Patterson", "Hughes", "Flores",
+    "Washington", "Butler", "Simmons", "Foster", "Gonzales", "Bryant", "Alexander",
+    "Russell", "Griffin", "Diaz", "Hayes", "Myers", "Ford", "Hamilton", "Graham",
+    "Sullivan", "Wallace", "Woods", "Cole", "West", "Jordan", "Owens", "Reynolds",
+    "Fisher", "Ellis", "Harrison", "Gibson", "McDonald", "Cruz", "Marshall", "Ortiz",
+    "Gomez", "Murray", "Freeman", "Wells", "Webb", "Simpson", "Stevens", "Tucker",
+    "Porter", "Hunter", "Hicks", "Crawford", "Henry", "Boyd", "Mason", "Morales",
+    "Kennedy", "Warren", "Dixon", "Ramos", "Reyes", "Burns", "Gordon", "Shaw", "Holmes",
+    "Rice", "Robertson", "Hunt", "Black", "Daniels", "Palmer", "Mills", "Nichols",
+    "Grant", "Knight", "Ferguson", "Rose", "Stone", "Hawkins", "Dunn", "Perkins",
+    "Hudson", "Spencer", "Gardner", "Stephens", "Payne", "Pierce", "Berry", "Matthews",
+    "Arnold", "Wagner", "Willis", "Ray", "Watkins", "Olson", "Carroll", "Duncan",
+    "Snyder", "Hart", "Cunningham", "Bradley", "Lane", "Andrews", "Ruiz", "Harper",
+    "Fox", "Riley", "Armstrong", "Carpenter", "Weaver", "Greene", "Lawrence", "Elliott",
+    "Chavez", "Sims", "Austin", "Peters", "Kelley", "Franklin", "Lawson", "Fields",
+    "Gutierrez", "Ryan", "Schmidt", "Carr", "Vasquez", "Castillo", "Wheeler", "Chapman",
+    "Oliver", "Montgomery", "Richards", "Williamson", "Johnston", "Banks", "Meyer",
+    "Bishop", "McCoy", "Howell", "Alvarez", "Morrison", "Hansen", "Fernandez", "Garza",
+    "Harvey", "Little", "Burton", "Stanley", "Nguyen", "George", "Jacobs", "Reid",
+    "Kim", "Fuller", "Lynch", "Dean", "Gilbert", "Garrett", "Romero", "Welch", "Larson",
+    "Frazier", "Burke", "Hanson", "Day", "Mendoza", "Moreno", "Bowman", "Medina",
+    "Fowler", "Brewer", "Hoffman", "Carlson", "Silva", "Pearson", "Holland", "Douglas",
+    "Fleming", "Jensen", "Vargas", "Byrd", "Davidson", "Hopkins", "May", "Terry",
+    "Herrera", "Wade", "Soto", "Walters", "Curtis", "Neal", "Caldwell", "Lowe",
+    "Jennings", "Barnett", "Graves", "Jimenez", "Horton", "Shelton", "Barrett",
+    "Obrien", "Castro", "Sutton", "Gregory", "McKinney", "Lucas", "Miles", "Craig",
+    "Rodriquez", "Chambers", "Holt", "Lambert", "Fletcher", "Watts", "Bates", "Hale",
+    "Rhodes", "Pena", "Beck", "Newman",
+)
+
+
+def nombre_completo(genero: str, rng=None) -> str:
+    """
+    Genera un nombre completo (nombre y apellido) al azar.
+
+    Args:
+        genero (str): "M" o "F"
+        rng (RandomWrapper): Generador a utilizar (por defecto, la instancia global)
+
+    Returns:
+        str: Nombre y apellido separados por un espacio
+
+    Raises:
+        ValueError: Si el género no es "M" ni "F"
+    """
+    if genero == "M":
+        nombres = NOMBRES_MASCULINOS
+    elif genero == "F":
+        nombres = NOMBRES_FEMENINOS
+    else:
+        raise ValueError(f"Género desconocido: {genero!r}")
+    rng = rng if rng is not None else get_instance()
+    return f"{rng.choice(nombres)} {rng.choice(APELLIDOS)}"
@@ -0,0 +1,232 @@
+"""
+Perfilado bajo demanda de la simulación.
+
+Ejecuta una cantidad acotada de juegos bajo cProfile y, al mismo tiempo, con un
+hilo que muestrea la pila del hilo perfilado a intervalos regulares. De cProfile
+sale la tabla de funciones con más tiempo acumulado; del muestreo, las pilas en
+formato colapsado ("a;b;c 12" por línea), que aceptan herramientas de flamegraph
+como flamegraph.pl o speedscope.
+
+Uso:
+    python -m simulacion.perfilado --juegos 200 --top 30 --pilas pilas.txt
+"""
+
+import argparse
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import replace
+from typing import Dict, Optional, Tuple
+
+from .simulador import ConfiguracionSimulacion, Simulador
+
+CRITERIOS_ORDEN = ("cumulative", "tottime", "calls")
+
+# sys.setswitchinterval afecta a todo el proceso: los perfilados se ejecutan de a uno
+# para que cada uno restaure el intervalo que encontró y no el que dejó otro
+_bloqueo_perfilado = threading.Lock()
+
+
+class MuestreadorPilas(threading.Thread):
+    """
+    Hilo que muestrea periódicamente la pila de otro hilo.
+
+    Solo se cuentan los marcos que están por debajo del marco raíz indicado, de
+    modo que las pilas no incluyan, por ejemplo, el servidor web que atendió la
+    petición.
+    """
+
+    PROFUNDIDAD_MAXIMA = 256
+
+    def __init__(self, hilo_id: int, codigo_raiz, intervalo: float = 0.005):
+        """
+        Args:
+            hilo_id (int): Identificador (threading.get_ident()) del hilo a muestrear
+            codigo_raiz (CodeType): Código de la función donde empiezan las pilas
+            intervalo (float): Segundos entre muestras
+
+        Atributos:
+            conteos (Counter): Muestras por pila (tupla de marcos, de la raíz a la hoja)
+        """
+        super().__init__(name="muestreador-pilas", daemon=True)
+        self.hilo_id = hilo_id
+        self.codigo_raiz = codigo_raiz
+        self.intervalo = intervalo
+        self.conteos: Counter = Counter()
+        self._detener = threading.Event()
+
+    def run(self) -> None:
+        while not self._detener.wait(self.intervalo):
+            marco = sys._current_frames().get(self.hilo_id)
+            pila = []
+            while marco is not None and len(pila) < self.PROFUNDIDAD_MAXIMA:
+                if marco.f_code is self.codigo_raiz:
+                    if pila:
+                        self.conteos[tuple(reversed(pila))] += 1
+                    break
+                codigo = marco.f_code
+                pila.append(f"{os.path.basename(codigo.co_filename)}:{codigo.co_name}")
+                marco = marco.f_back
+
+    def detener(self) -> None:
+        """Detiene el muestreo y espera a que el hilo termine."""
+        self._detener.set()
+        self.join()
+
+    def colapsadas(self) -> str:
+        """Pilas muestreadas en formato colapsado, una por línea."""
+        return "".join(
+            f"{';'.join(pila)} {conteo}\n" for pila, conteo in sorted(self.conteos.items())
+        )
+
+
+def _nombre_funcion(clave: Tuple[str, int, str]) -> str:
+    archivo, linea, funcion = clave
+    if archivo == "~":
+        # Funciones de C, p. ej. "<built-in method builtins.min>"
+        return funcion
+    return f"{os.path.basename(archivo)}:{linea}({funcion})"
+
+
+def _jugar_juegos(simulador: Simulador, num_juegos: int) -> None:
+    """Juega los juegos perfilados; es la raíz de las pilas muestreadas."""
+    for numero in range(1, num_juegos + 1):
+        simulador.jugar_juego(numero)
+
+
+def perfilar_juegos(
+    config: Optional[ConfiguracionSimulacion] = None,
+    num_juegos: int = 100,
+    top: int = 25,
+    orden: str = "cumulative",
+    intervalo_muestreo: float = 0.005,
+    esperar: bool = True,
+) -> Dict:
+    """
+    Simula num_juegos juegos bajo cProfile y muestreo de pilas.
+
+    Args:
+        config (ConfiguracionSimulacion): Configuración de los juegos (su num_juegos
+            se reemplaza por el argumento num_juegos)
+        num_juegos (int): Juegos a simular
+        top (int): Cantidad de funciones a retornar
+        orden (str): Criterio de la tabla: "cumulative", "tottime" o "calls"
+        intervalo_muestreo (float): Segundos entre muestras de la pila
+        esperar (bool): Si ya hay un perfilado en curso, esperar a que termine
+            (True) o fallar de inmediato (False)
+
+    Returns:
+        dict: "juegos", "duracion", "funciones" (las top funciones con llamadas,
+            tiempo propio, tiempo acumulado y tiempo acumulado por llamada),
+            "muestras" y "pilas_colapsadas"
+
+    Raises:
+        ValueError: Si el orden no existe o la configuración no es válida
+        RuntimeError: Si esperar es False y ya hay un perfilado en curso
+    """
+    if orden not in CRITERIOS_ORDEN:
+        raise ValueError(f"orden debe ser uno de {list(CRITERIOS_ORDEN)}")
+    config = replace(
+        config if config is not None else ConfiguracionSimulacion(), num_juegos=num_juegos
+    ).validar()
+    simulador = Simulador(config)
+
+    if not _bloqueo_perfilado.acquire(blocking=esperar):
+        raise RuntimeError("Ya hay un perfilado en curso")
+    try:
+        # Las pilas empiezan en _jugar_juegos, así que no se cuentan las muestras
+        # tomadas mientras este hilo arranca o detiene el muestreador
+        muestreador = MuestreadorPilas(
+            threading.get_ident(), _jugar_juegos.__code__, intervalo_muestreo
+        )
+        perfil = cProfile.Profile()
+        # El muestreador solo toma la pila cuando obtiene el GIL. Con el intervalo de
+        # cambio por defecto (5 ms) lo obtendría casi siempre cuando el hilo perfilado
+        # lo libera en una llamada al sistema, y esas funciones aparecerían
+        # sobrerrepresentadas
+        intervalo_cambio = sys.getswitchinterval()
+        sys.setswitchinterval(min(intervalo_cambio, intervalo_muestreo / 10))
+        inicio = time.perf_counter()
+        muestreador.start()
+        perfil.enable()
+        try:
+            _jugar_juegos(simulador, num_juegos)
+        finally:
+            perfil.disable()
+            muestreador.detener()
+            sys.setswitchinterval(intervalo_cambio)
+    finally:
+        _bloqueo_perfilado.release()
+    duracion = time.perf_counter() - inicio
+
+    estadisticas = pstats.Stats(perfil)
+    indice = {"calls": 1, "tottime": 2, "cumulative": 3}[orden]
+    filas = sorted(estadisticas.stats.items(), key=lambda item: item[1][indice], reverse=True)
+    funciones = [
+        {
+            "funcion": _nombre_funcion(clave),
+            "llamadas": llamadas,
+            "tiempo_propio": round(propio, 6),
+            "tiempo_acumulado": round(acumulado, 6),
+            "acumulado_por_llamada": round(acumulado / llamadas, 9) if llamadas else 0.0,
+        }
+        for clave, (_primitivas, llamadas, propio, acumulado, _llamadores) in filas[:top]
+    ]
+    return {
+        "juegos": num_juegos,
+        "duracion": round(duracion, 6),
+        "orden": orden,
+        "funciones": funciones,
+        "muestras": sum(muestreador.conteos.values()),
+        "pilas_colapsadas": muestreador.colapsadas(),
+    }
+
+
+def main(argv=None) -> int:
+    """Perfila juegos desde la línea de comandos e imprime la tabla de funciones."""
+    parser = argparse.ArgumentParser(
+        prog="python -m simulacion.perfilado", description="Perfila juegos de la simulación"
+    )
+    parser.add_argument("--juegos", type=int, default=100, help="Juegos a simular")
+    parser.add_argument("--rondas", type=int, default=10, help="Rondas por juego")
+    parser.add_argument("--semilla", type=int, default=None)
+    parser.add_argument("--top", type=int, default=25, help="Funciones a mostrar")
+    parser.add_argument("--orden", choices=CRITERIOS_ORDEN, default="cumulative")
+    parser.add_argument("--intervalo", type=float, default=0.005, help="Segundos entre muestras")
+    parser.add_argument("--pilas", help="Archivo donde guardar las pilas colapsadas")
+    args = parser.parse_args(argv)
+
+    try:
+        perfil = perfilar_juegos(
+            ConfiguracionSimulacion(num_rondas=args.rondas, semilla=args.semilla),
+            num_juegos=args.juegos,
+            top=args.top,
+            orden=args.orden,
+            intervalo_muestreo=args.intervalo,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    print(
+        f"{perfil['juegos']} juegos en {perfil['duracion']:.3f} s "
+        f"({perfil['muestras']} muestras)"
+    )
+    print(f"{'llamadas':>10}  {'propio s':>10}  {'acumulado s':>11}  función")
+    for fila in perfil["funciones"]:
+        print(
+            f"{fila['llamadas']:>10}  {fila['tiempo_propio']:>10.4f}  "
+            f"{fila['tiempo_acumulado']:>11.4f}  {fila['funcion']}"
+        )
+    if args.pilas:
+        with open(args.pilas, "w") as f:
+            f.write(perfil["pilas_colapsadas"])
+        print(f"Pilas colapsadas guardadas en {args.pilas}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,253 @@
+"""
+Ratings incrementales de equipos y jugadores.
+
+Cada juego terminado actualiza, en tiempo constante, el Elo de los dos equipos y
+el índice de rendimiento de cada jugador que participó. Así la evolución de la
+fuerza de equipos y jugadores puede consultarse en cualquier momento de una
+simulación larga, sin recorrer la lista completa de resultados.
+
+- Elo de equipo: se parte de ELO_INICIAL y, tras cada juego, el Elo cambia en
+  k * (S - E), con S = 1, 0.5 o 0 según el resultado y E la probabilidad de
+  victoria esperada según la diferencia de Elo.
+- Rendimiento de jugador: promedio móvil exponencial de sus puntos en cada juego
+  relativos a la media de los jugadores de ese juego, escalado a 100 (100 es un
+  jugador promedio, 120 uno que hace un 20 % más de puntos que la media).
+"""
+
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class RatingEquipo:
+    """
+    Rating de un equipo.
+
+    Attributes:
+        nombre (str): Nombre del equipo
+        elo (float): Elo actual
+        juegos (int): Juegos registrados
+        ganados, empatados, perdidos (int): Resultados de esos juegos
+        elo_maximo (float): Elo más alto alcanzado
+    """
+
+    __slots__ = ("nombre", "elo", "juegos", "ganados", "empatados", "perdidos", "elo_maximo")
+
+    def __init__(self, nombre: str, elo: float):
+        self.nombre = nombre
+        self.elo = elo
+        self.juegos = 0
+        self.ganados = 0
+        self.empatados = 0
+        self.perdidos = 0
+        self.elo_maximo = elo
+
+    def a_dict(self) -> dict:
+        return {
+            "nombre": self.nombre,
+            "elo": round(self.elo, 2),
+            "elo_maximo": round(self.elo_maximo, 2),
+            "juegos": self.juegos,
+            "ganados": self.ganados,
+            "empatados": self.empatados,
+            "perdidos": self.perdidos,
+        }
+
+
+class RatingJugador:
+    """
+    Índice de rendimiento de un jugador.
+
+    Attributes:
+        nombre (str): Nombre del jugador
+        equipo (str): Identificador del equipo del jugador
+        rendimiento (float): Promedio móvil del rendimiento relativo (100 = media)
+        juegos (int): Juegos registrados
+        ultimo (float): Rendimiento relativo en el último juego
+    """
+
+    __slots__ = ("nombre", "equipo", "rendimiento", "juegos", "ultimo")
+
+    def __init__(self, nombre: str, equipo: str):
+        self.nombre = nombre
+        self.equipo = equipo
+        self.rendimiento = 100.0
+        self.juegos = 0
+        self.ultimo = 100.0
+
+    def a_dict(self) -> dict:
+        return {
+            "nombre": self.nombre,
+            "equipo": self.equipo,
+            "rendimiento": round(self.rendimiento, 2),
+            "ultimo": round(self.ultimo, 2),
+            "juegos": self.juegos,
+        }
+
+
+class MotorRatings:
+    """
+    Mantiene los ratings de equipos y jugadores, actualizados juego a juego.
+
+    Es seguro consultarlo desde otro hilo mientras la simulación lo actualiza.
+    """
+
+    ELO_INICIAL = 1500.0
+    ESCALA_ELO = 400.0
+
+    def __init__(self, k: float = 24.0, alfa: float = 0.1):
+        """
+        Args:
+            k (float): Cambio máximo de Elo por juego
+            alfa (float): Peso del último juego en el rendimiento de los jugadores
+                (0 < alfa <= 1; valores altos siguen más rápido los cambios de forma)
+
+        Atributos:
+            juegos (int): Juegos registrados
+
+        Raises:
+            ValueError: Si k no es positivo o alfa está fuera de (0, 1]
+        """
+        if k <= 0:
+            raise ValueError("k debe ser positivo")
+        if not 0 < alfa <= 1:
+            raise ValueError("alfa debe estar en (0, 1]")
+        self.k = k
+        self.alfa = alfa
+        self.juegos = 0
+        self._equipos: Dict[str, RatingEquipo] = {}
+        self._jugadores: Dict[str, RatingJugador] = {}
+        self._lock = threading.Lock()
+
+    def probabilidad_victoria(self, elo1: float, elo2: float) -> float:
+        """Probabilidad esperada de que gane el equipo con elo1."""
+        return 1.0 / (1.0 + 10.0 ** ((elo2 - elo1) / self.ESCALA_ELO))
+
+    def registrar(
+        self,
+        equipo1: Tuple[str, str],
+        equipo2: Tuple[str, str],
+        puntaje1: int,
+        puntaje2: int,
+        jugadores: Iterable[Tuple[str, str, str, int]] = (),
+    ) -> None:
+        """
+        Actualiza los ratings con el resultado de un juego.
+
+        Args:
+            equipo1 (Tuple[str, str]): (identificador, nombre) del primer equipo
+            equipo2 (Tuple[str, str]): (identificador, nombre) del segundo equipo
+            puntaje1 (int): Puntaje total del primer equipo
+            puntaje2 (int): Puntaje total del segundo equipo
+            jugadores (Iterable[tuple]): (user_id, nombre, identificador de equipo,
+                puntos en el juego) de cada jugador; vacío actualiza solo los equipos
+        """
+        jugadores = list(jugadores)
+        with self._lock:
+            rating1 = self._equipo(*equipo1)
+            rating2 = self._equipo(*equipo2)
+            esperado = self.probabilidad_victoria(rating1.elo, rating2.elo)
+            if puntaje1 > puntaje2:
+                resultado = 1.0
+                rating1.ganados += 1
+                rating2.perdidos += 1
+            elif puntaje2 > puntaje1:
+                resultado = 0.0
+                rating1.perdidos += 1
+                rating2.ganados += 1
+            else:
+                resultado = 0.5
+                rating1.empatados += 1
+                rating2.empatados += 1
+            cambio = self.k * (resultado - esperado)
+            for rating, delta in ((rating1, cambio), (rating2, -cambio)):
+                rating.elo += delta
+                rating.juegos += 1
+                rating.elo_maximo = max(rating.elo_maximo, rating.elo)
+
+            if jugadores:
+                media = sum(j[3] for j in jugadores) / len(jugadores)
+                for user_id, nombre, equipo_id, puntos in jugadores:
+                    rating = self._jugadores.get(user_id)
+                    if rating is None:
+                        rating = self._jugadores[user_id] = RatingJugador(nombre, equipo_id)
+                    relativo = 100.0 * puntos / media if media > 0 else 100.0
+                    rating.ultimo = relativo
+                    rating.rendimiento += self.alfa * (relativo - rating.rendimiento)
+                    rating.juegos += 1
+            self.juegos += 1
+
+    def _equipo(self, equipo_id: str, nombre: str) -> RatingEquipo:
+        rating = self._equipos.get(equipo_id)
+        if rating is None:
+            rating = self._equipos[equipo_id] = RatingEquipo(nombre, self.ELO_INICIAL)
+        return rating
+
+    def registrar_juego(self, juego) -> None:
+        """
+        Actualiza los ratings con un Juego recién terminado.
+
+        Args:
+            juego (Juego): Juego sobre el que ya se llamó jugar_juego_completo()
+        """
+        jugadores = [
+            (jugador.user_id, jugador.nombre, equipo.equipo_id, jugador.puntaje_juego_actual)
+            for equipo in (juego.equipo1, juego.equipo2)
+            for jugador in equipo.jugadores
+        ]
+        self.registrar(
+            (juego.equipo1.equipo_id, juego.equipo1.nombre),
+            (juego.equipo2.equipo_id, juego.equipo2.nombre),
+            juego.puntaje_equipo1_final,
+            juego.puntaje_equipo2_final,
+            jugadores,
+        )
+
+    def registrar_resultado(self, resultado: dict) -> None:
+        """
+        Actualiza el Elo de los equipos con un resultado serializado
+        (esquema de resultados_acumulados.json). Los equipos se identifican por
+        nombre y, como el resultado no incluye los puntos por jugador, los
+        ratings de los jugadores no cambian.
+        """
+        equipo1, equipo2 = resultado["equipo_1"], resultado["equipo_2"]
+        self.registrar(
+            (equipo1["nombre"], equipo1["nombre"]),
+            (equipo2["nombre"], equipo2["nombre"]),
+            equipo1["puntaje_total"],
+            equipo2["puntaje_total"],
+        )
+
+    def equipos(self, limite: Optional[int] = None) -> List[dict]:
+        """Ratings de los equipos, del mayor al menor Elo."""
+        with self._lock:
+            filas = [
+                dict(rating.a_dict(), equipo_id=equipo_id)
+                for equipo_id, rating in self._equipos.items()
+            ]
+        filas.sort(key=lambda fila: fila["elo"], reverse=True)
+        return filas[:limite] if limite is not None else filas
+
+    def jugadores(self, limite: Optional[int] = None) -> List[dict]:
+        """Ratings de los jugadores, del mayor al menor rendimiento."""
+        with self._lock:
+            filas = [
+                dict(rating.a_dict(), user_id=user_id)
+                for user_id, rating in self._jugadores.items()
+            ]
+        filas.sort(key=lambda fila: fila["rendimiento"], reverse=True)
+        return filas[:limite] if limite is not None else filas
+
+    def a_dict(self, limite: Optional[int] = None) -> dict:
+        """
+        Retorna los ratings en formato serializable.
+
+        Args:
+            limite (int): Máximo de equipos y de jugadores a incluir (None: todos)
+        """
+        return {
+            "juegos": self.juegos,
+            "k": self.k,
+            "alfa": self.alfa,
+            "equipos": self.equipos(limite),
+            "jugadores": self.jugadores(limite),
+        }
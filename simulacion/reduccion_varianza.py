@@ -0,0 +1,235 @@
+"""
+Estimadores con reducción de varianza para la simulación.
+
+Dos técnicas, combinables entre sí:
+
+- Variables antitéticas: cada juego se simula dos veces con la misma semilla, una
+  con los números u del generador y otra con 1 - u. Se promedia cada par, y como
+  los dos juegos tienden a desviarse en sentidos opuestos, el promedio varía menos
+  que el de dos juegos independientes.
+- Números aleatorios comunes: para comparar dos escenarios (por ejemplo, dos
+  configuraciones de equipos o de parámetros), el juego i de ambos usa el mismo
+  subflujo del generador. La diferencia por juego elimina la mayor parte del ruido
+  compartido y deja sobre todo el efecto del cambio de configuración.
+
+Cada estimación informa, además del intervalo de confianza, la ganancia en tamaño
+de muestra efectivo: cuántas veces más juegos independientes habría que simular
+para lograr el mismo error estándar.
+"""
+
+import math
+from dataclasses import asdict, dataclass, replace
+from statistics import NormalDist
+from typing import Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .simulador import ConfiguracionSimulacion, Simulador
+
+# Métricas por juego que se pueden estimar: nombre -> función sobre el resultado serializado
+METRICAS_JUEGO: Dict[str, Callable[[dict], float]] = {
+    "puntaje_equipo1": lambda r: r["equipo_1"]["puntaje_total"],
+    "puntaje_equipo2": lambda r: r["equipo_2"]["puntaje_total"],
+    "diferencia_puntaje": lambda r: (
+        r["equipo_1"]["puntaje_total"] - r["equipo_2"]["puntaje_total"]
+    ),
+    "victoria_equipo1": lambda r: float(
+        r["equipo_1"]["puntaje_total"] > r["equipo_2"]["puntaje_total"]
+    ),
+    "victoria_equipo2": lambda r: float(
+        r["equipo_2"]["puntaje_total"] > r["equipo_1"]["puntaje_total"]
+    ),
+    "victoria_genero_M": lambda r: float(r["genero_con_mas_victorias"] == "M"),
+    "victoria_genero_F": lambda r: float(r["genero_con_mas_victorias"] == "F"),
+}
+
+
+@dataclass
+class EstimacionReducida:
+    """
+    Estimación de una métrica con reducción de varianza.
+
+    Attributes:
+        metrica (str): Nombre de la métrica
+        estimacion (float): Media estimada (o diferencia de medias al comparar escenarios)
+        error_estandar (float): Error estándar con reducción de varianza
+        inferior (float): Límite inferior del intervalo de confianza
+        superior (float): Límite superior del intervalo de confianza
+        error_estandar_independiente (float): Error estándar que tendría el mismo número
+            de juegos simulados de forma independiente
+        ganancia_ess (float): Razón entre las varianzas independiente y reducida; los
+            juegos simulados "valen" ganancia_ess veces más juegos independientes
+        juegos_simulados (int): Total de juegos simulados para la estimación
+    """
+    metrica: str
+    estimacion: float
+    error_estandar: float
+    inferior: float
+    superior: float
+    error_estandar_independiente: float
+    ganancia_ess: float
+    juegos_simulados: int
+
+    @property
+    def juegos_equivalentes(self) -> float:
+        """Juegos independientes necesarios para igualar la precisión obtenida."""
+        return self.ganancia_ess * self.juegos_simulados
+
+    def a_dict(self) -> dict:
+        """Retorna la estimación en formato serializable."""
+        datos = asdict(self)
+        datos["juegos_equivalentes"] = self.juegos_equivalentes
+        return datos
+
+
+def _validar_metricas(metricas: Optional[Iterable[str]]) -> List[str]:
+    """Retorna la lista de métricas solicitadas, verificando que existan."""
+    metricas = list(metricas) if metricas is not None else list(METRICAS_JUEGO)
+    desconocidas = set(metricas) - set(METRICAS_JUEGO)
+    if desconocidas:
+        raise ValueError(f"Métricas desconocidas: {sorted(desconocidas)}")
+    return metricas
+
+
+def _simular(config: ConfiguracionSimulacion, metricas: List[str], antitetico: bool) -> np.ndarray:
+    """
+    Simula la configuración con subflujos por juego y extrae las métricas.
+
+    Returns:
+        np.ndarray: Arreglo (corridas, juegos, métricas); la segunda corrida, si
+                    existe, es la antitética de la primera
+    """
+    if config.semilla is None:
+        raise ValueError("La reducción de varianza requiere una semilla")
+    if config.num_juegos < 2:
+        raise ValueError("Se requieren al menos 2 juegos para estimar la varianza")
+    funciones = [METRICAS_JUEGO[metrica] for metrica in metricas]
+    corridas = []
+    for reflejada in ([False, True] if antitetico else [False]):
+        variante = replace(
+            config, subflujos=True, antitetico=reflejada, semi_ancho_objetivo=None
+        ).validar()
+        resultados = Simulador(variante).ejecutar()
+        corridas.append([[f(r) for f in funciones] for r in resultados])
+    return np.asarray(corridas, dtype=np.float64)
+
+
+def _estimaciones(
+    metricas: List[str],
+    muestras: np.ndarray,
+    varianza_independiente: np.ndarray,
+    juegos_simulados: int,
+    confianza: float,
+) -> Dict[str, EstimacionReducida]:
+    """
+    Construye las estimaciones a partir de las muestras por juego ya combinadas.
+
+    Args:
+        muestras: Arreglo (juegos, métricas) con el promedio de cada par antitético o la
+            diferencia por juego entre escenarios
+        varianza_independiente: Varianza de la media que se obtendría con el mismo
+            número de juegos independientes, por métrica
+    """
+    n = muestras.shape[0]
+    z = NormalDist().inv_cdf((1 + confianza) / 2)
+    medias = muestras.mean(axis=0)
+    varianza_reducida = muestras.var(axis=0, ddof=1) / n
+    estimaciones = {}
+    for j, metrica in enumerate(metricas):
+        error = math.sqrt(varianza_reducida[j])
+        if varianza_reducida[j] > 0:
+            ganancia = varianza_independiente[j] / varianza_reducida[j]
+        else:
+            ganancia = 1.0 if varianza_independiente[j] == 0 else math.inf
+        estimaciones[metrica] = EstimacionReducida(
+            metrica=metrica,
+            estimacion=float(medias[j]),
+            error_estandar=error,
+            inferior=float(medias[j] - z * error),
+            superior=float(medias[j] + z * error),
+            error_estandar_independiente=math.sqrt(varianza_independiente[j]),
+            ganancia_ess=float(ganancia),
+            juegos_simulados=juegos_simulados,
+        )
+    return estimaciones
+
+
+def estimar(
+    config: ConfiguracionSimulacion,
+    metricas: Optional[Iterable[str]] = None,
+    antitetico: bool = True,
+    confianza: float = 0.95,
+) -> Dict[str, EstimacionReducida]:
+    """
+    Estima la media de cada métrica usando pares antitéticos.
+
+    Con antitetico=True se simulan 2 * config.num_juegos juegos: cada juego y su
+    versión antitética.
+
+    Args:
+        config (ConfiguracionSimulacion): Configuración a simular (requiere semilla)
+        metricas (Iterable[str]): Métricas de METRICAS_JUEGO (por defecto, todas)
+        antitetico (bool): Si es False, la estimación es la ingenua (ganancia 1)
+        confianza (float): Nivel de confianza de los intervalos
+
+    Returns:
+        Dict[str, EstimacionReducida]: Estimación por métrica
+
+    Raises:
+        ValueError: Si falta la semilla, hay menos de 2 juegos o una métrica no existe
+    """
+    metricas = _validar_metricas(metricas)
+    corridas = _simular(config, metricas, antitetico)
+    observaciones = corridas.reshape(-1, len(metricas))
+    varianza_independiente = observaciones.var(axis=0, ddof=1) / len(observaciones)
+    return _estimaciones(
+        metricas, corridas.mean(axis=0), varianza_independiente, len(observaciones), confianza
+    )
+
+
+def comparar_escenarios(
+    config_a: ConfiguracionSimulacion,
+    config_b: ConfiguracionSimulacion,
+    metricas: Optional[Iterable[str]] = None,
+    antitetico: bool = False,
+    confianza: float = 0.95,
+) -> Dict[str, EstimacionReducida]:
+    """
+    Estima la diferencia de medias (escenario B menos escenario A) de cada métrica
+    con números aleatorios comunes.
+
+    Ambos escenarios usan la semilla y el número de juegos de config_a, con un
+    subflujo por juego, de modo que el juego i de A y de B parte del mismo estado
+    del generador. La ganancia se calcula frente a simular A y B de forma
+    independiente con el mismo número de juegos.
+
+    Args:
+        config_a (ConfiguracionSimulacion): Escenario de referencia (requiere semilla)
+        config_b (ConfiguracionSimulacion): Escenario a comparar
+        metricas (Iterable[str]): Métricas de METRICAS_JUEGO (por defecto, todas)
+        antitetico (bool): Si es True, además se combinan pares antitéticos en
+            cada escenario
+        confianza (float): Nivel de confianza de los intervalos
+
+    Returns:
+        Dict[str, EstimacionReducida]: Diferencia estimada por métrica
+
+    Raises:
+        ValueError: Si falta la semilla, hay menos de 2 juegos o una métrica no existe
+    """
+    metricas = _validar_metricas(metricas)
+    config_b = replace(config_b, semilla=config_a.semilla, num_juegos=config_a.num_juegos)
+    corridas_a = _simular(config_a, metricas, antitetico)
+    corridas_b = _simular(config_b, metricas, antitetico)
+    observaciones_a = corridas_a.reshape(-1, len(metricas))
+    observaciones_b = corridas_b.reshape(-1, len(metricas))
+    varianza_independiente = (
+        observaciones_a.var(axis=0, ddof=1) + observaciones_b.var(axis=0, ddof=1)
+    ) / len(observaciones_a)
+    return _estimaciones(
+        metricas,
+        (corridas_b - corridas_a).mean(axis=0),
+        varianza_independiente,
+        len(observaciones_a) + len(observaciones_b),
+        confianza,
+    )
@@ -0,0 +1,233 @@
+"""
+Registro compacto de los tiros de un blanco.
+
+En lugar de un objeto por tiro, los tiros se guardan en un arreglo estructurado de
+NumPy que crece por duplicación: cada tiro ocupa 14 bytes (índice de jugador,
+código de zona, puntaje y coordenadas en float32). Los datos de cada jugador se
+guardan una sola vez en un registro con __slots__. La serialización se hace en
+bloque sobre las columnas del arreglo.
+
+Las coordenadas no se calculan al registrar el tiro: si el registro tiene un
+generador de coordenadas, se obtienen en bloque la primera vez que se consultan
+los tiros (por ejemplo, para un mapa de calor o una repetición del juego).
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Estructura de cada tiro en el registro
+TIRO_DTYPE = np.dtype(
+    [
+        ("jugador", np.int32),
+        ("zona", np.int8),
+        ("puntaje", np.int8),
+        ("x", np.float32),
+        ("y", np.float32),
+    ]
+)
+
+
+class JugadorRegistrado:
+    """
+    Datos de un jugador que realizó tiros en el blanco.
+
+    Attributes:
+        jugador_id (str): Identificador único del jugador
+        nombre (str): Nombre del jugador
+        genero (str): Género del jugador ('M' o 'F')
+    """
+
+    __slots__ = ("jugador_id", "nombre", "genero")
+
+    def __init__(self, jugador_id: str, nombre: str, genero: str):
+        self.jugador_id = jugador_id
+        self.nombre = nombre
+        self.genero = genero
+
+
+class RegistroTiros:
+    """
+    Historial de tiros respaldado por un arreglo estructurado creciente.
+
+    Las zonas se guardan como su posición en el orden de zonas del blanco; el
+    registro recibe ese orden para poder traducir los códigos al serializar.
+    """
+
+    __slots__ = (
+        "_datos",
+        "_cantidad",
+        "_indices",
+        "jugadores",
+        "_valores_zona",
+        "_generador_coordenadas",
+        "_con_coordenadas",
+        "_primer_tiro",
+    )
+
+    CAPACIDAD_INICIAL = 256
+
+    def __init__(
+        self,
+        valores_zona: List[int],
+        generador_coordenadas: Optional[
+            Callable[[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]
+        ] = None,
+    ):
+        """
+        Args:
+            valores_zona (List[int]): Valor de cada código de zona (Blanco.ZONAS en orden)
+            generador_coordenadas (Callable): Función que recibe los números de tiro y
+                sus códigos de zona y retorna los arreglos (x, y); None registra solo
+                los puntajes
+
+        Atributos:
+            jugadores (List[JugadorRegistrado]): Jugadores en orden de su primer tiro
+        """
+        self._datos = np.empty(self.CAPACIDAD_INICIAL, dtype=TIRO_DTYPE)
+        self._cantidad = 0
+        self._indices: Dict[str, int] = {}
+        self.jugadores: List[JugadorRegistrado] = []
+        self._valores_zona = np.asarray(valores_zona, dtype=np.int64)
+        self._generador_coordenadas = generador_coordenadas
+        self._con_coordenadas = 0  # Tiros cuyas coordenadas ya fueron calculadas
+        self._primer_tiro = 0  # Número del primer tiro tras la última limpieza
+
+    def __len__(self) -> int:
+        return self._cantidad
+
+    @property
+    def tiene_coordenadas(self) -> bool:
+        """Indica si el registro puede entregar las coordenadas de los tiros."""
+        return self._generador_coordenadas is not None
+
+    @property
+    def tiros(self) -> np.ndarray:
+        """
+        Vista del arreglo estructurado con los tiros registrados.
+
+        Calcula antes las coordenadas pendientes; sin generador, x e y valen NaN.
+        """
+        self._completar_coordenadas()
+        return self._datos[: self._cantidad]
+
+    def _completar_coordenadas(self) -> None:
+        """Calcula en bloque las coordenadas de los tiros que aún no las tienen."""
+        if self._generador_coordenadas is None or self._con_coordenadas == self._cantidad:
+            return
+        pendientes = self._datos[self._con_coordenadas : self._cantidad]
+        numeros = np.arange(
+            self._primer_tiro + self._con_coordenadas, self._primer_tiro + self._cantidad
+        )
+        x, y = self._generador_coordenadas(numeros, pendientes["zona"])
+        pendientes["x"] = x
+        pendientes["y"] = y
+        self._con_coordenadas = self._cantidad
+
+    @property
+    def nbytes(self) -> int:
+        """Memoria reservada por el arreglo de tiros."""
+        return self._datos.nbytes
+
+    def indice_jugador(self, jugador) -> int:
+        """Retorna el índice del jugador en el registro, registrándolo si es nuevo."""
+        indice = self._indices.get(jugador.user_id)
+        if indice is None:
+            indice = len(self.jugadores)
+            self._indices[jugador.user_id] = indice
+            self.jugadores.append(
+                JugadorRegistrado(jugador.user_id, jugador.nombre, jugador.genero)
+            )
+        return indice
+
+    def registrar(self, jugador, codigo_zona: int, puntaje: int) -> None:
+        """
+        Agrega un tiro al registro; sus coordenadas se calculan al consultarlas.
+
+        Args:
+            jugador (Jugador): Jugador que realizó el tiro
+            codigo_zona (int): Posición de la zona en el orden de zonas del blanco
+            puntaje (int): Puntaje obtenido
+        """
+        if self._cantidad == len(self._datos):
+            ampliado = np.empty(2 * len(self._datos), dtype=TIRO_DTYPE)
+            ampliado[: self._cantidad] = self._datos
+            self._datos = ampliado
+        self._datos[self._cantidad] = (
+            self.indice_jugador(jugador), codigo_zona, puntaje, np.nan, np.nan
+        )
+        self._cantidad += 1
+
+    def tiros_de(self, jugador_id: str) -> np.ndarray:
+        """Retorna los tiros de un jugador (arreglo vacío si no ha tirado)."""
+        indice = self._indices.get(jugador_id)
+        if indice is None:
+            return self._datos[:0]
+        tiros = self.tiros
+        return tiros[tiros["jugador"] == indice]
+
+    def serializar(self) -> List[dict]:
+        """
+        Convierte el registro al formato serializable de Blanco.obtener_tiros_serializables.
+
+        Returns:
+            List[dict]: Por jugador, sus datos y la lista de lanzamientos
+                        ({"coordenadas": [x, y], "zona": int, "puntaje": int});
+                        sin generador de coordenadas, "coordenadas" es None
+        """
+        tiros = self.tiros
+        orden = np.argsort(tiros["jugador"], kind="stable")
+        ordenados = tiros[orden]
+        zonas = self._valores_zona[ordenados["zona"]].tolist()
+        puntajes = ordenados["puntaje"].tolist()
+        if self.tiene_coordenadas:
+            xs = np.round(ordenados["x"].astype(np.float64), 2).tolist()
+            ys = np.round(ordenados["y"].astype(np.float64), 2).tolist()
+            coordenadas = [[x, y] for x, y in zip(xs, ys)]
+        else:
+            coordenadas = [None] * len(ordenados)
+        limites = np.cumsum(np.bincount(ordenados["jugador"], minlength=len(self.jugadores)))
+
+        resultado = []
+        inicio = 0
+        for jugador, fin in zip(self.jugadores, limites.tolist()):
+            resultado.append(
+                {
+                    "jugador_id": jugador.jugador_id,
+                    "nombre": jugador.nombre,
+                    "genero": jugador.genero,
+                    "lanzamientos": [
+                        {"coordenadas": coordenadas[i], "zona": zonas[i], "puntaje": puntajes[i]}
+                        for i in range(inicio, fin)
+                    ],
+                }
+            )
+            inicio = fin
+        return resultado
+
+    def reiniciar(self) -> None:
+        """
+        Elimina todos los tiros y jugadores y vuelve la numeración de tiros a cero.
+
+        A diferencia de limpiar(), conserva el arreglo ya reservado; se usa cuando el
+        blanco cambia de semilla de coordenadas para un nuevo juego.
+        """
+        self._primer_tiro = 0
+        self._cantidad = 0
+        self._con_coordenadas = 0
+        self._indices.clear()
+        self.jugadores.clear()
+
+    def limpiar(self) -> None:
+        """
+        Elimina todos los tiros y jugadores registrados.
+
+        La numeración de tiros continúa, de modo que los tiros posteriores no
+        repiten las coordenadas de los eliminados.
+        """
+        self._primer_tiro += self._cantidad
+        self._datos = np.empty(self.CAPACIDAD_INICIAL, dtype=TIRO_DTYPE)
+        self._cantidad = 0
+        self._con_coordenadas = 0
+        self._indices.clear()
+        self.jugadores.clear()
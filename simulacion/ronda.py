@@ -1,13 +1,226 @@
-from modelos.random_wrapper import randint
+from dataclasses import dataclass
+from typing import Optional
+
+from .eventos import Evento
+from .jugador import Jugador
+
+
+class Enfrentamiento:
+    """
+    Índices de los jugadores de dos equipos, calculados una sola vez por enfrentamiento.
+
+    Los jugadores de ambos equipos se numeran en orden (primero los del equipo 1);
+    equipos y generos se indexan con ese número, y indices traduce cada jugador a
+    su número sin recorrer las listas de los equipos.
+
+    Attributes:
+        jugadores (List[Jugador]): Jugadores del equipo 1 seguidos por los del equipo 2
+        equipos (tuple): Número de equipo (1 o 2) de cada jugador
+        generos (tuple): Género de cada jugador
+        indices (dict): Jugador -> su número en jugadores
+        rangos (tuple): Números de los jugadores de cada equipo, (rango_1, rango_2)
+    """
+
+    __slots__ = ("jugadores", "equipos", "generos", "indices", "rangos")
+
+    def __init__(self, equipo1, equipo2):
+        """
+        Args:
+            equipo1 (Equipo): Primer equipo
+            equipo2 (Equipo): Segundo equipo
+        """
+        n1 = len(equipo1.jugadores)
+        self.jugadores = list(equipo1.jugadores) + list(equipo2.jugadores)
+        self.equipos = (1,) * n1 + (2,) * len(equipo2.jugadores)
+        self.generos = tuple(jugador.genero for jugador in self.jugadores)
+        self.indices = {jugador: i for i, jugador in enumerate(self.jugadores)}
+        self.rangos = (range(n1), range(n1, len(self.jugadores)))
+
+    def equipo_de(self, jugador) -> int:
+        """Retorna el número de equipo (1 o 2) del jugador."""
+        return self.equipos[self.indices[jugador]]
+
+
+@dataclass
+class ResultadoEquipoRonda:
+    """
+    Resultado de un equipo en una ronda.
+
+    Attributes:
+        nombre (str): Nombre del equipo
+        puntaje (int): Puntos obtenidos en la ronda, incluido el tiro extra
+        tiros (int): Tiros regulares realizados por sus jugadores
+        puntaje_grupo (int): Puntos de lanzamientos extra consecutivos
+        tiros_jugadores (dict): Tiros serializados por jugador (None si no se registraron)
+    """
+    __slots__ = ("nombre", "puntaje", "tiros", "puntaje_grupo", "tiros_jugadores")
+    nombre: str
+    puntaje: int
+    tiros: int
+    puntaje_grupo: int
+    tiros_jugadores: Optional[dict]
+
+    def reiniciar(self) -> None:
+        """Vuelve el resultado a cero para reutilizarlo en otra ronda."""
+        self.puntaje = 0
+        self.tiros = 0
+        self.puntaje_grupo = 0
+        self.tiros_jugadores = None
+
+    def a_dict(self) -> dict:
+        """Retorna el resultado con el esquema de diccionario de la ronda."""
+        return {
+            "nombre": self.nombre,
+            "puntaje": self.puntaje,
+            "tiros": self.tiros,
+            "puntaje_grupo": self.puntaje_grupo,
+            "tiros_jugadores": self.tiros_jugadores or {},
+        }
+
+
+@dataclass
+class ResultadoRonda:
+    """
+    Resultado completo de una ronda.
+
+    Los jugadores destacados se guardan por referencia, junto con el valor de
+    suerte o experiencia que tenían al terminar la ronda y el número de su equipo
+    (1 o 2); a_dict() arma con ellos el diccionario que se expone hacia afuera.
+
+    Attributes:
+        numero_ronda (int): Número de la ronda dentro del juego
+        equipo1 (ResultadoEquipoRonda): Resultado del primer equipo
+        equipo2 (ResultadoEquipoRonda): Resultado del segundo equipo
+        ganador_individual (str): Nombre del equipo ganador, "EMPATE" o None
+        ganador_grupal (str): Ganador grupal (no se usa actualmente)
+        jugador_con_mas_suerte (Jugador): Último jugador que lanzó el tiro extra
+        suerte_maxima (float): Suerte de ese jugador en la ronda
+        equipo_con_mas_suerte (int): Equipo de ese jugador
+        jugador_con_mas_experiencia (Jugador): Jugador con más experiencia al final
+        experiencia_maxima (int): Experiencia de ese jugador al final de la ronda
+        equipo_con_mas_experiencia (int): Equipo de ese jugador
+    """
+    __slots__ = (
+        "numero_ronda",
+        "equipo1",
+        "equipo2",
+        "ganador_individual",
+        "ganador_grupal",
+        "jugador_con_mas_suerte",
+        "suerte_maxima",
+        "equipo_con_mas_suerte",
+        "jugador_con_mas_experiencia",
+        "experiencia_maxima",
+        "equipo_con_mas_experiencia",
+    )
+    numero_ronda: int
+    equipo1: ResultadoEquipoRonda
+    equipo2: ResultadoEquipoRonda
+    ganador_individual: Optional[str]
+    ganador_grupal: Optional[str]
+    jugador_con_mas_suerte: Optional[Jugador]
+    suerte_maxima: float
+    equipo_con_mas_suerte: int
+    jugador_con_mas_experiencia: Optional[Jugador]
+    experiencia_maxima: int
+    equipo_con_mas_experiencia: int
+
+    @classmethod
+    def nuevo(
+        cls, numero_ronda: int, nombre_equipo1: str, nombre_equipo2: str
+    ) -> "ResultadoRonda":
+        """Crea un resultado vacío para una ronda entre los equipos indicados."""
+        return cls(
+            numero_ronda,
+            ResultadoEquipoRonda(nombre_equipo1, 0, 0, 0, None),
+            ResultadoEquipoRonda(nombre_equipo2, 0, 0, 0, None),
+            None,
+            None,
+            None,
+            0.0,
+            0,
+            None,
+            0,
+            0,
+        )
+
+    def reiniciar(self, numero_ronda: int) -> None:
+        """
+        Vacía el resultado en su lugar para reutilizarlo en otra ronda.
+
+        Args:
+            numero_ronda (int): Número de la nueva ronda
+        """
+        self.numero_ronda = numero_ronda
+        self.equipo1.reiniciar()
+        self.equipo2.reiniciar()
+        self.ganador_individual = None
+        self.ganador_grupal = None
+        self.jugador_con_mas_suerte = None
+        self.suerte_maxima = 0.0
+        self.equipo_con_mas_suerte = 0
+        self.jugador_con_mas_experiencia = None
+        self.experiencia_maxima = 0
+        self.equipo_con_mas_experiencia = 0
+
+    def a_dict(self) -> dict:
+        """
+        Convierte el resultado al diccionario de ronda usado por la API.
+
+        Returns:
+            dict: Resultado con las claves "ronda actual", "equipo 1", "equipo 2",
+                  ganadores y jugadores destacados
+        """
+        if self.jugador_con_mas_suerte is not None:
+            suerte = {
+                "nombre": self.jugador_con_mas_suerte.nombre,
+                "user_id": self.jugador_con_mas_suerte.user_id,
+                "suerte": self.suerte_maxima,
+                "equipo": f"equipo {self.equipo_con_mas_suerte}",
+            }
+        else:
+            suerte = "No determinado"
+        if self.jugador_con_mas_experiencia is not None:
+            experiencia = {
+                "nombre": self.jugador_con_mas_experiencia.nombre,
+                "user_id": self.jugador_con_mas_experiencia.user_id,
+                "experiencia": self.experiencia_maxima,
+                "equipo": f"equipo {self.equipo_con_mas_experiencia}",
+            }
+        else:
+            experiencia = "No determinado"
+        return {
+            "ronda actual": self.numero_ronda,
+            "equipo 1": self.equipo1.a_dict(),
+            "equipo 2": self.equipo2.a_dict(),
+            "ganador_individual": self.ganador_individual,
+            "ganador_grupal": self.ganador_grupal,
+            "jugador_con_mas_suerte": suerte,
+            "jugador_con_mas_experiencia": experiencia,
+            "ronda": self.numero_ronda,
+        }
 
 
 class Ronda:
     """
     Representa una ronda del juego de arquería donde dos equipos compiten.
     Maneja la lógica de los turnos, puntajes y determina los ganadores de la ronda.
+
+    Una misma instancia puede jugar varias rondas: reiniciar() vacía su estado en
+    su lugar, de modo que un juego ejecuta todas sus rondas sin crear objetos nuevos.
     """
 
-    def __init__(self, numero_ronda, equipo1, equipo2, blanco):
+    def __init__(
+        self,
+        numero_ronda,
+        equipo1,
+        equipo2,
+        blanco,
+        rng=None,
+        rango_cansancio=None,
+        enfrentamiento=None,
+        eventos=None,
+    ):
         """
         Inicializa una nueva ronda del juego.
 
@@ -16,42 +229,56 @@ class Ronda:
             equipo1 (Equipo): Primer equipo participante
             equipo2 (Equipo): Segundo equipo participante
             blanco (Blanco): El blanco objetivo donde se realizarán los tiros
+            rng (RandomWrapper): Generador a utilizar (por defecto, el del blanco)
+            rango_cansancio (tuple): Cansancio mínimo y máximo acumulado al final de
+                la ronda (por defecto, Jugador.RANGO_CANSANCIO)
+            enfrentamiento (Enfrentamiento): Índices de los jugadores de ambos equipos
+                (por defecto, se calculan a partir de los equipos)
+            eventos (BusEventos): Bus al que se emiten los eventos de la ronda
+                (None: no se emiten)
 
         Atributos:
             jugador_ganador: El jugador que obtuvo el mayor puntaje en la ronda
             jugador_con_mas_suerte: El jugador que tuvo la mayor suerte en la ronda
             jugador_con_mas_experiencia: El jugador con mayor experiencia acumulada
-            resultado (dict): Diccionario que almacena todos los resultados de la ronda
+            resultado (ResultadoRonda): Registro con todos los resultados de la ronda
         """
         self.numero_ronda = numero_ronda
         self.equipo1 = equipo1
         self.equipo2 = equipo2
         self.blanco = blanco
+        self.enfrentamiento = (
+            enfrentamiento if enfrentamiento is not None else Enfrentamiento(equipo1, equipo2)
+        )
+        self.rng = rng if rng is not None else blanco.rng
+        self.rango_cansancio = (
+            tuple(rango_cansancio) if rango_cansancio is not None else Jugador.RANGO_CANSANCIO
+        )
         self.jugador_ganador = None
         self.jugador_con_mas_suerte = None
         self.jugador_con_mas_experiencia = None
-        self.resultado = {
-            "ronda actual": numero_ronda,
-            "equipo 1": {
-                "nombre": equipo1.nombre,
-                "puntaje": 0,
-                "tiros": 0,
-                "puntaje_grupo": 0,
-                "tiros_jugadores": {},
-            },
-            "equipo 2": {
-                "nombre": equipo2.nombre,
-                "puntaje": 0,
-                "tiros": 0,
-                "puntaje_grupo": 0,
-                "tiros_jugadores": {},
-            },
-            "ganador_individual": None,
-            "ganador_grupal": None,
-            "jugador_con_mas_suerte": self.jugador_con_mas_suerte,
-            "jugador_con_mas_experiencia": self.jugador_con_mas_experiencia,
-            "ronda": numero_ronda,
-        }
+        self.eventos = eventos
+        self.resultado = ResultadoRonda.nuevo(numero_ronda, equipo1.nombre, equipo2.nombre)
+
+    def reiniciar(self, numero_ronda, resultado=None):
+        """
+        Prepara la instancia para jugar otra ronda entre los mismos equipos.
+
+        Args:
+            numero_ronda (int): Número de la nueva ronda
+            resultado (ResultadoRonda): Registro preasignado donde guardar el resultado
+                (por defecto, se reutiliza el de la ronda anterior)
+
+        Efectos:
+            - Vacía el resultado y los jugadores destacados de la ronda anterior
+        """
+        self.numero_ronda = numero_ronda
+        self.jugador_ganador = None
+        self.jugador_con_mas_suerte = None
+        self.jugador_con_mas_experiencia = None
+        if resultado is not None:
+            self.resultado = resultado
+        self.resultado.reiniciar(numero_ronda)
 
     def jugar(self):
         """
@@ -66,8 +293,11 @@ class Ronda:
         6. Se actualiza la resistencia de los jugadores
 
         Returns:
-            dict: Resultados completos de la ronda, incluyendo puntajes, ganadores y estadísticas
+            ResultadoRonda: Resultados completos de la ronda, incluyendo puntajes,
+                ganadores y estadísticas (a_dict() da su versión serializable)
         """
+        if self.eventos is not None:
+            self.eventos.emitir(Evento.INICIO_RONDA, ronda=self)
         self._jugar_turnos_equipos()
         self._jugar_tiro_extra()
         self._determinar_jugador_ganador()
@@ -76,50 +306,38 @@ class Ronda:
         self._actualizar_experiencia()
         self._recuperar_resistencia()
 
+        resultado = self.resultado
         if self.jugador_con_mas_suerte:
-            self.resultado["jugador_con_mas_suerte"] = {
-                "nombre": self.jugador_con_mas_suerte.nombre,
-                "user_id": self.jugador_con_mas_suerte.user_id,
-                "suerte": self.jugador_con_mas_suerte.suerte,
-                "equipo": (
-                    "equipo 1"
-                    if self.jugador_con_mas_suerte in self.equipo1.jugadores
-                    else "equipo 2"
-                ),
-            }
-        else:
-            self.resultado["jugador_con_mas_suerte"] = "No determinado"
-
+            resultado.jugador_con_mas_suerte = self.jugador_con_mas_suerte
+            resultado.suerte_maxima = self.jugador_con_mas_suerte.suerte
+            resultado.equipo_con_mas_suerte = self.enfrentamiento.equipo_de(
+                self.jugador_con_mas_suerte
+            )
         if self.jugador_con_mas_experiencia:
-            self.resultado["jugador_con_mas_experiencia"] = {
-                "nombre": self.jugador_con_mas_experiencia.nombre,
-                "user_id": self.jugador_con_mas_experiencia.user_id,
-                "experiencia": self.jugador_con_mas_experiencia.experiencia,
-                "equipo": (
-                    "equipo 1"
-                    if self.jugador_con_mas_experiencia in self.equipo1.jugadores
-                    else "equipo 2"
-                ),
-            }
-        else:
-            self.resultado["jugador_con_mas_experiencia"] = "No determinado"
-        return self.resultado
+            resultado.jugador_con_mas_experiencia = self.jugador_con_mas_experiencia
+            resultado.experiencia_maxima = self.jugador_con_mas_experiencia.experiencia
+            resultado.equipo_con_mas_experiencia = self.enfrentamiento.equipo_de(
+                self.jugador_con_mas_experiencia
+            )
+        if self.eventos is not None:
+            self.eventos.emitir(Evento.FIN_RONDA, ronda=self, resultado=resultado)
+        return resultado
 
     def _jugar_turnos_equipos(self):
         """
         Gestiona los turnos de tiro de ambos equipos.
         Cada equipo realiza sus tiros en orden.
         """
-        self._jugar_turno_equipo(self.equipo1, "equipo 1")
-        self._jugar_turno_equipo(self.equipo2, "equipo 2")
+        self._jugar_turno_equipo(self.equipo1, self.resultado.equipo1)
+        self._jugar_turno_equipo(self.equipo2, self.resultado.equipo2)
 
-    def _jugar_turno_equipo(self, equipo, clave_equipo):
+    def _jugar_turno_equipo(self, equipo, resultado_equipo):
         """
         Ejecuta el turno de tiro para un equipo específico.
 
         Args:
             equipo (Equipo): El equipo que realizará los tiros
-            clave_equipo (str): Identificador del equipo ("equipo 1" o "equipo 2")
+            resultado_equipo (ResultadoEquipoRonda): Resultado del equipo en la ronda
             
         Efectos:
             - Cada jugador del equipo realiza tiros mientras tenga suficiente resistencia
@@ -129,11 +347,11 @@ class Ronda:
         for jugador in equipo.jugadores:
             jugador.reiniciar_suerte()
             puntaje, tiros = 0, 0
-            while jugador.puede_tirar():
+            while jugador.puede_tirar(self.blanco.costo_tiro):
                 puntaje += self.blanco.realizar_tiro(jugador)
                 tiros += 1
-            self.resultado[clave_equipo]["puntaje"] += puntaje
-            self.resultado[clave_equipo]["tiros"] += tiros
+            resultado_equipo.puntaje += puntaje
+            resultado_equipo.tiros += tiros
             jugador.puntaje_total += puntaje
             jugador.puntaje_ronda_actual = puntaje
 
@@ -147,47 +365,27 @@ class Ronda:
             - Actualiza el puntaje del equipo con el resultado del tiro extra
         """
         # el jugador con más suerte de cada equipo lanza un tiro extra
-        for equipo, clave in [(self.equipo1, "equipo 1"), (self.equipo2, "equipo 2")]:
+        for equipo, resultado_equipo in (
+            (self.equipo1, self.resultado.equipo1),
+            (self.equipo2, self.resultado.equipo2),
+        ):
             jugador = max(equipo.jugadores, key=lambda j: j.suerte)
             self.jugador_con_mas_suerte = jugador
-            tiro = self.blanco.realizar_tiro(jugador)
-            self.resultado[clave]["puntaje"] += tiro
-
-    def _registrar_tiros_jugadores(self):
-        """
-        Registra los tiros de cada jugador en el resultado, asociándolos al equipo correspondiente.
-        Utiliza el método obtener_tiros_serializables del blanco para obtener datos detallados.
-        """
-        tiros_serializados = self.blanco.obtener_tiros_serializables()
-
-        # Creamos conjuntos con los IDs de los jugadores de cada equipo para búsqueda eficiente
-        ids_equipo1 = {jugador.user_id for jugador in self.equipo1.jugadores}
-        ids_equipo2 = {jugador.user_id for jugador in self.equipo2.jugadores}
-
-        # Asignamos los tiros al equipo correspondiente
-        for jugador_tiros in tiros_serializados:
-            jugador_id = jugador_tiros["jugador_id"]
-
-            if jugador_id in ids_equipo1:
-                self.resultado["equipo 1"]["tiros_jugadores"][
-                    jugador_id
-                ] = jugador_tiros
-            elif jugador_id in ids_equipo2:
-                self.resultado["equipo 2"]["tiros_jugadores"][
-                    jugador_id
-                ] = jugador_tiros
+            puntaje = self.blanco.realizar_tiro(jugador)
+            resultado_equipo.puntaje += puntaje
+            if self.eventos is not None:
+                self.eventos.emitir(Evento.TIRO_EXTRA, ronda=self, jugador=jugador, puntaje=puntaje)
 
     def _manejar_lanzamientos_extra_consecutivos(self):
-        for jugador in self.equipo1.jugadores + self.equipo2.jugadores:
+        for jugador in self.enfrentamiento.jugadores:
             if jugador.consecutivo_extra_ganados >= 3:
                 tiro = self.blanco.realizar_tiro(jugador)
-                equipo = (
-                    self.equipo1 if jugador in self.equipo1.jugadores else self.equipo2
-                )
+                if self.enfrentamiento.equipo_de(jugador) == 1:
+                    equipo, resultado_equipo = self.equipo1, self.resultado.equipo1
+                else:
+                    equipo, resultado_equipo = self.equipo2, self.resultado.equipo2
                 equipo.puntaje_total += tiro
-
-                clave_equipo = "equipo 1" if equipo == self.equipo1 else "equipo 2"
-                self.resultado[clave_equipo]["puntaje_grupo"] += tiro
+                resultado_equipo.puntaje_grupo += tiro
 
                 jugador.consecutivo_extra_ganados = 0
 
@@ -200,8 +398,8 @@ class Ronda:
             - Asigna el ganador o declara empate
             - Actualiza el resultado de la ronda con el equipo ganador
         """
-        puntaje1 = self.resultado["equipo 1"]["puntaje"]
-        puntaje2 = self.resultado["equipo 2"]["puntaje"]
+        puntaje1 = self.resultado.equipo1.puntaje
+        puntaje2 = self.resultado.equipo2.puntaje
 
         if puntaje1 > puntaje2:
             self._asignar_ganador_ronda(self.equipo1)
@@ -209,7 +407,7 @@ class Ronda:
             self._asignar_ganador_ronda(self.equipo2)
         else:
             # se salta a la siguiente ronda
-            self.resultado["ganador_individual"] = "EMPATE"
+            self.resultado.ganador_individual = "EMPATE"
 
     def _determinar_jugador_ganador(self):
         """
@@ -225,16 +423,15 @@ class Ronda:
             - Actualiza el atributo jugador_ganador con el jugador que ganó la ronda
             - En caso de empate, inicia el proceso de desempate
         """
+        jugadores = self.enfrentamiento.jugadores
         maximo = 0
-        for jugador in self.equipo1.jugadores + self.equipo2.jugadores:
+        for jugador in jugadores:
             if jugador.puntaje_ronda_actual > maximo:
                 maximo = jugador.puntaje_ronda_actual
 
         # Find all players with the maximum score
         jugadores_empatados = [
-            jugador
-            for jugador in self.equipo1.jugadores + self.equipo2.jugadores
-            if jugador.puntaje_ronda_actual == maximo
+            jugador for jugador in jugadores if jugador.puntaje_ronda_actual == maximo
         ]
 
         # If there's only one player with the maximum score, they're the winner
@@ -277,6 +474,13 @@ class Ronda:
             ]
 
         # Devolver el único jugador que queda en contendientes
+        if self.eventos is not None:
+            self.eventos.emitir(
+                Evento.DESEMPATE,
+                ronda=self,
+                empatados=jugadores_empatados,
+                ganador=contendientes[0],
+            )
         return contendientes[0]
 
     def _desempatar_ronda(self):
@@ -296,7 +500,7 @@ class Ronda:
 
     def _asignar_ganador_ronda(self, equipo, jugador_extra=None):
         equipo.rondas_ganadas += 1
-        self.resultado["ganador_individual"] = equipo.nombre
+        self.resultado.ganador_individual = equipo.nombre
         if jugador_extra:
             jugador_extra.consecutivo_extra_ganados += 1
 
@@ -319,7 +523,7 @@ class Ronda:
                 self.jugador_ganador.rondas_con_beneficio = 2  # Beneficio por 2 rondas
 
         # Encontrar el jugador con más experiencia entre todos los jugadores
-        todos_los_jugadores = self.equipo1.jugadores + self.equipo2.jugadores
+        todos_los_jugadores = self.enfrentamiento.jugadores
         if todos_los_jugadores:
             self.jugador_con_mas_experiencia = max(
                 todos_los_jugadores, key=lambda j: j.experiencia
@@ -336,8 +540,8 @@ class Ronda:
             - Actualiza los beneficios de resistencia si están activos
             - Ajusta la resistencia actual según el cansancio y beneficios
         """
-        for jugador in self.equipo1.jugadores + self.equipo2.jugadores:
-            jugador.cansancio_acumulado += randint(1, 2)
+        for jugador in self.enfrentamiento.jugadores:
+            jugador.cansancio_acumulado += self.rng.randint(*self.rango_cansancio)
 
             # Decrementar contador de rondas con beneficio si está activo
             if jugador.beneficio_resistencia and jugador.rondas_con_beneficio > 0:
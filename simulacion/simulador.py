@@ -0,0 +1,461 @@
+"""
+Ejecución de simulaciones completas de arquería.
+
+Este módulo concentra la lógica que antes vivía en las rutas de la aplicación web:
+creación de equipos, ejecución de los juegos y conversión de cada juego a un
+diccionario serializable. No depende de Flask, por lo que puede usarse desde
+hilos de trabajo, procesos o scripts.
+"""
+
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, ClassVar, Dict, List, Optional
+from numpy import int64
+
+from modelos.substreams import derive_seed
+from .blanco_objetivo import Blanco, NivelRegistro
+from .contexto import ContextoSimulacion
+from .convergencia import MonitorConvergencia
+from .equipo import Equipo
+from .estadisticas_tiros import EstadisticasTiros
+from .juego import Juego
+from .ratings import MotorRatings
+
+
+@dataclass
+class ConfiguracionSimulacion:
+    """
+    Parámetros de una simulación.
+
+    Attributes:
+        num_juegos (int): Cantidad de juegos a simular
+        num_rondas (int): Rondas por juego
+        semilla (Optional[int]): Semilla del generador; None usa una semilla basada en el tiempo
+        nombre_equipo1 (str): Nombre del primer equipo
+        nombre_equipo2 (str): Nombre del segundo equipo
+        jugadores_por_equipo (int): Número de jugadores de cada equipo
+        semi_ancho_objetivo (Optional[float]): Si se indica, activa el modo secuencial:
+            la simulación se detiene cuando el intervalo de confianza de cada métrica
+            objetivo tiene a lo sumo este semi-ancho (num_juegos pasa a ser el máximo)
+        confianza (float): Nivel de confianza de los intervalos del modo secuencial
+        juegos_minimos (int): Juegos mínimos antes de evaluar la convergencia
+        metricas_objetivo (Optional[List[str]]): Métricas que deben converger
+            (por defecto, todas las de MonitorConvergencia)
+        probabilidades (Optional[dict]): Probabilidades base por género y zona del
+            blanco (None usa Blanco.PROBABILIDADES)
+        costo_tiro (Optional[int]): Resistencia consumida por tiro
+            (None usa Blanco.TIRO_RESISTENCIA_COST)
+        rango_cansancio (Optional[List[int]]): Cansancio mínimo y máximo por ronda
+            (None usa Jugador.RANGO_CANSANCIO)
+        subflujos (bool): Si es True, cada ronda de cada juego usa un subflujo del
+            generador derivado de la semilla, del número de juego y de la ronda, de modo
+            que la ronda r del juego i parte de los mismos números en cualquier
+            escenario (números aleatorios comunes)
+        antitetico (bool): Si es True, los juegos usan la variable antitética 1 - u
+            de cada número del generador; ver simulacion.reduccion_varianza
+        nivel_registro (str): Nivel de NivelRegistro con el que se guardan los tiros de
+            cada juego; los resultados no dependen de él (por defecto, ninguno)
+    """
+    num_juegos: int = 20000
+    num_rondas: int = 10
+    semilla: Optional[int] = None
+    nombre_equipo1: str = "Los tiguere"
+    nombre_equipo2: str = "Los jaguares"
+    jugadores_por_equipo: int = 5
+    semi_ancho_objetivo: Optional[float] = None
+    confianza: float = 0.95
+    juegos_minimos: int = 100
+    metricas_objetivo: Optional[List[str]] = None
+    probabilidades: Optional[Dict[str, Dict[str, float]]] = None
+    costo_tiro: Optional[int] = None
+    rango_cansancio: Optional[List[int]] = None
+    subflujos: bool = False
+    antitetico: bool = False
+    nivel_registro: str = NivelRegistro.NINGUNO
+
+    # Límites aceptados al recibir configuraciones desde el exterior
+    MAX_JUEGOS: ClassVar[int] = 10_000_000
+    MAX_RONDAS: ClassVar[int] = 1000
+
+    def validar(self) -> "ConfiguracionSimulacion":
+        """
+        Verifica que los parámetros estén dentro de los rangos admitidos.
+
+        Returns:
+            ConfiguracionSimulacion: La misma configuración, para encadenar llamadas
+
+        Raises:
+            ValueError: Si algún parámetro está fuera de rango
+        """
+        if not 1 <= self.num_juegos <= self.MAX_JUEGOS:
+            raise ValueError(f"num_juegos debe estar entre 1 y {self.MAX_JUEGOS}")
+        if not 1 <= self.num_rondas <= self.MAX_RONDAS:
+            raise ValueError(f"num_rondas debe estar entre 1 y {self.MAX_RONDAS}")
+        if self.semilla is not None and self.semilla <= 0:
+            raise ValueError("La semilla debe ser un entero positivo")
+        if self.jugadores_por_equipo < 2:
+            raise ValueError("Cada equipo debe tener al menos 2 jugadores")
+        if self.costo_tiro is not None and self.costo_tiro < 1:
+            raise ValueError("costo_tiro debe ser un entero positivo")
+        if self.rango_cansancio is not None:
+            if (
+                len(self.rango_cansancio) != 2
+                or not 0 <= self.rango_cansancio[0] <= self.rango_cansancio[1]
+            ):
+                raise ValueError(
+                    "rango_cansancio debe ser [minimo, maximo] con 0 <= minimo <= maximo"
+                )
+        if self.probabilidades is not None:
+            self._validar_probabilidades()
+        if self.nivel_registro not in NivelRegistro.TODOS:
+            raise ValueError(f"nivel_registro debe ser uno de {list(NivelRegistro.TODOS)}")
+        if self.subflujos and self.semilla is None:
+            raise ValueError("subflujos requiere una semilla")
+        self.crear_monitor()
+        return self
+
+    def _validar_probabilidades(self) -> None:
+        """Verifica que haya pesos no negativos para cada género y zona del blanco."""
+        for genero in ("M", "F"):
+            pesos = self.probabilidades.get(genero)
+            if pesos is None or set(pesos) != set(Blanco.ZONAS):
+                raise ValueError(
+                    f"probabilidades[{genero!r}] debe definir las zonas {sorted(Blanco.ZONAS)}"
+                )
+            if any(p < 0 for p in pesos.values()) or sum(pesos.values()) <= 0:
+                raise ValueError(f"probabilidades[{genero!r}] debe tener pesos no negativos")
+
+    def crear_monitor(self) -> Optional[MonitorConvergencia]:
+        """
+        Crea el monitor de convergencia del modo secuencial.
+
+        Returns:
+            MonitorConvergencia: Monitor configurado, o None si el modo secuencial
+                                 no está activo
+
+        Raises:
+            ValueError: Si los parámetros del modo secuencial no son válidos
+        """
+        if self.semi_ancho_objetivo is None:
+            return None
+        return MonitorConvergencia(
+            self.semi_ancho_objetivo,
+            confianza=self.confianza,
+            juegos_minimos=self.juegos_minimos,
+            metricas=self.metricas_objetivo,
+        )
+
+    def a_dict(self) -> dict:
+        """Retorna la configuración como diccionario serializable."""
+        return asdict(self)
+
+
+def convert_numpy(obj):
+    """
+    Convierte objetos de NumPy a tipos nativos de Python para permitir la serialización JSON.
+
+    Esta función es crucial porque los objetos NumPy (como np.int64) no son directamente
+    serializables a JSON. La función recorre recursivamente diccionarios y listas para
+    convertir todos los tipos NumPy encontrados.
+
+    Args:
+        obj: El objeto a convertir (puede ser dict, list, np.int64 u otro tipo)
+
+    Returns:
+        El objeto convertido a tipos nativos de Python
+    """
+    if isinstance(obj, dict):
+        return {k: convert_numpy(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [convert_numpy(x) for x in obj]
+    elif isinstance(obj, int64):
+        return int(obj)
+    else:
+        return obj
+
+
+def describir_equipo(equipo) -> dict:
+    """
+    Retorna la plantilla de un equipo en formato serializable.
+
+    Args:
+        equipo (Equipo): Equipo a describir
+
+    Returns:
+        dict: Nombre del equipo y lista de jugadores (nombre, género, user_id)
+    """
+    return {
+        "nombre": equipo.nombre,
+        "jugadores": [
+            {
+                "nombre": jugador.nombre,
+                "genero": jugador.genero,
+                "user_id": jugador.user_id,
+            }
+            for jugador in equipo.jugadores
+        ],
+    }
+
+
+def resultado_juego(juego) -> dict:
+    """
+    Construye el diccionario de resultados de un juego ya terminado.
+
+    Args:
+        juego (Juego): Juego sobre el que ya se llamó jugar_juego_completo()
+
+    Returns:
+        dict: Resultados del juego con el esquema de resultados_acumulados.json
+    """
+    generos_globales = juego.contexto.generos_victorias_totales
+    return {
+        "id_juego": juego.id_juego,
+        "jugador_con_mas_suerte": (
+            {
+                "nombre": juego.jugador_con_mas_suerte.nombre,
+                "user_id": juego.jugador_con_mas_suerte.user_id,
+                "suerte": juego.jugador_con_mas_suerte.suerte,
+            }
+            if isinstance(juego.jugador_con_mas_suerte, object)
+            and hasattr(juego.jugador_con_mas_suerte, "nombre")
+            else "No determinado"
+        ),
+        "jugador_con_mas_experiencia": (
+            {
+                "nombre": juego.jugador_con_mas_experiencia.nombre,
+                "user_id": juego.jugador_con_mas_experiencia.user_id,
+                "experiencia": juego.experiencia_maxima,
+            }
+            if isinstance(juego.jugador_con_mas_experiencia, object)
+            and hasattr(juego.jugador_con_mas_experiencia, "nombre")
+            else "No determinado"
+        ),
+        "genero_con_mas_victorias": juego.genero_con_mas_victorias,
+        "generos_victorias_totales": {
+            "M": juego.victorias_por_genero["M"],
+            "F": juego.victorias_por_genero["F"],
+        },
+        "generos_victorias_globales": {
+            "M": generos_globales["M"],
+            "F": generos_globales["F"],
+        },
+        "equipo_ganador": (
+            {
+                "nombre": juego.equipo_ganador_juego.nombre,
+                "puntaje": juego.puntaje_ganador,
+            }
+            if juego.equipo_ganador_juego is not None
+            else {"nombre": "Empate", "puntaje": 0}
+        ),
+        "numero_juego": juego.juego_actual,
+        "equipo_1": {
+            "nombre": juego.equipo1.nombre,
+            "rondas_ganadas": juego.equipo1.rondas_ganadas,
+            "puntaje_total": juego.puntaje_equipo1_final,
+        },
+        "equipo_2": {
+            "nombre": juego.equipo2.nombre,
+            "rondas_ganadas": juego.equipo2.rondas_ganadas,
+            "puntaje_total": juego.puntaje_equipo2_final,
+        },
+    }
+
+
+class ContadoresSimulacion:
+    """
+    Totales acumulados de una o varias simulaciones, para métricas de rendimiento.
+
+    Se actualizan al terminar cada juego; otro hilo puede leerlos en cualquier
+    momento (a lo sumo verá el último juego a medio contar).
+
+    Atributos:
+        juegos (int): Juegos simulados
+        rondas (int): Rondas jugadas
+        tiros (int): Tiros de los turnos y tiros extra (sin los de desempate)
+        segundos (Dict[str, float]): Tiempo acumulado en cada fase de FASES
+    """
+
+    __slots__ = ("juegos", "rondas", "tiros", "segundos")
+
+    # Fases de Simulador.jugar_juego, en orden
+    FASES = ("preparacion", "juego", "estadisticas_tiros", "ratings", "resultado")
+
+    def __init__(self):
+        self.juegos = 0
+        self.rondas = 0
+        self.tiros = 0
+        self.segundos = dict.fromkeys(self.FASES, 0.0)
+
+    def sumar(self, otros: "ContadoresSimulacion") -> "ContadoresSimulacion":
+        """Agrega los totales de otros contadores a estos y los retorna."""
+        self.juegos += otros.juegos
+        self.rondas += otros.rondas
+        self.tiros += otros.tiros
+        for fase, segundos in otros.segundos.items():
+            self.segundos[fase] += segundos
+        return self
+
+    def a_dict(self) -> dict:
+        """Retorna los totales en formato serializable."""
+        return {
+            "juegos": self.juegos,
+            "rondas": self.rondas,
+            "tiros": self.tiros,
+            "segundos": dict(self.segundos),
+        }
+
+
+class Simulador:
+    """
+    Ejecuta una simulación completa con su propio contexto.
+    Cada instancia crea sus equipos y su generador, por lo que dos simuladores
+    pueden ejecutarse en paralelo sin interferir entre sí.
+    """
+
+    def __init__(self, config: Optional[ConfiguracionSimulacion] = None, contexto=None):
+        """
+        Inicializa el simulador y crea los equipos participantes.
+
+        Args:
+            config (ConfiguracionSimulacion): Parámetros de la simulación
+            contexto (ContextoSimulacion): Contexto a utilizar; por defecto se crea
+                uno nuevo a partir de config.semilla
+
+        Atributos:
+            equipo1, equipo2 (Equipo): Equipos participantes
+            resultados (List[dict]): Resultados de los juegos completados
+            convergencia (MonitorConvergencia): Monitor del modo secuencial (o None)
+            estadisticas_tiros (EstadisticasTiros): Mapas de calor y frecuencias de zonas
+                de todos los juegos (None si config.nivel_registro es "ninguno")
+            ratings (MotorRatings): Elo de los equipos y rendimiento de los jugadores,
+                actualizados al terminar cada juego
+            contadores (ContadoresSimulacion): Juegos, rondas, tiros y tiempo por fase
+        """
+        self.config = config if config is not None else ConfiguracionSimulacion()
+        self.contexto = (
+            contexto
+            if contexto is not None
+            else ContextoSimulacion(
+                semilla=self.config.semilla,
+                probabilidades=self.config.probabilidades,
+                costo_tiro=self.config.costo_tiro,
+                rango_cansancio=self.config.rango_cansancio,
+                nivel_registro=self.config.nivel_registro,
+            )
+        )
+        self.equipo1 = Equipo(
+            self.config.nombre_equipo1,
+            self.config.jugadores_por_equipo,
+            self.contexto.rng,
+        )
+        self.equipo2 = Equipo(
+            self.config.nombre_equipo2,
+            self.config.jugadores_por_equipo,
+            self.contexto.rng,
+        )
+        # Las plantillas se generan siempre con el flujo normal: un juego y su
+        # antitético enfrentan a los mismos equipos
+        if self.config.antitetico:
+            self.contexto.rng.antithetic = True
+        self.resultados: List[dict] = []
+        self._juego: Optional[Juego] = None
+        self.convergencia = self.config.crear_monitor()
+        self.estadisticas_tiros = (
+            EstadisticasTiros()
+            if self.config.nivel_registro != NivelRegistro.NINGUNO
+            else None
+        )
+        self.ratings = MotorRatings()
+        self.contadores = ContadoresSimulacion()
+
+    def equipos(self) -> List[dict]:
+        """Retorna la plantilla de ambos equipos en formato serializable."""
+        return [describir_equipo(self.equipo1), describir_equipo(self.equipo2)]
+
+    def jugar_juego(self, numero_juego: int) -> dict:
+        """
+        Simula un único juego y registra su resultado.
+
+        Args:
+            numero_juego (int): Número del juego dentro de la simulación (desde 1)
+
+        Returns:
+            dict: Resultado serializable del juego
+        """
+        reloj = time.perf_counter
+        inicio = reloj()
+        if self.config.subflujos:
+            self.contexto.semilla_subflujo = derive_seed(self.config.semilla, numero_juego)
+        juego = self._juego
+        if juego is None:
+            juego = self._juego = Juego(
+                self.equipo1,
+                self.equipo2,
+                num_rondas=self.config.num_rondas,
+                juego_actual=numero_juego,
+                contexto=self.contexto,
+            )
+        else:
+            # El mismo juego (blanco, ronda y resultados de ronda) se reutiliza
+            juego.reiniciar(numero_juego)
+        preparado = reloj()
+        juego.jugar_juego_completo()
+        jugado = reloj()
+        if self.estadisticas_tiros is not None:
+            self.estadisticas_tiros.acumular(juego.blanco.registro)
+        acumulado = reloj()
+        self.ratings.registrar_juego(juego)
+        registrado = reloj()
+        resultado = convert_numpy(resultado_juego(juego))
+        self.resultados.append(resultado)
+        fin = reloj()
+
+        contadores = self.contadores
+        rondas = juego.historial_rondas
+        contadores.juegos += 1
+        contadores.rondas += len(rondas)
+        # Tiros de los turnos más el tiro extra de cada equipo por ronda
+        contadores.tiros += sum(r.equipo1.tiros + r.equipo2.tiros + 2 for r in rondas)
+        segundos = contadores.segundos
+        segundos["preparacion"] += preparado - inicio
+        segundos["juego"] += jugado - preparado
+        segundos["estadisticas_tiros"] += acumulado - jugado
+        segundos["ratings"] += registrado - acumulado
+        segundos["resultado"] += fin - registrado
+        return resultado
+
+    def ejecutar(
+        self,
+        al_progresar: Optional[Callable[[int, int], None]] = None,
+        cancelacion: Optional[threading.Event] = None,
+    ) -> List[dict]:
+        """
+        Ejecuta todos los juegos configurados.
+
+        La cancelación es cooperativa: se revisa entre juegos, por lo que el juego
+        en curso siempre termina y los resultados parciales quedan completos.
+        En modo secuencial la simulación termina además en cuanto todas las
+        métricas objetivo convergen; el resumen queda en self.convergencia.
+
+        Args:
+            al_progresar (Callable[[int, int], None]): Función opcional que recibe
+                (juegos_completados, total_juegos) después de cada juego
+            cancelacion (threading.Event): Evento opcional; si se activa, la
+                simulación se detiene antes del siguiente juego
+
+        Returns:
+            List[dict]: Resultados de los juegos simulados
+        """
+        total = self.config.num_juegos
+        for i in range(len(self.resultados), total):
+            if cancelacion is not None and cancelacion.is_set():
+                break
+            resultado = self.jugar_juego(i + 1)
+            if al_progresar is not None:
+                al_progresar(i + 1, total)
+            if self.convergencia is not None:
+                self.convergencia.registrar(resultado)
+                if self.convergencia.convergio():
+                    break
+        return self.resultados
@@ -0,0 +1,571 @@
+"""
+Torneos entre muchos equipos.
+
+Un torneo crea N equipos (cada uno con su plantilla) y los enfrenta en partidos de
+uno o más juegos, ya sea todos contra todos o por eliminación directa. Los
+partidos se reparten entre procesos: cada proceso recibe las plantillas una sola
+vez al iniciar y, para cada partido, trabaja sobre una copia de los dos equipos
+con un generador derivado de la semilla del torneo y de los equipos enfrentados.
+Así el resultado de un partido no depende del proceso que lo juegue ni del orden
+en que terminen los demás. La tabla de posiciones se actualiza a medida que
+llegan los resultados y puede consultarse durante la ejecución.
+"""
+
+import copy
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from typing import Callable, ClassVar, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+import numpy as np
+
+from modelos.linear_congruence import LinearCongruenceRandom
+from modelos.random_wrapper import RandomWrapper
+from modelos.substreams import derive_seed
+from .blanco_objetivo import NivelRegistro
+from .contexto import ContextoSimulacion
+from .equipo import Equipo
+from .juego import Juego
+from .ratings import MotorRatings
+from .simulador import describir_equipo
+from .trabajos import EstadoTrabajo
+
+
+class FormatoTorneo:
+    """Formatos de torneo disponibles."""
+
+    TODOS_CONTRA_TODOS = "todos_contra_todos"
+    ELIMINACION = "eliminacion"
+
+    TODOS = (TODOS_CONTRA_TODOS, ELIMINACION)
+
+
+@dataclass
+class ConfiguracionTorneo:
+    """
+    Parámetros de un torneo.
+
+    Attributes:
+        num_equipos (int): Cantidad de equipos participantes
+        jugadores_por_equipo (int): Número de jugadores de cada equipo
+        formato (str): Uno de FormatoTorneo.TODOS
+        juegos_por_partido (int): Juegos que disputa cada par de equipos en un partido
+        num_rondas (int): Rondas por juego
+        semilla (Optional[int]): Semilla del torneo; None usa una basada en el tiempo
+        probabilidades (Optional[dict]): Probabilidades base por género y zona del
+            blanco (None usa Blanco.PROBABILIDADES)
+        costo_tiro (Optional[int]): Resistencia consumida por tiro
+        rango_cansancio (Optional[List[int]]): Cansancio mínimo y máximo por ronda
+    """
+    num_equipos: int = 8
+    jugadores_por_equipo: int = 5
+    formato: str = FormatoTorneo.TODOS_CONTRA_TODOS
+    juegos_por_partido: int = 1
+    num_rondas: int = 10
+    semilla: Optional[int] = None
+    probabilidades: Optional[Dict[str, Dict[str, float]]] = None
+    costo_tiro: Optional[int] = None
+    rango_cansancio: Optional[List[int]] = None
+
+    # Límites aceptados al recibir configuraciones desde el exterior
+    MAX_EQUIPOS: ClassVar[int] = 1000
+    MAX_JUGADORES: ClassVar[int] = 1000
+    MAX_JUEGOS_POR_PARTIDO: ClassVar[int] = 1000
+    MAX_RONDAS: ClassVar[int] = 1000
+
+    def validar(self) -> "ConfiguracionTorneo":
+        """
+        Verifica que los parámetros estén dentro de los rangos admitidos.
+
+        Returns:
+            ConfiguracionTorneo: La misma configuración, para encadenar llamadas
+
+        Raises:
+            ValueError: Si algún parámetro está fuera de rango
+        """
+        if not 2 <= self.num_equipos <= self.MAX_EQUIPOS:
+            raise ValueError(f"num_equipos debe estar entre 2 y {self.MAX_EQUIPOS}")
+        if not 2 <= self.jugadores_por_equipo <= self.MAX_JUGADORES:
+            raise ValueError(
+                f"jugadores_por_equipo debe estar entre 2 y {self.MAX_JUGADORES}"
+            )
+        if self.formato not in FormatoTorneo.TODOS:
+            raise ValueError(f"formato debe ser uno de {list(FormatoTorneo.TODOS)}")
+        if not 1 <= self.juegos_por_partido <= self.MAX_JUEGOS_POR_PARTIDO:
+            raise ValueError(
+                f"juegos_por_partido debe estar entre 1 y {self.MAX_JUEGOS_POR_PARTIDO}"
+            )
+        if not 1 <= self.num_rondas <= self.MAX_RONDAS:
+            raise ValueError(f"num_rondas debe estar entre 1 y {self.MAX_RONDAS}")
+        if self.semilla is not None and self.semilla <= 0:
+            raise ValueError("La semilla debe ser un entero positivo")
+        if self.costo_tiro is not None and self.costo_tiro < 1:
+            raise ValueError("costo_tiro debe ser un entero positivo")
+        return self
+
+    def a_dict(self) -> dict:
+        """Retorna la configuración como diccionario serializable."""
+        return asdict(self)
+
+
+def jugar_partido(
+    equipo1: Equipo,
+    equipo2: Equipo,
+    semilla: int,
+    juegos: int = 1,
+    num_rondas: int = 10,
+    probabilidades: Optional[dict] = None,
+    costo_tiro: Optional[int] = None,
+    rango_cansancio: Optional[List[int]] = None,
+) -> dict:
+    """
+    Juega un partido entre dos equipos sin modificarlos.
+
+    Los juegos se disputan sobre copias de los equipos cuyos jugadores usan un
+    generador propio del partido, de modo que el resultado solo depende de las
+    plantillas y de la semilla.
+
+    Args:
+        equipo1 (Equipo): Primer equipo
+        equipo2 (Equipo): Segundo equipo
+        semilla (int): Semilla del partido
+        juegos (int): Cantidad de juegos del partido
+        num_rondas (int): Rondas por juego
+        probabilidades, costo_tiro, rango_cansancio: Parámetros del blanco y del
+            cansancio (None usa los valores por defecto)
+
+    Returns:
+        dict: "puntajes" (puntaje de cada equipo por juego), "juegos_ganados" y
+            "puntos_jugadores" (puntos de cada jugador de cada equipo por juego, en
+            el orden de las plantillas)
+    """
+    contexto = ContextoSimulacion(
+        semilla=semilla,
+        probabilidades=probabilidades,
+        costo_tiro=costo_tiro,
+        rango_cansancio=rango_cansancio,
+        nivel_registro=NivelRegistro.NINGUNO,
+    )
+    # Las copias comparten el generador del partido en lugar del de la plantilla
+    memo = {id(equipo1.rng): contexto.rng, id(equipo2.rng): contexto.rng}
+    local1, local2 = copy.deepcopy((equipo1, equipo2), memo)
+    juego = Juego(local1, local2, num_rondas=num_rondas, juego_actual=1, contexto=contexto)
+    puntajes = []
+    puntos_jugadores = []
+    ganados = [0, 0]
+    for numero in range(1, juegos + 1):
+        if numero > 1:
+            juego.reiniciar(numero)
+        juego.jugar_juego_completo()
+        puntaje1, puntaje2 = juego.puntaje_equipo1_final, juego.puntaje_equipo2_final
+        puntajes.append([puntaje1, puntaje2])
+        puntos_jugadores.append(
+            [
+                [jugador.puntaje_juego_actual for jugador in local.jugadores]
+                for local in (local1, local2)
+            ]
+        )
+        if puntaje1 != puntaje2:
+            ganados[0 if puntaje1 > puntaje2 else 1] += 1
+    return {
+        "puntajes": puntajes,
+        "juegos_ganados": ganados,
+        "puntos_jugadores": puntos_jugadores,
+    }
+
+
+# Plantillas y parámetros de los partidos en cada proceso de trabajo
+_EQUIPOS: List[Equipo] = []
+_PARAMETROS: dict = {}
+
+
+def _inicializar_proceso(equipos: List[Equipo], parametros: dict) -> None:
+    """Recibe una sola vez, en cada proceso, las plantillas de todos los equipos."""
+    global _EQUIPOS, _PARAMETROS
+    _EQUIPOS = equipos
+    _PARAMETROS = parametros
+
+
+def _jugar_tarea(tarea: Tuple[int, int, int, int]) -> dict:
+    """Juega el partido (fase, indice1, indice2, semilla) con las plantillas del proceso."""
+    fase, indice1, indice2, semilla = tarea
+    partido = jugar_partido(_EQUIPOS[indice1], _EQUIPOS[indice2], semilla, **_PARAMETROS)
+    partido.update({"fase": fase, "equipo1": indice1, "equipo2": indice2})
+    return partido
+
+
+class TablaPosiciones:
+    """
+    Tabla de posiciones de un torneo, actualizada partido a partido.
+
+    Cada partido ganado suma 3 puntos y cada empate 1. Registrar un partido cuesta
+    O(1); la clasificación ordena por puntos, diferencia de juegos y diferencia de
+    puntaje.
+    """
+
+    COLUMNAS = (
+        "partidos",
+        "ganados",
+        "empatados",
+        "perdidos",
+        "juegos_ganados",
+        "juegos_perdidos",
+        "puntaje_favor",
+        "puntaje_contra",
+        "puntos",
+    )
+
+    def __init__(self, nombres: List[str]):
+        """
+        Args:
+            nombres (List[str]): Nombre de cada equipo, en el orden de sus índices
+        """
+        self.nombres = list(nombres)
+        self._valores = np.zeros((len(nombres), len(self.COLUMNAS)), dtype=np.int64)
+        self._columna = {nombre: i for i, nombre in enumerate(self.COLUMNAS)}
+        self._lock = threading.Lock()
+
+    def registrar(self, partido: dict) -> Optional[int]:
+        """
+        Suma un partido a la tabla.
+
+        Args:
+            partido (dict): Resultado con "equipo1", "equipo2", "puntajes" y
+                "juegos_ganados", como lo retorna el torneo
+
+        Returns:
+            int: Índice del equipo ganador, o None si el partido terminó empatado
+        """
+        ganador = ganador_partido(partido)
+        c = self._columna
+        indices = (partido["equipo1"], partido["equipo2"])
+        puntajes = np.asarray(partido["puntajes"], dtype=np.int64).sum(axis=0)
+        with self._lock:
+            for lado, indice in enumerate(indices):
+                fila = self._valores[indice]
+                fila[c["partidos"]] += 1
+                fila[c["juegos_ganados"]] += partido["juegos_ganados"][lado]
+                fila[c["juegos_perdidos"]] += partido["juegos_ganados"][1 - lado]
+                fila[c["puntaje_favor"]] += puntajes[lado]
+                fila[c["puntaje_contra"]] += puntajes[1 - lado]
+                if ganador is None:
+                    fila[c["empatados"]] += 1
+                    fila[c["puntos"]] += 1
+                elif ganador == indice:
+                    fila[c["ganados"]] += 1
+                    fila[c["puntos"]] += 3
+                else:
+                    fila[c["perdidos"]] += 1
+        return ganador
+
+    def clasificacion(self) -> List[dict]:
+        """
+        Retorna la tabla ordenada del primero al último.
+
+        Returns:
+            List[dict]: Por equipo, su posición, índice, nombre y columnas de la tabla
+        """
+        with self._lock:
+            valores = self._valores.copy()
+        c = self._columna
+        diferencia_juegos = valores[:, c["juegos_ganados"]] - valores[:, c["juegos_perdidos"]]
+        diferencia_puntaje = valores[:, c["puntaje_favor"]] - valores[:, c["puntaje_contra"]]
+        # np.lexsort ordena por la última clave primero
+        orden = np.lexsort(
+            (
+                np.arange(len(valores)),
+                -diferencia_puntaje,
+                -diferencia_juegos,
+                -valores[:, c["puntos"]],
+            )
+        )
+        return [
+            dict(
+                {"posicion": posicion, "equipo": int(i), "nombre": self.nombres[i]},
+                **dict(zip(self.COLUMNAS, valores[i].tolist())),
+            )
+            for posicion, i in enumerate(orden, start=1)
+        ]
+
+
+def ganador_partido(partido: dict) -> Optional[int]:
+    """
+    Determina el ganador de un partido: más juegos ganados y, si empatan, más
+    puntaje total.
+
+    Returns:
+        int: Índice del equipo ganador, o None si también empatan en puntaje
+    """
+    ganados1, ganados2 = partido["juegos_ganados"]
+    if ganados1 == ganados2:
+        puntajes = np.asarray(partido["puntajes"], dtype=np.int64).sum(axis=0)
+        ganados1, ganados2 = puntajes
+    if ganados1 == ganados2:
+        return None
+    return partido["equipo1"] if ganados1 > ganados2 else partido["equipo2"]
+
+
+def calendario_todos_contra_todos(num_equipos: int) -> List[List[Tuple[int, int]]]:
+    """
+    Genera las jornadas de un torneo todos contra todos (método del círculo).
+
+    Returns:
+        List[List[Tuple[int, int]]]: Por jornada, los pares de índices enfrentados;
+            cada par de equipos aparece exactamente una vez
+    """
+    participantes = list(range(num_equipos))
+    if num_equipos % 2:
+        participantes.append(None)  # Descanso
+    n = len(participantes)
+    jornadas = []
+    for _ in range(n - 1):
+        jornada = []
+        for k in range(n // 2):
+            a, b = participantes[k], participantes[n - 1 - k]
+            if a is not None and b is not None:
+                jornada.append((min(a, b), max(a, b)))
+        jornadas.append(jornada)
+        participantes = [participantes[0], participantes[-1]] + participantes[1:-1]
+    return jornadas
+
+
+class Torneo:
+    """
+    Ejecuta un torneo todos contra todos o por eliminación directa.
+
+    Los equipos se crean al iniciar ejecutar(). Mientras el torneo corre, tabla,
+    partidos y resumen() reflejan los partidos terminados hasta el momento.
+    """
+
+    # Partidos en curso por proceso: limita la memoria sin dejar procesos ociosos
+    PARTIDOS_POR_PROCESO = 4
+
+    def __init__(
+        self, config: Optional[ConfiguracionTorneo] = None, max_procesos: Optional[int] = None
+    ):
+        """
+        Args:
+            config (ConfiguracionTorneo): Parámetros del torneo
+            max_procesos (int): Procesos de trabajo (por defecto, uno por CPU;
+                1 juega los partidos en el proceso actual)
+
+        Atributos:
+            torneo_id (str): Identificador único del torneo
+            estado (str): Uno de los valores de EstadoTrabajo
+            semilla (int): Semilla efectiva del torneo
+            equipos (List[Equipo]): Equipos participantes (vacío hasta iniciar)
+            tabla (TablaPosiciones): Posiciones (None hasta iniciar)
+            partidos (List[dict]): Resultados de los partidos, en orden de llegada
+            campeon (int): Índice del campeón en el formato de eliminación
+            cancelacion (threading.Event): Señal de cancelación revisada entre partidos
+            ratings (MotorRatings): Elo de los equipos y rendimiento de los jugadores,
+                actualizados juego a juego; a diferencia de la tabla, con varios
+                procesos depende del orden en que lleguen los partidos
+        """
+        self.config = (config if config is not None else ConfiguracionTorneo()).validar()
+        self.max_procesos = max_procesos or os.cpu_count() or 1
+        self.torneo_id = str(uuid4())
+        self.estado = EstadoTrabajo.PENDIENTE
+        self.error: Optional[str] = None
+        self.semilla = (
+            self.config.semilla
+            if self.config.semilla is not None
+            else int(time.time() * 1000) % (LinearCongruenceRandom.DEFAULT_M - 1) + 1
+        )
+        self.equipos: List[Equipo] = []
+        self.tabla: Optional[TablaPosiciones] = None
+        self.partidos: List[dict] = []
+        self.campeon: Optional[int] = None
+        self.cancelacion = threading.Event()
+        self.ratings = MotorRatings()
+        self.iniciado: Optional[float] = None
+        self.finalizado: Optional[float] = None
+
+    @property
+    def total_partidos(self) -> int:
+        """Cantidad de partidos que se disputan en el torneo."""
+        n = self.config.num_equipos
+        if self.config.formato == FormatoTorneo.ELIMINACION:
+            return n - 1
+        return n * (n - 1) // 2
+
+    def _crear_equipos(self) -> None:
+        """Genera las plantillas de todos los equipos con el generador del torneo."""
+        rng = RandomWrapper(self.semilla)
+        self.equipos = [
+            Equipo(f"Equipo {i}", self.config.jugadores_por_equipo, rng)
+            for i in range(1, self.config.num_equipos + 1)
+        ]
+        self.tabla = TablaPosiciones([equipo.nombre for equipo in self.equipos])
+
+    def _parametros_partido(self) -> dict:
+        return {
+            "juegos": self.config.juegos_por_partido,
+            "num_rondas": self.config.num_rondas,
+            "probabilidades": self.config.probabilidades,
+            "costo_tiro": self.config.costo_tiro,
+            "rango_cansancio": self.config.rango_cansancio,
+        }
+
+    def _tarea(self, fase: int, indice1: int, indice2: int) -> Tuple[int, int, int, int]:
+        """Partido de una fase con su semilla derivada de la del torneo."""
+        return (fase, indice1, indice2, derive_seed(self.semilla, fase, indice1, indice2))
+
+    def ejecutar(
+        self, al_progresar: Optional[Callable[[int, int], None]] = None
+    ) -> "Torneo":
+        """
+        Juega todos los partidos del torneo.
+
+        Args:
+            al_progresar (Callable[[int, int], None]): Función opcional que recibe
+                (partidos_jugados, total_partidos) después de cada partido
+
+        Returns:
+            Torneo: El mismo torneo, con su tabla y partidos completos (o parciales
+                    si se canceló)
+        """
+        self.estado = EstadoTrabajo.EJECUTANDO
+        self.iniciado = time.time()
+        try:
+            self._crear_equipos()
+            parametros = self._parametros_partido()
+            if self.max_procesos == 1:
+                _inicializar_proceso(self.equipos, parametros)
+                self._jugar_fases(None, al_progresar)
+            else:
+                with ProcessPoolExecutor(
+                    max_workers=self.max_procesos,
+                    initializer=_inicializar_proceso,
+                    initargs=(self.equipos, parametros),
+                ) as executor:
+                    self._jugar_fases(executor, al_progresar)
+            self.estado = (
+                EstadoTrabajo.CANCELADO if self.cancelacion.is_set() else EstadoTrabajo.COMPLETADO
+            )
+        except Exception as e:
+            self.error = str(e)
+            self.estado = EstadoTrabajo.FALLIDO
+            raise
+        finally:
+            self.finalizado = time.time()
+        return self
+
+    def _jugar_fases(self, executor, al_progresar) -> None:
+        """Juega el calendario del formato configurado."""
+        if self.config.formato == FormatoTorneo.TODOS_CONTRA_TODOS:
+            tareas = [
+                self._tarea(0, a, b)
+                for jornada in calendario_todos_contra_todos(len(self.equipos))
+                for a, b in jornada
+            ]
+            self._jugar_tareas(executor, tareas, al_progresar)
+            return
+
+        # Eliminación directa: en cada fase los sobrevivientes se ordenan por
+        # número de equipo; el primero enfrenta al último, y con un número impar
+        # de sobrevivientes el primero pasa sin jugar
+        vivos = list(range(len(self.equipos)))
+        fase = 1
+        while len(vivos) > 1 and not self.cancelacion.is_set():
+            libre = [vivos.pop(0)] if len(vivos) % 2 else []
+            tareas = [
+                self._tarea(fase, vivos[k], vivos[len(vivos) - 1 - k])
+                for k in range(len(vivos) // 2)
+            ]
+            ganadores = self._jugar_tareas(executor, tareas, al_progresar)
+            vivos = sorted(libre + ganadores)
+            fase += 1
+        if len(vivos) == 1:
+            self.campeon = vivos[0]
+
+    def _jugar_tareas(self, executor, tareas, al_progresar) -> List[int]:
+        """
+        Juega un conjunto de partidos independientes y registra cada resultado al llegar.
+
+        Returns:
+            List[int]: Equipo que avanza en cada partido (en un empate, el de menor índice)
+        """
+        ganadores = []
+
+        def registrar(partido):
+            ganador = self.tabla.registrar(partido)
+            self._registrar_ratings(partido)
+            self.partidos.append(partido)
+            ganadores.append(ganador if ganador is not None else partido["equipo1"])
+            if al_progresar is not None:
+                al_progresar(len(self.partidos), self.total_partidos)
+
+        if executor is None:
+            for tarea in tareas:
+                if self.cancelacion.is_set():
+                    break
+                registrar(_jugar_tarea(tarea))
+            return ganadores
+
+        pendientes = iter(tareas)
+        en_curso = set()
+        limite = self.max_procesos * self.PARTIDOS_POR_PROCESO
+        while True:
+            while len(en_curso) < limite and not self.cancelacion.is_set():
+                tarea = next(pendientes, None)
+                if tarea is None:
+                    break
+                en_curso.add(executor.submit(_jugar_tarea, tarea))
+            if not en_curso:
+                return ganadores
+            terminados, en_curso = wait(en_curso, return_when=FIRST_COMPLETED)
+            for futuro in terminados:
+                registrar(futuro.result())
+
+    def _registrar_ratings(self, partido: dict) -> None:
+        """Actualiza los ratings con cada juego del partido y descarta los puntos por jugador."""
+        equipos = (self.equipos[partido["equipo1"]], self.equipos[partido["equipo2"]])
+        for (puntaje1, puntaje2), puntos in zip(
+            partido["puntajes"], partido.pop("puntos_jugadores")
+        ):
+            self.ratings.registrar(
+                (equipos[0].equipo_id, equipos[0].nombre),
+                (equipos[1].equipo_id, equipos[1].nombre),
+                puntaje1,
+                puntaje2,
+                [
+                    (jugador.user_id, jugador.nombre, equipo.equipo_id, puntos_jugador)
+                    for equipo, puntos_equipo in zip(equipos, puntos)
+                    for jugador, puntos_jugador in zip(equipo.jugadores, puntos_equipo)
+                ],
+            )
+
+    def resumen(self, incluir_plantillas: bool = False) -> dict:
+        """
+        Retorna el estado del torneo en formato serializable.
+
+        Args:
+            incluir_plantillas (bool): Si es True, incluye las plantillas de los equipos
+
+        Returns:
+            dict: Estado, progreso, clasificación actual y campeón
+        """
+        resumen = {
+            "torneo_id": self.torneo_id,
+            "estado": self.estado,
+            "error": self.error,
+            "configuracion": self.config.a_dict(),
+            "semilla": self.semilla,
+            "partidos_jugados": len(self.partidos),
+            "total_partidos": self.total_partidos,
+            "clasificacion": self.tabla.clasificacion() if self.tabla is not None else [],
+            "campeon": (
+                {"equipo": self.campeon, "nombre": self.equipos[self.campeon].nombre}
+                if self.campeon is not None
+                else None
+            ),
+            "iniciado": self.iniciado,
+            "finalizado": self.finalizado,
+        }
+        if incluir_plantillas:
+            resumen["equipos"] = [describir_equipo(equipo) for equipo in self.equipos]
+        return resumen
@@ -0,0 +1,500 @@
+"""
+Cola de trabajos de simulación.
+
+Permite ejecutar varias simulaciones al mismo tiempo, cada una con su propio
+contexto (equipos, generador y contadores), sobre un conjunto acotado de hilos
+de trabajo. Cada trabajo tiene un identificador con el que se consulta su
+estado, se cancela o se obtienen sus resultados.
+
+La cancelación de un trabajo en ejecución es cooperativa: el hilo de trabajo la
+detecta entre juegos y guarda los resultados parciales obtenidos hasta ese punto.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+from uuid import uuid4
+
+from .archivo_columnar import ArchivoColumnar, guardar_resultados
+from .blanco_objetivo import NivelRegistro
+from .cache import clave_simulacion
+from .estadisticas_tiros import EstadisticasTiros
+from .ratings import MotorRatings
+from .simulador import ConfiguracionSimulacion, ContadoresSimulacion, Simulador
+
+
+class EstadoTrabajo:
+    """Estados posibles de un trabajo de simulación."""
+
+    PENDIENTE = "pendiente"
+    EJECUTANDO = "ejecutando"
+    COMPLETADO = "completado"
+    CANCELADO = "cancelado"
+    FALLIDO = "fallido"
+
+    FINALES = (COMPLETADO, CANCELADO, FALLIDO)
+
+
+class Trabajo:
+    """
+    Representa una simulación enviada a la cola.
+    Mantiene su configuración, su progreso y, al terminar, sus resultados.
+    """
+
+    def __init__(self, config: ConfiguracionSimulacion):
+        """
+        Inicializa un trabajo pendiente.
+
+        Args:
+            config (ConfiguracionSimulacion): Parámetros de la simulación
+
+        Atributos:
+            trabajo_id (str): Identificador único del trabajo
+            estado (str): Uno de los valores de EstadoTrabajo
+            juegos_completados (int): Juegos simulados hasta el momento
+            resultados (List[dict]): Resultados por juego (vacío hasta terminar)
+            equipos (List[dict]): Plantillas de los equipos de la simulación
+            error (str): Mensaje de error si el trabajo falló
+            cancelacion (threading.Event): Señal de cancelación revisada entre juegos
+            desde_cache (bool): Indica si los resultados se obtuvieron de la caché
+            convergencia (dict): Intervalos finales y juegos usados en modo secuencial
+            estadisticas_tiros (EstadisticasTiros): Mapas de calor y zonas de los tiros
+                (None si la simulación no registra tiros)
+            ratings (MotorRatings): Elo de los equipos y rendimiento de los jugadores,
+                consultable mientras el trabajo se ejecuta (None si aún no inicia)
+        """
+        self.trabajo_id = str(uuid4())
+        self.config = config
+        self.estado = EstadoTrabajo.PENDIENTE
+        self.juegos_completados = 0
+        self.resultados: List[dict] = []
+        self.equipos: List[dict] = []
+        self.error: Optional[str] = None
+        self.creado = time.time()
+        self.iniciado: Optional[float] = None
+        self.finalizado: Optional[float] = None
+        self.cancelacion = threading.Event()
+        self.desde_cache = False
+        self.convergencia: Optional[dict] = None
+        self.estadisticas_tiros: Optional[EstadisticasTiros] = None
+        self.ratings: Optional[MotorRatings] = None
+        self.futuro = None
+
+    @property
+    def total_juegos(self) -> int:
+        """Cantidad de juegos que el trabajo debe simular."""
+        return self.config.num_juegos
+
+    @property
+    def progreso(self) -> int:
+        """Porcentaje de avance (0-100)."""
+        if self.estado == EstadoTrabajo.COMPLETADO:
+            # En modo secuencial un trabajo completo puede usar menos juegos que el máximo
+            return 100
+        if self.total_juegos <= 0:
+            return 0
+        return int(self.juegos_completados / self.total_juegos * 100)
+
+    @property
+    def terminado(self) -> bool:
+        """Indica si el trabajo alcanzó un estado final."""
+        return self.estado in EstadoTrabajo.FINALES
+
+    def resumen(self) -> dict:
+        """
+        Retorna el estado del trabajo en formato serializable (sin resultados).
+
+        Returns:
+            dict: Identificador, estado, progreso, configuración y tiempos
+        """
+        duracion = None
+        if self.iniciado is not None:
+            duracion = (self.finalizado or time.time()) - self.iniciado
+        return {
+            "trabajo_id": self.trabajo_id,
+            "estado": self.estado,
+            "cancelacion_solicitada": self.cancelacion.is_set(),
+            "progreso": self.progreso,
+            "juegos_completados": self.juegos_completados,
+            "total_juegos": self.total_juegos,
+            "configuracion": self.config.a_dict(),
+            "error": self.error,
+            "desde_cache": self.desde_cache,
+            "convergencia": self.convergencia,
+            "creado": self.creado,
+            "iniciado": self.iniciado,
+            "finalizado": self.finalizado,
+            "duracion": duracion,
+        }
+
+
+class GestorTrabajos:
+    """
+    Administra la cola de trabajos de simulación.
+    Ejecuta los trabajos en un conjunto acotado de hilos y guarda los
+    resultados de cada uno en memoria y en disco.
+    """
+
+    def __init__(
+        self,
+        max_trabajadores: int = 2,
+        directorio_resultados: str = "resultados_trabajos",
+        max_trabajos_en_memoria: int = 20,
+        al_completar: Optional[Callable[[Trabajo], None]] = None,
+        cache=None,
+    ):
+        """
+        Inicializa el gestor.
+
+        Args:
+            max_trabajadores (int): Máximo de simulaciones ejecutándose a la vez
+            directorio_resultados (str): Carpeta donde se guarda un JSON por trabajo
+            max_trabajos_en_memoria (int): Trabajos terminados cuyos resultados se
+                conservan en memoria; los que terminaron antes solo quedan en disco
+            al_completar (Callable[[Trabajo], None]): Función opcional invocada cuando
+                un trabajo termina con resultados (completo o cancelado con
+                resultados parciales)
+            cache (CacheResultados): Caché opcional; las simulaciones con semilla
+                ya ejecutadas se resuelven desde ella sin volver a simular
+        """
+        if max_trabajadores < 1:
+            raise ValueError("Se requiere al menos un trabajador")
+        self.max_trabajadores = max_trabajadores
+        self.directorio_resultados = directorio_resultados
+        self.max_trabajos_en_memoria = max_trabajos_en_memoria
+        self.al_completar = al_completar
+        self.cache = cache
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_trabajadores, thread_name_prefix="simulacion"
+        )
+        self._trabajos = OrderedDict()  # trabajo_id -> Trabajo, en orden de envío
+        self._estadisticas_cargadas = OrderedDict()  # trabajo_id -> EstadisticasTiros
+        # Contadores de los simuladores en ejecución y totales de los ya terminados
+        self._contadores_en_ejecucion = {}  # trabajo_id -> ContadoresSimulacion
+        self._contadores_terminados = ContadoresSimulacion()
+        # Trabajos en ejecución o publicándose: _liberar_memoria no los toca
+        self._en_curso = set()  # trabajo_id
+        self._lock = threading.Lock()
+
+    def enviar(self, config: Optional[ConfiguracionSimulacion] = None) -> Trabajo:
+        """
+        Encola una nueva simulación.
+
+        Args:
+            config (ConfiguracionSimulacion): Parámetros de la simulación
+
+        Returns:
+            Trabajo: El trabajo creado, en estado pendiente
+        """
+        trabajo = Trabajo(config if config is not None else ConfiguracionSimulacion())
+        with self._lock:
+            self._trabajos[trabajo.trabajo_id] = trabajo
+        trabajo.futuro = self._executor.submit(self._ejecutar, trabajo)
+        return trabajo
+
+    def obtener(self, trabajo_id: str) -> Optional[Trabajo]:
+        """Retorna el trabajo con el identificador dado o None si no existe."""
+        with self._lock:
+            return self._trabajos.get(trabajo_id)
+
+    def listar(self) -> List[Trabajo]:
+        """Retorna todos los trabajos conocidos, del más antiguo al más reciente."""
+        with self._lock:
+            return list(self._trabajos.values())
+
+    def ultimo(self) -> Optional[Trabajo]:
+        """Retorna el trabajo enviado más recientemente o None."""
+        with self._lock:
+            return next(reversed(self._trabajos.values()), None)
+
+    def cancelar(self, trabajo_id: str) -> bool:
+        """
+        Cancela un trabajo pendiente o en ejecución.
+
+        Un trabajo pendiente se retira de la cola. Un trabajo en ejecución recibe la
+        señal de cancelación y se detiene al terminar el juego en curso, guardando
+        los resultados parciales.
+
+        Args:
+            trabajo_id (str): Identificador del trabajo
+
+        Returns:
+            bool: True si el trabajo fue cancelado o se solicitó su cancelación,
+                  False si no existe o ya había terminado
+        """
+        trabajo = self.obtener(trabajo_id)
+        if trabajo is None or trabajo.terminado:
+            return False
+        trabajo.cancelacion.set()
+        if trabajo.futuro is not None and trabajo.futuro.cancel():
+            trabajo.estado = EstadoTrabajo.CANCELADO
+            trabajo.finalizado = time.time()
+        return True
+
+    def resultados(self, trabajo_id: str) -> Optional[List[dict]]:
+        """
+        Retorna los resultados de un trabajo terminado.
+
+        Busca primero en memoria y, si el trabajo ya fue descartado de ella,
+        en su archivo de resultados.
+
+        Args:
+            trabajo_id (str): Identificador del trabajo
+
+        Returns:
+            List[dict]: Resultados por juego, o None si no están disponibles
+        """
+        trabajo = self.obtener(trabajo_id)
+        if trabajo is not None and trabajo.resultados:
+            return trabajo.resultados
+        try:
+            with open(self._ruta_resultados(trabajo_id), "r") as f:
+                return json.load(f)["resultados"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            return None
+
+    def archivo_columnar(self, trabajo_id: str) -> Optional[ArchivoColumnar]:
+        """
+        Abre el archivo columnar con los resultados de un trabajo terminado.
+
+        Args:
+            trabajo_id (str): Identificador del trabajo
+
+        Returns:
+            ArchivoColumnar: Resultados del trabajo por columnas, o None si no están
+                             disponibles (trabajo en curso o inexistente)
+        """
+        try:
+            return ArchivoColumnar(self._ruta_columnas(trabajo_id))
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def estadisticas_tiros(self, trabajo_id: str) -> Optional[EstadisticasTiros]:
+        """
+        Retorna las estadísticas de tiros de un trabajo terminado.
+
+        Busca primero en memoria y, si el trabajo ya fue descartado de ella, en su
+        archivo de tiros; las cargadas desde disco se conservan en una caché pequeña.
+
+        Args:
+            trabajo_id (str): Identificador del trabajo
+
+        Returns:
+            EstadisticasTiros: Estadísticas del trabajo, o None si no están
+                               disponibles (trabajo sin registro de tiros o en curso)
+        """
+        trabajo = self.obtener(trabajo_id)
+        if trabajo is not None:
+            if not trabajo.terminado:
+                return None
+            if trabajo.estadisticas_tiros is not None:
+                return trabajo.estadisticas_tiros
+        with self._lock:
+            if trabajo_id in self._estadisticas_cargadas:
+                self._estadisticas_cargadas.move_to_end(trabajo_id)
+                return self._estadisticas_cargadas[trabajo_id]
+        try:
+            estadisticas = EstadisticasTiros.cargar(self._ruta_tiros(trabajo_id))
+        except (FileNotFoundError, OSError, KeyError, ValueError):
+            return None
+        with self._lock:
+            self._estadisticas_cargadas[trabajo_id] = estadisticas
+            while len(self._estadisticas_cargadas) > self.max_trabajos_en_memoria:
+                self._estadisticas_cargadas.popitem(last=False)
+        return estadisticas
+
+    def contadores(self) -> ContadoresSimulacion:
+        """
+        Retorna los juegos, rondas, tiros y tiempos por fase simulados por todos los
+        trabajos desde que se creó el gestor, incluidos los que están en ejecución.
+
+        Los trabajos resueltos desde la caché no suman, porque no simulan.
+        """
+        with self._lock:
+            total = ContadoresSimulacion().sumar(self._contadores_terminados)
+            for contadores in self._contadores_en_ejecucion.values():
+                total.sumar(contadores)
+        return total
+
+    def conteo_por_estado(self) -> dict:
+        """Retorna la cantidad de trabajos conocidos en cada estado de EstadoTrabajo."""
+        conteo = dict.fromkeys(
+            (EstadoTrabajo.PENDIENTE, EstadoTrabajo.EJECUTANDO) + EstadoTrabajo.FINALES, 0
+        )
+        for trabajo in self.listar():
+            conteo[trabajo.estado] += 1
+        return conteo
+
+    def cerrar(self, esperar: bool = True) -> None:
+        """
+        Detiene el conjunto de hilos de trabajo.
+
+        Los trabajos pendientes se descartan y los que están en ejecución reciben
+        la señal de cancelación, por lo que terminan en el siguiente juego.
+        """
+        for trabajo in self.listar():
+            if not trabajo.terminado:
+                trabajo.cancelacion.set()
+        self._executor.shutdown(wait=esperar, cancel_futures=True)
+
+    def _ruta_resultados(self, trabajo_id: str) -> str:
+        return os.path.join(self.directorio_resultados, f"{trabajo_id}.json")
+
+    def _ruta_columnas(self, trabajo_id: str) -> str:
+        return os.path.join(self.directorio_resultados, f"{trabajo_id}_columnas")
+
+    def _ruta_tiros(self, trabajo_id: str) -> str:
+        return os.path.join(self.directorio_resultados, f"{trabajo_id}_tiros.npz")
+
+    def _ejecutar(self, trabajo: Trabajo) -> None:
+        """
+        Ejecuta la simulación de un trabajo dentro de un hilo de trabajo.
+
+        Efectos:
+            - Actualiza el estado y el progreso del trabajo
+            - Guarda los resultados (completos o parciales) en memoria y en disco
+            - Invoca al_completar si hay resultados
+        """
+        if trabajo.cancelacion.is_set():
+            trabajo.estado = EstadoTrabajo.CANCELADO
+            trabajo.finalizado = time.time()
+            return
+        with self._lock:
+            self._en_curso.add(trabajo.trabajo_id)
+        trabajo.estado = EstadoTrabajo.EJECUTANDO
+        trabajo.iniciado = time.time()
+        try:
+            simulador = Simulador(trabajo.config)
+            with self._lock:
+                self._contadores_en_ejecucion[trabajo.trabajo_id] = simulador.contadores
+            trabajo.equipos = simulador.equipos()
+            trabajo.estadisticas_tiros = simulador.estadisticas_tiros
+            trabajo.ratings = simulador.ratings
+            # La caché solo guarda resultados por juego, no los tiros: con registro de
+            # tiros se simula siempre para poder construir sus estadísticas
+            clave = (
+                clave_simulacion(simulador)
+                if self.cache is not None
+                and trabajo.config.nivel_registro == NivelRegistro.NINGUNO
+                else None
+            )
+
+            guardado = self.cache.obtener(clave) if clave is not None else None
+            if guardado is not None:
+                # Misma configuración, equipos y semilla: los resultados ya existen
+                trabajo.equipos = guardado["equipos"]
+                trabajo.resultados = guardado["resultados"]
+                trabajo.convergencia = guardado.get("convergencia")
+                trabajo.juegos_completados = len(trabajo.resultados)
+                trabajo.desde_cache = True
+                # La caché no guarda puntos por jugador: solo se reconstruye el Elo
+                for resultado in trabajo.resultados:
+                    trabajo.ratings.registrar_resultado(resultado)
+            else:
+
+                def al_progresar(completados, _total):
+                    trabajo.juegos_completados = completados
+
+                trabajo.resultados = simulador.ejecutar(al_progresar, trabajo.cancelacion)
+                if simulador.convergencia is not None:
+                    trabajo.convergencia = simulador.convergencia.resumen()
+            trabajo.finalizado = time.time()
+            detenido_antes = len(trabajo.resultados) < trabajo.total_juegos and not (
+                trabajo.convergencia and trabajo.convergencia["convergio"]
+            )
+            estado_final = (
+                EstadoTrabajo.CANCELADO if detenido_antes else EstadoTrabajo.COMPLETADO
+            )
+            self._guardar(trabajo, estado_final)
+            if (
+                clave is not None
+                and not trabajo.desde_cache
+                and estado_final == EstadoTrabajo.COMPLETADO
+            ):
+                self.cache.guardar(
+                    clave,
+                    {
+                        "equipos": trabajo.equipos,
+                        "resultados": trabajo.resultados,
+                        "convergencia": trabajo.convergencia,
+                    },
+                )
+            trabajo.estado = estado_final
+        except Exception as e:
+            trabajo.error = str(e)
+            trabajo.estado = EstadoTrabajo.FALLIDO
+            trabajo.finalizado = time.time()
+            print(f"Error en el trabajo {trabajo.trabajo_id}: {str(e)}")
+        finally:
+            with self._lock:
+                contadores = self._contadores_en_ejecucion.pop(trabajo.trabajo_id, None)
+                if contadores is not None:
+                    self._contadores_terminados.sumar(contadores)
+
+        # Los resultados se publican antes de descartar los de trabajos viejos: un
+        # trabajo largo puede terminar después de varios trabajos enviados más tarde
+        try:
+            if trabajo.resultados and self.al_completar is not None:
+                self.al_completar(trabajo)
+        finally:
+            with self._lock:
+                self._en_curso.discard(trabajo.trabajo_id)
+            self._liberar_memoria(trabajo)
+
+    def _guardar(self, trabajo: Trabajo, estado: str) -> None:
+        """
+        Escribe los resultados del trabajo en su archivo JSON y en su archivo columnar
+        (y sus estadísticas de tiros, si las tiene, en un archivo .npz).
+
+        El archivo se escribe antes de que el trabajo pase a su estado final, de
+        modo que quien observe ese estado también encuentre el archivo.
+
+        Args:
+            trabajo (Trabajo): Trabajo cuyos resultados se guardan
+            estado (str): Estado final con el que se registra el trabajo
+        """
+        os.makedirs(self.directorio_resultados, exist_ok=True)
+        with open(self._ruta_resultados(trabajo.trabajo_id), "w") as f:
+            json.dump(
+                {
+                    "trabajo": dict(trabajo.resumen(), estado=estado),
+                    "equipos": trabajo.equipos,
+                    "resultados": trabajo.resultados,
+                },
+                f,
+            )
+        guardar_resultados(
+            self._ruta_columnas(trabajo.trabajo_id),
+            trabajo.resultados,
+            {"trabajo_id": trabajo.trabajo_id, "configuracion": trabajo.config.a_dict()},
+        )
+        if trabajo.estadisticas_tiros is not None:
+            trabajo.estadisticas_tiros.guardar(self._ruta_tiros(trabajo.trabajo_id))
+
+    def _liberar_memoria(self, actual: Trabajo) -> None:
+        """
+        Descarta de memoria los resultados y las estadísticas de tiros de los
+        trabajos que terminaron hace más tiempo.
+
+        Conserva el trabajo que acaba de terminar y los max_trabajos_en_memoria - 1
+        que terminaron más recientemente; los que aún se ejecutan o publican sus
+        resultados no se tocan.
+
+        Args:
+            actual (Trabajo): Trabajo que acaba de terminar
+        """
+        with self._lock:
+            terminados = [
+                t
+                for t in self._trabajos.values()
+                if t.terminado and t is not actual and t.trabajo_id not in self._en_curso
+            ]
+        terminados.sort(key=lambda t: t.finalizado or 0)
+        conservar = max(self.max_trabajos_en_memoria - 1, 0)
+        for trabajo in terminados[: len(terminados) - conservar]:
+            trabajo.resultados = []
+            trabajo.estadisticas_tiros = None
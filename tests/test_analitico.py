@@ -0,0 +1,57 @@
+import unittest
+import numpy as np
+from simulacion.analitico import (
+    PESOS_SUERTE,
+    EstadoJugador,
+    MotorAnalitico,
+    comparar,
+)
+
+
+class TestMotorAnalitico(unittest.TestCase):
+    def test_ronda_coincide_con_enumeracion(self):
+        """
+        Verifica la distribución de un equipo de dos jugadores contra la enumeración
+        directa de todos los pares de valores de suerte, incluido el tiro extra.
+        """
+        motor = MotorAnalitico()
+        estados = [EstadoJugador("M", 10), EstadoJugador("F", 5)]
+        tiro_m = motor.distribucion_tiro("M", 10)
+        tiro_f = motor.distribucion_tiro("F", 10)
+        esperada = np.zeros(41)
+        for k1, w1 in enumerate(PESOS_SUERTE):
+            propios_m = np.convolve(tiro_m[k1], tiro_m[k1])
+            for k2, w2 in enumerate(PESOS_SUERTE):
+                # max() elige al primer jugador en caso de empate de suerte
+                extra = tiro_m[k1] if k1 >= k2 else tiro_f[k2]
+                esperada += w1 * w2 * np.convolve(np.convolve(propios_m, tiro_f[k2]), extra)
+        obtenida = motor.distribucion_equipo_ronda(estados)
+        np.testing.assert_allclose(obtenida, esperada, atol=1e-12)
+        self.assertAlmostEqual(obtenida.sum(), 1.0)
+
+    def test_comparar(self):
+        """
+        Verifica las probabilidades de victoria y empate entre dos distribuciones.
+        """
+        resultado = comparar(np.array([0.5, 0.5]), np.array([0.0, 1.0]))
+        self.assertAlmostEqual(resultado["equipo1"], 0.0)
+        self.assertAlmostEqual(resultado["equipo2"], 0.5)
+        self.assertAlmostEqual(resultado["empate"], 0.5)
+
+    def test_juego_sin_cansancio_es_suma_de_rondas(self):
+        """
+        Verifica que, con una resistencia que no cambia los tiros, la distribución
+        del juego tenga la media de num_rondas rondas independientes.
+        """
+        motor = MotorAnalitico(rango_cansancio=(0, 0))
+        estado = EstadoJugador("F", 20)
+        ronda = motor.distribucion_jugador_ronda(estado)
+        juego = motor.distribucion_jugador_juego(estado, num_rondas=3)
+        puntajes = np.arange(len(juego))
+        self.assertAlmostEqual(
+            float(puntajes @ juego), 3 * float(np.arange(len(ronda)) @ ronda), places=9
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from simulacion.archivo_columnar import ArchivoColumnar, TipoColumna, guardar_resultados
+from simulacion.simulador import ConfiguracionSimulacion, Simulador
+
+
+class TestArchivoColumnar(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        self.ruta = os.path.join(self.directorio, "corrida")
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio, ignore_errors=True)
+
+    def test_ida_y_vuelta(self):
+        """
+        Verifica que los resultados de una simulación se reconstruyan iguales, incluido
+        un juego con el marcador "No determinado" en lugar de un jugador.
+        """
+        resultados = Simulador(ConfiguracionSimulacion(num_juegos=30, semilla=3)).ejecutar()
+        resultados[4]["jugador_con_mas_suerte"] = "No determinado"
+        guardar_resultados(self.ruta, resultados, {"semilla": 3})
+
+        archivo = ArchivoColumnar(self.ruta)
+        self.assertEqual(archivo.filas, 30)
+        self.assertEqual(archivo.metadatos, {"semilla": 3})
+        self.assertEqual(archivo.resultados(), resultados)
+        self.assertEqual(archivo.resultados(inicio=4, fin=5), resultados[4:5])
+        self.assertEqual(
+            archivo.resultados(["equipo_1.puntaje_total"], fin=1),
+            [{"equipo_1": {"puntaje_total": resultados[0]["equipo_1"]["puntaje_total"]}}],
+        )
+
+    def test_tipos_y_nulos(self):
+        """
+        Verifica la codificación de cada tipo: enteros con el tipo más chico, textos
+        por diccionario y campos faltantes como nulos.
+        """
+        guardar_resultados(
+            self.ruta,
+            [
+                {"n": 1, "x": 0.5, "b": True, "equipo": {"nombre": "A"}},
+                {"n": 300, "b": False, "equipo": {"nombre": "B"}},
+                {"n": 2, "x": 1, "equipo": {"nombre": "A"}},
+            ],
+        )
+        archivo = ArchivoColumnar(self.ruta)
+        self.assertEqual(archivo.tipo("n"), TipoColumna.ENTERO)
+        self.assertEqual(archivo.valores("n").dtype, np.int16)
+        self.assertEqual(archivo.tipo("x"), TipoColumna.REAL)
+        self.assertEqual(archivo.nulos("x").tolist(), [False, True, False])
+        self.assertEqual(archivo.nulos("b").tolist(), [False, False, True])
+        self.assertEqual(archivo.diccionario("equipo.nombre"), ["A", "B"])
+        self.assertEqual(archivo.valores("equipo.nombre").tolist(), [0, 1, 0])
+        self.assertEqual(archivo.codigo("equipo.nombre", "B"), 1)
+        self.assertIsNone(archivo.codigo("equipo.nombre", "C"))
+        self.assertEqual(archivo.resultados()[1], {"n": 300, "b": False, "equipo": {"nombre": "B"}})
+
+        with self.assertRaises(ValueError):
+            guardar_resultados(self.ruta, [{"lista": [1, 2]}])
+        with self.assertRaises(KeyError):
+            archivo.valores("inexistente")
+
+
+if __name__ == "__main__":
+    unittest.main()
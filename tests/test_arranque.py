@@ -0,0 +1,46 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CODIGO = """
+import sys, time
+import index
+cliente = index.app.test_client()
+inicio = time.time()
+while cliente.get("/listo").status_code != 200 and time.time() - inicio < 30:
+    time.sleep(0.01)
+print(sorted(m for m in ("matplotlib", "scipy") if m in sys.modules))
+print(cliente.get("/listo").get_json()["juegos"])
+print(cliente.get("/todos_juegos/2").get_json()["numero_juego"])
+index.gestor_trabajos.cerrar()
+"""
+
+
+class TestArranque(unittest.TestCase):
+    def test_carga_diferida(self):
+        """
+        Verifica que importar la aplicación no cargue matplotlib ni scipy, y que los
+        resultados previos se lean después, quedando disponibles en /listo.
+        """
+        with tempfile.TemporaryDirectory() as directorio:
+            with open(os.path.join(directorio, "resultados_acumulados.json"), "w") as f:
+                json.dump([{"numero_juego": i} for i in range(1, 4)], f)
+            salida = subprocess.run(
+                [sys.executable, "-c", CODIGO],
+                cwd=directorio,
+                env=dict(os.environ, PYTHONPATH=RAIZ),
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        lineas = salida.stdout.strip().splitlines()
+        self.assertEqual(lineas[-3:], ["[]", "3", "2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
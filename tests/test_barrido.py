@@ -0,0 +1,47 @@
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from simulacion.barrido import METRICAS_BARRIDO, BarridoParametros, CuboResultados
+from simulacion.simulador import ConfiguracionSimulacion
+
+
+class TestBarridoParametros(unittest.TestCase):
+    def test_cubo_y_numeros_aleatorios_comunes(self):
+        """
+        Verifica la forma del cubo y que dos celdas con los mismos parámetros
+        produzcan exactamente las mismas métricas.
+        """
+        barrido = BarridoParametros(
+            {"costo_tiro": [5, 5, 8], "num_rondas": [2, 3]},
+            ConfiguracionSimulacion(num_juegos=4, semilla=11),
+            max_procesos=1,
+        )
+        cubo = barrido.ejecutar()
+        self.assertEqual(cubo.valores.shape, (3, 2, len(METRICAS_BARRIDO)))
+        np.testing.assert_array_equal(cubo.valores[0], cubo.valores[1])
+        self.assertFalse(np.isnan(cubo.valores).any())
+
+        directorio = tempfile.mkdtemp()
+        try:
+            ruta = os.path.join(directorio, "cubo")
+            cubo.guardar(ruta)
+            cargado = CuboResultados.cargar(ruta)
+        finally:
+            shutil.rmtree(directorio, ignore_errors=True)
+        np.testing.assert_array_equal(cargado.valores, cubo.valores)
+        self.assertEqual(len(cargado.a_dict()["celdas"]), 6)
+
+    def test_rejilla_invalida(self):
+        """
+        Verifica que se rechacen parámetros desconocidos y barridos sin semilla.
+        """
+        with self.assertRaises(ValueError):
+            BarridoParametros({"no_existe": [1]})
+        with self.assertRaises(ValueError):
+            BarridoParametros({"num_rondas": [1]}, ConfiguracionSimulacion())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from benchmarks.comun import comparar, ejecutar_suite, medir, resumir
+from benchmarks.generadores import PRUEBAS, TAMANOS_PRUEBAS, benchmark_pruebas
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_resumir_y_comparar(self):
+        """
+        Verifica los percentiles por operación y que solo se marquen como regresión
+        las caídas mayores que la tolerancia.
+        """
+        resultado = resumir("prueba", [0.1, 0.2, 0.3, 0.4], 100, 200 * 1024)
+        self.assertEqual(resultado.operaciones, 400)
+        self.assertAlmostEqual(resultado.ops_por_segundo, 400)
+        self.assertAlmostEqual(resultado.latencia_p50_us, 2500)
+        self.assertEqual(resultado.memoria_pico_kb, 200)
+
+        referencia = {"prueba": dict(resultado.a_dict(), ops_por_segundo=450)}
+        self.assertEqual(comparar([resultado], referencia, 0.15), [])
+        referencia["prueba"]["ops_por_segundo"] = 600
+        self.assertEqual(len(comparar([resultado], referencia, 0.15)), 1)
+        referencia = {"prueba": dict(resultado.a_dict(), memoria_pico_kb=100)}
+        self.assertEqual(len(comparar([resultado], referencia, 0.15)), 1)
+
+    def test_suite_guarda_y_compara_la_referencia(self):
+        """
+        Verifica que una suite guarde su referencia y que, comparada contra una
+        referencia mucho más rápida, termine con código 1.
+        """
+
+        def benchmark(_escala):
+            return [medir("suma", lambda: list(range(1000)), sum, 1, 5)]
+
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "prueba.json")
+            argumentos = ["--referencia", ruta]
+            with redirect_stdout(io.StringIO()):
+                guardar = argumentos + ["--guardar-referencia"]
+                self.assertEqual(ejecutar_suite("prueba", {"suma": benchmark}, guardar), 0)
+                self.assertTrue(os.path.exists(ruta))
+
+                def lento(_escala):
+                    resultado = benchmark(_escala)[0]
+                    resultado.ops_por_segundo /= 10
+                    return [resultado]
+
+                self.assertEqual(ejecutar_suite("prueba", {"suma": lento}, argumentos), 1)
+
+    def test_pruebas_de_aleatoriedad_por_tamano(self):
+        """
+        Verifica que haya una medición por prueba y tamaño, y que con muestras
+        pequeñas también se mida la memoria.
+        """
+        resultados = benchmark_pruebas(escala=1e-4)
+        self.assertEqual(len(resultados), len(PRUEBAS) * len(TAMANOS_PRUEBAS))
+        self.assertTrue(all(r.ops_por_segundo > 0 for r in resultados))
+        self.assertTrue(all(r.memoria_pico_kb is not None for r in resultados))
+        self.assertIn("poker[n=1000]", {r.nombre for r in resultados})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import os
+import shutil
+import tempfile
+import unittest
+from simulacion.cache import CacheResultados, clave_simulacion
+from simulacion.simulador import ConfiguracionSimulacion, Simulador
+from simulacion.trabajos import EstadoTrabajo, GestorTrabajos
+
+
+class TestCacheResultados(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio, ignore_errors=True)
+
+    def test_clave_depende_de_la_configuracion(self):
+        """
+        Verifica que la clave sea estable para la misma configuración y cambie
+        al variar cualquier parámetro; sin semilla no hay clave.
+        """
+        config = ConfiguracionSimulacion(num_juegos=10, semilla=42)
+        clave = clave_simulacion(Simulador(config))
+        self.assertEqual(clave, clave_simulacion(Simulador(config)))
+        self.assertNotEqual(
+            clave, clave_simulacion(Simulador(ConfiguracionSimulacion(num_juegos=10, semilla=43)))
+        )
+        self.assertNotEqual(
+            clave,
+            clave_simulacion(
+                Simulador(ConfiguracionSimulacion(num_juegos=10, num_rondas=9, semilla=42))
+            ),
+        )
+        self.assertIsNone(clave_simulacion(Simulador(ConfiguracionSimulacion(num_juegos=10))))
+
+    def test_desalojo_lru(self):
+        """
+        Verifica que al superar el tamaño máximo se elimine la entrada usada hace más tiempo.
+        """
+        cache = CacheResultados(self.directorio, max_bytes=250)
+        datos = {"resultados": ["x" * 100]}
+        cache.guardar("a", datos)
+        cache.guardar("b", datos)
+        os.utime(os.path.join(self.directorio, "a.json"), (0, 0))
+        os.utime(os.path.join(self.directorio, "b.json"), (10, 10))
+        self.assertIsNotNone(cache.obtener("a"))  # "a" pasa a ser la más reciente
+        cache.guardar("c", datos)
+        self.assertIsNone(cache.obtener("b"))
+        self.assertIsNotNone(cache.obtener("a"))
+        self.assertIsNotNone(cache.obtener("c"))
+
+    def test_trabajo_repetido_usa_cache(self):
+        """
+        Verifica que un segundo trabajo con la misma configuración se resuelva desde
+        la caché con los mismos resultados.
+        """
+        cache = CacheResultados(os.path.join(self.directorio, "cache"))
+        gestor = GestorTrabajos(
+            max_trabajadores=1,
+            directorio_resultados=os.path.join(self.directorio, "trabajos"),
+            cache=cache,
+        )
+        try:
+            config = ConfiguracionSimulacion(num_juegos=5, semilla=99)
+            primero = gestor.enviar(config)
+            primero.futuro.result(timeout=30)
+            segundo = gestor.enviar(config)
+            segundo.futuro.result(timeout=30)
+        finally:
+            gestor.cerrar()
+        self.assertEqual(segundo.estado, EstadoTrabajo.COMPLETADO)
+        self.assertFalse(primero.desde_cache)
+        self.assertTrue(segundo.desde_cache)
+        self.assertEqual(primero.resultados, segundo.resultados)
+        self.assertEqual(primero.equipos, segundo.equipos)
+
+
+if __name__ == '__main__':
+    unittest.main()
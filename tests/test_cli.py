@@ -0,0 +1,63 @@
+import csv
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from simulacion.__main__ import COLUMNAS_CSV, simular
+from simulacion.simulador import ConfiguracionSimulacion
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestCli(unittest.TestCase):
+    def test_csv_sin_flask_ni_matplotlib(self):
+        """
+        Verifica que la línea de comandos escriba un juego por fila y que no importe
+        la aplicación web ni las bibliotecas de gráficas.
+        """
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "juegos.csv")
+            codigo = (
+                "import sys\n"
+                "from simulacion.__main__ import main\n"
+                f"main(['--juegos', '6', '--rondas', '3', '--semilla', '5', "
+                f"'--formato', 'csv', '-o', {ruta!r}])\n"
+                "print(sorted(m for m in ('flask', 'matplotlib', 'scipy') if m in sys.modules))\n"
+            )
+            salida = subprocess.run(
+                [sys.executable, "-c", codigo],
+                cwd=RAIZ,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            self.assertEqual(salida.stdout.strip(), "[]")
+            with open(ruta) as f:
+                filas = list(csv.reader(f))
+        self.assertEqual(tuple(filas[0]), COLUMNAS_CSV)
+        self.assertEqual([fila[1] for fila in filas[1:]], ["1", "2", "3", "4", "5", "6"])
+
+    def test_replicas_reproducibles(self):
+        """
+        Verifica que los juegos se repartan entre réplicas con semillas distintas y
+        que la corrida se repita con la misma semilla y el mismo número de procesos.
+        """
+        config = ConfiguracionSimulacion(num_juegos=7, num_rondas=3, semilla=11)
+        corrida = simular(config, procesos=2)
+        self.assertEqual([r["juegos"] for r in corrida["replicas"]], [4, 3])
+        self.assertNotEqual(*[r["semilla"] for r in corrida["replicas"]])
+        self.assertEqual(corrida["contadores"]["juegos"], 7)
+
+        def puntajes(c):
+            return [
+                (replica, r["equipo_1"]["puntaje_total"], r["equipo_2"]["puntaje_total"])
+                for replica, r in c["resultados"]
+            ]
+
+        self.assertEqual(puntajes(corrida), puntajes(simular(config, procesos=2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
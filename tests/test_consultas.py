@@ -0,0 +1,189 @@
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from simulacion.archivo_columnar import ArchivoColumnar, guardar_resultados
+from simulacion.consultas import Consulta
+
+EQUIPOS = ("Los jaguares", "Los pumas", "Empate")
+
+
+def resultados_prueba(cantidad):
+    rng = random.Random(4)
+    resultados = []
+    for i in range(1, cantidad + 1):
+        resultado = {
+            "numero_juego": i,
+            "genero_con_mas_victorias": rng.choice("MF"),
+            "equipo_ganador": {"nombre": rng.choice(EQUIPOS)},
+            "equipo_1": {"puntaje_total": rng.randint(200, 320)},
+            "suerte": rng.random() * 3,
+        }
+        if i % 10 == 0:
+            del resultado["suerte"]
+        resultados.append(resultado)
+    return resultados
+
+
+class TestConsultas(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        self.resultados = resultados_prueba(500)
+        ruta = os.path.join(self.directorio, "columnas")
+        guardar_resultados(ruta, self.resultados)
+        self.archivo = ArchivoColumnar(ruta)
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio, ignore_errors=True)
+
+    def test_proporcion_por_intervalos(self):
+        """
+        Verifica la tasa de victorias de un equipo por intervalos de juegos contra
+        un recorrido en Python.
+        """
+        respuesta = Consulta.desde_dict(
+            {
+                "filtros": [["numero_juego", "entre", [50, 449]]],
+                "agrupar": [{"columna": "numero_juego", "ancho": 100}],
+                "agregados": {
+                    "juegos": ["conteo"],
+                    "tasa": ["proporcion", "equipo_ganador.nombre", "==", "Los jaguares"],
+                },
+            }
+        ).ejecutar(self.archivo)
+
+        self.assertEqual(respuesta["filas"], 500)
+        self.assertEqual(respuesta["seleccionadas"], 400)
+        claves = [grupo["clave"]["numero_juego"] for grupo in respuesta["grupos"]]
+        self.assertEqual(claves, [0, 100, 200, 300, 400])
+        for grupo in respuesta["grupos"]:
+            inicio = grupo["clave"]["numero_juego"]
+            juegos = [
+                r
+                for r in self.resultados
+                if 50 <= r["numero_juego"] <= 449 and inicio <= r["numero_juego"] < inicio + 100
+            ]
+            victorias = sum(r["equipo_ganador"]["nombre"] == "Los jaguares" for r in juegos)
+            self.assertEqual(grupo["agregados"]["juegos"], len(juegos))
+            self.assertAlmostEqual(grupo["agregados"]["tasa"], victorias / len(juegos))
+
+    def test_distribucion_con_filtro_de_texto(self):
+        """
+        Verifica percentiles, histograma y estadísticos de los puntajes de los juegos
+        en que ganó el género F, y que los nulos se ignoren en los agregados.
+        """
+        respuesta = Consulta.desde_dict(
+            {
+                "filtros": [["genero_con_mas_victorias", "==", "F"]],
+                "agregados": {
+                    "percentiles": ["percentil", "equipo_1.puntaje_total", [0, 25, 50, 90, 100]],
+                    "histograma": ["histograma", "equipo_1.puntaje_total", 50],
+                    "media": ["media", "equipo_1.puntaje_total"],
+                    "desviacion": ["desviacion", "equipo_1.puntaje_total"],
+                    "maximo": ["maximo", "equipo_1.puntaje_total"],
+                    "suerte_mediana": ["percentil", "suerte", 50],
+                    "suerte_suma": ["suma", "suerte"],
+                },
+            }
+        ).ejecutar(self.archivo)
+
+        filas = [r for r in self.resultados if r["genero_con_mas_victorias"] == "F"]
+        puntajes = np.array([r["equipo_1"]["puntaje_total"] for r in filas])
+        suerte = np.array([r["suerte"] for r in filas if "suerte" in r])
+        (grupo,) = respuesta["grupos"]
+        self.assertEqual(grupo["clave"], {})
+        agregados = grupo["agregados"]
+        np.testing.assert_allclose(
+            agregados["percentiles"], np.percentile(puntajes, [0, 25, 50, 90, 100])
+        )
+        self.assertEqual(agregados["histograma"]["inicio"], 200)
+        self.assertEqual(
+            agregados["histograma"]["conteos"],
+            np.bincount(puntajes // 50 - 4).tolist(),
+        )
+        self.assertAlmostEqual(agregados["media"], puntajes.mean())
+        self.assertAlmostEqual(agregados["desviacion"], puntajes.std(ddof=1))
+        self.assertEqual(agregados["maximo"], puntajes.max())
+        self.assertAlmostEqual(agregados["suerte_mediana"], np.median(suerte))
+        self.assertAlmostEqual(agregados["suerte_suma"], suerte.sum())
+
+    def test_agrupar_varias_columnas(self):
+        """
+        Verifica la frecuencia de empates y la agrupación por dos columnas, y los
+        percentiles de reales con muchos grupos (ruta con ordenamiento).
+        """
+        respuesta = Consulta.desde_dict(
+            {
+                "agrupar": ["equipo_ganador.nombre", "genero_con_mas_victorias"],
+                "agregados": {"fraccion": ["fraccion"], "minimo": ["minimo", "suerte"]},
+            }
+        ).ejecutar(self.archivo)
+        self.assertEqual(len(respuesta["grupos"]), 6)
+        for grupo in respuesta["grupos"]:
+            clave = grupo["clave"]
+            filas = [
+                r
+                for r in self.resultados
+                if r["equipo_ganador"]["nombre"] == clave["equipo_ganador.nombre"]
+                and r["genero_con_mas_victorias"] == clave["genero_con_mas_victorias"]
+            ]
+            self.assertAlmostEqual(grupo["agregados"]["fraccion"], len(filas) / 500)
+            self.assertEqual(
+                grupo["agregados"]["minimo"], min(r["suerte"] for r in filas if "suerte" in r)
+            )
+
+        empates = Consulta(
+            filtros=[["equipo_ganador.nombre", "en", ["Empate", "Inexistente"]]]
+        ).ejecutar(self.archivo)
+        self.assertEqual(
+            empates["grupos"][0]["agregados"]["juegos"],
+            sum(r["equipo_ganador"]["nombre"] == "Empate" for r in self.resultados),
+        )
+
+        por_intervalo = Consulta(
+            agrupar=[{"columna": "numero_juego", "ancho": 20}],
+            agregados={"mediana": ["percentil", "suerte", 50]},
+        ).ejecutar(self.archivo)
+        self.assertEqual(len(por_intervalo["grupos"]), 26)
+        for grupo in por_intervalo["grupos"]:
+            inicio = grupo["clave"]["numero_juego"]
+            suerte = [
+                r["suerte"]
+                for r in self.resultados
+                if inicio <= r["numero_juego"] < inicio + 20 and "suerte" in r
+            ]
+            if suerte:
+                self.assertAlmostEqual(grupo["agregados"]["mediana"], np.median(suerte))
+            else:
+                # El juego 500 es el único de su intervalo y no tiene suerte
+                self.assertIsNone(grupo["agregados"]["mediana"])
+
+    def test_consultas_invalidas(self):
+        with self.assertRaises(KeyError):
+            Consulta(filtros=[["no_existe", "==", 1]]).ejecutar(self.archivo)
+        with self.assertRaises(ValueError):
+            Consulta(filtros=[["equipo_ganador.nombre", "<", "A"]]).ejecutar(self.archivo)
+        with self.assertRaises(ValueError):
+            Consulta(agregados={"media": ["media", "equipo_ganador.nombre"]}).ejecutar(
+                self.archivo
+            )
+        with self.assertRaises(ValueError):
+            Consulta.desde_dict({"agregados": {"p": ["percentil", "suerte", 120]}})
+        with self.assertRaises(ValueError):
+            Consulta.desde_dict({"agrupar": [{"columna": "numero_juego", "ancho": 0}]})
+        with self.assertRaises(ValueError):
+            Consulta.desde_dict({"orden": []})
+
+        vacia = Consulta(
+            filtros=[["equipo_ganador.nombre", "==", "Inexistente"]],
+            agregados={"media": ["media", "suerte"], "juegos": ["conteo"]},
+        ).ejecutar(self.archivo)
+        self.assertEqual(vacia["grupos"][0]["agregados"], {"media": None, "juegos": 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+from simulacion.convergencia import EstimadorProporcion, MonitorConvergencia
+from simulacion.simulador import ConfiguracionSimulacion, Simulador
+
+
+class TestEstimadorProporcion(unittest.TestCase):
+    def test_intervalo_wilson(self):
+        """
+        Verifica el intervalo de Wilson para 40 éxitos en 100 observaciones
+        (valores de referencia con z = 1.96).
+        """
+        estimador = EstimadorProporcion()
+        for i in range(100):
+            estimador.registrar(i < 40)
+        inferior, superior, semi_ancho = estimador.intervalo(1.96)
+        self.assertAlmostEqual(estimador.estimacion, 0.4)
+        self.assertAlmostEqual(inferior, 0.3094, places=3)
+        self.assertAlmostEqual(superior, 0.4980, places=3)
+        self.assertAlmostEqual(semi_ancho, (superior - inferior) / 2, places=9)
+
+    def test_intervalo_no_colapsa_en_extremos(self):
+        """
+        Verifica que con todas las observaciones iguales el intervalo conserve ancho.
+        """
+        estimador = EstimadorProporcion()
+        for _ in range(10):
+            estimador.registrar(True)
+        self.assertGreater(estimador.intervalo(1.96)[2], 0.05)
+
+
+class TestModoSecuencial(unittest.TestCase):
+    def test_parada_temprana(self):
+        """
+        Verifica que el simulador se detenga al converger, antes del máximo de juegos,
+        y que los intervalos reportados cumplan el semi-ancho solicitado.
+        """
+        config = ConfiguracionSimulacion(
+            num_juegos=5000,
+            semilla=31,
+            semi_ancho_objetivo=0.1,
+            juegos_minimos=20,
+            metricas_objetivo=["victoria_equipo1"],
+        )
+        simulador = Simulador(config)
+        simulador.ejecutar()
+        resumen = simulador.convergencia.resumen()
+        self.assertTrue(resumen["convergio"])
+        self.assertLess(len(simulador.resultados), config.num_juegos)
+        self.assertEqual(resumen["juegos_usados"], len(simulador.resultados))
+        self.assertLessEqual(resumen["intervalos"]["victoria_equipo1"]["semi_ancho"], 0.1)
+
+    def test_metrica_desconocida(self):
+        """
+        Verifica que se rechacen métricas objetivo que no existen.
+        """
+        with self.assertRaises(ValueError):
+            MonitorConvergencia(0.05, metricas=["puntaje_medio"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from simulacion.blanco_objetivo import Blanco, NivelRegistro
+from simulacion.estadisticas_tiros import EstadisticasTiros
+from simulacion.simulador import ConfiguracionSimulacion, Simulador
+
+
+class TestEstadisticasTiros(unittest.TestCase):
+    def setUp(self):
+        config = ConfiguracionSimulacion(
+            num_juegos=3, num_rondas=2, semilla=21, nivel_registro=NivelRegistro.COMPLETO
+        ).validar()
+        self.simulador = Simulador(config)
+        self.simulador.ejecutar()
+        self.estadisticas = self.simulador.estadisticas_tiros
+
+    def test_mapa_calor_cuenta_todos_los_tiros(self):
+        """
+        Verifica que el mapa de calor contenga cada tiro una vez, que la suma por
+        género coincida con el total y que reducir la resolución conserve los conteos.
+        """
+        total = self.estadisticas.total_tiros
+        self.assertGreater(total, 0)
+        fino = self.estadisticas.mapa_calor(celdas=300)
+        grueso = self.estadisticas.mapa_calor(celdas=10)
+        self.assertEqual(fino["total"], total)
+        self.assertEqual(grueso["total"], total)
+        self.assertEqual(np.asarray(grueso["conteos"]).shape, (10, 10))
+        self.assertEqual(
+            np.asarray(fino["conteos"]).reshape(10, 30, 10, 30).sum(axis=(1, 3)).tolist(),
+            grueso["conteos"],
+        )
+        por_genero = sum(self.estadisticas.mapa_calor(10, g)["total"] for g in ("M", "F"))
+        self.assertEqual(por_genero, total)
+        with self.assertRaises(ValueError):
+            self.estadisticas.mapa_calor(celdas=7)
+
+    def test_frecuencias_zonas(self):
+        """
+        Verifica que las tablas de zonas sumen el total de tiros y que haya una fila
+        por cada jugador de ambos equipos.
+        """
+        zonas = self.estadisticas.frecuencias_zonas()
+        total = self.estadisticas.total_tiros
+        self.assertEqual(sum(t["total"] for t in zonas["por_genero"].values()), total)
+        self.assertEqual(sum(j["total"] for j in zonas["por_jugador"]), total)
+        jugadores = len(self.simulador.equipo1.jugadores) + len(self.simulador.equipo2.jugadores)
+        self.assertEqual(len(zonas["por_jugador"]), jugadores)
+        for tabla in zonas["por_genero"].values():
+            self.assertEqual(set(tabla["conteos"]), set(Blanco.ZONAS))
+
+    def test_guardar_y_cargar(self):
+        """
+        Verifica que las estadísticas cargadas desde disco respondan igual que las originales.
+        """
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "tiros.npz")
+            self.estadisticas.guardar(ruta)
+            cargadas = EstadisticasTiros.cargar(ruta)
+        self.assertEqual(cargadas.mapa_calor(30), self.estadisticas.mapa_calor(30))
+        self.assertEqual(cargadas.frecuencias_zonas(), self.estadisticas.frecuencias_zonas())
+
+
+if __name__ == "__main__":
+    unittest.main()
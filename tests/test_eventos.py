@@ -0,0 +1,72 @@
+import unittest
+from collections import Counter
+
+from simulacion.contexto import ContextoSimulacion
+from simulacion.equipo import Equipo
+from simulacion.eventos import BusEventos, Evento
+from simulacion.juego import Juego
+
+
+def jugar(semilla, eventos=None):
+    contexto = ContextoSimulacion(semilla=semilla, eventos=eventos)
+    equipo1 = Equipo("Equipo 1", rng=contexto.rng)
+    equipo2 = Equipo("Equipo 2", rng=contexto.rng)
+    juego = Juego(equipo1, equipo2, num_rondas=6, contexto=contexto)
+    juego.jugar_juego_completo()
+    return juego
+
+
+class TestEventos(unittest.TestCase):
+    def test_eventos_de_un_juego(self):
+        """
+        Verifica que se emita un inicio y un fin por ronda, dos tiros extra por ronda
+        y un evento de tiro por cada tiro contado en los resultados.
+        """
+        bus = BusEventos()
+        conteos = Counter()
+        tiros = Counter()
+
+        def contar(evento):
+            return lambda **datos: conteos.update([evento])
+
+        for evento in Evento.TODOS:
+            bus.suscribir(evento, contar(evento))
+        bus.suscribir(Evento.TIRO, lambda desempate, **datos: tiros.update([desempate]))
+
+        juego = jugar(11, bus)
+        self.assertEqual(conteos[Evento.INICIO_RONDA], 6)
+        self.assertEqual(conteos[Evento.FIN_RONDA], 6)
+        self.assertEqual(conteos[Evento.TIRO_EXTRA], 12)
+        tiros_turnos = sum(r.equipo1.tiros + r.equipo2.tiros for r in juego.historial_rondas)
+        self.assertEqual(tiros[False], tiros_turnos + conteos[Evento.TIRO_EXTRA])
+        self.assertEqual(conteos[Evento.TIRO], tiros[False] + tiros[True])
+
+    def test_suscriptores_no_alteran_resultados(self):
+        """
+        Verifica que los puntajes sean los mismos con y sin suscriptores, y que sin
+        suscriptores el blanco y la ronda no reciban el bus.
+        """
+        bus = BusEventos()
+        sin_bus = jugar(5, bus)
+        self.assertIsNone(sin_bus.blanco.eventos)
+
+        bus.suscribir(Evento.TIRO, lambda **datos: None)
+        con_bus = jugar(5, bus)
+        self.assertIs(con_bus.blanco.eventos, bus)
+        self.assertEqual(
+            [(r.equipo1.puntaje, r.equipo2.puntaje) for r in sin_bus.historial_rondas],
+            [(r.equipo1.puntaje, r.equipo2.puntaje) for r in con_bus.historial_rondas],
+        )
+
+    def test_desuscribir(self):
+        bus = BusEventos()
+        funcion = bus.suscribir(Evento.FIN_RONDA, lambda **datos: None)
+        self.assertTrue(bus.hay_suscriptores(Evento.FIN_RONDA))
+        bus.desuscribir(Evento.FIN_RONDA, funcion)
+        self.assertFalse(bus.hay_suscriptores())
+        with self.assertRaises(ValueError):
+            bus.suscribir("disparo", funcion)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+
+from simulacion.simulador import ConfiguracionSimulacion, ContadoresSimulacion, Simulador
+from utils.metricas import RegistroMetricas
+
+
+class TestMetricas(unittest.TestCase):
+    def test_exposicion_prometheus(self):
+        """
+        Verifica el formato de contadores, medidores con etiquetas e histogramas,
+        con intervalos acumulativos, suma y conteo.
+        """
+        registro = RegistroMetricas()
+        juegos = registro.contador("juegos_total", "Juegos")
+        estados = registro.medidor("trabajos", "Trabajos por estado", ("estado",))
+        latencia = registro.histograma(
+            "latencia_segundos", "Latencia", ("ruta",), limites=(0.1, 1.0)
+        )
+        juegos.incrementar(3)
+        juegos.incrementar()
+        estados.fijar(2, estado='con "comillas"')
+        for valor in (0.05, 0.1, 0.5, 3.0):
+            latencia.observar(valor, ruta="/jugar")
+
+        lineas = registro.exponer().splitlines()
+        self.assertIn("# TYPE juegos_total counter", lineas)
+        self.assertIn("juegos_total 4", lineas)
+        self.assertIn('trabajos{estado="con \\"comillas\\""} 2', lineas)
+        self.assertIn('latencia_segundos_bucket{ruta="/jugar",le="0.1"} 2', lineas)
+        self.assertIn('latencia_segundos_bucket{ruta="/jugar",le="1"} 3', lineas)
+        self.assertIn('latencia_segundos_bucket{ruta="/jugar",le="+Inf"} 4', lineas)
+        self.assertIn('latencia_segundos_sum{ruta="/jugar"} 3.65', lineas)
+        self.assertIn('latencia_segundos_count{ruta="/jugar"} 4', lineas)
+
+        with self.assertRaises(ValueError):
+            estados.fijar(1)
+        with self.assertRaises(ValueError):
+            juegos.incrementar(-1)
+
+    def test_recolector(self):
+        registro = RegistroMetricas()
+        medidor = registro.medidor("valor", "Valor")
+        llamadas = []
+
+        @registro.recolector
+        def recolectar():
+            llamadas.append(1)
+            medidor.fijar(len(llamadas))
+
+        self.assertIn("valor 1", registro.exponer().splitlines())
+        self.assertIn("valor 2", registro.exponer().splitlines())
+
+    def test_contadores_simulacion(self):
+        """
+        Verifica que el simulador cuente juegos, rondas y tiros, y que mida tiempo en
+        cada fase.
+        """
+        simulador = Simulador(ConfiguracionSimulacion(num_juegos=4, num_rondas=3, semilla=9))
+        simulador.ejecutar()
+        contadores = simulador.contadores
+        self.assertEqual(contadores.juegos, 4)
+        self.assertEqual(contadores.rondas, 12)
+        ultimo = simulador._juego.historial_rondas
+        self.assertGreaterEqual(
+            contadores.tiros, sum(r.equipo1.tiros + r.equipo2.tiros + 2 for r in ultimo)
+        )
+        self.assertEqual(set(contadores.segundos), set(ContadoresSimulacion.FASES))
+        self.assertGreater(contadores.segundos["juego"], 0)
+
+        total = ContadoresSimulacion().sumar(contadores).sumar(contadores)
+        self.assertEqual(total.rondas, 24)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+
+from modelos.random_wrapper import RandomWrapper
+from simulacion.equipo import Equipo
+from simulacion.nombres import APELLIDOS, NOMBRES_FEMENINOS, NOMBRES_MASCULINOS, nombre_completo
+
+
+class TestNombres(unittest.TestCase):
+    def test_plantillas_reproducibles(self):
+        """
+        Verifica que la misma semilla genere los mismos nombres y que cada nombre
+        corresponda al género del jugador.
+        """
+        equipos = [Equipo("Equipo", 8, RandomWrapper(99)) for _ in range(2)]
+        nombres = [[(j.nombre, j.genero) for j in e.jugadores] for e in equipos]
+        self.assertEqual(nombres[0], nombres[1])
+        for nombre, genero in nombres[0]:
+            primero, apellido = nombre.split(" ")
+            pool = NOMBRES_MASCULINOS if genero == "M" else NOMBRES_FEMENINOS
+            self.assertIn(primero, pool)
+            self.assertIn(apellido, APELLIDOS)
+
+    def test_genero_desconocido(self):
+        with self.assertRaises(ValueError):
+            nombre_completo("X", RandomWrapper(1))
+
+
+if __name__ == "__main__":
+    unittest.main()
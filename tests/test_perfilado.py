@@ -0,0 +1,52 @@
+import sys
+import unittest
+
+from simulacion import perfilado
+from simulacion.perfilado import perfilar_juegos
+from simulacion.simulador import ConfiguracionSimulacion
+
+
+class TestPerfilado(unittest.TestCase):
+    def test_perfilar_juegos(self):
+        """
+        Verifica que el perfil ordene las funciones por tiempo acumulado y que las
+        pilas colapsadas partan de la simulación del juego.
+        """
+        intervalo_cambio = sys.getswitchinterval()
+        perfil = perfilar_juegos(
+            ConfiguracionSimulacion(num_rondas=5, semilla=7),
+            num_juegos=30,
+            top=10,
+            intervalo_muestreo=0.001,
+        )
+        funciones = perfil["funciones"]
+        self.assertEqual(len(funciones), 10)
+        acumulados = [f["tiempo_acumulado"] for f in funciones]
+        self.assertEqual(acumulados, sorted(acumulados, reverse=True))
+        self.assertTrue(any("jugar_juego_completo" in f["funcion"] for f in funciones))
+
+        self.assertGreater(perfil["muestras"], 0)
+        lineas = perfil["pilas_colapsadas"].splitlines()
+        self.assertEqual(sum(int(linea.rsplit(" ", 1)[1]) for linea in lineas), perfil["muestras"])
+        self.assertTrue(all(linea.startswith("simulador.py:jugar_juego") for linea in lineas))
+        self.assertEqual(sys.getswitchinterval(), intervalo_cambio)
+
+    def test_un_perfilado_a_la_vez(self):
+        """
+        Verifica que, sin esperar, un perfilado falle si ya hay otro en curso, y que
+        no cambie el intervalo de cambio de hilos del proceso.
+        """
+        intervalo_cambio = sys.getswitchinterval()
+        with perfilado._bloqueo_perfilado:
+            with self.assertRaises(RuntimeError):
+                perfilar_juegos(num_juegos=1, esperar=False)
+        self.assertEqual(sys.getswitchinterval(), intervalo_cambio)
+        self.assertEqual(perfilar_juegos(num_juegos=1, esperar=False)["juegos"], 1)
+
+    def test_orden_invalido(self):
+        with self.assertRaises(ValueError):
+            perfilar_juegos(num_juegos=1, orden="nombre")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+from simulacion.ratings import MotorRatings
+from simulacion.simulador import ConfiguracionSimulacion, Simulador
+from simulacion.torneo import ConfiguracionTorneo, Torneo
+
+
+class TestMotorRatings(unittest.TestCase):
+    def test_elo_se_conserva_y_premia_al_ganador(self):
+        """
+        Verifica que el ganador suba lo mismo que baja el perdedor y que un empate
+        entre equipos de igual Elo no cambie sus ratings.
+        """
+        motor = MotorRatings(k=20)
+        motor.registrar(("a", "A"), ("b", "B"), 30, 10)
+        equipos = {fila["equipo_id"]: fila for fila in motor.equipos()}
+        self.assertAlmostEqual(equipos["a"]["elo"], 1510)
+        self.assertAlmostEqual(equipos["b"]["elo"], 1490)
+        self.assertEqual((equipos["a"]["ganados"], equipos["b"]["perdidos"]), (1, 1))
+
+        motor.registrar(("c", "C"), ("d", "D"), 5, 5)
+        equipos = {fila["equipo_id"]: fila for fila in motor.equipos()}
+        self.assertAlmostEqual(equipos["c"]["elo"], 1500)
+        self.assertEqual(equipos["d"]["empatados"], 1)
+
+    def test_rendimiento_relativo_a_la_media(self):
+        """Verifica que el rendimiento siga el promedio móvil de los puntos relativos."""
+        motor = MotorRatings(alfa=0.5)
+        jugadores = [("j1", "Uno", "a", 30), ("j2", "Dos", "b", 10)]
+        motor.registrar(("a", "A"), ("b", "B"), 30, 10, jugadores)
+        filas = {fila["user_id"]: fila for fila in motor.jugadores()}
+        self.assertAlmostEqual(filas["j1"]["ultimo"], 150)
+        self.assertAlmostEqual(filas["j1"]["rendimiento"], 125)
+        self.assertAlmostEqual(filas["j2"]["rendimiento"], 75)
+        self.assertEqual(motor.jugadores(limite=1)[0]["user_id"], "j1")
+        with self.assertRaises(ValueError):
+            MotorRatings(alfa=0)
+
+    def test_simulador_y_torneo_actualizan_ratings(self):
+        """
+        Verifica que el simulador y el torneo registren cada juego y a cada jugador.
+        """
+        simulador = Simulador(ConfiguracionSimulacion(num_juegos=4, num_rondas=2, semilla=5))
+        simulador.ejecutar()
+        ratings = simulador.ratings.a_dict()
+        self.assertEqual(ratings["juegos"], 4)
+        self.assertTrue(all(fila["juegos"] == 4 for fila in ratings["equipos"]))
+        self.assertEqual(len(ratings["jugadores"]), 10)
+
+        torneo = Torneo(
+            ConfiguracionTorneo(
+                num_equipos=4, jugadores_por_equipo=2, juegos_por_partido=2, num_rondas=2, semilla=9
+            ),
+            max_procesos=1,
+        ).ejecutar()
+        self.assertEqual(torneo.ratings.juegos, 12)
+        self.assertEqual(len(torneo.ratings.jugadores()), 8)
+        self.assertTrue(all("puntos_jugadores" not in partido for partido in torneo.partidos))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+from modelos.random_wrapper import RandomWrapper
+from simulacion.reduccion_varianza import comparar_escenarios, estimar
+from simulacion.simulador import ConfiguracionSimulacion
+
+
+class TestReduccionVarianza(unittest.TestCase):
+    def test_generador_antitetico(self):
+        """
+        Verifica que el modo antitético entregue 1 - u para la misma semilla.
+        """
+        normal = RandomWrapper(17)
+        antitetico = RandomWrapper(17, antithetic=True)
+        for _ in range(100):
+            self.assertAlmostEqual(normal.random() + antitetico.random(), 1.0)
+
+    def test_escenarios_identicos_no_tienen_ruido(self):
+        """
+        Verifica que, con números aleatorios comunes, comparar un escenario consigo
+        mismo dé una diferencia exactamente nula.
+        """
+        config = ConfiguracionSimulacion(num_juegos=4, num_rondas=3, semilla=8)
+        diferencia = comparar_escenarios(config, config, metricas=["diferencia_puntaje"])
+        estimacion = diferencia["diferencia_puntaje"]
+        self.assertEqual(estimacion.estimacion, 0.0)
+        self.assertEqual(estimacion.error_estandar, 0.0)
+        self.assertEqual(estimacion.juegos_simulados, 8)
+
+    def test_estimacion_antitetica(self):
+        """
+        Verifica que la estimación antitética use pares de juegos y que el
+        intervalo contenga la estimación.
+        """
+        config = ConfiguracionSimulacion(num_juegos=5, num_rondas=3, semilla=3)
+        estimacion = estimar(config, metricas=["puntaje_equipo1"])["puntaje_equipo1"]
+        self.assertEqual(estimacion.juegos_simulados, 10)
+        self.assertLessEqual(estimacion.inferior, estimacion.estimacion)
+        self.assertGreaterEqual(estimacion.superior, estimacion.estimacion)
+        self.assertGreater(estimacion.ganancia_ess, 0)
+        with self.assertRaises(ValueError):
+            estimar(ConfiguracionSimulacion(num_juegos=5), metricas=["puntaje_equipo1"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+from modelos.random_wrapper import RandomWrapper
+from simulacion.blanco_objetivo import Blanco, NivelRegistro
+from simulacion.simulador import ConfiguracionSimulacion, Simulador
+from simulacion.jugador import Jugador
+from simulacion.registro_tiros import TIRO_DTYPE, RegistroTiros
+
+
+class TestRegistroTiros(unittest.TestCase):
+    def test_serializacion_y_crecimiento(self):
+        """
+        Verifica que el registro crezca más allá de su capacidad inicial y que la
+        serialización agrupe los tiros por jugador en el orden en que se hicieron.
+        """
+        rng = RandomWrapper(5)
+        jugadores = [Jugador("A", "M", rng), Jugador("B", "F", rng)]
+        registro = RegistroTiros(
+            list(Blanco.ZONAS.values()), lambda numeros, zonas: (numeros / 100, -numeros / 100)
+        )
+        total = RegistroTiros.CAPACIDAD_INICIAL + 10
+        for i in range(total):
+            registro.registrar(jugadores[i % 2], i % 4, i % 11)
+
+        self.assertEqual(len(registro), total)
+        serializado = registro.serializar()
+        self.assertEqual([d["nombre"] for d in serializado], ["A", "B"])
+        self.assertEqual(len(serializado[0]["lanzamientos"]), total // 2)
+        segundo = serializado[1]["lanzamientos"][0]
+        self.assertEqual(segundo["coordenadas"], [0.01, -0.01])
+        self.assertEqual(segundo["zona"], list(Blanco.ZONAS.values())[1])
+        self.assertEqual(segundo["puntaje"], 1)
+        self.assertEqual(len(registro.tiros_de(jugadores[1].user_id)), total // 2)
+        self.assertEqual(TIRO_DTYPE.itemsize, 14)
+
+    def test_blanco_registra_tiros(self):
+        """
+        Verifica que Blanco registre cada tiro y mantenga la vista por jugador.
+        """
+        rng = RandomWrapper(9)
+        blanco = Blanco(rng)
+        jugador = Jugador("C", "F", rng)
+        puntajes = [blanco.realizar_tiro(jugador) for _ in range(3)]
+        lanzamientos = blanco.players[jugador.user_id].lanzamientos
+        self.assertEqual([l.puntaje for l in lanzamientos], puntajes)
+        blanco.reset()
+        self.assertEqual(blanco.obtener_tiros_serializables(), [])
+
+    def test_niveles_de_registro(self):
+        """
+        Verifica que los resultados no dependan del nivel de registro y que las
+        coordenadas sean las mismas sin importar cuándo se calculan.
+        """
+        resultados = {}
+        for nivel in NivelRegistro.TODOS:
+            config = ConfiguracionSimulacion(
+                num_juegos=3, num_rondas=4, semilla=13, nivel_registro=nivel
+            )
+            resultados[nivel] = [
+                (r["equipo_1"]["puntaje_total"], r["equipo_2"]["puntaje_total"])
+                for r in Simulador(config).ejecutar()
+            ]
+        self.assertEqual(resultados[NivelRegistro.NINGUNO], resultados[NivelRegistro.COMPLETO])
+        self.assertEqual(resultados[NivelRegistro.PUNTAJES], resultados[NivelRegistro.COMPLETO])
+
+        def tiros(nivel, consultar_cada_tiro):
+            rng = RandomWrapper(4)
+            blanco = Blanco(rng, nivel_registro=nivel)
+            jugador = Jugador("D", "M", rng)
+            for _ in range(20):
+                blanco.realizar_tiro(jugador)
+                if consultar_cada_tiro:
+                    blanco.obtener_tiros_serializables()
+            return blanco.obtener_tiros_serializables()[0]["lanzamientos"]
+
+        completos = tiros(NivelRegistro.COMPLETO, False)
+        self.assertEqual(completos, tiros(NivelRegistro.COMPLETO, True))
+        for lanzamiento in completos:
+            radio = (lanzamiento["coordenadas"][0] ** 2 + lanzamiento["coordenadas"][1] ** 2) ** 0.5
+            zona = list(Blanco.ZONAS.values()).index(lanzamiento["zona"])
+            minimo, maximo = Blanco.RANGOS_RADIO[zona]
+            self.assertTrue(minimo - 0.02 <= radio <= maximo + 0.02)
+        solo_puntajes = tiros(NivelRegistro.PUNTAJES, False)
+        self.assertEqual([l["puntaje"] for l in solo_puntajes], [l["puntaje"] for l in completos])
+        self.assertIsNone(solo_puntajes[0]["coordenadas"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+
+from modelos.random_wrapper import RandomWrapper
+from simulacion.blanco_objetivo import Blanco
+from simulacion.contexto import ContextoSimulacion
+from simulacion.equipo import Equipo
+from simulacion.juego import Juego
+from simulacion.ronda import Enfrentamiento, ResultadoRonda, Ronda
+
+
+class TestResultadoRonda(unittest.TestCase):
+    def test_a_dict_conserva_el_esquema(self):
+        """
+        Verifica que el resultado de la ronda se convierta al diccionario de siempre
+        y que sus puntajes coincidan con los del registro.
+        """
+        rng = RandomWrapper(17)
+        equipo1, equipo2 = Equipo("Equipo 1", rng=rng), Equipo("Equipo 2", rng=rng)
+        resultado = Ronda(1, equipo1, equipo2, Blanco(rng)).jugar()
+        self.assertIsInstance(resultado, ResultadoRonda)
+
+        datos = resultado.a_dict()
+        self.assertEqual(
+            set(datos),
+            {
+                "ronda actual",
+                "equipo 1",
+                "equipo 2",
+                "ganador_individual",
+                "ganador_grupal",
+                "jugador_con_mas_suerte",
+                "jugador_con_mas_experiencia",
+                "ronda",
+            },
+        )
+        self.assertEqual(datos["equipo 1"]["puntaje"], resultado.equipo1.puntaje)
+        self.assertEqual(datos["equipo 2"]["tiros_jugadores"], {})
+        self.assertEqual(
+            datos["jugador_con_mas_suerte"]["user_id"], resultado.jugador_con_mas_suerte.user_id
+        )
+        self.assertIn(datos["jugador_con_mas_experiencia"]["equipo"], ("equipo 1", "equipo 2"))
+
+    def test_clases_sin_diccionario_de_atributos(self):
+        """Verifica que jugadores, equipos y resultados no tengan __dict__."""
+        rng = RandomWrapper(3)
+        equipo = Equipo("Equipo", rng=rng)
+        resultado = Ronda(1, equipo, Equipo("Rival", rng=rng), Blanco(rng)).jugar()
+        for objeto in (equipo, equipo.jugadores[0], resultado, resultado.equipo1):
+            self.assertFalse(hasattr(objeto, "__dict__"))
+
+    def test_juego_reutilizado_igual_a_juegos_nuevos(self):
+        """
+        Verifica que reutilizar un juego con reiniciar() produzca los mismos
+        puntajes por ronda que crear un juego nuevo cada vez.
+        """
+
+        def puntajes(reutilizar):
+            contexto = ContextoSimulacion(semilla=29)
+            equipo1 = Equipo("Equipo 1", rng=contexto.rng)
+            equipo2 = Equipo("Equipo 2", rng=contexto.rng)
+            juego = None
+            obtenidos = []
+            for numero in range(1, 4):
+                if reutilizar and juego is not None:
+                    juego.reiniciar(numero)
+                else:
+                    juego = Juego(
+                        equipo1, equipo2, num_rondas=5, juego_actual=numero, contexto=contexto
+                    )
+                juego.jugar_juego_completo()
+                obtenidos.append(
+                    [(r.equipo1.puntaje, r.equipo2.puntaje) for r in juego.historial_rondas]
+                )
+            return obtenidos
+
+        self.assertEqual(puntajes(True), puntajes(False))
+
+
+    def test_enfrentamiento_indexa_jugadores(self):
+        """
+        Verifica que el enfrentamiento asigne a cada jugador su equipo y su género.
+        """
+        rng = RandomWrapper(8)
+        equipo1 = Equipo("Equipo 1", num_jugadores=40, rng=rng)
+        equipo2 = Equipo("Equipo 2", num_jugadores=25, rng=rng)
+        enfrentamiento = Enfrentamiento(equipo1, equipo2)
+        self.assertEqual(len(enfrentamiento.jugadores), 65)
+        for numero, equipo in ((1, equipo1), (2, equipo2)):
+            rango = enfrentamiento.rangos[numero - 1]
+            self.assertEqual([enfrentamiento.jugadores[i] for i in rango], equipo.jugadores)
+            for jugador in equipo.jugadores:
+                self.assertEqual(enfrentamiento.equipo_de(jugador), numero)
+                indice = enfrentamiento.indices[jugador]
+                self.assertEqual(enfrentamiento.generos[indice], jugador.genero)
+
+
+if __name__ == "__main__":
+    unittest.main()
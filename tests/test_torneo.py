@@ -0,0 +1,78 @@
+import itertools
+import unittest
+
+from simulacion.torneo import (
+    ConfiguracionTorneo,
+    FormatoTorneo,
+    Torneo,
+    calendario_todos_contra_todos,
+)
+
+
+class TestTorneo(unittest.TestCase):
+    def test_calendario_todos_contra_todos(self):
+        """
+        Verifica que cada par de equipos se enfrente una sola vez y que ningún
+        equipo juegue dos partidos en la misma jornada.
+        """
+        for num_equipos in (2, 5, 8):
+            jornadas = calendario_todos_contra_todos(num_equipos)
+            pares = [par for jornada in jornadas for par in jornada]
+            self.assertEqual(
+                sorted(pares), list(itertools.combinations(range(num_equipos), 2))
+            )
+            for jornada in jornadas:
+                equipos = [equipo for par in jornada for equipo in par]
+                self.assertEqual(len(equipos), len(set(equipos)))
+
+    def test_resultados_independientes_de_los_procesos(self):
+        """
+        Verifica que la tabla de un torneo todos contra todos sea la misma con uno
+        o varios procesos y que sume los partidos y juegos disputados.
+        """
+        config = ConfiguracionTorneo(
+            num_equipos=5, jugadores_por_equipo=3, juegos_por_partido=2, num_rondas=2, semilla=13
+        )
+        secuencial = Torneo(config, max_procesos=1).ejecutar()
+        paralelo = Torneo(config, max_procesos=2).ejecutar()
+        self.assertEqual(secuencial.tabla.clasificacion(), paralelo.tabla.clasificacion())
+
+        clasificacion = secuencial.tabla.clasificacion()
+        self.assertEqual(len(secuencial.partidos), 10)
+        self.assertTrue(all(fila["partidos"] == 4 for fila in clasificacion))
+        self.assertEqual(
+            sum(fila["ganados"] for fila in clasificacion),
+            sum(fila["perdidos"] for fila in clasificacion),
+        )
+        puntos = [fila["puntos"] for fila in clasificacion]
+        self.assertEqual(puntos, sorted(puntos, reverse=True))
+
+    def test_eliminacion_directa(self):
+        """
+        Verifica que la eliminación directa juegue n - 1 partidos y que el campeón
+        gane todos los suyos.
+        """
+        torneo = Torneo(
+            ConfiguracionTorneo(
+                num_equipos=6,
+                jugadores_por_equipo=2,
+                formato=FormatoTorneo.ELIMINACION,
+                num_rondas=2,
+                semilla=4,
+            ),
+            max_procesos=1,
+        ).ejecutar()
+        self.assertEqual(len(torneo.partidos), 5)
+        self.assertIsNotNone(torneo.campeon)
+        fila = next(f for f in torneo.tabla.clasificacion() if f["equipo"] == torneo.campeon)
+        self.assertEqual(fila["perdidos"], 0)
+
+    def test_configuracion_invalida(self):
+        with self.assertRaises(ValueError):
+            ConfiguracionTorneo(num_equipos=1).validar()
+        with self.assertRaises(ValueError):
+            ConfiguracionTorneo(formato="liga").validar()
+
+
+if __name__ == "__main__":
+    unittest.main()
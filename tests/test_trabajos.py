@@ -0,0 +1,151 @@
+import shutil
+import tempfile
+import time
+import unittest
+from simulacion.simulador import ConfiguracionSimulacion, Simulador
+from simulacion.trabajos import EstadoTrabajo, GestorTrabajos
+
+
+def puntajes(resultados):
+    return [
+        (r["equipo_1"]["puntaje_total"], r["equipo_2"]["puntaje_total"])
+        for r in resultados
+    ]
+
+
+class TestSimuladorAislado(unittest.TestCase):
+    def test_misma_semilla_mismos_puntajes(self):
+        """
+        Verifica que dos simulaciones con la misma semilla produzcan los mismos puntajes,
+        aunque se ejecuten intercaladas.
+        """
+        config = ConfiguracionSimulacion(num_juegos=5, semilla=2024)
+        sim1, sim2 = Simulador(config), Simulador(config)
+        for i in range(config.num_juegos):
+            sim1.jugar_juego(i + 1)
+            sim2.jugar_juego(i + 1)
+        self.assertEqual(puntajes(sim1.resultados), puntajes(sim2.resultados))
+
+    def test_contadores_por_contexto(self):
+        """
+        Verifica que las victorias globales por género se acumulen por simulación
+        y no entre simulaciones distintas.
+        """
+        sim1 = Simulador(ConfiguracionSimulacion(num_juegos=4, semilla=7))
+        sim2 = Simulador(ConfiguracionSimulacion(num_juegos=4, semilla=7))
+        sim1.ejecutar()
+        sim2.ejecutar()
+        self.assertEqual(
+            sim1.resultados[-1]["generos_victorias_globales"],
+            sim2.resultados[-1]["generos_victorias_globales"],
+        )
+
+
+class TestGestorTrabajos(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        self.gestor = GestorTrabajos(max_trabajadores=1, directorio_resultados=self.directorio)
+
+    def tearDown(self):
+        self.gestor.cerrar()
+        shutil.rmtree(self.directorio, ignore_errors=True)
+
+    def esperar(self, trabajo, limite=30):
+        inicio = time.time()
+        while not trabajo.terminado and time.time() - inicio < limite:
+            time.sleep(0.02)
+
+    def test_trabajo_completo_guarda_resultados(self):
+        """
+        Verifica que un trabajo termine con sus resultados disponibles en memoria
+        y en disco.
+        """
+        trabajo = self.gestor.enviar(ConfiguracionSimulacion(num_juegos=3, semilla=11))
+        self.esperar(trabajo)
+        self.assertEqual(trabajo.estado, EstadoTrabajo.COMPLETADO)
+        self.assertEqual(trabajo.progreso, 100)
+        self.assertEqual(len(self.gestor.resultados(trabajo.trabajo_id)), 3)
+
+        trabajo.resultados = []
+        self.assertEqual(len(self.gestor.resultados(trabajo.trabajo_id)), 3)
+
+        self.assertEqual(self.gestor.contadores().juegos, 3)
+        archivo = self.gestor.archivo_columnar(trabajo.trabajo_id)
+        self.assertEqual(archivo.filas, 3)
+        self.assertEqual(archivo.metadatos["trabajo_id"], trabajo.trabajo_id)
+        self.assertEqual(self.gestor.conteo_por_estado()[EstadoTrabajo.COMPLETADO], 1)
+
+    def test_trabajo_largo_se_publica_aunque_termine_despues(self):
+        """
+        Verifica que un trabajo largo que termina después de otro enviado más tarde
+        se publique con todos sus resultados, aunque solo se conserve un trabajo en
+        memoria, y que se descarte el que terminó primero.
+        """
+        publicados = {}
+        gestor = GestorTrabajos(
+            max_trabajadores=2,
+            directorio_resultados=self.directorio,
+            max_trabajos_en_memoria=1,
+            al_completar=lambda t: publicados.setdefault(t.trabajo_id, len(t.resultados)),
+        )
+        try:
+            largo = gestor.enviar(ConfiguracionSimulacion(num_juegos=1500, semilla=5))
+            corto = gestor.enviar(ConfiguracionSimulacion(num_juegos=10, semilla=6))
+            inicio = time.time()
+            while len(publicados) < 2 and time.time() - inicio < 60:
+                time.sleep(0.02)
+        finally:
+            gestor.cerrar()
+
+        self.assertLess(corto.finalizado, largo.finalizado)
+        self.assertEqual(publicados, {largo.trabajo_id: 1500, corto.trabajo_id: 10})
+        self.assertEqual(len(largo.resultados), 1500)
+        self.assertEqual(corto.resultados, [])
+        self.assertEqual(len(gestor.resultados(corto.trabajo_id)), 10)
+
+    def test_cancelar_trabajo_pendiente(self):
+        """
+        Verifica que un trabajo en cola pueda cancelarse antes de ejecutarse.
+        """
+        primero = self.gestor.enviar(ConfiguracionSimulacion(num_juegos=20, semilla=1))
+        segundo = self.gestor.enviar(ConfiguracionSimulacion(num_juegos=20, semilla=2))
+        self.assertTrue(self.gestor.cancelar(segundo.trabajo_id))
+        self.esperar(primero)
+        self.assertEqual(segundo.estado, EstadoTrabajo.CANCELADO)
+        self.assertIsNone(self.gestor.resultados(segundo.trabajo_id))
+
+    def test_cancelar_trabajo_en_ejecucion(self):
+        """
+        Verifica que un trabajo en ejecución se detenga entre juegos y conserve
+        los resultados parciales.
+        """
+        trabajo = self.gestor.enviar(ConfiguracionSimulacion(num_juegos=100000, semilla=3))
+        while trabajo.juegos_completados < 3:
+            time.sleep(0.01)
+        self.assertTrue(self.gestor.cancelar(trabajo.trabajo_id))
+        self.esperar(trabajo)
+        self.assertEqual(trabajo.estado, EstadoTrabajo.CANCELADO)
+        parciales = self.gestor.resultados(trabajo.trabajo_id)
+        self.assertGreaterEqual(len(parciales), 3)
+        self.assertLess(len(parciales), 100000)
+        self.assertEqual(parciales[-1]["numero_juego"], len(parciales))
+        self.assertFalse(self.gestor.cancelar(trabajo.trabajo_id))
+
+
+class TestConfiguracionSimulacion(unittest.TestCase):
+    def test_validar_rangos(self):
+        """
+        Verifica que se rechacen cantidades de juegos, rondas y semillas fuera de rango.
+        """
+        ConfiguracionSimulacion(num_juegos=1000, num_rondas=5, semilla=9).validar()
+        for invalida in (
+            ConfiguracionSimulacion(num_juegos=0),
+            ConfiguracionSimulacion(num_rondas=0),
+            ConfiguracionSimulacion(semilla=0),
+        ):
+            with self.assertRaises(ValueError):
+                invalida.validar()
+
+
+if __name__ == '__main__':
+    unittest.main()
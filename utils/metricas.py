@@ -0,0 +1,262 @@
+"""
+Métricas de la aplicación en el formato de texto de Prometheus.
+
+Un RegistroMetricas agrupa contadores, medidores e histogramas con etiquetas y los
+expone como texto para el endpoint /metrics. Los valores que ya lleva otro
+componente (por ejemplo, los juegos simulados por el gestor de trabajos) se copian
+en el registro con funciones recolectoras, que se ejecutan justo antes de cada
+exposición.
+
+Formato: https://prometheus.io/docs/instrumenting/exposition_formats/
+"""
+
+import bisect
+import math
+import os
+import sys
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+TIPO_CONTENIDO = "text/plain; version=0.0.4; charset=utf-8"
+
+# Límites por defecto de los histogramas de latencia, en segundos
+LIMITES_LATENCIA = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _formatear_valor(valor: float) -> str:
+    if math.isinf(valor):
+        return "+Inf" if valor > 0 else "-Inf"
+    if math.isnan(valor):
+        return "NaN"
+    if float(valor).is_integer() and abs(valor) < 2**53:
+        return str(int(valor))
+    return repr(float(valor))
+
+
+def _escapar(valor: str) -> str:
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _formatear_etiquetas(nombres: Sequence[str], valores: Sequence[str]) -> str:
+    if not nombres:
+        return ""
+    pares = ",".join(f'{nombre}="{_escapar(valor)}"' for nombre, valor in zip(nombres, valores))
+    return "{" + pares + "}"
+
+
+class Metrica:
+    """
+    Familia de series de una métrica: una serie por combinación de etiquetas.
+    """
+
+    tipo = "untyped"
+
+    def __init__(self, nombre: str, ayuda: str, etiquetas: Sequence[str] = ()):
+        """
+        Args:
+            nombre (str): Nombre de la métrica
+            ayuda (str): Descripción que acompaña a la métrica en la exposición
+            etiquetas (Sequence[str]): Nombres de las etiquetas de cada serie
+        """
+        self.nombre = nombre
+        self.ayuda = ayuda
+        self.etiquetas = tuple(etiquetas)
+        self._valores: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def _clave(self, etiquetas: Dict[str, str]) -> Tuple[str, ...]:
+        if set(etiquetas) != set(self.etiquetas):
+            raise ValueError(f"{self.nombre} requiere las etiquetas {list(self.etiquetas)}")
+        return tuple(str(etiquetas[nombre]) for nombre in self.etiquetas)
+
+    def fijar(self, valor: float, **etiquetas) -> None:
+        """Asigna el valor de la serie con las etiquetas dadas."""
+        clave = self._clave(etiquetas)
+        with self._lock:
+            self._valores[clave] = valor
+
+    def limpiar(self) -> None:
+        """Elimina todas las series (p. ej. antes de volver a fijarlas en un recolector)."""
+        with self._lock:
+            self._valores.clear()
+
+    def valor(self, **etiquetas) -> Optional[float]:
+        """Retorna el valor de una serie, o None si no existe."""
+        with self._lock:
+            return self._valores.get(self._clave(etiquetas))
+
+    def muestras(self) -> Iterable[Tuple[str, Tuple[str, ...], float]]:
+        """Retorna (nombre de la muestra, valores de las etiquetas, valor) de cada serie."""
+        with self._lock:
+            return [(self.nombre, clave, valor) for clave, valor in sorted(self._valores.items())]
+
+    def exponer(self) -> str:
+        """Retorna la familia en el formato de texto de Prometheus."""
+        lineas = [f"# HELP {self.nombre} {self.ayuda}", f"# TYPE {self.nombre} {self.tipo}"]
+        for nombre, valores, valor in self.muestras():
+            etiquetas = self.etiquetas
+            if nombre.endswith("_bucket"):
+                etiquetas += ("le",)
+            lineas.append(
+                f"{nombre}{_formatear_etiquetas(etiquetas, valores)} {_formatear_valor(valor)}"
+            )
+        return "\n".join(lineas) + "\n"
+
+
+class Contador(Metrica):
+    """
+    Valor que solo crece. La tasa por segundo se obtiene en Prometheus con rate().
+
+    fijar() se usa para copiar totales que ya lleva otro componente.
+    """
+
+    tipo = "counter"
+
+    def incrementar(self, valor: float = 1, **etiquetas) -> None:
+        """Suma valor a la serie con las etiquetas dadas."""
+        if valor < 0:
+            raise ValueError("Un contador no puede disminuir")
+        clave = self._clave(etiquetas)
+        with self._lock:
+            self._valores[clave] = self._valores.get(clave, 0) + valor
+
+
+class Medidor(Metrica):
+    """Valor que puede subir y bajar, como la memoria en uso."""
+
+    tipo = "gauge"
+
+
+class Histograma(Metrica):
+    """
+    Distribución de observaciones en intervalos acumulativos (le = "menor o igual").
+    """
+
+    tipo = "histogram"
+
+    def __init__(
+        self,
+        nombre: str,
+        ayuda: str,
+        etiquetas: Sequence[str] = (),
+        limites: Sequence[float] = LIMITES_LATENCIA,
+    ):
+        """
+        Args:
+            limites (Sequence[float]): Límites superiores de los intervalos, en orden
+                creciente (el intervalo +Inf se agrega siempre)
+        """
+        super().__init__(nombre, ayuda, etiquetas)
+        if list(limites) != sorted(limites):
+            raise ValueError("Los límites del histograma deben estar en orden creciente")
+        self.limites = tuple(limites)
+        # clave -> [conteo por intervalo (sin acumular)..., conteo +Inf, suma]
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observar(self, valor: float, **etiquetas) -> None:
+        """Registra una observación en la serie con las etiquetas dadas."""
+        clave = self._clave(etiquetas)
+        indice = bisect.bisect_left(self.limites, valor)
+        with self._lock:
+            serie = self._series.get(clave)
+            if serie is None:
+                serie = self._series[clave] = [0] * (len(self.limites) + 1) + [0.0]
+            serie[indice] += 1
+            serie[-1] += valor
+
+    def limpiar(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def muestras(self) -> Iterable[Tuple[str, Tuple[str, ...], float]]:
+        with self._lock:
+            series = sorted((clave, list(serie)) for clave, serie in self._series.items())
+        muestras = []
+        limites = [_formatear_valor(limite) for limite in self.limites] + ["+Inf"]
+        for clave, serie in series:
+            acumulado = 0
+            for limite, conteo in zip(limites, serie):
+                acumulado += conteo
+                muestras.append((f"{self.nombre}_bucket", clave + (limite,), acumulado))
+            muestras.append((f"{self.nombre}_sum", clave, serie[-1]))
+            muestras.append((f"{self.nombre}_count", clave, acumulado))
+        return muestras
+
+
+class RegistroMetricas:
+    """
+    Conjunto de métricas que se exponen juntas.
+    """
+
+    def __init__(self):
+        self._metricas: List[Metrica] = []
+        self._recolectores: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def _registrar(self, metrica: Metrica) -> Metrica:
+        with self._lock:
+            if any(m.nombre == metrica.nombre for m in self._metricas):
+                raise ValueError(f"La métrica {metrica.nombre} ya está registrada")
+            self._metricas.append(metrica)
+        return metrica
+
+    def contador(self, nombre: str, ayuda: str, etiquetas: Sequence[str] = ()) -> Contador:
+        """Crea y registra un contador."""
+        return self._registrar(Contador(nombre, ayuda, etiquetas))
+
+    def medidor(self, nombre: str, ayuda: str, etiquetas: Sequence[str] = ()) -> Medidor:
+        """Crea y registra un medidor."""
+        return self._registrar(Medidor(nombre, ayuda, etiquetas))
+
+    def histograma(
+        self,
+        nombre: str,
+        ayuda: str,
+        etiquetas: Sequence[str] = (),
+        limites: Sequence[float] = LIMITES_LATENCIA,
+    ) -> Histograma:
+        """Crea y registra un histograma."""
+        return self._registrar(Histograma(nombre, ayuda, etiquetas, limites))
+
+    def recolector(self, funcion: Callable[[], None]) -> Callable[[], None]:
+        """
+        Registra una función que actualiza métricas antes de cada exposición.
+
+        Puede usarse como decorador.
+        """
+        with self._lock:
+            self._recolectores.append(funcion)
+        return funcion
+
+    def exponer(self) -> str:
+        """
+        Ejecuta los recolectores y retorna todas las métricas en el formato de texto
+        de Prometheus.
+        """
+        with self._lock:
+            recolectores = list(self._recolectores)
+            metricas = list(self._metricas)
+        for recolector in recolectores:
+            recolector()
+        return "".join(metrica.exponer() for metrica in metricas)
+
+
+def memoria_residente() -> Optional[int]:
+    """
+    Retorna la memoria residente (RSS) del proceso en bytes.
+
+    Lee /proc/self/statm en Linux; en otros sistemas usa el pico de memoria
+    residente de getrusage, o None si tampoco está disponible.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS lo reporta en bytes y Linux en KiB
+    return pico if sys.platform == "darwin" else pico * 1024